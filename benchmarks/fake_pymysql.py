@@ -0,0 +1,365 @@
+#!/usr/bin/python3.4
+
+"""Fake in-process pymysql driver for benchmarks.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file fake_pymysql.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for standing in for pymysql in benchmarks, so that the
+    time measured is the time spent in Database Connector and not in network or server.
+
+Working; -
+----------
+    install() puts this module in sys.modules as 'pymysql', before Database Connector modules
+    are imported. Connections open instantly, and every SELECT returns the canned rows set by
+    set_rows() with zero latency. Other queries affect one row, and queries starting with
+    ERROR_QUERY fail with ProgrammingError.
+
+    Like pymysql, DictCursor builds a dict per row on execute and SSDictCursor builds it as the
+    row is fetched. fetchall() and fetchmany() return tuples of rows without copying them, as
+    pymysql buffered cursors do.
+
+    Tests script the driver further, and reset() puts it back to its defaults,
+
+        set_result()    -   Query starting with given prefix returns given columns and rows.
+        fail()          -   Next query starting with given prefix raises given error. Prefix
+                            CONNECT_QUERY fails the next connect(). Error of a lost connection,
+                            code in LOST_CODES, closes the connection as pymysql does.
+        QUERY_LOG       -   List of host and query string of executed queries, if set.
+
+    LOAD DATA LOCAL INFILE query reads its data file and affects one row per line. Connection
+    counts its commits and rollbacks.
+
+Uses; -
+-------
+    This will be used by benchmarks/overhead.py and by tests.
+
+Reference; -
+------------
+
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Added scripted results, failures and query log for tests.
+#
+#
+# #############################################################################
+
+
+import re
+import sys
+import types
+
+
+class MySQLError(Exception):
+    pass
+
+
+class Warning(Warning, MySQLError):
+    pass
+
+
+class Error(MySQLError):
+    pass
+
+
+class InterfaceError(Error):
+    pass
+
+
+class DatabaseError(Error):
+    pass
+
+
+class DataError(DatabaseError):
+    pass
+
+
+class OperationalError(DatabaseError):
+    pass
+
+
+class IntegrityError(DatabaseError):
+    pass
+
+
+class InternalError(DatabaseError):
+    pass
+
+
+class ProgrammingError(DatabaseError):
+    pass
+
+
+class NotSupportedError(DatabaseError):
+    pass
+
+
+class FIELD_TYPE(object):
+    DECIMAL, TINY, SHORT, LONG, FLOAT, DOUBLE, NULL, TIMESTAMP, LONGLONG, INT24 = range(10)
+    DATE, TIME, DATETIME, YEAR = 10, 11, 12, 13
+    VARCHAR, BIT = 15, 16
+    NEWDECIMAL, ENUM, SET, TINY_BLOB, MEDIUM_BLOB, LONG_BLOB, BLOB, VAR_STRING, STRING, GEOMETRY = range(246, 256)
+
+
+ROWS            =   ()
+DESCRIPTION     =   (("id", FIELD_TYPE.LONGLONG, None, None, None, None, False),
+                     ("name", FIELD_TYPE.VAR_STRING, None, None, None, None, True),
+                     ("score", FIELD_TYPE.DOUBLE, None, None, None, None, True))
+FIELD_NAMES     =   tuple(column[0] for column in DESCRIPTION)
+MAX_PACKET      =   ((64 * 1024 * 1024,),)
+ERROR_QUERY     =   "ERROR"                 # Query starting with it fails with syntax error.
+CONNECT_QUERY   =   "CONNECT"               # Prefix of fail() which fails connect().
+LOST_CODES      =   (2006, 2013)            # Errors of lost connection, connection is closed by them.
+LOAD_PATTERN    =   re.compile(r"LOAD DATA LOCAL INFILE '([^']+)'")
+
+RESULTS         =   {}                      # Query prefix to description and rows, set by set_result().
+FAILURES        =   []                      # Query prefix and error of queries to fail, set by fail().
+QUERY_LOG       =   None                    # List of host and query string of executed queries, None to not log.
+
+
+def make_rows(count):
+    return tuple((index, "name-{}".format(index), index * 0.5) for index in range(count))
+
+
+def set_rows(rows):
+    """ To set rows returned by every SELECT query. """
+    global ROWS
+    ROWS = rows
+
+
+def set_result(prefix, names, rows):
+    """ To make query starting with prefix return rows of columns names, instead of rows set by set_rows(). """
+    RESULTS[prefix] = (tuple((name, FIELD_TYPE.VAR_STRING, None, None, None, None, True) for name in names), tuple(rows))
+
+
+def fail(prefix, error, count = 1):
+    """ To make next count queries starting with prefix raise error. """
+    FAILURES.extend([(prefix, error)] * count)
+
+
+def reset():
+    """ To put back default rows and drop scripted results, failures and query log. """
+    global ROWS, QUERY_LOG
+    ROWS = ()
+    QUERY_LOG = None
+    RESULTS.clear()
+    del FAILURES[:]
+
+
+def check_failure(prefix_of):
+    """ To raise error of first failure whose prefix matches, prefix_of tells if a prefix matches. """
+    for index, (prefix, error) in enumerate(FAILURES):
+        if prefix_of(prefix):
+            del FAILURES[index]
+            raise error
+
+
+class Cursor(object):
+
+    def __init__(self, connection):
+        self.connection     =   connection
+        self.description    =   None
+        self.rowcount       =   -1
+        self.arraysize      =   1
+        self._rows          =   ()
+        self._position      =   0
+
+    def execute(self, query, args = None):
+        if query.startswith(ERROR_QUERY):
+            raise ProgrammingError(1064, "You have an error in your SQL syntax.")
+
+        if not self.connection.open:
+            raise InterfaceError(0, "")
+
+        if QUERY_LOG is not None:
+            QUERY_LOG.append((self.connection.host, query))
+
+        if FAILURES:
+            try:
+                check_failure(query.startswith)
+            except Error as error:
+                if error.args and error.args[0] in LOST_CODES:
+                    self.connection.open = False
+                raise
+
+        result = self.get_result(query) if RESULTS else None
+
+        if result is not None:
+            self.description = result[0]
+            self._rows = self.convert_rows(result[1])
+            self.rowcount = len(result[1])
+        elif query.lstrip()[:6].upper() == "SELECT":
+            rows = MAX_PACKET if "@@max_allowed_packet" in query else ROWS
+            self.description = DESCRIPTION
+            self._rows = self.convert_rows(rows)
+            self.rowcount = len(rows)
+        elif query.startswith("LOAD DATA"):
+            with open(LOAD_PATTERN.match(query).group(1), "rb") as data:
+                self.rowcount = data.read().count(b"\n")
+            self.description = None
+            self._rows = ()
+        else:
+            self.description = None
+            self._rows = ()
+            self.rowcount = 1 + query.count("),(")
+
+        self._position = 0
+
+        return self.rowcount
+
+    @staticmethod
+    def get_result(query):
+        for prefix, result in RESULTS.items():
+            if query.startswith(prefix):
+                return result
+
+        return None
+
+    def get_names(self):
+        return FIELD_NAMES if self.description is DESCRIPTION else tuple(column[0] for column in self.description)
+
+    def convert_rows(self, rows):
+        return rows
+
+    def fetchone(self):
+        if self._position >= len(self._rows):
+            return None
+
+        self._position += 1
+
+        return self._rows[self._position - 1]
+
+    def fetchmany(self, size = None):
+        end = self._position + (size or self.arraysize)
+        rows = self._rows[self._position:end]
+        self._position += len(rows)
+
+        return rows
+
+    def fetchall(self):
+        rows = self._rows[self._position:] if self._position else self._rows
+        self._position = len(self._rows)
+
+        return rows
+
+    def close(self):
+        self._rows = ()
+
+
+class DictCursor(Cursor):
+
+    def convert_rows(self, rows):
+        names = self.get_names()
+        return [dict(zip(names, row)) for row in rows]
+
+
+class SSCursor(Cursor):
+    pass
+
+
+class SSDictCursor(SSCursor):
+
+    def fetchone(self):
+        row = super(SSDictCursor, self).fetchone()
+
+        return None if row is None else dict(zip(self.get_names(), row))
+
+    def fetchmany(self, size = None):
+        names = self.get_names()
+        return [dict(zip(names, row)) for row in super(SSDictCursor, self).fetchmany(size)]
+
+    def fetchall(self):
+        names = self.get_names()
+        return [dict(zip(names, row)) for row in super(SSDictCursor, self).fetchall()]
+
+
+class Connection(object):
+
+    def __init__(self, host = None, *args, **kwargs):
+        self.host           =   kwargs.get("host", host)
+        self.port           =   kwargs.get("port")
+        self.open           =   True
+        self.encoding       =   "utf8"
+        self.charset        =   "utf8mb4"
+        self.commit_count   =   0
+        self.rollback_count =   0
+
+    def cursor(self, cursor_class = None):
+        return (cursor_class or Cursor)(self)
+
+    def commit(self):
+        if not self.open:
+            raise InterfaceError(0, "")
+
+        self.commit_count += 1
+
+    def rollback(self):
+        if not self.open:
+            raise InterfaceError(0, "")
+
+        self.rollback_count += 1
+
+    def ping(self, reconnect = False):
+        if not self.open:
+            raise Error("Already closed")
+
+    def close(self):
+        self.open = False
+
+    def escape(self, value, mapping = None):
+        if value is None:
+            return "NULL"
+
+        if isinstance(value, str):
+            return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+        return str(value)
+
+
+def connect(*args, **kwargs):
+    if FAILURES:
+        check_failure(lambda prefix: prefix == CONNECT_QUERY)
+
+    return Connection(*args, **kwargs)
+
+
+cursors = types.ModuleType("pymysql.cursors")
+cursors.Cursor, cursors.DictCursor, cursors.SSCursor, cursors.SSDictCursor = Cursor, DictCursor, SSCursor, SSDictCursor
+
+constants = types.ModuleType("pymysql.constants")
+constants.FIELD_TYPE = FIELD_TYPE
+
+
+def install():
+    """ To register this module as 'pymysql' in sys.modules.
+
+    Args:
+        Not Applicable.
+    Returns:
+        module: This module.
+    Raises:
+        RuntimeError: If Database Connector or real pymysql is already imported.
+    """
+    module = sys.modules[__name__]
+
+    if sys.modules.get("pymysql") not in (None, module) or "db_connection" in sys.modules:
+        raise RuntimeError("Fake driver must be installed before pymysql and db_connection are imported.")
+
+    sys.modules["pymysql"] = module
+    sys.modules["pymysql.cursors"] = cursors
+    sys.modules["pymysql.constants"] = constants
+
+    return module
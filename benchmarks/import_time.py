@@ -0,0 +1,113 @@
+#!/usr/bin/python3.4
+
+"""Measures import time of Database Connector.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file import_time.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python script is responsible for measuring the time taken to import Database Connector
+    factory in a fresh interpreter, and for checking that no database driver is imported with it.
+
+Working; -
+----------
+    Script runs 'python -X importtime -c "import dc_factory"' a few times, takes the best
+    cumulative import time of dc_factory and compares it with the budget.
+
+    Exit code is 1 if import time is over budget or a driver module is imported, else 0.
+    Option -X importtime needs Python 3.7 or later.
+
+Uses; -
+-------
+    python3 benchmarks/import_time.py [--budget-ms 30] [--runs 5]
+
+Reference; -
+------------
+    https://docs.python.org/3/using/cmdline.html#cmdoption-X
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import argparse
+import os
+import subprocess
+import sys
+
+
+ROOT_DIR        =   os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIRS     =   [os.path.join(ROOT_DIR, "src", "DomainLayer"), os.path.join(ROOT_DIR, "src", "DataAccessLayer", "config_dao")]
+DRIVER_MODULES  =   ("pymysql", "aiomysql", "cx_Oracle", "numpy", "pyarrow")
+DEF_BUDGET_MS   =   30.0
+DEF_RUNS        =   5
+
+
+def measure(module):
+    """ Returns import time of each module imported by 'import module'.
+
+    Args:
+        module: Name of module to import.
+    Returns:
+        dict: Module name to cumulative import time in microseconds.
+    Raises:
+        RuntimeError: If import fails.
+    """
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(SOURCE_DIRS + [environment.get("PYTHONPATH", "")])
+
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", "import {}".format(module)],
+                             stdout = subprocess.PIPE, stderr = subprocess.PIPE, env = environment, universal_newlines = True)
+
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr)
+
+    timings = {}
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        fields = line[len("import time:"):].split("|")
+
+        try:
+            timings[fields[2].strip()] = int(fields[1])
+        except ValueError:
+            pass                            # Header line.
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Measure import time of dc_factory.")
+    parser.add_argument("--budget-ms", type = float, default = DEF_BUDGET_MS)
+    parser.add_argument("--runs", type = int, default = DEF_RUNS)
+    arguments = parser.parse_args()
+
+    runs        =   [measure("dc_factory") for _ in range(arguments.runs)]
+    best_ms     =   min(run["dc_factory"] for run in runs) / 1000.0
+    drivers     =   sorted(set(name for run in runs for name in run if name.split(".")[0] in DRIVER_MODULES))
+
+    print("dc_factory import time: {:.2f} ms (budget {:.2f} ms)".format(best_ms, arguments.budget_ms))
+
+    if drivers:
+        print("Driver modules imported by dc_factory: {}".format(", ".join(drivers)))
+
+    return 1 if best_ms > arguments.budget_ms or drivers else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+#!/usr/bin/python3.4
+
+"""Measures per call overhead of Database Connector.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file overhead.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python script is responsible for measuring time and memory which Database Connector adds
+    on top of the driver, so that releases can be compared.
+
+Working; -
+----------
+    pymysql is replaced with fake_pymysql, an in-process driver which returns canned rows with
+    zero latency, so the measured time is spent in Database Connector, or in the driver's row
+    building for dictionary cursors. 'driver.*' cases run the fake driver alone as baseline.
+
+    Each case is run enough times to last at least --min-time seconds, best of --repeat runs is
+    reported. Memory is measured with tracemalloc over one more call,
+
+        peak_bytes      -   Peak memory allocated during the call.
+        retained_blocks -   Memory blocks still allocated after the call, while its result is held.
+        retained_bytes  -   Size of those blocks.
+
+    Results are written as JSON, to stdout or to --output file. Python 3.9 or later is needed
+    for tracemalloc.reset_peak().
+
+Uses; -
+-------
+    python3 benchmarks/overhead.py [--output overhead.json] [--max-rows 1000000] [--min-time 0.2] [--repeat 3]
+
+Reference; -
+------------
+
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+
+BENCHMARK_DIR   =   os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR        =   os.path.dirname(BENCHMARK_DIR)
+sys.path[:0]    =   [BENCHMARK_DIR, os.path.join(ROOT_DIR, "src", "DomainLayer"), os.path.join(ROOT_DIR, "src", "DataAccessLayer", "config_dao")]
+
+import fake_pymysql
+fake_pymysql.install()
+
+from db_connection import QueryResult
+from db_query_info import QueryType, CursorType, RecordCount
+from dc_factory import DCFactory, DCFactoryType
+from dc_config_dao_factory import DCConfigDaoFactory, DCConfigFactoryType
+from dc_connection_dao import ConnectionDao
+
+
+DEF_ROW_COUNT   =   100                     # Rows returned by execute() cases other than result size cases.
+ROW_COUNTS      =   (1, 10, 100, 1000, 10000, 100000, 1000000)
+
+
+def configure():
+    os.environ[DCFactory.DC_FACT_ENV_VAR] = str(int(DCFactoryType.MYSQL_FACTORY))
+    os.environ[DCConfigDaoFactory.DC_CFG_FACT_ENV_VAR] = str(int(DCConfigFactoryType.JSON_FACTORY))
+    os.environ.setdefault(ConnectionDao.CONN_CFG_ENV_VAR, os.path.join(ROOT_DIR, "config", "connection.json"))
+
+
+def measure_allocations(operation):
+    """ Returns peak bytes, retained blocks and retained bytes of one call of operation. """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    start_bytes = tracemalloc.get_traced_memory()[0]
+
+    result = operation()
+
+    peak_bytes = tracemalloc.get_traced_memory()[1] - start_bytes
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    statistics = after.compare_to(before, "filename")
+    del result
+
+    return (peak_bytes,
+            sum(stat.count_diff for stat in statistics if not stat.traceback[0].filename.startswith("<frozen")),
+            sum(stat.size_diff for stat in statistics if not stat.traceback[0].filename.startswith("<frozen")))
+
+
+def measure(name, operation, arguments, **parameters):
+    """ Returns benchmark result of operation.
+
+    Args:
+        name: Name of benchmark case.
+        operation: Callable without arguments, its return value is held while memory is measured.
+        arguments: Parsed command line arguments.
+        parameters: Parameters of case, reported as they are.
+    Returns:
+        dict: Benchmark result.
+    Raises:
+        Not Applicable.
+    """
+    timer = timeit.Timer(operation)
+    number = 1
+
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= arguments.min_time:
+            break
+        number = max(number * 2, int(number * arguments.min_time / max(elapsed, 1e-9)))
+
+    best = min([elapsed] + timer.repeat(repeat = arguments.repeat - 1, number = number)) / number
+    peak_bytes, retained_blocks, retained_bytes = measure_allocations(operation)
+
+    result = {"name": name,
+              "parameters": parameters,
+              "iterations": number,
+              "ns_per_op": best * 1e9,
+              "ops_per_sec": 1.0 / best if best else None,
+              "peak_bytes": peak_bytes,
+              "retained_blocks": retained_blocks,
+              "retained_bytes": retained_bytes}
+
+    print("{:<64}{:>14.0f} ops/s{:>14.0f} ns/op".format(name + "".join(" {}={}".format(*item) for item in sorted(parameters.items())),
+                                                        result["ops_per_sec"], result["ns_per_op"]), file = sys.stderr)
+
+    return result
+
+
+def make_query(factory, record_count, query_string = "SELECT id, name, score FROM benchmark"):
+    query               =   factory.get_query()
+    query.query_string  =   query_string
+    query.query_type    =   QueryType.SELECT
+    query.record_count  =   record_count
+    query.batch_size    =   DEF_ROW_COUNT
+
+    return query
+
+
+def make_execute(connection, query):
+    if query.record_count == RecordCount.STREAM:
+        def operation():
+            query_result = connection.execute(query)
+            for _ in query_result.result:
+                pass
+            return query_result
+
+        return operation
+
+    return lambda: connection.execute(query)
+
+
+def run(arguments):
+    configure()
+    results = []
+
+    fake_pymysql.set_rows(fake_pymysql.make_rows(DEF_ROW_COUNT))
+    factory = DCFactory.get_dc_factory()
+
+    results.append(measure("QueryResult", QueryResult, arguments))
+    results.append(measure("get_dc_factory", DCFactory.get_dc_factory, arguments))
+    results.append(measure("get_connection", factory.get_connection, arguments))
+
+    connection = factory.get_connection()
+
+    def connect_disconnect():
+        connection.connect()
+        connection.set_cursor(CursorType.NORMAL)
+        connection.disconnect()
+
+    results.append(measure("connect_disconnect", connect_disconnect, arguments))
+
+    driver_connection = fake_pymysql.connect()
+
+    for cursor_type in (CursorType.NORMAL, CursorType.DICTIONARY):
+        connection.connect()
+        connection.set_cursor(cursor_type)
+
+        for record_count in (RecordCount.SINGLE, RecordCount.Many, RecordCount.ALL, RecordCount.STREAM):
+            results.append(measure("execute", make_execute(connection, make_query(factory, record_count)), arguments,
+                                   cursor = cursor_type.name, record_count = record_count.name, rows = DEF_ROW_COUNT))
+
+        connection.disconnect()
+
+    connection.connect()
+    connection.set_cursor(CursorType.NORMAL)
+
+    results.append(measure("execute_error", make_execute(connection, make_query(factory, RecordCount.ALL, fake_pymysql.ERROR_QUERY)), arguments))
+
+    for row_count in ROW_COUNTS:
+        if row_count > arguments.max_rows:
+            break
+
+        fake_pymysql.set_rows(fake_pymysql.make_rows(row_count))
+
+        for cursor_type, cursor_class in ((CursorType.NORMAL, fake_pymysql.Cursor), (CursorType.DICTIONARY, fake_pymysql.DictCursor)):
+            connection.set_cursor(cursor_type)
+            driver_cursor = driver_connection.cursor(cursor_class)
+
+            def driver_execute():
+                driver_cursor.execute("SELECT id, name, score FROM benchmark")
+                return driver_cursor.fetchall()
+
+            results.append(measure("driver.execute", driver_execute, arguments, cursor = cursor_type.name, record_count = "ALL", rows = row_count))
+            results.append(measure("execute", make_execute(connection, make_query(factory, RecordCount.ALL)), arguments,
+                                   cursor = cursor_type.name, record_count = "ALL", rows = row_count))
+
+    connection.disconnect()
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Measure per call overhead of Database Connector.")
+    parser.add_argument("--output", help = "JSON file to write results to, stdout if not given.")
+    parser.add_argument("--max-rows", type = int, default = ROW_COUNTS[-1])
+    parser.add_argument("--min-time", type = float, default = 0.2)
+    parser.add_argument("--repeat", type = int, default = 3)
+    arguments = parser.parse_args()
+
+    report = {"benchmark": "overhead",
+              "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+              "python": platform.python_version(),
+              "implementation": platform.python_implementation(),
+              "platform": platform.platform(),
+              "results": run(arguments)}
+
+    if arguments.output:
+        with open(arguments.output, "w") as output:
+            json.dump(report, output, indent = 2)
+    else:
+        json.dump(report, sys.stdout, indent = 2)
+        print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+#!/usr/bin/python3.4
+
+"""Measures memory and construction time of Database Connector value objects.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file value_objects.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python script is responsible for comparing slotted QueryResult, MySqlQuery and
+    MySqlConnectionConfig with their earlier property based implementation, which is kept below
+    for reference only.
+
+Working; -
+----------
+    Memory per object is measured with tracemalloc over a large number of live objects.
+    Construction time is measured with timeit for creating an object and setting its attributes
+    the way the execute path does.
+
+Uses; -
+-------
+    python3 benchmarks/value_objects.py [--count 100000]
+
+Reference; -
+------------
+    https://docs.python.org/3/reference/datamodel.html#slots
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import argparse
+import os
+import sys
+import timeit
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT_DIR, "src", "DomainLayer"), os.path.join(ROOT_DIR, "src", "DataAccessLayer", "config_dao")]
+
+from db_connection import QueryResult
+from db_query import MySqlQuery
+from db_query_info import QueryType, RecordCount
+from dc_connection_dao import MySqlConnectionConfig
+
+
+class PropertyQueryResult(object):
+    """ Property based QueryResult, as it was before slots. """
+
+    def __init__(self):
+        self._code      =   None
+        self._message   =   None
+        self._result    =   None
+        self._info      =   None
+
+    @property
+    def code(self):
+        return self._code
+
+    @code.setter
+    def code(self, code):
+        self._code = code
+
+    @property
+    def message(self):
+        return self._message
+
+    @message.setter
+    def message(self, message):
+        self._message = message
+
+    @property
+    def result(self):
+        return self._result
+
+    @result.setter
+    def result(self, result):
+        self._result = result
+
+    @property
+    def info(self):
+        return self._info
+
+    @info.setter
+    def info(self, info):
+        self._info = info
+
+
+class PropertyMySqlQuery(object):
+    """ Property based MySqlQuery, as it was before slots. """
+
+    def __init__(self):
+        self._query_string      =   None
+        self._query_type        =   None
+        self._record_count      =   None
+        self._parameters        =   None
+        self._batch_size        =   None
+        self._cache_ttl         =   None
+        self._result_layout     =   None
+        self._info              =   None
+
+    @property
+    def query_string(self):
+        return self._query_string
+
+    @query_string.setter
+    def query_string(self, query_string):
+        self._query_string = query_string
+
+    @property
+    def query_type(self):
+        return self._query_type
+
+    @query_type.setter
+    def query_type(self, query_type):
+        self._query_type = query_type
+
+    @property
+    def record_count(self):
+        return self._record_count
+
+    @record_count.setter
+    def record_count(self, record_count):
+        self._record_count = record_count
+
+    @property
+    def parameters(self):
+        return self._parameters
+
+    @parameters.setter
+    def parameters(self, parameters):
+        self._parameters = parameters
+
+
+class PropertyMySqlConnectionConfig(object):
+    """ Property based MySqlConnectionConfig, as it was before slots. """
+
+    def __init__(self, database, host, port, name, user, password, pool_min_size = 1, pool_max_size = 10, pool_timeout = 30.0, result_cache_size = 0):
+        self._database          =   database
+        self._host              =   host
+        self._port              =   port
+        self._name              =   name
+        self._user              =   user
+        self._password          =   password
+        self._pool_min_size     =   pool_min_size
+        self._pool_max_size     =   pool_max_size
+        self._pool_timeout      =   pool_timeout
+        self._result_cache_size =   result_cache_size
+
+
+def make_query_result(cls):
+    query_result            =   cls()
+    query_result.code       =   0
+    query_result.message    =   "Success"
+    query_result.result     =   1
+    return query_result
+
+
+def make_query(cls):
+    query                   =   cls()
+    query.query_string      =   "SELECT id FROM user WHERE id = %s"
+    query.query_type        =   QueryType.SELECT
+    query.record_count      =   RecordCount.SINGLE
+    query.parameters        =   (1,)
+    return query
+
+
+def make_config(cls):
+    return cls("MySql", "localhost", "3306", "db", "user", "password")
+
+
+def measure_memory(factory, count):
+    """ Returns bytes allocated per object while count objects are alive. """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    size -= sys.getsizeof(objects)              # List holding the objects is not counted.
+
+    return float(size) / count
+
+
+def measure_time(factory, count):
+    """ Returns construction time of one object in nanoseconds, best of five runs. """
+    return min(timeit.repeat(factory, number = count, repeat = 5)) / count * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Measure memory and construction time of value objects.")
+    parser.add_argument("--count", type = int, default = 100000)
+    arguments = parser.parse_args()
+
+    cases = (("QueryResult", make_query_result, PropertyQueryResult, QueryResult),
+             ("MySqlQuery", make_query, PropertyMySqlQuery, MySqlQuery),
+             ("MySqlConnectionConfig", make_config, PropertyMySqlConnectionConfig, MySqlConnectionConfig))
+
+    print("{:<24}{:>16}{:>16}{:>16}{:>16}".format("Object", "property bytes", "slots bytes", "property ns", "slots ns"))
+
+    for name, make, old_class, new_class in cases:
+        old_factory = lambda: make(old_class)
+        new_factory = lambda: make(new_class)
+
+        print("{:<24}{:>16.1f}{:>16.1f}{:>16.1f}{:>16.1f}".format(name,
+                                                                  measure_memory(old_factory, arguments.count),
+                                                                  measure_memory(new_factory, arguments.count),
+                                                                  measure_time(old_factory, arguments.count),
+                                                                  measure_time(new_factory, arguments.count)))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
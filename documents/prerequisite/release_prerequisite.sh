@@ -8,4 +8,6 @@ echo "**** Installing Python Dev Package ****"
 apt-get --yes --force-yes install python3.5-dev
 echo "**********************************"
 
-# Need to install PIP, pymysql
\ No newline at end of file
+# Need to install PIP, pymysql
+# aiomysql is needed only by clients of asyncio factory (DCFactory.get_async_dc_factory)
+# numpy is needed only for ResultLayout.NUMPY query results
\ No newline at end of file
@@ -65,6 +65,7 @@ Reference; -
 # Date (DD-MM-YY)  |  Author                    |   Change
 # -----------------------------------------------------------------------------
 # 12-02-19            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Connection DAOs are shared in process.
 #
 #                                                                              
 # #############################################################################
@@ -172,6 +173,8 @@ class JsonDCConfigDaoFactory(DCConfigDaoFactory):
 
         This method is responsible for creating Json connection DAO object.
 
+        DAO is shared in process, so configuration is read once.
+
         Args:
             Not Applicable.
         Returns:
@@ -179,7 +182,7 @@ class JsonDCConfigDaoFactory(DCConfigDaoFactory):
         Raises:
             Not Applicable.
         """         
-        return JsonConnectionDao()
+        return JsonConnectionDao.get_shared()
 
 
 class YamlDCConfigDaoFactory(DCConfigDaoFactory):
@@ -205,6 +208,8 @@ class YamlDCConfigDaoFactory(DCConfigDaoFactory):
 
         This method is responsible for creating Yaml connection DAO object.
 
+        DAO is shared in process, so configuration is read once.
+
         Args:
             Not Applicable.
         Returns:
@@ -212,7 +217,7 @@ class YamlDCConfigDaoFactory(DCConfigDaoFactory):
         Raises:
             Not Applicable.
         """         
-        return YamlConnectionDao()
+        return YamlConnectionDao.get_shared()
 
 
 class IniDCConfigDaoFactory(DCConfigDaoFactory):
@@ -238,6 +243,8 @@ class IniDCConfigDaoFactory(DCConfigDaoFactory):
 
         This method is responsible for creating Ini connection DAO object.
 
+        DAO is shared in process, so configuration is read once.
+
         Args:
             Not Applicable.
         Returns:
@@ -245,7 +252,7 @@ class IniDCConfigDaoFactory(DCConfigDaoFactory):
         Raises:
             Not Applicable.
         """         
-        return IniConnectionDao()
+        return IniConnectionDao.get_shared()
 
 
 class XmlDCConfigDaoFactory(DCConfigDaoFactory):
@@ -271,6 +278,8 @@ class XmlDCConfigDaoFactory(DCConfigDaoFactory):
 
         This method is responsible for creating Xml connection DAO object.
 
+        DAO is shared in process, so configuration is read once.
+
         Args:
             Not Applicable.
         Returns:
@@ -278,7 +287,7 @@ class XmlDCConfigDaoFactory(DCConfigDaoFactory):
         Raises:
             Not Applicable.
         """         
-        return XmlConnectionDao()
+        return XmlConnectionDao.get_shared()
 
 
 class TextDCConfigDaoFactory(DCConfigDaoFactory):
@@ -304,6 +313,8 @@ class TextDCConfigDaoFactory(DCConfigDaoFactory):
 
         This method is responsible for creating Text connection DAO object.
 
+        DAO is shared in process, so configuration is read once.
+
         Args:
             Not Applicable.
         Returns:
@@ -311,4 +322,4 @@ class TextDCConfigDaoFactory(DCConfigDaoFactory):
         Raises:
             Not Applicable.
         """         
-        return TextConnectionDao()
\ No newline at end of file
+        return TextConnectionDao.get_shared()
\ No newline at end of file
@@ -78,6 +78,16 @@ Reference; -
 # Date (DD-MM-YY)  |  Author                    |   Change
 # -----------------------------------------------------------------------------
 # 14-02-19            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Added connection pool configuration.
+# 18-10-26            Dilip Kumar Sharma            Added result cache size configuration.
+# 18-10-26            Dilip Kumar Sharma            Configuration is read once per process by shared DAOs.
+# 18-10-26            Dilip Kumar Sharma            Connection configurations are slotted classes.
+# 18-10-26            Dilip Kumar Sharma            Added retry configuration.
+# 18-10-26            Dilip Kumar Sharma            Added read replica configuration.
+# 18-10-26            Dilip Kumar Sharma            Added pool liveness and lifetime configuration.
+# 18-10-26            Dilip Kumar Sharma            Added Oracle fetch and statement cache configuration.
+# 18-10-26            Dilip Kumar Sharma            Added LOAD DATA LOCAL INFILE configuration.
+# 18-10-26            Dilip Kumar Sharma            Added slow query log configuration.
 #
 #                                                                              
 # #############################################################################
@@ -86,14 +96,15 @@ Reference; -
 import abc
 import json
 import os
+import threading
 # TO DO : Need to import package for parsing Yaml, INI, XML Configuration
 
 
-class MySqlConnectionConfig:
-    """ Class MySqlConnectionConfig is the transfer object for MySql database connection configuration.
-    
-    This transfer object represents the connection information fetched from configuration file.
-    
+class ReplicaConfig:
+    """ Class ReplicaConfig is the transfer object for read replica of MySql database.
+
+    Name, user and password of replica are same as of primary database.
+
     Args:
         Not Applicable.
     Returns:
@@ -102,61 +113,84 @@ class MySqlConnectionConfig:
         Not Applicable.
     """
 
-    def __init__(self, database, host, port, name, user, password):
-        self._database  =   database
-        self._host      =   host
-        self._port      =   port
-        self._name      =   name
-        self._user      =   user
-        self._password  =   password               
-
-    @property
-    def database(self):       
-        return self._database
-    
-    @database.setter
-    def database(self, database):
-        self._database = database 
+    DEF_WEIGHT  =   1
 
-    @property
-    def host(self):       
-        return self._host
-    
-    @host.setter
-    def host(self, host):
-        self._host = host 
+    __slots__ = ("host", "port", "weight")
 
-    @property
-    def port(self):       
-        return self._port
-    
-    @port.setter
-    def port(self, port):
-        self._port = port 
+    def __init__(self, host, port, weight = DEF_WEIGHT):
+        self.host               =   host
+        self.port               =   port
+        self.weight             =   weight          # Relative share of SELECT queries sent to replica.
 
-    @property
-    def name(self):       
-        return self._name
-    
-    @name.setter
-    def name(self, name):
-        self._name = name 
 
-    @property
-    def user(self):       
-        return self._user
+class MySqlConnectionConfig:
+    """ Class MySqlConnectionConfig is the transfer object for MySql database connection configuration.
     
-    @user.setter
-    def user(self, user):
-        self._user = user 
-
-    @property
-    def password(self):       
-        return self._password
+    This transfer object represents the connection information fetched from configuration file.
     
-    @password.setter
-    def password(self, password):
-        self._password = password
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    DEF_POOL_MIN_SIZE   =   1
+    DEF_POOL_MAX_SIZE   =   10
+    DEF_POOL_TIMEOUT    =   30.0
+    DEF_RESULT_CACHE    =   0                   # Result cache size in bytes, 0 to disable result cache.
+    DEF_RETRY_COUNT     =   3                   # Retries of connection and SELECT query on transient error, 0 to not retry.
+    DEF_RETRY_DELAY     =   0.05                # Backoff delay limit of first retry in seconds.
+    DEF_RETRY_MAX_DELAY =   2.0                 # Backoff delay limit of any retry in seconds.
+    DEF_REPLICA_MAX_LAG =   5.0                 # Replica lagging by more seconds is not read from.
+    DEF_STICKY_TIME     =   2.0                 # Seconds after a write for which SELECT of that connection is sent to primary.
+    DEF_POOL_IDLE_LIMIT =   5.0                 # Pooled connection idle for more seconds is pinged before it is handed out.
+    DEF_POOL_KEEPALIVE  =   60.0                # Pooled connection idle for more seconds is pinged in background, 0 to not keep alive.
+    DEF_POOL_LIFETIME   =   1800.0              # Pooled connection is reopened after these many seconds, 0 to keep it open.
+    DEF_POOL_JITTER     =   0.1                 # Fraction by which lifetime of each pooled connection is randomly shortened.
+    DEF_LOCAL_INFILE    =   False               # True to allow LOAD DATA LOCAL INFILE of bulk load.
+    DEF_SLOW_QUERY_LOG  =   ""                  # Path of slow query log file, empty to not log slow queries.
+    DEF_SLOW_THRESHOLD  =   1.0                 # Query taking more seconds is logged.
+    DEF_SLOW_SAMPLE     =   0.0                 # Fraction of faster queries logged as samples.
+    DEF_EXPLAIN_LIMIT   =   5.0                 # SELECT query taking more seconds is logged with its EXPLAIN, 0 to not explain.
+
+    __slots__ = ("database", "host", "port", "name", "user", "password", "pool_min_size", "pool_max_size", "pool_timeout", "result_cache_size",
+                 "retry_count", "retry_delay", "retry_max_delay", "replicas", "replica_max_lag", "sticky_time",
+                 "pool_idle_threshold", "pool_keepalive", "pool_max_lifetime", "pool_lifetime_jitter", "local_infile",
+                 "slow_query_log", "slow_query_threshold", "slow_query_sample_rate", "explain_threshold")
+
+    def __init__(self, database, host, port, name, user, password, pool_min_size = DEF_POOL_MIN_SIZE, pool_max_size = DEF_POOL_MAX_SIZE, pool_timeout = DEF_POOL_TIMEOUT,
+                 result_cache_size = DEF_RESULT_CACHE, retry_count = DEF_RETRY_COUNT, retry_delay = DEF_RETRY_DELAY, retry_max_delay = DEF_RETRY_MAX_DELAY,
+                 replicas = (), replica_max_lag = DEF_REPLICA_MAX_LAG, sticky_time = DEF_STICKY_TIME,
+                 pool_idle_threshold = DEF_POOL_IDLE_LIMIT, pool_keepalive = DEF_POOL_KEEPALIVE, pool_max_lifetime = DEF_POOL_LIFETIME,
+                 pool_lifetime_jitter = DEF_POOL_JITTER, local_infile = DEF_LOCAL_INFILE, slow_query_log = DEF_SLOW_QUERY_LOG,
+                 slow_query_threshold = DEF_SLOW_THRESHOLD, slow_query_sample_rate = DEF_SLOW_SAMPLE, explain_threshold = DEF_EXPLAIN_LIMIT):
+        self.database           =   database
+        self.host               =   host
+        self.port               =   port
+        self.name               =   name
+        self.user               =   user
+        self.password           =   password
+        self.pool_min_size      =   pool_min_size
+        self.pool_max_size      =   pool_max_size
+        self.pool_timeout       =   pool_timeout
+        self.result_cache_size  =   result_cache_size
+        self.retry_count        =   retry_count
+        self.retry_delay        =   retry_delay
+        self.retry_max_delay    =   retry_max_delay
+        self.replicas           =   tuple(replicas)     # ReplicaConfig objects, empty to send all queries to primary.
+        self.replica_max_lag    =   replica_max_lag
+        self.sticky_time        =   sticky_time
+        self.pool_idle_threshold =  pool_idle_threshold
+        self.pool_keepalive     =   pool_keepalive
+        self.pool_max_lifetime  =   pool_max_lifetime
+        self.pool_lifetime_jitter = pool_lifetime_jitter
+        self.local_infile       =   local_infile
+        self.slow_query_log     =   slow_query_log
+        self.slow_query_threshold = slow_query_threshold
+        self.slow_query_sample_rate = slow_query_sample_rate
+        self.explain_threshold  =   explain_threshold
 
 
 class OracleConnectionConfig:
@@ -172,70 +206,24 @@ class OracleConnectionConfig:
         Not Applicable.
     """
 
-    def __init__(self, database, host, port, service_name, name, user, password):
-        self._database      =   database
-        self._host          =   host
-        self._port          =   port
-        self._service_name  =   service_name
-        self._name          =   name
-        self._user          =   user
-        self._password      =   password               
-
-    @property
-    def database(self):       
-        return self._database
-    
-    @database.setter
-    def database(self, database):
-        self._database = database 
-
-    @property
-    def host(self):       
-        return self._host
-    
-    @host.setter
-    def host(self, host):
-        self._host = host 
+    DEF_ARRAY_SIZE      =   100                 # Rows fetched per round trip by fetchmany() and fetchall().
+    DEF_PREFETCH_ROWS   =   2                   # Rows returned with execute() round trip of a query.
+    DEF_STMT_CACHE_SIZE =   20                  # Parsed statements kept per connection by the driver.
 
-    @property
-    def port(self):       
-        return self._port
-    
-    @port.setter
-    def port(self, port):
-        self._port = port 
+    __slots__ = ("database", "host", "port", "service_name", "name", "user", "password", "arraysize", "prefetch_rows", "statement_cache_size")
 
-    @property
-    def service_name(self):       
-        return self._service_name
-    
-    @service_name.setter
-    def service_name(self, service_name):
-        self._service_name = service_name 
-
-    @property
-    def name(self):       
-        return self._name
-    
-    @name.setter
-    def name(self, name):
-        self._name = name 
-
-    @property
-    def user(self):       
-        return self._user
-    
-    @user.setter
-    def user(self, user):
-        self._user = user 
-
-    @property
-    def password(self):       
-        return self._password
-    
-    @password.setter
-    def password(self, password):
-        self._password = password
+    def __init__(self, database, host, port, service_name, name, user, password, arraysize = DEF_ARRAY_SIZE, prefetch_rows = DEF_PREFETCH_ROWS,
+                 statement_cache_size = DEF_STMT_CACHE_SIZE):
+        self.database           =   database
+        self.host               =   host
+        self.port               =   port
+        self.service_name       =   service_name
+        self.name               =   name
+        self.user               =   user
+        self.password           =   password
+        self.arraysize          =   arraysize
+        self.prefetch_rows      =   prefetch_rows
+        self.statement_cache_size = statement_cache_size
 
 
 class ConnectionDao:
@@ -251,6 +239,10 @@ class ConnectionDao:
     __metaclass__ = abc.ABCMeta
 
     CONN_CFG_ENV_VAR      =   "DC_CONN_CFG"
+    CONN_CFG_DEF_PATH     =   None
+
+    _shared_daos          =   {}                    # DAO shared in process, keyed by DAO class and configuration file path.
+    _shared_daos_lock     =   threading.Lock()
 
     def __init__(self):
         pass
@@ -258,6 +250,46 @@ class ConnectionDao:
     def read_env(self):
         return os.getenv(ConnectionDao.CONN_CFG_ENV_VAR, None)        # Returns None if key does not exist
 
+    @classmethod
+    def get_shared(cls):
+        """ Returns DAO shared in process for configuration file path.
+
+        Configuration file is read once, when shared DAO is created.
+
+        Args:
+            Not Applicable.
+        Returns:
+            ConnectionDao: Shared DAO of this class.
+        Raises:
+            ValueError: If configuration file path is invalid.
+        """
+        key = (cls, os.getenv(ConnectionDao.CONN_CFG_ENV_VAR, None) or cls.CONN_CFG_DEF_PATH)
+        dao = ConnectionDao._shared_daos.get(key)
+
+        if dao is None:
+            with ConnectionDao._shared_daos_lock:
+                dao = ConnectionDao._shared_daos.get(key)
+
+                if dao is None:
+                    dao = cls()
+                    ConnectionDao._shared_daos[key] = dao
+
+        return dao
+
+    @classmethod
+    def clear_shared(cls):
+        """ To drop shared DAOs, so that configuration is read again on next request.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        with ConnectionDao._shared_daos_lock:
+            ConnectionDao._shared_daos.clear()
+
     @abc.abstractmethod
     def get_file_path(self):
         raise NotImplementedError("Abstract method 'get_file_path' needs implementation.")
@@ -294,6 +326,8 @@ class JsonConnectionDao(ConnectionDao):
 
     def __init__(self):
         self.json_data = None
+        self.mysql_config = None            # Transfer objects are built once and shared by all the clients of this DAO.
+        self.oracle_config = None
         self.read_configuration()     
 
     def get_file_path(self):
@@ -338,6 +372,21 @@ class JsonConnectionDao(ConnectionDao):
     def get_mysql_connection_config(self):
         """ Returns MySql Json connection configuration data.
 
+        Args:
+            Not Applicable.
+        Returns:
+            MySqlConnectionConfig: Transfer Object representing Json connection information.
+        Raises:
+            Not Applicable.
+        """
+        if self.mysql_config is None:
+            self.mysql_config = self.read_mysql_connection_config()
+
+        return self.mysql_config
+
+    def read_mysql_connection_config(self):
+        """ Reads MySql Json connection configuration data.
+
         Args:
             Not Applicable.
         Returns:
@@ -354,11 +403,51 @@ class JsonConnectionDao(ConnectionDao):
         user        =       mysql_data["User"]
         password    =       mysql_data["Password"]
 
-        return MySqlConnectionConfig(database, host, port, name, user, password)
+        pool_min_size   =   int(mysql_data.get("PoolMinSize", MySqlConnectionConfig.DEF_POOL_MIN_SIZE))
+        pool_max_size   =   int(mysql_data.get("PoolMaxSize", MySqlConnectionConfig.DEF_POOL_MAX_SIZE))
+        pool_timeout    =   float(mysql_data.get("PoolTimeout", MySqlConnectionConfig.DEF_POOL_TIMEOUT))
+        result_cache    =   int(mysql_data.get("ResultCacheSize", MySqlConnectionConfig.DEF_RESULT_CACHE))
+        retry_count     =   int(mysql_data.get("RetryCount", MySqlConnectionConfig.DEF_RETRY_COUNT))
+        retry_delay     =   float(mysql_data.get("RetryDelay", MySqlConnectionConfig.DEF_RETRY_DELAY))
+        retry_max_delay =   float(mysql_data.get("RetryMaxDelay", MySqlConnectionConfig.DEF_RETRY_MAX_DELAY))
+        replica_max_lag =   float(mysql_data.get("ReplicaMaxLag", MySqlConnectionConfig.DEF_REPLICA_MAX_LAG))
+        sticky_time     =   float(mysql_data.get("StickyTime", MySqlConnectionConfig.DEF_STICKY_TIME))
+        idle_threshold  =   float(mysql_data.get("PoolIdleThreshold", MySqlConnectionConfig.DEF_POOL_IDLE_LIMIT))
+        keepalive       =   float(mysql_data.get("PoolKeepalive", MySqlConnectionConfig.DEF_POOL_KEEPALIVE))
+        max_lifetime    =   float(mysql_data.get("PoolMaxLifetime", MySqlConnectionConfig.DEF_POOL_LIFETIME))
+        lifetime_jitter =   float(mysql_data.get("PoolLifetimeJitter", MySqlConnectionConfig.DEF_POOL_JITTER))
+        local_infile    =   str(mysql_data.get("LocalInfile", MySqlConnectionConfig.DEF_LOCAL_INFILE)).lower() in ("true", "1", "yes")
+        slow_query_log  =   mysql_data.get("SlowQueryLog", MySqlConnectionConfig.DEF_SLOW_QUERY_LOG)
+        slow_threshold  =   float(mysql_data.get("SlowQueryThreshold", MySqlConnectionConfig.DEF_SLOW_THRESHOLD))
+        slow_sample     =   float(mysql_data.get("SlowQuerySampleRate", MySqlConnectionConfig.DEF_SLOW_SAMPLE))
+        explain_limit   =   float(mysql_data.get("ExplainThreshold", MySqlConnectionConfig.DEF_EXPLAIN_LIMIT))
+
+        replicas        =   [ReplicaConfig(replica_data["Host"], replica_data.get("Port", port), int(replica_data.get("Weight", ReplicaConfig.DEF_WEIGHT)))
+                             for replica_data in mysql_data.get("Replicas", [])]
+
+        return MySqlConnectionConfig(database, host, port, name, user, password, pool_min_size, pool_max_size, pool_timeout, result_cache,
+                                     retry_count, retry_delay, retry_max_delay, replicas, replica_max_lag, sticky_time,
+                                     idle_threshold, keepalive, max_lifetime, lifetime_jitter, local_infile,
+                                     slow_query_log, slow_threshold, slow_sample, explain_limit)
 
     def get_oracle_connection_config(self):
         """ Returns Oracle Json connection configuration data.
 
+        Args:
+            Not Applicable.
+        Returns:
+            OracleConnectionConfig: Transfer Object representing Oracle Json connection information.
+        Raises:
+            Not Applicable.
+        """
+        if self.oracle_config is None:
+            self.oracle_config = self.read_oracle_connection_config()
+
+        return self.oracle_config
+
+    def read_oracle_connection_config(self):
+        """ Reads Oracle Json connection configuration data.
+
         Args:
             Not Applicable.
         Returns:
@@ -376,7 +465,11 @@ class JsonConnectionDao(ConnectionDao):
         user            =       oracle_data["User"]
         password        =       oracle_data["Password"]
 
-        return OracleConnectionConfig(database, host, port, service_name, name, user, password)
+        arraysize       =       int(oracle_data.get("ArraySize", OracleConnectionConfig.DEF_ARRAY_SIZE))
+        prefetch_rows   =       int(oracle_data.get("PrefetchRows", OracleConnectionConfig.DEF_PREFETCH_ROWS))
+        stmt_cache_size =       int(oracle_data.get("StatementCacheSize", OracleConnectionConfig.DEF_STMT_CACHE_SIZE))
+
+        return OracleConnectionConfig(database, host, port, service_name, name, user, password, arraysize, prefetch_rows, stmt_cache_size)
 
 
 class YamlConnectionDao(ConnectionDao):
@@ -0,0 +1,595 @@
+#!/usr/bin/python3.5
+
+"""Provides asyncio database connection functionlity.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_async_connection.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for providing non blocking database connection functionlity
+    for clients running on asyncio event loop.
+
+Design Pattern; -
+-----------------
+    This is implemented as a part of Abstract factory design pattern.
+
+Working; -
+----------
+    This python module provides coroutines to connect to database, execute query and disconnect
+    from database. Driver connections are borrowed from AsyncConnectionPool, which bounds the number
+    of open connections while any number of queries wait for a free connection without blocking the
+    event loop.
+
+    MySql connection uses aiomysql driver, which needs to be installed for async factory only.
+
+Uses; -
+-------
+    This will be used by any asyncio client who wishes to communicate with database.
+
+Reference; -
+------------
+
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            aiomysql is imported on first use.
+# 18-10-26            Dilip Kumar Sharma            Errors are classified by table.
+# 18-10-26            Dilip Kumar Sharma            Many fetches batch size records, added BATCHES of adaptive size.
+# 18-10-26            Dilip Kumar Sharma            RAW and LAZY cursor types are rejected.
+# 18-10-26            Dilip Kumar Sharma            Connection not borrowed from pool is ignored on release and discard.
+#
+#
+# #############################################################################
+
+
+import abc
+import asyncio
+import time
+from db_batch_size import BatchSizer
+from db_connection import QueryResult
+from db_connection_pool import PoolTimeoutError, PoolClosedError
+from db_error import ErrorClassifier, MYSQL_ERROR_CATEGORIES
+from db_lazy_import import lazy_import
+from db_query_info import QueryType, CursorType, RecordCount
+from db_statement_cache import StatementCache
+
+aiomysql = lazy_import("aiomysql")      # Driver is loaded on first connect().
+
+
+class AsyncConnectionPool(object):
+    """ Class AsyncConnectionPool represents asyncio pool of driver connections.
+
+    Pool must be used from one event loop only.
+
+    Args:
+        creator: Coroutine function which opens and returns a new driver connection.
+        reset: Coroutine function which resets a returned driver connection. It may raise to discard the connection.
+        close: Callable which closes a driver connection.
+        min_size: Number of connections opened on first borrow and kept open.
+        max_size: Maximum number of connections opened at any time.
+        timeout: Seconds to wait for a free connection when pool is exhausted.
+    Returns:
+        Not Applicable.
+    Raises:
+        ValueError: If pool sizes are invalid.
+    """
+
+    def __init__(self, creator, reset = None, close = None, min_size = 1, max_size = 10, timeout = 30.0):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Invalid connection pool size, min '{}' max '{}'.".format(min_size, max_size))
+
+        self._creator       =   creator
+        self._reset         =   reset
+        self._close         =   close
+        self._min_size      =   min_size
+        self._max_size      =   max_size
+        self._timeout       =   timeout
+        self._idle          =   []                      # Idle driver connections, most recently released at end.
+        self._borrowed      =   set()                   # Borrowed driver connections.
+        self._slots         =   None                    # Semaphore of max_size, created on first borrow inside event loop.
+        self._size          =   0
+        self._is_closed     =   False
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def idle_count(self):
+        return len(self._idle)
+
+    async def acquire(self, timeout = None):
+        """ To borrow a driver connection from pool.
+
+        Args:
+            timeout: Seconds to wait, pool timeout is used if it is None.
+        Returns:
+            connection: Driver connection.
+        Raises:
+            PoolTimeoutError: If no connection is available within timeout.
+            PoolClosedError: If pool is closed.
+        """
+        timeout = self._timeout if timeout is None else timeout
+
+        if self._is_closed:
+            raise PoolClosedError("Connection pool is closed.")
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_size)
+            await self._fill()
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            raise PoolTimeoutError("No free connection in pool within {} seconds.".format(timeout))
+
+        if self._idle:
+            connection = self._idle.pop()
+        else:
+            try:
+                connection = await self._creator()
+            except BaseException:
+                self._slots.release()
+                raise
+
+            self._size += 1
+
+        self._borrowed.add(connection)
+
+        return connection
+
+    async def release(self, connection):
+        """ To return a borrowed driver connection to pool.
+
+        Connection which is not borrowed from pool, e.g. it is already released or discarded, is ignored.
+
+        Args:
+            connection: Driver connection borrowed using acquire().
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        if connection not in self._borrowed:
+            return
+
+        self._borrowed.remove(connection)
+
+        try:
+            if self._reset is not None:
+                await self._reset(connection)
+        except Exception:
+            self._drop(connection)
+            return
+
+        if self._is_closed:
+            self._drop(connection)
+            return
+
+        self._idle.append(connection)
+        self._slots.release()
+
+    def discard(self, connection):
+        """ To close a borrowed driver connection and free its slot in pool.
+
+        Connection which is not borrowed from pool is ignored, as for release().
+
+        Args:
+            connection: Driver connection borrowed using acquire().
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        if connection in self._borrowed:
+            self._borrowed.remove(connection)
+            self._drop(connection)
+
+    def close(self):
+        """ To close all idle connections, borrowed connections are closed on release.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        self._is_closed = True
+
+        while self._idle:
+            self._close_connection(self._idle.pop())
+            self._size -= 1
+
+    async def _fill(self):
+        for _ in range(self._min_size):
+            await self._slots.acquire()             # Slots are held while opening, so pool never exceeds max_size.
+
+        try:
+            results = await asyncio.gather(*[self._creator() for _ in range(self._min_size)], return_exceptions = True)
+        finally:
+            for _ in range(self._min_size):
+                self._slots.release()
+
+        for connection in results:
+            if not isinstance(connection, BaseException):   # Failure is reported by acquire() when it opens its own connection.
+                self._idle.append(connection)
+                self._size += 1
+
+    def _drop(self, connection):
+        """ To close connection taken out of pool and free its slot. """
+        self._close_connection(connection)
+        self._size -= 1
+        self._slots.release()
+
+    def _close_connection(self, connection):
+        try:
+            if self._close is not None:
+                self._close(connection)
+        except Exception:
+            pass                        # Connection is already unusable.
+
+
+class AsyncRecordStream(object):
+    """ Class AsyncRecordStream is the async iterator of records read from unbuffered cursor.
+
+    Cursor is closed when all the records are read or aclose() is awaited.
+
+    Args:
+        cursor: Unbuffered aiomysql cursor on which query is executed.
+        batch_size: Number of records per batch, None to iterate records one by one.
+        sizer: BatchSizer giving size of each batch, None to use batch_size.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    def __init__(self, cursor, batch_size = None, sizer = None):
+        self._cursor        =   cursor
+        self._batch_size    =   batch_size
+        self._sizer         =   sizer
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._cursor is None:
+            raise StopAsyncIteration
+
+        is_batch = self._sizer is not None or bool(self._batch_size)
+
+        try:
+            if self._sizer is not None:
+                started = time.monotonic()
+                record = await self._cursor.fetchmany(self._sizer.size)
+                self._sizer.update(record, time.monotonic() - started)
+            elif self._batch_size:
+                record = await self._cursor.fetchmany(self._batch_size)
+            else:
+                record = await self._cursor.fetchone()
+        except BaseException:
+            await self.aclose()
+            raise
+
+        if record is None or (is_batch and not record):
+            await self.aclose()
+            raise StopAsyncIteration
+
+        return record
+
+    async def aclose(self):
+        if self._cursor is not None:
+            cursor, self._cursor = self._cursor, None
+            await cursor.close()
+
+
+class AsyncDBConnection(object):
+    """ Abstract class AsyncDBConnection is base class for specific asyncio DBConnection.
+
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+    __metaclass__ = abc.ABCMeta
+
+    def __init__(self, database_config):
+        self.database_config = database_config
+
+    @abc.abstractmethod
+    async def connect(self):
+        raise NotImplementedError("Abstract method 'connect' needs implementation.")
+
+    @abc.abstractmethod
+    async def execute(self, query, is_commit = False):
+        raise NotImplementedError("Abstract method 'execute' needs implementation.")
+
+    @abc.abstractmethod
+    async def commit(self):
+        raise NotImplementedError("Abstract method 'commit' needs implementation.")
+
+    @abc.abstractmethod
+    async def disconnect(self):
+        raise NotImplementedError("Abstract method 'disconnect' needs implementation.")
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.disconnect()
+
+
+class AsyncMySqlDBConnection(AsyncDBConnection):
+    """ Class AsyncMySqlDBConnection is the specific asyncio DAO class for MySql Database connection.
+
+    Driver connection is borrowed from pool on connect() and returned on disconnect(),
+    or opened and closed directly if there is no pool.
+
+    Args:
+        database_config: MySqlConnectionConfig object.
+        pool: AsyncConnectionPool object of aiomysql connections, or None.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    STATEMENT_CACHE_SIZE    =   StatementCache.DEF_MAX_SIZE
+    ERROR_CLASSIFIER        =   ErrorClassifier(aiomysql, MYSQL_ERROR_CATEGORIES)
+
+    def __init__(self, database_config, pool = None):
+        super(AsyncMySqlDBConnection, self).__init__(database_config)
+        self._pool          =   pool
+        self._connection    =   None
+        self._cursor        =   None
+        self._cursor_type   =   None
+
+    @property
+    def pool(self):
+        return self._pool
+
+    @property
+    def connection(self):
+        return self._connection
+
+    @connection.setter
+    def connection(self, connection):
+        self._connection = connection
+
+    @property
+    def cursor(self):
+        return self._cursor
+
+    @cursor.setter
+    def cursor(self, cursor):
+        self._cursor = cursor
+
+    @property
+    def cursor_type(self):
+        return self._cursor_type
+
+    @cursor_type.setter
+    def cursor_type(self, cursor_type):
+        self._cursor_type = cursor_type
+
+    @staticmethod
+    async def create_connection(database_config):
+        """ To create aiomysql connection to MySql database.
+
+        Args:
+            database_config: MySqlConnectionConfig object.
+        Returns:
+            connection: aiomysql connection object.
+        Raises:
+            aiomysql.Error: If connection could not be opened.
+        """
+        return await aiomysql.connect(host = database_config.host, port = int(database_config.port), user = database_config.user,
+                                      password = database_config.password, db = database_config.name)
+
+    @staticmethod
+    async def reset_connection(connection):
+        """ To reset aiomysql connection before it is reused by another client.
+
+        Args:
+            connection: aiomysql connection object.
+        Returns:
+            Not Applicable.
+        Raises:
+            aiomysql.Error: If connection is not usable anymore.
+        """
+        if connection.closed:
+            raise aiomysql.InterfaceError(0, "Connection is closed.")
+
+        await connection.rollback()
+
+    @staticmethod
+    def close_connection(connection):
+        """ To close aiomysql connection.
+
+        Args:
+            connection: aiomysql connection object.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        connection.close()
+
+    async def connect(self):
+        """ To connect to MySql database.
+
+        Args:
+            Not Applicable.
+        Returns:
+            QueryResult: Object representing connection result.
+        Raises:
+            Not Applicable.
+        """
+        query_result = QueryResult()
+
+        try:
+            await self.disconnect()
+
+            if self.pool is None:
+                self.connection = await self.create_connection(self.database_config)
+            else:
+                self.connection = await self.pool.acquire()
+        except Exception as error:
+            self.ERROR_CLASSIFIER.set_result(query_result, error)
+        else:
+            query_result.code       =       0               # Successfull
+            query_result.message    =       "Database connection successful."
+
+        return query_result
+
+    async def set_cursor(self, cursor_type):
+        """ To set cursor for MySql database.
+
+        Args:
+            cursor_type: Type of cursor, e.g. Dictionary Cursor
+        Returns:
+            QueryResult: Object representing cursor creation result.
+        Raises:
+            Not Applicable.
+        """
+        query_result = QueryResult()
+
+        try:
+            if cursor_type in (CursorType.RAW, CursorType.LAZY):
+                raise ValueError("Cursor type '{}' is not supported for asyncio connection.".format(cursor_type.name))
+
+            if cursor_type == CursorType.DICTIONARY:
+                self.cursor = await self.connection.cursor(aiomysql.DictCursor)
+            else:
+                self.cursor = await self.connection.cursor()
+
+            self.cursor_type = cursor_type
+        except Exception as error:
+            self.ERROR_CLASSIFIER.set_result(query_result, error)
+        else:
+            query_result.code       =       0               # Successfull
+            query_result.message    =       "Cursor created successfully."
+
+        return query_result
+
+    async def execute(self, query, is_commit = False):
+        """ To execute query in MySql database.
+
+        For RecordCount.STREAM, query runs on a separate unbuffered cursor and result is an
+        AsyncRecordStream of records, or of lists of query.batch_size records.
+
+        For RecordCount.BATCHES, result is an AsyncRecordStream of lists of records, whose size adapts
+        to record width and fetch latency if query.batch_bytes is set.
+
+        Args:
+            query: MySqlQuery object representing query attributes.
+            is_commit: True to commit the records.
+        Returns:
+            QueryResult: Object representing query result.
+        Raises:
+            Not Applicable.
+        """
+        query_result = QueryResult()
+        cursor = self.cursor
+        sizer = None
+
+        try:
+            if query.query_type == QueryType.SELECT and query.record_count in (RecordCount.STREAM, RecordCount.BATCHES):
+                if query.record_count == RecordCount.BATCHES:
+                    sizer = BatchSizer.from_query(query)
+                cursor = await self.connection.cursor(aiomysql.SSDictCursor if self.cursor_type == CursorType.DICTIONARY else aiomysql.SSCursor)
+
+            await cursor.execute(self.get_query_string(query))
+
+            if query.query_type == QueryType.SELECT:
+                if query.record_count == RecordCount.SINGLE:
+                    query_result.result = await cursor.fetchone()
+                elif query.record_count == RecordCount.Many:
+                    query_result.result = await cursor.fetchmany(query.batch_size or BatchSizer.DEF_BATCH_SIZE)
+                elif query.record_count == RecordCount.ALL:
+                    query_result.result = await cursor.fetchall()
+                elif query.record_count == RecordCount.STREAM:
+                    query_result.result = AsyncRecordStream(cursor, query.batch_size)
+                elif query.record_count == RecordCount.BATCHES:
+                    query_result.result = AsyncRecordStream(cursor, sizer = sizer)
+            elif is_commit:
+                await self.connection.commit()
+        except Exception as error:
+            self.ERROR_CLASSIFIER.set_result(query_result, error)
+        else:
+            query_result.code       =       0               # Successfull
+            query_result.message    =       "Query execution successful."
+
+        if cursor is not self.cursor and query_result.result is None:
+            await cursor.close()            # Streaming query failed.
+
+        return query_result
+
+    def get_query_string(self, query):
+        """ Returns executable query string with bind parameters escaped into it.
+
+        Args:
+            query: MySqlQuery object representing query attributes.
+        Returns:
+            str: Query string to be sent to MySql database.
+        Raises:
+            ValueError: If parameters do not match the placeholders of query string.
+        """
+        if query.parameters is None:
+            return query.query_string
+
+        statement = StatementCache.for_connection(self.connection, self.STATEMENT_CACHE_SIZE).get(query.query_string)
+
+        return statement.bind(query.parameters, self.connection.escape)
+
+    async def commit(self):
+        """ To commit recrods in MySql database.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        await self.connection.commit()
+
+    async def disconnect(self):
+        """ To disconnect from MySql database, connection is returned to pool if there is one.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        if self.cursor is not None:
+            cursor, self.cursor = self.cursor, None
+            try:
+                await cursor.close()
+            except Exception:
+                pass                        # Connection is checked by pool on release.
+
+        if self.connection is not None:
+            connection, self.connection = self.connection, None
+
+            if self.pool is None:
+                self.close_connection(connection)
+            else:
+                await self.pool.release(connection)
@@ -0,0 +1,141 @@
+#!/usr/bin/python3.4
+
+"""Provides batch sizing of fetched records.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_batch_size.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for deciding how many records are fetched per batch, when
+    the result of a SELECT query is read in batches.
+
+Working; -
+----------
+    Batch size is fixed unless target bytes per batch is given. Then, after each batch, size of
+    next batch is worked out from the record width observed so far, so that a batch of narrow
+    records has many rows and a batch of wide records has few.
+
+    If fetching a batch takes longer than target latency, next batch is made smaller in the ratio
+    of the two, so that caller gets records without long pauses even on a slow network.
+
+    Batch size changes at most by half or double per batch, and stays within min and max size.
+
+Uses; -
+-------
+    This will be used by database connections to fetch RecordCount.BATCHES results.
+
+        sizer = BatchSizer(1000, target_bytes = 1024 * 1024)
+        records = cursor.fetchmany(sizer.size)
+        sizer.update(records, elapsed)
+
+Reference; -
+------------
+
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import sys
+from db_result_cache import QueryResultCache
+
+
+class BatchSizer(object):
+    """ Class BatchSizer represents size of next batch of records to fetch.
+
+    Args:
+        batch_size: Size of first batch, None for default size.
+        target_bytes: Target size in bytes of a batch, None to keep batch size fixed.
+        target_latency: Target seconds to fetch a batch, None to not limit batch by latency.
+        min_size: Minimum number of records per batch.
+        max_size: Maximum number of records per batch.
+    Returns:
+        Not Applicable.
+    Raises:
+        ValueError: If any of the values is not positive, or min size is more than max size.
+    """
+
+    DEF_BATCH_SIZE      =   1000
+    DEF_TARGET_LATENCY  =   0.1
+    DEF_MIN_SIZE        =   1
+    DEF_MAX_SIZE        =   100000
+    SAMPLE_SIZE         =   32              # Records of a batch measured for record width.
+    MAX_STEP            =   2               # Batch size grows or shrinks at most by this factor per batch.
+
+    def __init__(self, batch_size = None, target_bytes = None, target_latency = DEF_TARGET_LATENCY,
+                 min_size = DEF_MIN_SIZE, max_size = DEF_MAX_SIZE):
+        batch_size = batch_size or self.DEF_BATCH_SIZE
+
+        if batch_size < 1 or min_size < 1 or min_size > max_size or (target_bytes is not None and target_bytes <= 0) or \
+                (target_latency is not None and target_latency <= 0):
+            raise ValueError("Invalid batch size '{}, {}, {}, {}, {}'.".format(batch_size, target_bytes, target_latency, min_size, max_size))
+
+        self._size              =   min(max(batch_size, min_size), max_size)
+        self._target_bytes      =   target_bytes
+        self._target_latency    =   target_latency
+        self._min_size          =   min_size
+        self._max_size          =   max_size
+        self._record_bytes      =   None            # Moving average of record width.
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def is_adaptive(self):
+        return self._target_bytes is not None
+
+    @property
+    def record_bytes(self):
+        return self._record_bytes
+
+    @classmethod
+    def from_query(cls, query):
+        """ Returns BatchSizer of query's batch size and target bytes per batch. """
+        return cls(query.batch_size, query.batch_bytes)
+
+    def update(self, records, elapsed):
+        """ To work out size of next batch from a fetched batch.
+
+        Args:
+            records: List of records of fetched batch.
+            elapsed: Seconds taken to fetch the batch.
+        Returns:
+            int: Size of next batch.
+        Raises:
+            Not Applicable.
+        """
+        if not self.is_adaptive or not records:
+            return self._size
+
+        sample = records[:self.SAMPLE_SIZE]
+        record_bytes = max(QueryResultCache.estimate_size(sample) - sys.getsizeof(sample), 1) / len(sample)
+
+        if self._record_bytes is None:
+            self._record_bytes = record_bytes
+        else:
+            self._record_bytes = (self._record_bytes + record_bytes) / 2
+
+        size = self._target_bytes / self._record_bytes
+
+        if self._target_latency is not None and elapsed > self._target_latency:
+            size = min(size, len(records) * self._target_latency / elapsed)
+
+        size = min(max(size, self._size / self.MAX_STEP), self._size * self.MAX_STEP)
+        self._size = int(min(max(size, self._min_size), self._max_size))
+
+        return self._size
@@ -0,0 +1,225 @@
+#!/usr/bin/python3.4
+
+"""Provides streaming of rows to LOAD DATA LOCAL INFILE.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_bulk_load.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for turning rows in memory into the data file of a MySql
+    LOAD DATA LOCAL INFILE statement, without writing the file to disk.
+
+Working; -
+----------
+    Driver reads the data file of LOAD DATA LOCAL INFILE by opening its file name. File name given
+    is /dev/fd/N, i.e. read end of a pipe. A writer thread encodes the rows of a chunk and writes
+    them to write end of the pipe while driver sends them to the server from the read end, so only
+    the pipe buffer is held in memory.
+
+    Each row is one line of comma separated fields. Fields are escaped by the connection the same
+    way as bind parameters, i.e. strings and dates are enclosed in single quotes with backslash
+    escapes, numbers are bare and None is NULL, which is what the FIELDS clause of the statement
+    tells the server.
+
+    File-like source is read as CSV, one row per record, with an optional field value standing
+    for NULL.
+
+Uses; -
+-------
+    This will be used by MySqlDBConnection.load_data() for bulk loading.
+
+Reference; -
+------------
+    https://dev.mysql.com/doc/refman/8.0/en/load-data.html
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import csv
+import io
+import os
+import threading
+
+
+class BulkLoadFormat(object):
+    """ Class BulkLoadFormat represents data file format and statement of LOAD DATA LOCAL INFILE.
+
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    FIELDS_CLAUSE   =   "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\\'' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n'"
+
+    @staticmethod
+    def quote_name(name):
+        return ".".join("`{}`".format(part.replace("`", "``")) for part in name.split("."))
+
+    @classmethod
+    def get_load_clause(cls, table, columns, charset):
+        """ Returns LOAD DATA statement following the file name.
+
+        Args:
+            table: Name of table, may be qualified by database name.
+            columns: Column names of row values, None for all columns of table in order.
+            charset: Character set of data file, i.e. of connection.
+        Returns:
+            str: INTO TABLE, CHARACTER SET, FIELDS and column list clauses.
+        Raises:
+            Not Applicable.
+        """
+        clause = "INTO TABLE {} CHARACTER SET {} {}".format(cls.quote_name(table), charset, cls.FIELDS_CLAUSE)
+
+        if columns:
+            clause += " ({})".format(", ".join(cls.quote_name(column) for column in columns))
+
+        return clause
+
+    @staticmethod
+    def make_encoder(escape, encoding, columns = None):
+        """ Returns function encoding a row to a line of data file.
+
+        Args:
+            escape: Function escaping a value to SQL literal, i.e. escape() of driver connection.
+            encoding: Python encoding of connection character set.
+            columns: Column names to take values of dict row, None if rows are sequences.
+        Returns:
+            function: Takes tuple/list of values, or dict keyed by column name, and returns bytes.
+        Raises:
+            Not Applicable.
+        """
+        def encode(row):
+            if isinstance(row, dict):
+                if not columns:
+                    raise ValueError("Columns are required to load dict rows.")
+                row = [row[column] for column in columns]
+
+            return (",".join([escape(value) for value in row]) + "\n").encode(encoding)
+
+        return encode
+
+    @staticmethod
+    def read_rows(source, null_value = None, encoding = "utf-8"):
+        """ Generator of rows of CSV file-like object.
+
+        Args:
+            source: File-like object of CSV text or bytes.
+            null_value: Field value to be loaded as NULL, None to load every field as string.
+            encoding: Encoding of bytes source.
+        Returns:
+            generator: List of field values for each CSV record.
+        Raises:
+            csv.Error: If CSV is malformed.
+        """
+        is_bytes = isinstance(source.read(0), bytes)
+
+        if is_bytes:
+            source = io.TextIOWrapper(source, encoding = encoding, newline = "")
+
+        try:
+            for row in csv.reader(source):
+                if null_value is not None:
+                    row = [None if value == null_value else value for value in row]
+                yield row
+        finally:
+            if is_bytes:
+                source.detach()             # Caller's file is not closed with wrapper.
+
+    @classmethod
+    def get_rows(cls, source, null_value = None, encoding = "utf-8"):
+        """ Returns iterator of rows of a source, i.e. of iterable of rows or of CSV file-like object. """
+        if hasattr(source, "read"):
+            return cls.read_rows(source, null_value, encoding)
+
+        return iter(source)
+
+
+class LoadDataPipe(object):
+    """ Class LoadDataPipe represents a pipe whose read end is data file of one LOAD DATA statement.
+
+    Writer thread is started at once. It stops when rows are written or read end is closed.
+
+    Args:
+        rows: Iterable of rows of the chunk.
+        encode: Function encoding a row to bytes, returned by BulkLoadFormat.make_encoder().
+    Returns:
+        Not Applicable.
+    Raises:
+        OSError: If pipe could not be created.
+    """
+
+    BUFFER_SIZE     =   256 * 1024
+
+    def __init__(self, rows, encode):
+        self._read_fd, write_fd     =   os.pipe()
+        self._row_count             =   0
+        self._error                 =   None
+        self._writer                =   threading.Thread(target = self._write, args = (write_fd, rows, encode), name = "LoadDataPipe", daemon = True)
+        self._writer.start()
+
+    @property
+    def path(self):
+        return "/dev/fd/{}".format(self._read_fd)
+
+    @property
+    def row_count(self):
+        return self._row_count
+
+    @property
+    def error(self):
+        return self._error
+
+    def close(self):
+        """ To close read end of pipe and wait for writer thread.
+
+        Writer still writing, e.g. because LOAD DATA failed, stops with broken pipe.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Exception: Error raised while reading or encoding rows, None if all rows are written.
+        Raises:
+            Not Applicable.
+        """
+        if self._read_fd is not None:
+            os.close(self._read_fd)
+            self._read_fd = None
+
+        self._writer.join()
+
+        return self._error
+
+    def _write(self, write_fd, rows, encode):
+        file = open(write_fd, "wb", buffering = self.BUFFER_SIZE)
+
+        try:
+            for row in rows:
+                file.write(encode(row))
+                self._row_count += 1
+        except BrokenPipeError:
+            pass                            # Reader has stopped, its error is reported by LOAD DATA.
+        except Exception as error:
+            self._error = error             # Rows written so far end the data file, so chunk must not be committed.
+        finally:
+            try:
+                file.close()
+            except OSError:
+                pass                        # Reader has stopped.
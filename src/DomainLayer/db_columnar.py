@@ -0,0 +1,184 @@
+#!/usr/bin/python3.4
+
+"""Provides columnar query result functionlity.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_columnar.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for building query result column by column, for
+    clients doing analysis on whole columns.
+
+Design Pattern; -
+-----------------
+    This is implemented as Builder design pattern.
+
+Working; -
+----------
+    One buffer is created for each column of cursor description. Numeric columns use typed
+    array.array buffers, other columns use list. Records are added to the buffers as they are
+    fetched, so records are not kept in memory as tuples.
+
+    NULL is stored as zero (or None for list column) and tracked in validity mask of the column,
+    a bytearray with 1 for valid and 0 for NULL value. Mask is created on first NULL of the column.
+
+    NumPy arrays are built over typed buffers without copying, NumPy is imported only if asked for.
+
+Uses; -
+-------
+    This will be used by database connection for ResultLayout.COLUMNAR and ResultLayout.NUMPY.
+
+Reference; -
+------------
+
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import array
+import collections
+
+
+class ColumnarResultBuilder(object):
+    """ Class ColumnarResultBuilder builds mapping of column name to column buffer from records.
+
+    Args:
+        description: Cursor description, sequence of (name, type_code, ...) of each column.
+        typecodes: Dict of cursor type code to array.array typecode, columns of other types use list.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    NULL_VALUES     =   {"q": 0, "Q": 0, "d": 0.0}
+    NUMPY_DTYPES    =   {"q": "int64", "Q": "uint64", "d": "float64"}
+
+    def __init__(self, description, typecodes):
+        self._names         =   [column[0] for column in description]
+        self._columns       =   []
+        self._masks         =   [None] * len(description)
+        self._row_count     =   0
+
+        for column in description:
+            typecode = typecodes.get(column[1])
+            self._columns.append(array.array(typecode) if typecode else [])
+
+    @property
+    def row_count(self):
+        return self._row_count
+
+    def add_records(self, records):
+        """ To add records to column buffers.
+
+        Args:
+            records: Iterable of record tuples in description order.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        columns = self._columns
+
+        for record in records:
+            for index, value in enumerate(record):
+                if value is None:
+                    self.add_null(index)
+                    continue
+
+                try:
+                    columns[index].append(value)
+                except (OverflowError, TypeError):
+                    self.to_list(index)                 # e.g. BIGINT UNSIGNED beyond int64 or non numeric value.
+                    columns[index].append(value)
+
+                mask = self._masks[index]
+                if mask is not None:
+                    mask.append(1)
+
+            self._row_count += 1
+
+    def add_null(self, index):
+        column = self._columns[index]
+
+        if self._masks[index] is None:
+            self._masks[index] = bytearray(b"\x01") * len(column)
+
+        self._masks[index].append(0)
+        column.append(self.NULL_VALUES.get(getattr(column, "typecode", None)))
+
+    def to_list(self, index):
+        self._columns[index] = list(self._columns[index])
+
+    def build(self):
+        """ Returns columns and validity masks.
+
+        Args:
+            Not Applicable.
+        Returns:
+            tuple: OrderedDict of column name to buffer, dict of column name to validity mask or None if column has no NULL.
+        Raises:
+            Not Applicable.
+        """
+        columns = collections.OrderedDict(zip(self._names, self._columns))
+        masks   = dict(zip(self._names, self._masks))
+
+        return columns, masks
+
+    @staticmethod
+    def import_numpy():
+        """ Returns NumPy module, it is imported only when NumPy result is asked for.
+
+        Args:
+            Not Applicable.
+        Returns:
+            module: numpy module.
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        import numpy
+
+        return numpy
+
+    def build_numpy(self):
+        """ Returns columns and validity masks as NumPy arrays.
+
+        Typed buffers are shared with NumPy arrays, list columns become object arrays.
+
+        Args:
+            Not Applicable.
+        Returns:
+            tuple: OrderedDict of column name to ndarray, dict of column name to bool ndarray or None if column has no NULL.
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        numpy = self.import_numpy()
+
+        columns = collections.OrderedDict()
+        masks   = {}
+
+        for name, column, mask in zip(self._names, self._columns, self._masks):
+            if isinstance(column, array.array):
+                columns[name] = numpy.frombuffer(column, dtype = self.NUMPY_DTYPES[column.typecode]) if column else numpy.empty(0, dtype = self.NUMPY_DTYPES[column.typecode])
+            else:
+                columns[name] = numpy.empty(len(column), dtype = object)
+                columns[name][:] = column
+
+            masks[name] = None if mask is None else numpy.frombuffer(mask, dtype = bool)
+
+        return columns, masks
@@ -39,15 +39,59 @@ Reference; -
 # Date (DD-MM-YY)  |  Author                    |   Change
 # -----------------------------------------------------------------------------
 # 15-02-19            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Added pooled MySql connection.
+# 18-10-26            Dilip Kumar Sharma            Added parameterized queries with statement cache.
+# 18-10-26            Dilip Kumar Sharma            Added streaming of records from unbuffered cursor.
+# 18-10-26            Dilip Kumar Sharma            Added execute_many for bulk insert.
+# 18-10-26            Dilip Kumar Sharma            Added SELECT result cache to execute path.
+# 18-10-26            Dilip Kumar Sharma            Added columnar result layout.
+# 18-10-26            Dilip Kumar Sharma            pymysql is imported on first use.
+# 18-10-26            Dilip Kumar Sharma            QueryResult is a slotted class.
+# 18-10-26            Dilip Kumar Sharma            Errors are classified by table, SELECT is retried after reconnect.
+# 18-10-26            Dilip Kumar Sharma            Added instrumentation events of connect, cursor, execute, fetch and commit.
+# 18-10-26            Dilip Kumar Sharma            Added transaction() context manager and rollback.
+# 18-10-26            Dilip Kumar Sharma            Added owner thread check of connection.
+# 18-10-26            Dilip Kumar Sharma            Driver connection uses configured port.
+# 18-10-26            Dilip Kumar Sharma            Added ping of pooled driver connection.
+# 18-10-26            Dilip Kumar Sharma            Implemented OracleDBConnection.
+# 18-10-26            Dilip Kumar Sharma            Many fetches batch size records, added BATCHES of adaptive size.
+# 18-10-26            Dilip Kumar Sharma            Added load_data bulk load by LOAD DATA LOCAL INFILE.
+# 18-10-26            Dilip Kumar Sharma            Added export of SELECT result to CSV, JSON Lines and Arrow file.
+# 18-10-26            Dilip Kumar Sharma            Added RAW and LAZY cursor types of MySql connection.
+# 18-10-26            Dilip Kumar Sharma            Added slow query log to execute path of MySql connection.
+# 18-10-26            Dilip Kumar Sharma            Result cache is not used with uncommitted work, stale result is not cached.
+# 18-10-26            Dilip Kumar Sharma            Failed load_data rolls back uncommitted work outside transaction.
+# 18-10-26            Dilip Kumar Sharma            Added reconnect and lost state of connection to DBConnection.
+# 18-10-26            Dilip Kumar Sharma            Failed fetch of records is reported and retried as failed execution.
+# 18-10-26            Dilip Kumar Sharma            Failed execute_many rolls back uncommitted work outside transaction.
+# 18-10-26            Dilip Kumar Sharma            Failed export marks transaction to be rolled back.
 #
 #                                                                              
 # #############################################################################
 
 
 import abc
-import pymysql
+import inspect
+import itertools
+import re
+import threading
+import time
+from db_batch_size import BatchSizer
+from db_bulk_load import BulkLoadFormat, LoadDataPipe
+from db_columnar import ColumnarResultBuilder
+from db_export import ExportSink, ExportWriter
+from db_error import ErrorCategory, ErrorClassifier, OracleErrorClassifier, MYSQL_ERROR_CATEGORIES, ORACLE_ERROR_CATEGORIES
+from db_instrumentation import DBEvent, EventPhase, Instrumentation
+from db_lazy_import import lazy_import
 from db_query import MySqlQuery, OracleQuery
-from db_query_info import QueryType, CursorType, RecordCount
+from db_query_info import QueryType, CursorType, RecordCount, ResultLayout, ExportFormat
+from db_raw_row import RawRowCursors
+from db_result_cache import QueryResultCache
+from db_retry import RetryPolicy
+from db_statement_cache import StatementCache
+
+pymysql = lazy_import("pymysql")        # Driver is loaded on first connect().
+cx_Oracle = lazy_import("cx_Oracle")
 
 
 class QueryResult:
@@ -64,43 +108,82 @@ class QueryResult:
     Raises:
         Not Applicable.
     """
+    __slots__ = ("code", "message", "result", "info")
+
     def __init__(self):
-        self._code      =   None
-        self._message   =   None
-        self._result    =   None
-        self._info      =   None            # Any other information will be store here. It's of a dict type.
+        self.code       =   None
+        self.message    =   None
+        self.result     =   None
+        self.info       =   None            # Any other information will be store here. It's of a dict type.
+
+
+class CrossThreadUsageError(RuntimeError):
+    """ Class CrossThreadUsageError is raised when a connection owned by one thread is used by another thread.
+
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+    pass
+
+
+class Transaction(object):
+    """ Class Transaction represents the context manager returned by DBConnection.transaction().
+
+    Args:
+        connection: DBConnection object on which queries of transaction are executed.
+    Returns:
+        Not Applicable.
+    Raises:
+        RuntimeError: On enter, if connection already has an active transaction.
+    """
+
+    def __init__(self, connection):
+        self._connection        =   connection
+        self._is_rollback_only  =   False
+        self._is_committed      =   False
+        self._query_result      =   None        # QueryResult of commit or rollback.
 
     @property
-    def code(self):       
-        return self._code
-    
-    @code.setter
-    def code(self, code):
-        self._code = code
+    def connection(self):
+        return self._connection
 
     @property
-    def message(self):       
-        return self._message
-    
-    @message.setter
-    def message(self, message):
-        self._message = message
+    def is_rollback_only(self):
+        return self._is_rollback_only
 
     @property
-    def result(self):       
-        return self._result
-    
-    @result.setter
-    def result(self, result):
-        self._result = result
+    def is_committed(self):
+        return self._is_committed
 
     @property
-    def info(self):       
-        return self._info
-    
-    @info.setter
-    def info(self, info):
-        self._info = info
+    def query_result(self):
+        return self._query_result
+
+    def set_rollback_only(self):
+        """ To roll back transaction on exit instead of committing it. """
+        self._is_rollback_only = True
+
+    def __enter__(self):
+        if self._connection.active_transaction is not None:
+            raise RuntimeError("Connection already has an active transaction.")
+
+        self._connection.active_transaction = self
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._connection.active_transaction = None
+
+        is_commit = exc_type is None and not self._is_rollback_only
+
+        self._query_result = self._connection.end_transaction(is_commit)
+        self._is_committed = is_commit and self._query_result.code == 0
+
+        return False
 
 
 class DBConnection:
@@ -117,6 +200,8 @@ class DBConnection:
 
     def __init__(self, database_config):
         self.database_config = database_config
+        self.active_transaction = None          # Transaction object, None outside transaction().
+        self.owner_thread = None                # Ident of the only thread allowed to use connection, None for any thread.
 
     @abc.abstractmethod
     def connect(self):
@@ -126,10 +211,138 @@ class DBConnection:
     def execute(self, query, is_commit = False):
         raise NotImplementedError("Abstract method 'execute' needs implementation.")
 
+    @abc.abstractmethod
+    def execute_many(self, query, parameters_list, is_commit = False, commit_size = None):
+        raise NotImplementedError("Abstract method 'execute_many' needs implementation.")
+
     @abc.abstractmethod
     def commit(self):
         raise NotImplementedError("Abstract method 'commit' needs implementation.")
 
+    @abc.abstractmethod
+    def rollback(self):
+        raise NotImplementedError("Abstract method 'rollback' needs implementation.")
+
+    @abc.abstractmethod
+    def end_transaction(self, is_commit):
+        raise NotImplementedError("Abstract method 'end_transaction' needs implementation.")
+
+    @abc.abstractmethod
+    def reconnect(self):
+        raise NotImplementedError("Abstract method 'reconnect' needs implementation.")
+
+    @abc.abstractmethod
+    def is_connection_lost(self):
+        raise NotImplementedError("Abstract method 'is_connection_lost' needs implementation.")
+
+    def check_owner(self):
+        """ To check that connection is used by its owner thread.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            CrossThreadUsageError: If owner thread is set and current thread is another thread.
+        """
+        if self.owner_thread is not None and self.owner_thread != threading.get_ident():
+            raise CrossThreadUsageError("Connection owned by thread {} is used by thread {}.".format(self.owner_thread, threading.get_ident()))
+
+    @staticmethod
+    def emit_event(phase, started, query_string = None, row_count = None, byte_count = None, error_code = None):
+        """ To send instrumentation event of a phase to the listeners.
+
+        Args:
+            phase: EventPhase of operation.
+            started: Monotonic time at which phase started, None if instrumentation was off then.
+            query_string: Query string of execute and fetch phases.
+            row_count: Number of rows executed or fetched.
+            byte_count: Estimated size of fetched records in bytes.
+            error_code: Error code if phase failed.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        if started is not None:
+            Instrumentation.emit(DBEvent(phase, started, time.monotonic() - started, query_string, row_count, byte_count, error_code))
+
+    @staticmethod
+    def stream(cursor, batch_size = None):
+        """ Generator of records read from unbuffered cursor.
+
+        Cursor is closed when all the records are read or generator is closed.
+
+        Args:
+            cursor: Unbuffered cursor on which query is executed.
+            batch_size: Number of records per batch, None to yield records one by one.
+        Returns:
+            generator: Records, or lists of records if batch size is given.
+        Raises:
+            pymysql.Error: If reading of records fails.
+        """
+        try:
+            if batch_size:
+                while True:
+                    records = cursor.fetchmany(batch_size)
+                    if not records:
+                        break
+                    yield records
+            else:
+                record = cursor.fetchone()
+                while record is not None:
+                    yield record
+                    record = cursor.fetchone()
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def stream_batches(cursor, sizer):
+        """ Generator of batches of records read from cursor, sized by batch sizer.
+
+        Cursor is closed when all the records are read or generator is closed.
+
+        Args:
+            cursor: Cursor on which query is executed.
+            sizer: BatchSizer giving size of each batch.
+        Returns:
+            generator: Lists of records.
+        Raises:
+            Error of driver: If reading of records fails.
+        """
+        try:
+            while True:
+                started = time.monotonic()
+                records = cursor.fetchmany(sizer.size)
+
+                if not records:
+                    break
+
+                sizer.update(records, time.monotonic() - started)
+                yield records
+        finally:
+            cursor.close()
+
+    def transaction(self):
+        """ Returns context manager which commits the queries executed within it as a unit.
+
+        Inside the context, is_commit of execute() and execute_many() is ignored. Transaction is
+        rolled back if an exception is raised or a query fails, else it is committed on exit.
+
+            with connection.transaction() as transaction:
+                connection.execute(query)
+            if not transaction.is_committed:
+                print(transaction.query_result.message)
+
+        Args:
+            Not Applicable.
+        Returns:
+            Transaction: Context manager of the transaction.
+        Raises:
+            Not Applicable.
+        """
+        return Transaction(self)
+
     @abc.abstractmethod
     def disconnect(self):
         raise NotImplementedError("Abstract method 'disconnect' needs implementation.")
@@ -202,11 +415,34 @@ class MySqlDBConnection(DBConnection):
         Not Applicable.
     """
 
+    DEF_PORT                    =   3306
+    STATEMENT_CACHE_SIZE        =   StatementCache.DEF_MAX_SIZE
+    DEF_MAX_ALLOWED_PACKET      =   4 * 1024 * 1024     # MySql default, used if server value can not be read.
+    PACKET_HEADROOM             =   1024                # Bytes kept free in packet for protocol overhead.
+
+    ERROR_CLASSIFIER            =   ErrorClassifier(pymysql, MYSQL_ERROR_CATEGORIES)
+
+    DEF_LOAD_CHUNK_SIZE         =   100000              # Rows per LOAD DATA statement of load_data().
+    MAX_WARNING_MESSAGES        =   64                  # Warning messages of load_data() kept in query result.
+
+    COLUMNAR_FETCH_SIZE         =   1000                # Records read from unbuffered cursor at a time for columnar result.
+    _columnar_typecodes         =   None                # Cursor type code to array.array typecode, built on first columnar query.
+
+    INSERT_VALUES_PATTERN       =   re.compile(r"\s*((?:INSERT|REPLACE)\b.+\bVALUES?\s*)"
+                                               r"(\(\s*(?:%s|%\(\w+\)s)\s*(?:,\s*(?:%s|%\(\w+\)s)\s*)*\))"
+                                               r"(\s*(?:ON\s+DUPLICATE.*)?);?\s*\Z",
+                                               re.IGNORECASE | re.DOTALL)
+
     def __init__(self, database_config):
         super(MySqlDBConnection, self).__init__(database_config)
         self._connection = None
         self._cursor = None
         self._cursor_type = None
+        self._result_cache = None
+        self._retry_policy = None               # RetryPolicy object, None to not retry.
+        self._slow_query_log = None             # SlowQueryLog object, None to not log slow queries.
+        self._pending_tables = set()            # Tables written since last commit, invalidated again on commit.
+        self._is_uncommitted = False            # True if UPDATE query is executed since last commit.
 
     @property
     def connection(self):       
@@ -232,236 +468,1571 @@ class MySqlDBConnection(DBConnection):
     def cursor_type(self, cursor_type):
         self._cursor_type = cursor_type
 
-    def connect(self):
-        """ To connect to MySql database.
+    @property
+    def result_cache(self):
+        return self._result_cache
+
+    @result_cache.setter
+    def result_cache(self, result_cache):
+        self._result_cache = result_cache
+
+    @property
+    def retry_policy(self):
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, retry_policy):
+        self._retry_policy = retry_policy
+
+    @property
+    def slow_query_log(self):
+        return self._slow_query_log
+
+    @slow_query_log.setter
+    def slow_query_log(self, slow_query_log):
+        self._slow_query_log = slow_query_log
+
+    @property
+    def statement_cache(self):
+        """ Statement cache of current driver connection.
+
+        Cache lives as long as driver connection, so it is kept when pooled connection is reused.
 
         Args:
             Not Applicable.
         Returns:
-            Not Applicable.
+            StatementCache: Cache of prepared statements, None if not connected.
         Raises:
             Not Applicable.
         """
-        query_result = QueryResult()
-		
-        try:
-            self.connection = pymysql.connect(self.database_config.host, self.database_config.user, self.database_config.password, self.database_config.name)
-        except pymysql.ProgrammingError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.DataError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.InternalError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.IntegrityError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.DatabaseError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.NotSupportedError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.OperationalError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.MySQLError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.Error as error:
-            query_result.code, query_result.message = error.args
-        except Exception as error:
-            query_result.code = 9999
-            query_result.message = str(error)
-        else:
-            query_result.code       =       0		        # Successfull
-            query_result.message    =       "Database connection successful."
+        if self.connection is None:
+            return None
 
-        return query_result
+        return StatementCache.for_connection(self.connection, self.STATEMENT_CACHE_SIZE)
 
-    def set_cursor(self, cursor_type):
-        """ To set cursor for MySql database.
+    def connect(self):
+        """ To connect to MySql database.
+
+        Connection is tried again as per retry policy if it fails with a transient error.
 
         Args:
-            cursor_type: Type of cursor, e.g. Dictionary Cursor
+            Not Applicable.
         Returns:
             Not Applicable.
         Raises:
             Not Applicable.
         """
         query_result = QueryResult()
-		
-        try:
-            if cursor_type == CursorType.DICTIONARY:
-                self.cursor = self.connection.cursor(pymysql.cursors.DictCursor)
+        delays = self.get_retry_delays()
+
+        while True:
+            started = time.monotonic() if Instrumentation.listeners else None
+
+            try:
+                self.connection = self.open_connection()
+            except Exception as error:
+                category = self.ERROR_CLASSIFIER.set_result(query_result, error)
+                self.emit_event(EventPhase.CONNECT, started, error_code = query_result.code)
+
+                if category != ErrorCategory.FATAL and RetryPolicy.wait(delays):
+                    continue
             else:
-                self.cursor = self.connection.cursor()
-        
-        except pymysql.ProgrammingError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.DataError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.InternalError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.IntegrityError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.DatabaseError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.NotSupportedError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.OperationalError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.MySQLError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.Error as error:
-            query_result.code, query_result.message = error.args
-        except Exception as error:
-            query_result.code = 9999
-            query_result.message = str(error)
-        else:
-            query_result.code       =       0		        # Successfull
-            query_result.message    =       "Cursor created successfully."
+                self.emit_event(EventPhase.CONNECT, started)
+                self._is_uncommitted    =       False
+                query_result.code       =       0		        # Successfull
+                query_result.message    =       "Database connection successful."
 
-        return query_result
+            return query_result
 
-    def execute(self, query, is_commit = False):
-        """ To execute query in MySql database.
+    def reconnect(self):
+        """ To replace lost driver connection with a new one, cursor of same type is created again.
 
         Args:
-            query: MySqlQuery object representing query attributes.
+            Not Applicable.
         Returns:
-            QueryResult: Object representing query result.
+            tuple: QueryResult object, and ErrorCategory of error or None if reconnection is successful.
         Raises:
             Not Applicable.
         """
         query_result = QueryResult()
-		
+        cursor_type = self.cursor_type
+
+        self.discard_connection()
+
         try:
-            self.cursor.execute(query.query_string)
-        except pymysql.ProgrammingError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.DataError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.InternalError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.IntegrityError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.DatabaseError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.NotSupportedError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.OperationalError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.MySQLError as error:
-            query_result.code, query_result.message = error.args
-        except pymysql.Error as error:
-            query_result.code, query_result.message = error.args
+            self.connection = self.open_connection()
+
+            if cursor_type is not None:
+                self.cursor = self.create_cursor(cursor_type)
         except Exception as error:
-            query_result.code = 9999
-            query_result.message = str(error)
-        else:
-            query_result.code       =       0		        # Successfull
-            query_result.message    =       "Query execution successful."
+            return query_result, self.ERROR_CLASSIFIER.set_result(query_result, error)
 
-            if query.query_type == QueryType.SELECT:
-                if query.record_count == RecordCount.SINGLE:
-                    query_result.result = self.cursor.fetchone()
-                elif query.record_count == RecordCount.Many:
-                    query_result.result = self.cursor.fetchmany()                
-                if query.record_count == RecordCount.ALL:
-                    query_result.result = self.cursor.fetchall()
-            elif is_commit:
-                self.connection.commit()
+        self._is_uncommitted    =       False
+        query_result.code       =       0               # Successfull
+        query_result.message    =       "Database reconnection successful."
 
-        return query_result
+        return query_result, None
 
-    def commit(self):
-        """ To commit recrods in MySql database.
+    def is_connection_lost(self):
+        """ Returns True if there is no driver connection or it is closed, e.g. by driver on lost connection. """
+        return self.connection is None or not self.connection.open
+
+    def discard_connection(self, is_lost = True):
+        """ To close lost driver connection without using it.
 
         Args:
-            Not Applicable.
+            is_lost: False if connection is closed only because its unbuffered query is stopped early.
         Returns:
             Not Applicable.
         Raises:
             Not Applicable.
-        """        
-        self.connection.commit()
+        """
+        cursor, self.cursor = self.cursor, None
+        connection, self.connection = self.connection, None
+        self._pending_tables = set()
 
-    def disconnect(self):
-        """ To disconnect from MySql database.
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception:
+                pass                    # Connection is already unusable.
+
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def get_retry_delays(self):
+        """ Returns generator of delays before each retry of an operation.
 
         Args:
             Not Applicable.
         Returns:
-            Not Applicable.
+            iterator: Delays in seconds, empty if retry policy is not set.
         Raises:
             Not Applicable.
-        """        
-        if self.cursor is not None:
-            self.cursor.close()
+        """
+        if self.retry_policy is None:
+            return iter(())
 
-        if self.connection is not None:
-            self.connection.close()
+        return self.retry_policy.delays()
 
-    def __del__(self):
-        """ Destructor for DBUpdate.
-		
-        Closes cursor and connection.
+    def open_connection(self):
+        """ To open driver connection to MySql database.
 
-		Args:
-			None.
-		Returns:
-			None.
-		Raises:
-			Not Applicable.
-		"""
-        self.disconnect()
+        Args:
+            Not Applicable.
+        Returns:
+            connection: pymysql connection object.
+        Raises:
+            pymysql.Error: If connection could not be opened.
+        """
+        return self.create_connection(self.database_config)
 
+    @staticmethod
+    def create_connection(database_config):
+        """ To create driver connection to MySql database.
 
-class OracleDBConnection(DBConnection):
-    """ Class OracleDBConnection is the specific DAO class for Oracle Database connection.
-    
-    Args:
-        Not Applicable.
-    Returns:
-        Not Applicable.
-    Raises:
-        Not Applicable.
-    """
+        Args:
+            database_config: MySqlConnectionConfig object.
+        Returns:
+            connection: pymysql connection object.
+        Raises:
+            pymysql.Error: If connection could not be opened.
+        """
+        return pymysql.connect(database_config.host, database_config.user, database_config.password, database_config.name,
+                               port = int(database_config.port or MySqlDBConnection.DEF_PORT), local_infile = database_config.local_infile)
 
-    def __init__(self, database_config):
-        super(OracleDBConnection, self).__init__(database_config)
-        self.database_config = database_config      # OracleConnectionConfig object
+    @staticmethod
+    def reset_connection(connection):
+        """ To reset driver connection before it is reused by another client.
 
-    def connect(self):
-        """ To connect to Oracle database.
+        Uncommitted work is rolled back.
 
         Args:
-            Not Applicable.
+            connection: pymysql connection object.
         Returns:
             Not Applicable.
         Raises:
+            pymysql.Error: If connection is not usable anymore.
+        """
+        if not connection.open:
+            raise pymysql.InterfaceError(0, "Connection is closed.")
+
+        connection.rollback()
+
+    @staticmethod
+    def ping_connection(connection):
+        """ To check that driver connection is alive, without reconnecting it.
+
+        Args:
+            connection: pymysql connection object.
+        Returns:
             Not Applicable.
-        """        
-        pass
+        Raises:
+            pymysql.Error: If connection is not usable anymore.
+        """
+        connection.ping(reconnect = False)
 
-    def execute(self, query, is_commit = False):
-        """ To execute query in Oracle database.
+    @staticmethod
+    def close_connection(connection):
+        """ To close driver connection.
 
         Args:
-            query: OracleQuery object representing query attributes.
+            connection: pymysql connection object.
         Returns:
             Not Applicable.
         Raises:
             Not Applicable.
-        """        
-        pass
+        """
+        if connection.open:
+            connection.close()
 
-    def commit(self):
-        """ To commit recrods in Oracle database.
+    def set_cursor(self, cursor_type):
+        """ To set cursor for MySql database.
 
         Args:
-            Not Applicable.
+            cursor_type: Type of cursor, e.g. Dictionary Cursor
         Returns:
             Not Applicable.
         Raises:
-            Not Applicable.
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
         """
-        pass
+        self.check_owner()
+
+        query_result = QueryResult()
+        started = time.monotonic() if Instrumentation.listeners else None
+		
+        try:
+            self.cursor = self.create_cursor(cursor_type)
+            self.cursor_type = cursor_type
+        except Exception as error:
+            self.ERROR_CLASSIFIER.set_result(query_result, error)
+            self.emit_event(EventPhase.CURSOR, started, error_code = query_result.code)
+        else:
+            self.emit_event(EventPhase.CURSOR, started)
+            query_result.code       =       0		        # Successfull
+            query_result.message    =       "Cursor created successfully."
+
+        return query_result
+
+    def create_cursor(self, cursor_type):
+        """ Returns new cursor of given type.
+
+        Records of CursorType.RAW are tuples of memoryview of the undecoded fields, and records of
+        CursorType.LAZY are LazyRow objects converting a field on its first access.
+
+        Args:
+            cursor_type: Type of cursor, e.g. Dictionary Cursor
+        Returns:
+            Cursor: pymysql cursor.
+        Raises:
+            pymysql.Error: If cursor could not be created.
+        """
+        if cursor_type == CursorType.DICTIONARY:
+            return self.connection.cursor(pymysql.cursors.DictCursor)
+
+        if cursor_type in (CursorType.RAW, CursorType.LAZY):
+            return self.connection.cursor(RawRowCursors.get_cursor_class(cursor_type))
+
+        return self.connection.cursor()
+
+    def execute(self, query, is_commit = False):
+        """ To execute query in MySql database.
+
+        For RecordCount.Many, result is next query.batch_size records, or BatchSizer.DEF_BATCH_SIZE
+        records if batch size is not set.
+
+        For RecordCount.STREAM, query runs on a separate unbuffered cursor and result is a generator
+        of records, or of lists of query.batch_size records. Connection can not run another query
+        until the generator is exhausted or closed.
+
+        For RecordCount.BATCHES, query runs on a separate unbuffered cursor as for STREAM and result
+        is a generator of lists of records. Batch size starts at query.batch_size and, if
+        query.batch_bytes is set, adapts to record width and fetch latency of each batch.
+
+        If result cache is set, SELECT query with cache_ttl is served from cache when possible, and
+        UPDATE query removes cached results of the tables it writes. Cache is not used while connection
+        has uncommitted UPDATE or is in transaction(), as its reads may see uncommitted rows.
+
+        For ResultLayout.COLUMNAR and ResultLayout.NUMPY, all records are read from a separate unbuffered
+        cursor into column buffers. Result is mapping of column name to column and info has validity
+        masks of columns against "validity" key.
+
+        If retry policy is set, SELECT query failed with a transient error is executed again, after
+        reconnecting if connection is lost. It is not executed again if there is uncommitted UPDATE
+        on the connection, as that would be lost with the connection.
+
+        If slow query log is set, query taking its threshold seconds or more, or sampled, is logged
+        with its row count and phase timings. Query served from result cache is not logged.
+
+        Args:
+            query: MySqlQuery object representing query attributes.
+        Returns:
+            QueryResult: Object representing query result.
+        Raises:
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+
+        cache_key = None
+
+        if self.result_cache is not None and self.is_cacheable(query) and not self._is_uncommitted and self.active_transaction is None:
+            cache_key = self.result_cache.make_key(query.query_string, query.parameters)
+            cache_entry = self.result_cache.get(cache_key)
+
+            if cache_entry is not None:
+                return self.get_cached_result(cache_entry)
+
+        if self.active_transaction is not None:
+            is_commit = False                   # Transaction is committed on exit.
+
+        if query.query_type == QueryType.SELECT and not self._is_uncommitted:
+            delays = self.get_retry_delays()
+        else:
+            delays = iter(())
+
+        statistics = {"attempts": 0} if self.slow_query_log is not None else None
+        started = time.monotonic() if statistics is not None else None
+
+        query_result, category = self.execute_query(query, is_commit, cache_key, statistics)
+
+        while category is not None and category != ErrorCategory.FATAL and RetryPolicy.wait(delays):
+            if category == ErrorCategory.RECONNECT:
+                _, category = self.reconnect()
+
+                if category is not None:
+                    continue            # Query result of last attempt is returned if connection is not restored.
+
+            query_result, category = self.execute_query(query, is_commit, cache_key, statistics)
+
+        if query_result.code != 0 and self.active_transaction is not None:
+            self.active_transaction.set_rollback_only()
+
+        if statistics is not None:
+            self.slow_query_log.record(self, query, query_result, time.monotonic() - started, statistics)
+
+        return query_result
+
+    def execute_query(self, query, is_commit, cache_key, statistics = None):
+        """ To execute query in MySql database once.
+
+        Args:
+            query: MySqlQuery object representing query attributes.
+            is_commit: True to commit the records.
+            cache_key: Result cache key of query, None if result is not to be cached.
+            statistics: Dict to which execute and fetch seconds, rows and attempts are written, None to not measure.
+        Returns:
+            tuple: QueryResult object, and ErrorCategory of error or None if execution is successful.
+        Raises:
+            Not Applicable.
+        """
+        query_result = QueryResult()
+        category = None
+        cursor = self.cursor
+        sizer = None
+        generation = self.result_cache.get_generation(cache_key) if cache_key is not None else None
+        is_emitted = bool(Instrumentation.listeners)
+        started = time.monotonic() if is_emitted or statistics is not None else None
+
+        if statistics is not None:
+            statistics["attempts"] += 1
+            statistics["rows"] = statistics["execute"] = statistics["fetch"] = None     # Of last attempt only.
+		
+        try:
+            if query.query_type == QueryType.SELECT and query.result_layout in (ResultLayout.COLUMNAR, ResultLayout.NUMPY):
+                if query.result_layout == ResultLayout.NUMPY:
+                    ColumnarResultBuilder.import_numpy()            # Fails before query is sent if NumPy is missing.
+                cursor = self.connection.cursor(pymysql.cursors.SSCursor)
+            elif query.query_type == QueryType.SELECT and query.record_count in (RecordCount.STREAM, RecordCount.BATCHES):
+                if query.record_count == RecordCount.BATCHES:
+                    sizer = BatchSizer.from_query(query)
+                cursor = self.get_stream_cursor()
+
+            cursor.execute(self.get_query_string(query))
+        except Exception as error:
+            category = self.ERROR_CLASSIFIER.set_result(query_result, error)
+
+            if statistics is not None:
+                statistics["execute"] = time.monotonic() - started
+            if is_emitted:
+                self.emit_event(EventPhase.EXECUTE, started, query.query_string, error_code = query_result.code)
+        else:
+            if statistics is not None:
+                statistics["execute"] = time.monotonic() - started
+            if is_emitted:
+                self.emit_event(EventPhase.EXECUTE, started, query.query_string, cursor.rowcount)
+            query_result.code       =       0		        # Successfull
+            query_result.message    =       "Query execution successful."
+
+            if query.query_type == QueryType.SELECT:
+                if started is not None:
+                    started = time.monotonic()
+
+                try:
+                    if query.result_layout in (ResultLayout.COLUMNAR, ResultLayout.NUMPY):
+                        query_result.result, query_result.info = self.fetch_columns(cursor, query.result_layout)
+                    elif query.record_count == RecordCount.SINGLE:
+                        query_result.result = self.cursor.fetchone()
+                    elif query.record_count == RecordCount.Many:
+                        query_result.result = self.cursor.fetchmany(query.batch_size or BatchSizer.DEF_BATCH_SIZE)
+                    elif query.record_count == RecordCount.ALL:
+                        query_result.result = self.cursor.fetchall()
+                    elif query.record_count == RecordCount.STREAM:
+                        query_result.result = self.stream(cursor, query.batch_size)
+                    elif query.record_count == RecordCount.BATCHES:
+                        query_result.result = self.stream_batches(cursor, sizer)
+                except Exception as error:
+                    query_result.result = query_result.info = None  # Unbuffered records are read from server while fetching.
+                    category = self.ERROR_CLASSIFIER.set_result(query_result, error)
+                else:
+                    if started is not None and not inspect.isgenerator(query_result.result):
+                        if statistics is not None:
+                            statistics["fetch"] = time.monotonic() - started
+                            statistics["rows"] = self.get_row_count(query, query_result)
+                        if is_emitted:
+                            self.emit_fetch_event(started, query, query_result)
+
+                    if cache_key is not None:
+                        self.result_cache.put(cache_key, query_result.result, query.cache_ttl, generation)
+            else:
+                self.invalidate_result_cache(query)
+                self._is_uncommitted = True
+
+                if statistics is not None:
+                    statistics["rows"] = cursor.rowcount
+
+                if is_commit:
+                    self.commit()
+
+        if cursor is not self.cursor and query_result.result is None:
+            try:
+                cursor.close()              # Streaming query failed.
+            except Exception:
+                pass                        # Connection is lost.
+
+        return query_result, category
+
+    def export(self, query, sink, export_format = ExportFormat.CSV, compress = False):
+        """ To export result of SELECT query to a file.
+
+        Records are read from a separate unbuffered cursor in batches and each batch is written to sink
+        as soon as it is read, so memory use is bounded by one batch. Batch size is query.batch_size and,
+        if query.batch_bytes is set, adapts as for RecordCount.BATCHES. Record count and result layout
+        of query are ignored.
+
+        Failed export inside transaction() marks the transaction to be rolled back on exit, as a failed
+        execute() does.
+
+        Args:
+            query: MySqlQuery object of SELECT query.
+            sink: File path, or binary file-like object which is left open.
+            export_format: ExportFormat of the file.
+            compress: True to gzip compress the file.
+        Returns:
+            QueryResult: Object representing query result, result is number of records exported. info has
+                         count of rows and of bytes written before compression.
+        Raises:
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+
+        query_result    =   QueryResult()
+        statistics      =   {"rows": 0, "bytes": 0}
+        query_result.info = statistics
+        cursor = None
+        export_sink = None
+        started = time.monotonic() if Instrumentation.listeners else None
+
+        try:
+            if query.query_type != QueryType.SELECT:
+                raise ValueError("Only SELECT query can be exported.")
+
+            writer_class = ExportWriter.get_writer_class(export_format)
+            sizer = BatchSizer.from_query(query)
+            cursor = self.connection.cursor(pymysql.cursors.SSCursor)
+            cursor.execute(self.get_query_string(query))
+            self.emit_event(EventPhase.EXECUTE, started, query.query_string)
+
+            if started is not None:
+                started = time.monotonic()
+
+            fetch_started = time.monotonic()
+            records = cursor.fetchmany(sizer.size)          # Sink is opened after first batch, so that a failed query leaves it untouched.
+            export_sink = ExportSink(sink, compress)
+
+            with export_sink:
+                writer = writer_class(export_sink, cursor.description or ())
+
+                while records:
+                    sizer.update(records, time.monotonic() - fetch_started)
+                    writer.write_batch(records)
+                    statistics["rows"] += len(records)
+                    fetch_started = time.monotonic()
+                    records = cursor.fetchmany(sizer.size)
+
+                writer.close()
+
+            statistics["bytes"] = export_sink.byte_count
+            self.emit_event(EventPhase.FETCH, started, query.query_string, statistics["rows"], statistics["bytes"])
+        except Exception as error:
+            self.ERROR_CLASSIFIER.set_result(query_result, error)
+
+            if self.active_transaction is not None:
+                self.active_transaction.set_rollback_only()
+            if export_sink is not None:
+                statistics["bytes"] = export_sink.byte_count
+            self.emit_event(EventPhase.FETCH if cursor is not None else EventPhase.EXECUTE, started, query.query_string,
+                            error_code = query_result.code)
+        else:
+            query_result.code       =       0		        # Successfull
+            query_result.message    =       "Query execution successful."
+            query_result.result     =       statistics["rows"]
+        finally:
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass                        # Connection is lost.
+
+        return query_result
+
+    def emit_fetch_event(self, started, query, query_result):
+        """ To send instrumentation event of fetch phase with row count and size of fetched records.
+
+        Args:
+            started: Monotonic time at which fetch started.
+            query: MySqlQuery object representing query attributes.
+            query_result: QueryResult object having fetched records.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        duration = time.monotonic() - started
+        row_count = self.get_row_count(query, query_result)
+
+        Instrumentation.emit(DBEvent(EventPhase.FETCH, started, duration, query.query_string, row_count, QueryResultCache.estimate_size(query_result.result)))
+
+    @staticmethod
+    def get_row_count(query, query_result):
+        """ Returns number of records fetched into query result of SELECT query. """
+        result = query_result.result
+
+        if query.result_layout in (ResultLayout.COLUMNAR, ResultLayout.NUMPY):
+            return query_result.info["row_count"]
+
+        if query.record_count == RecordCount.SINGLE:
+            return 0 if result is None else 1
+
+        return len(result)
+
+    def fetch_columns(self, cursor, result_layout):
+        """ Returns all records of unbuffered cursor as columns.
+
+        Cursor is closed after reading the records.
+
+        Args:
+            cursor: Unbuffered cursor on which query is executed.
+            result_layout: ResultLayout.COLUMNAR for array.array/list or ResultLayout.NUMPY for NumPy array columns.
+        Returns:
+            tuple: OrderedDict of column name to column, and info dict with validity masks and row count.
+        Raises:
+            pymysql.Error: If reading of records fails.
+            ImportError: If NumPy is asked for and it is not installed.
+        """
+        try:
+            builder = ColumnarResultBuilder(cursor.description or (), self.get_columnar_typecodes())
+            records = cursor.fetchmany(self.COLUMNAR_FETCH_SIZE)
+
+            while records:
+                builder.add_records(records)
+                records = cursor.fetchmany(self.COLUMNAR_FETCH_SIZE)
+        finally:
+            cursor.close()
+
+        if result_layout == ResultLayout.NUMPY:
+            columns, masks = builder.build_numpy()
+        else:
+            columns, masks = builder.build()
+
+        return columns, {"validity": masks, "row_count": builder.row_count}
+
+    @classmethod
+    def get_columnar_typecodes(cls):
+        """ Returns mapping of MySql field type to array.array typecode of columnar result.
+
+        Args:
+            Not Applicable.
+        Returns:
+            dict: Field type code to typecode, field types not in mapping use list.
+        Raises:
+            Not Applicable.
+        """
+        if cls._columnar_typecodes is None:
+            field_type = pymysql.constants.FIELD_TYPE
+            MySqlDBConnection._columnar_typecodes = {field_type.TINY: "q", field_type.SHORT: "q", field_type.INT24: "q",
+                                                     field_type.LONG: "q", field_type.LONGLONG: "q", field_type.YEAR: "q",
+                                                     field_type.FLOAT: "d", field_type.DOUBLE: "d"}
+
+        return cls._columnar_typecodes
+
+    @staticmethod
+    def is_cacheable(query):
+        """ Returns True if result of query can be served from result cache.
+
+        Args:
+            query: MySqlQuery object representing query attributes.
+        Returns:
+            bool: True for SELECT query of single or all records with cache_ttl.
+        Raises:
+            Not Applicable.
+        """
+        return (query.query_type == QueryType.SELECT and bool(query.cache_ttl) and
+                query.record_count in (RecordCount.SINGLE, RecordCount.ALL) and query.result_layout == ResultLayout.ROW)
+
+    @staticmethod
+    def get_cached_result(cache_entry):
+        """ Returns QueryResult of cached result.
+
+        Cached records are shared by all the clients, so they must not be modified.
+
+        Args:
+            cache_entry: ResultCacheEntry object.
+        Returns:
+            QueryResult: Object representing query result.
+        Raises:
+            Not Applicable.
+        """
+        query_result            =   QueryResult()
+        query_result.code       =   0               # Successfull
+        query_result.message    =   "Query execution successful."
+        query_result.result     =   cache_entry.result
+        query_result.info       =   {"cached": True}
+
+        return query_result
+
+    def invalidate_result_cache(self, query):
+        """ To remove cached results of the tables written by UPDATE query.
+
+        Tables are invalidated again on commit, so results cached by other connections before commit are removed too.
+
+        Args:
+            query: MySqlQuery object representing query attributes.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        if self.result_cache is None:
+            return
+
+        tables = self.result_cache.write_tables(query.query_string)
+        self.result_cache.invalidate(tables)
+        self._pending_tables.update(tables)
+
+    def get_stream_cursor(self):
+        """ Returns unbuffered cursor of same type as the cursor set by set_cursor().
+
+        Args:
+            Not Applicable.
+        Returns:
+            SSCursor: Unbuffered pymysql cursor.
+        Raises:
+            pymysql.Error: If cursor could not be created.
+        """
+        if self.cursor_type == CursorType.DICTIONARY:
+            return self.connection.cursor(pymysql.cursors.SSDictCursor)
+
+        if self.cursor_type in (CursorType.RAW, CursorType.LAZY):
+            return self.connection.cursor(RawRowCursors.get_cursor_class(self.cursor_type, True))
+
+        return self.connection.cursor(pymysql.cursors.SSCursor)
+
+    def execute_many(self, query, parameters_list, is_commit = False, commit_size = None):
+        """ To execute query once for each parameters in MySql database.
+
+        INSERT/REPLACE query with single VALUES row is rewritten to multi-row statements, each of them
+        kept within server's max_allowed_packet. Other queries are executed once per parameters.
+
+        Failed execution rolls back all uncommitted work of the connection, so only rows committed
+        by commit_size before the failure are kept. Inside transaction() nothing is committed, and
+        failed execution marks the transaction to be rolled back on exit.
+
+        Args:
+            query: MySqlQuery object representing query attributes, its parameters are ignored.
+            parameters_list: Iterable of parameters, tuple or dict for each row.
+            is_commit: True to commit the records.
+            commit_size: Number of rows after which records are committed, None to commit once at end.
+        Returns:
+            QueryResult: Object representing query result, result is total number of affected rows. info has
+                         count of rows executed, rows committed, statements and commits.
+        Raises:
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+
+        query_result    =   QueryResult()
+        statistics      =   {"rows": 0, "committed_rows": 0, "statements": 0, "commits": 0}
+        query_result.info = statistics
+
+        if self.active_transaction is not None:
+            is_commit = False                   # Transaction is committed on exit.
+
+        try:
+            self.invalidate_result_cache(query)
+
+            match = self.INSERT_VALUES_PATTERN.match(query.query_string)
+
+            if match is None:
+                statements = self.single_row_statements(query.query_string, parameters_list)
+            else:
+                statements = self.multi_row_statements(match, parameters_list, commit_size)
+
+            affected_rows   =   0
+            pending_rows    =   0
+
+            for statement, row_count in statements:
+                self._is_uncommitted = True
+                started = time.monotonic() if Instrumentation.listeners else None
+                affected_rows += self.cursor.execute(statement)
+                self.emit_event(EventPhase.EXECUTE, started, query.query_string, row_count)
+                statistics["rows"] += row_count
+                statistics["statements"] += 1
+                pending_rows += row_count
+
+                if is_commit and commit_size and pending_rows >= commit_size:
+                    self.commit()
+                    statistics["commits"] += 1
+                    statistics["committed_rows"] = statistics["rows"]
+                    pending_rows = 0
+
+            if is_commit and pending_rows:
+                self.commit()
+                statistics["commits"] += 1
+                statistics["committed_rows"] = statistics["rows"]
+
+        except Exception as error:
+            self.ERROR_CLASSIFIER.set_result(query_result, error)
+
+            if self.active_transaction is not None:
+                self.active_transaction.set_rollback_only()
+            elif self._is_uncommitted:
+                try:
+                    self.rollback()
+                except Exception:
+                    pass                        # Connection is lost, rows are not committed.
+        else:
+            query_result.code       =       0		        # Successfull
+            query_result.message    =       "Query execution successful."
+            query_result.result     =       affected_rows
+
+        return query_result
+
+    def single_row_statements(self, query_string, parameters_list):
+        """ Generator of query strings, one for each parameters.
+
+        Args:
+            query_string: Query string with bind placeholders.
+            parameters_list: Iterable of parameters.
+        Returns:
+            generator: Tuple of query string and its row count.
+        Raises:
+            ValueError: If parameters do not match the placeholders of query string.
+        """
+        statement = self.statement_cache.get(query_string)
+
+        for parameters in parameters_list:
+            yield statement.bind(parameters, self.connection.escape), 1
+
+    def multi_row_statements(self, match, parameters_list, commit_size = None):
+        """ Generator of multi-row INSERT query strings, each within max_allowed_packet.
+
+        Args:
+            match: INSERT_VALUES_PATTERN match of query string.
+            parameters_list: Iterable of parameters.
+            commit_size: Maximum number of rows in one query string, None for no limit.
+        Returns:
+            generator: Tuple of query string and its row count.
+        Raises:
+            ValueError: If parameters do not match the placeholders or a row does not fit in packet.
+        """
+        prefix, values, suffix  =   match.group(1), match.group(2), match.group(3)
+        statement               =   self.statement_cache.get(values)
+        encoding                =   self.connection.encoding
+        max_length              =   self.get_max_allowed_packet() - self.PACKET_HEADROOM
+        fixed_length            =   len(prefix.encode(encoding)) + len(suffix.encode(encoding))
+
+        rows        =   []
+        length      =   fixed_length
+
+        for parameters in parameters_list:
+            row         =   statement.bind(parameters, self.connection.escape)
+            row_length  =   len(row.encode(encoding)) + 1                   # Row separator ','
+
+            if fixed_length + row_length > max_length:
+                raise ValueError("Row of {} bytes does not fit in max_allowed_packet.".format(row_length))
+
+            if rows and (length + row_length > max_length or len(rows) == commit_size):
+                yield prefix + ",".join(rows) + suffix, len(rows)
+                rows    =   []
+                length  =   fixed_length
+
+            rows.append(row)
+            length += row_length
+
+        if rows:
+            yield prefix + ",".join(rows) + suffix, len(rows)
+
+    def load_data(self, table, source, columns = None, is_commit = False, chunk_size = DEF_LOAD_CHUNK_SIZE, null_value = None):
+        """ To bulk load rows into table by LOAD DATA LOCAL INFILE.
+
+        Rows are sent chunk_size rows per LOAD DATA statement. Data file of each statement is read end
+        of a pipe, written by a thread encoding the rows, so no file is written to disk. LocalInfile
+        must be enabled in configuration and on the server, and /dev/fd must exist, e.g. Linux or macOS.
+
+        If is_commit is True, each chunk is committed after it is loaded, so a failed load keeps the
+        chunks loaded before it. Failed load rolls back all uncommitted work of the connection, i.e.
+        the failed chunk, and every chunk loaded before it if is_commit is False. Inside transaction()
+        nothing is committed, and failed load marks the transaction to be rolled back on exit.
+
+        Args:
+            table: Name of table, may be qualified by database name.
+            source: Iterable of rows, tuple/list of values or dict keyed by column, or file-like object of CSV text or bytes.
+            columns: Column names of row values, None for all columns of table in order.
+            is_commit: True to commit each chunk.
+            chunk_size: Number of rows per LOAD DATA statement.
+            null_value: Field value of CSV source to be loaded as NULL, None to load every field as string.
+        Returns:
+            QueryResult: Object representing query result, result is number of rows loaded. info has count
+                         of rows loaded, rows skipped, chunks, commits, warnings and first warning messages.
+        Raises:
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+
+        query_result    =   QueryResult()
+        statistics      =   {"rows": 0, "skipped": 0, "chunks": 0, "commits": 0, "warnings": 0, "warning_messages": []}
+        query_result.info = statistics
+
+        if self.active_transaction is not None:
+            is_commit = False                   # Transaction is committed on exit.
+
+        try:
+            if chunk_size < 1:
+                raise ValueError("Invalid load chunk size '{}'.".format(chunk_size))
+
+            query               =   MySqlQuery()
+            query.query_string  =   BulkLoadFormat.get_load_clause(table, columns, self.connection.charset)
+            query.query_type    =   QueryType.UPDATE
+            self.invalidate_result_cache(query)
+
+            encode  =   BulkLoadFormat.make_encoder(self.connection.escape, self.connection.encoding, columns)
+            rows    =   BulkLoadFormat.get_rows(source, null_value, self.connection.encoding)
+            row     =   next(rows, None)
+
+            while row is not None:
+                pipe = LoadDataPipe(itertools.chain((row,), itertools.islice(rows, chunk_size - 1)), encode)
+                self._is_uncommitted = True
+                started = time.monotonic() if Instrumentation.listeners else None
+
+                try:
+                    loaded = self.cursor.execute("LOAD DATA LOCAL INFILE '{}' {}".format(pipe.path, query.query_string))
+                finally:
+                    error = pipe.close()
+
+                if error is not None:
+                    raise error                 # Chunk is cut short, it is rolled back below.
+
+                self.emit_event(EventPhase.EXECUTE, started, query.query_string, loaded)
+                statistics["rows"] += loaded
+                statistics["skipped"] += pipe.row_count - loaded
+                statistics["chunks"] += 1
+                self.read_warnings(statistics)
+
+                if is_commit:
+                    self.commit()
+                    statistics["commits"] += 1
+
+                row = next(rows, None)
+        except Exception as error:
+            self.ERROR_CLASSIFIER.set_result(query_result, error)
+
+            if self.active_transaction is not None:
+                self.active_transaction.set_rollback_only()
+            elif self._is_uncommitted:
+                try:
+                    self.rollback()
+                except Exception:
+                    pass                        # Connection is lost, chunk is not committed.
+        else:
+            query_result.code       =       0		        # Successfull
+            query_result.message    =       "Query execution successful."
+            query_result.result     =       statistics["rows"]
+
+        return query_result
+
+    def read_warnings(self, statistics):
+        """ To add warnings of last statement to load statistics.
+
+        Args:
+            statistics: Dict of load statistics, its warnings count and warning messages are updated.
+        Returns:
+            Not Applicable.
+        Raises:
+            pymysql.Error: If warnings could not be read.
+        """
+        cursor = self.connection.cursor()
+
+        try:
+            cursor.execute("SHOW COUNT(*) WARNINGS")
+            record = cursor.fetchone()
+            count = int(record[0]) if record else 0
+            limit = self.MAX_WARNING_MESSAGES - len(statistics["warning_messages"])
+            statistics["warnings"] += count
+
+            if count and limit > 0:
+                cursor.execute("SHOW WARNINGS LIMIT {}".format(limit))
+                statistics["warning_messages"].extend("{} {}: {}".format(*record) for record in cursor.fetchall())
+        finally:
+            cursor.close()
+
+    def get_max_allowed_packet(self):
+        """ Returns max_allowed_packet of MySql server.
+
+        Args:
+            Not Applicable.
+        Returns:
+            int: Maximum packet size in bytes.
+        Raises:
+            Not Applicable.
+        """
+        cursor = self.connection.cursor()
+
+        try:
+            cursor.execute("SELECT @@max_allowed_packet")
+            record = cursor.fetchone()
+            return int(record[0]) if record else self.DEF_MAX_ALLOWED_PACKET
+        except (pymysql.Error, TypeError, ValueError):
+            return self.DEF_MAX_ALLOWED_PACKET
+        finally:
+            cursor.close()
+
+    def get_query_string(self, query):
+        """ Returns executable query string with bind parameters escaped into it.
+
+        Parameterized query string is parsed once per connection and kept in statement cache.
+
+        Args:
+            query: MySqlQuery object representing query attributes.
+        Returns:
+            str: Query string to be sent to MySql database.
+        Raises:
+            ValueError: If parameters do not match the placeholders of query string.
+        """
+        if query.parameters is None:
+            return query.query_string
+
+        statement = self.statement_cache.get(query.query_string)
+
+        return statement.bind(query.parameters, self.connection.escape)
+
+    def commit(self):
+        """ To commit recrods in MySql database.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """        
+        self.check_owner()
+
+        started = time.monotonic() if Instrumentation.listeners else None
+
+        self.connection.commit()
+        self._is_uncommitted = False
+        self.emit_event(EventPhase.COMMIT, started)
+
+        if self._pending_tables:
+            if self.result_cache is not None:
+                self.result_cache.invalidate(self._pending_tables)
+            self._pending_tables = set()
+
+    def rollback(self):
+        """ To roll back uncommitted records in MySql database.
+
+        Results cached from tables written since last commit are removed, as they may have been read
+        by this connection before rollback.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            pymysql.Error: If rollback fails.
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+
+        self.connection.rollback()
+        self._is_uncommitted = False
+
+        if self._pending_tables:
+            if self.result_cache is not None:
+                self.result_cache.invalidate(self._pending_tables)
+            self._pending_tables = set()
+
+    def end_transaction(self, is_commit):
+        """ To commit or roll back transaction.
+
+        Args:
+            is_commit: True to commit, False to roll back.
+        Returns:
+            QueryResult: Object representing commit or rollback result.
+        Raises:
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+
+        query_result = QueryResult()
+
+        try:
+            if is_commit:
+                self.commit()
+            else:
+                self.rollback()
+        except Exception as error:
+            self.ERROR_CLASSIFIER.set_result(query_result, error)
+        else:
+            query_result.code       =       0               # Successfull
+            query_result.message    =       "Transaction committed." if is_commit else "Transaction rolled back."
+
+        return query_result
+
+    def disconnect(self):
+        """ To disconnect from MySql database.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """        
+        if self.cursor is not None:
+            self.cursor.close()
+
+        if self.connection is not None:
+            self.connection.close()
+
+    def __del__(self):
+        """ Destructor for DBUpdate.
+		
+        Closes cursor and connection.
+
+		Args:
+			None.
+		Returns:
+			None.
+		Raises:
+			Not Applicable.
+		"""
+        self.disconnect()
+
+
+class PooledMySqlDBConnection(MySqlDBConnection):
+    """ Class PooledMySqlDBConnection is the MySql Database connection which borrows its driver connection from pool.
+
+    connect() borrows the connection from pool and disconnect() returns it back to pool,
+    so client code remains same as for MySqlDBConnection.
+
+    Args:
+        database_config: MySqlConnectionConfig object.
+        pool: ConnectionPool object of MySql driver connections.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    def __init__(self, database_config, pool):
+        super(PooledMySqlDBConnection, self).__init__(database_config)
+        self._pool = pool
+
+    @property
+    def pool(self):
+        return self._pool
+
+    def open_connection(self):
+        """ To borrow driver connection from pool.
+
+        Connection already borrowed by this object is returned to pool first.
+
+        Args:
+            Not Applicable.
+        Returns:
+            connection: pymysql connection object.
+        Raises:
+            PoolTimeoutError: If no connection is available within pool timeout.
+        """
+        self.disconnect()
+
+        return self.pool.acquire()
+
+    def disconnect(self):
+        """ To return driver connection to pool.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        if self.cursor is not None:
+            try:
+                self.cursor.close()
+            except Exception:
+                pass                    # Connection is checked by pool on release.
+            self.cursor = None
+
+        if self.connection is not None:
+            connection, self.connection = self.connection, None
+            self._pending_tables = set()        # Uncommitted work is rolled back by pool.
+            self._is_uncommitted = False
+            self.pool.release(connection)
+
+    def discard_connection(self, is_lost = True):
+        """ To remove lost driver connection from pool.
+
+        If connection is lost, idle connections of pool are closed too, as they are most likely lost
+        with the same server.
+
+        Args:
+            is_lost: False to remove only this connection, e.g. its unbuffered query is stopped early.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        cursor, self.cursor = self.cursor, None
+        connection, self.connection = self.connection, None
+        self._pending_tables = set()
+
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception:
+                pass                    # Connection is already unusable.
+
+        if connection is not None:
+            self.pool.discard(connection)
+
+            if is_lost:
+                self.pool.discard_idle()
+
+
+class OracleDBConnection(DBConnection):
+    """ Class OracleDBConnection is the specific DAO class for Oracle Database connection.
+
+    Fetch round trips of SELECT query are tuned by arraysize, rows fetched per round trip, and
+    prefetchrows, rows returned with the execute round trip. For SINGLE record query, record comes
+    back with execute round trip. For Many records query, batch size is fetched in one round trip.
+    Other queries use configured values, or values of the query if it has them.
+
+    Queries use bind variables, so the driver's statement cache parses each distinct query
+    string once per connection.
+
+    execute_many() sends rows as array DML, ARRAY_DML_SIZE rows per round trip.
+
+    Args:
+        database_config: OracleConnectionConfig object.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    ARRAY_DML_SIZE      =   10000               # Rows sent per executemany() round trip.
+
+    ERROR_CLASSIFIER    =   OracleErrorClassifier(cx_Oracle, ORACLE_ERROR_CATEGORIES)
+
+    def __init__(self, database_config):
+        super(OracleDBConnection, self).__init__(database_config)
+        self.database_config = database_config      # OracleConnectionConfig object
+        self.connection = None
+        self.cursor = None
+        self.cursor_type = None
+
+    def connect(self):
+        """ To connect to Oracle database.
+
+        Args:
+            Not Applicable.
+        Returns:
+            QueryResult: Object representing connection result.
+        Raises:
+            Not Applicable.
+        """        
+        query_result = QueryResult()
+        started = time.monotonic() if Instrumentation.listeners else None
+
+        try:
+            self.connection = self.open_connection()
+        except Exception as error:
+            self.ERROR_CLASSIFIER.set_result(query_result, error)
+            self.emit_event(EventPhase.CONNECT, started, error_code = query_result.code)
+        else:
+            self.emit_event(EventPhase.CONNECT, started)
+            query_result.code       =       0               # Successfull
+            query_result.message    =       "Database connection successful."
+
+        return query_result
+
+    def open_connection(self):
+        """ To open driver connection to Oracle database.
+
+        Args:
+            Not Applicable.
+        Returns:
+            connection: cx_Oracle connection object with statement cache size set.
+        Raises:
+            cx_Oracle.Error: If connection could not be opened.
+        """
+        config = self.database_config
+        dsn = cx_Oracle.makedsn(config.host, int(config.port), service_name = config.service_name)
+
+        connection = cx_Oracle.connect(user = config.user, password = config.password, dsn = dsn)
+        connection.stmtcachesize = config.statement_cache_size
+
+        return connection
+
+    def reconnect(self):
+        """ To replace lost driver connection with a new one, cursor is created again if it was set.
+
+        Args:
+            Not Applicable.
+        Returns:
+            tuple: QueryResult object, and ErrorCategory of error or None if reconnection is successful.
+        Raises:
+            Not Applicable.
+        """
+        query_result = QueryResult()
+        cursor_type = self.cursor_type
+
+        self.disconnect()
+
+        try:
+            self.connection = self.open_connection()
+
+            if cursor_type is not None:
+                self.cursor = self.connection.cursor()
+        except Exception as error:
+            return query_result, self.ERROR_CLASSIFIER.set_result(query_result, error)
+
+        query_result.code       =       0               # Successfull
+        query_result.message    =       "Database reconnection successful."
+
+        return query_result, None
+
+    def is_connection_lost(self):
+        """ Returns True if there is no driver connection. """
+        return self.connection is None
+
+    def set_cursor(self, cursor_type):
+        """ To set cursor for Oracle database.
+
+        Args:
+            cursor_type: Type of cursor, e.g. Dictionary Cursor
+        Returns:
+            QueryResult: Object representing cursor creation result.
+        Raises:
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+
+        query_result = QueryResult()
+        started = time.monotonic() if Instrumentation.listeners else None
+
+        try:
+            if cursor_type in (CursorType.RAW, CursorType.LAZY):
+                raise ValueError("Cursor type '{}' is not supported for Oracle database.".format(cursor_type.name))
+
+            self.cursor = self.connection.cursor()
+            self.cursor_type = cursor_type
+        except Exception as error:
+            self.ERROR_CLASSIFIER.set_result(query_result, error)
+            self.emit_event(EventPhase.CURSOR, started, error_code = query_result.code)
+        else:
+            self.emit_event(EventPhase.CURSOR, started)
+            query_result.code       =       0               # Successfull
+            query_result.message    =       "Cursor created successfully."
+
+        return query_result
+
+    def get_fetch_sizes(self, query):
+        """ Returns arraysize and prefetchrows for SELECT query.
+
+        Args:
+            query: OracleQuery object representing query attributes.
+        Returns:
+            tuple: Rows fetched per round trip, and rows returned with execute round trip.
+        Raises:
+            Not Applicable.
+        """
+        if query.record_count == RecordCount.SINGLE:
+            arraysize, prefetch_rows = 1, 2                 # One more row tells end of records without another round trip.
+        elif query.record_count in (RecordCount.Many, RecordCount.BATCHES) and query.batch_size:
+            arraysize, prefetch_rows = query.batch_size, query.batch_size + 1
+        else:
+            arraysize, prefetch_rows = self.database_config.arraysize, self.database_config.prefetch_rows
+
+        return query.arraysize or arraysize, prefetch_rows if query.prefetch_rows is None else query.prefetch_rows
+
+    def execute(self, query, is_commit = False):
+        """ To execute query in Oracle database.
+
+        For RecordCount.STREAM, query runs on a separate cursor and result is a generator of records,
+        or of lists of query.batch_size records.
+
+        For RecordCount.BATCHES, query runs on a separate cursor and result is a generator of lists of
+        records, whose size adapts to record width and fetch latency if query.batch_bytes is set.
+
+        Args:
+            query: OracleQuery object representing query attributes.
+            is_commit: True to commit the records.
+        Returns:
+            QueryResult: Object representing query result.
+        Raises:
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """        
+        self.check_owner()
+
+        query_result = QueryResult()
+        cursor = self.cursor
+        phase = EventPhase.EXECUTE
+        started = time.monotonic() if Instrumentation.listeners else None
+
+        if self.active_transaction is not None:
+            is_commit = False                   # Transaction is committed on exit.
+
+        try:
+            if query.query_type == QueryType.SELECT:
+                if query.record_count in (RecordCount.STREAM, RecordCount.BATCHES):
+                    cursor = self.connection.cursor()
+
+                cursor.arraysize, prefetch_rows = self.get_fetch_sizes(query)
+
+                if hasattr(cursor, "prefetchrows"):         # cx_Oracle 8 or later.
+                    cursor.prefetchrows = prefetch_rows
+
+            if query.parameters is None:
+                cursor.execute(query.query_string)
+            else:
+                cursor.execute(query.query_string, query.parameters)
+
+            if query.query_type == QueryType.SELECT:
+                self.emit_event(EventPhase.EXECUTE, started, query.query_string)
+
+                if self.cursor_type == CursorType.DICTIONARY:
+                    column_names = [column[0] for column in cursor.description]
+                    cursor.rowfactory = lambda *values: dict(zip(column_names, values))
+
+                phase = EventPhase.FETCH
+                started = time.monotonic() if Instrumentation.listeners else None
+                query_result.result = self.fetch(cursor, query, started)
+            else:
+                self.emit_event(EventPhase.EXECUTE, started, query.query_string, cursor.rowcount)
+                query_result.result = cursor.rowcount
+
+                if is_commit:
+                    self.commit()
+        except Exception as error:
+            self.ERROR_CLASSIFIER.set_result(query_result, error)
+            self.emit_event(phase, started, query.query_string, error_code = query_result.code)
+
+            if cursor is not self.cursor:
+                try:
+                    cursor.close()              # Streaming query failed.
+                except Exception:
+                    pass                        # Connection is lost.
+
+            if self.active_transaction is not None:
+                self.active_transaction.set_rollback_only()
+        else:
+            query_result.code       =       0               # Successfull
+            query_result.message    =       "Query execution successful."
+
+        return query_result
+
+    def fetch(self, cursor, query, started):
+        """ Returns records of executed SELECT query as per its record count.
+
+        Args:
+            cursor: Cursor on which query is executed.
+            query: OracleQuery object representing query attributes.
+            started: Monotonic time at which fetch started, None if instrumentation is off.
+        Returns:
+            Records, or generator of records for RecordCount.STREAM and RecordCount.BATCHES.
+        Raises:
+            cx_Oracle.Error: If reading of records fails.
+        """
+        if query.record_count == RecordCount.STREAM:
+            return self.stream(cursor, query.batch_size)
+
+        if query.record_count == RecordCount.BATCHES:
+            return self.stream_batches(cursor, BatchSizer.from_query(query))
+
+        if query.record_count == RecordCount.SINGLE:
+            result = cursor.fetchone()
+            row_count = 0 if result is None else 1
+        elif query.record_count == RecordCount.Many:
+            result = cursor.fetchmany(query.batch_size or cursor.arraysize)
+            row_count = len(result)
+        else:
+            result = cursor.fetchall()
+            row_count = len(result)
+
+        if started is not None:
+            self.emit_event(EventPhase.FETCH, started, query.query_string, row_count, QueryResultCache.estimate_size(result))
+
+        return result
+
+    def execute_many(self, query, parameters_list, is_commit = False, commit_size = None):
+        """ To execute query once for each parameters in Oracle database.
+
+        Rows are sent as array DML, one round trip per ARRAY_DML_SIZE rows, or per commit_size rows
+        if that is smaller. Failed execution outside transaction() rolls back uncommitted rows, as
+        for MySqlDBConnection.execute_many().
+
+        Args:
+            query: OracleQuery object representing query attributes, its parameters are ignored.
+            parameters_list: Iterable of parameters, tuple or dict for each row.
+            is_commit: True to commit the records.
+            commit_size: Number of rows after which records are committed, None to commit once at end.
+        Returns:
+            QueryResult: Object representing query result, result is total number of affected rows. info has
+                         count of rows executed, rows committed, statements and commits.
+        Raises:
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+
+        query_result    =   QueryResult()
+        statistics      =   {"rows": 0, "committed_rows": 0, "statements": 0, "commits": 0}
+        query_result.info = statistics
+        batch_size      =   min(commit_size or self.ARRAY_DML_SIZE, self.ARRAY_DML_SIZE)
+
+        if self.active_transaction is not None:
+            is_commit = False                   # Transaction is committed on exit.
+
+        try:
+            affected_rows   =   0
+            pending_rows    =   0
+            parameters_list =   iter(parameters_list)
+            rows            =   list(itertools.islice(parameters_list, batch_size))
+
+            while rows:
+                started = time.monotonic() if Instrumentation.listeners else None
+                self.cursor.executemany(query.query_string, rows)
+                self.emit_event(EventPhase.EXECUTE, started, query.query_string, len(rows))
+                affected_rows += self.cursor.rowcount
+                statistics["rows"] += len(rows)
+                statistics["statements"] += 1
+                pending_rows += len(rows)
+
+                if is_commit and commit_size and pending_rows >= commit_size:
+                    self.commit()
+                    statistics["commits"] += 1
+                    statistics["committed_rows"] = statistics["rows"]
+                    pending_rows = 0
+
+                rows = list(itertools.islice(parameters_list, batch_size))
+
+            if is_commit and pending_rows:
+                self.commit()
+                statistics["commits"] += 1
+                statistics["committed_rows"] = statistics["rows"]
+
+        except Exception as error:
+            self.ERROR_CLASSIFIER.set_result(query_result, error)
+
+            if self.active_transaction is not None:
+                self.active_transaction.set_rollback_only()
+            else:
+                try:
+                    self.rollback()
+                except Exception:
+                    pass                        # Connection is lost, rows are not committed.
+        else:
+            query_result.code       =       0               # Successfull
+            query_result.message    =       "Query execution successful."
+            query_result.result     =       affected_rows
+
+        return query_result
+
+    def commit(self):
+        """ To commit recrods in Oracle database.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            cx_Oracle.Error: If commit fails.
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+
+        started = time.monotonic() if Instrumentation.listeners else None
+
+        self.connection.commit()
+        self.emit_event(EventPhase.COMMIT, started)
+
+    def rollback(self):
+        """ To roll back uncommitted records in Oracle database.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            cx_Oracle.Error: If rollback fails.
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+
+        self.connection.rollback()
+
+    def end_transaction(self, is_commit):
+        """ To commit or roll back transaction in Oracle database.
+
+        Args:
+            is_commit: True to commit, False to roll back.
+        Returns:
+            QueryResult: Object representing commit or rollback result.
+        Raises:
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+
+        query_result = QueryResult()
+
+        try:
+            if is_commit:
+                self.commit()
+            else:
+                self.rollback()
+        except Exception as error:
+            self.ERROR_CLASSIFIER.set_result(query_result, error)
+        else:
+            query_result.code       =       0               # Successfull
+            query_result.message    =       "Transaction committed." if is_commit else "Transaction rolled back."
+
+        return query_result
 
     def disconnect(self):
         """ To disconnect from Oracle database.
@@ -473,4 +2044,12 @@ class OracleDBConnection(DBConnection):
         Raises:
             Not Applicable.
         """        
-        pass    
\ No newline at end of file
+        cursor, self.cursor = self.cursor, None
+        connection, self.connection = self.connection, None
+
+        for resource in (cursor, connection):
+            if resource is not None:
+                try:
+                    resource.close()
+                except Exception:
+                    pass                        # Connection is already unusable.
@@ -0,0 +1,488 @@
+#!/usr/bin/python3.4
+
+"""Provides database connection pool functionlity.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_connection_pool.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for keeping database connections open and handing them
+    out to the clients, so that a client does not pay connection handshake for every query.
+
+Design Pattern; -
+-----------------
+    This is implemented as Object pool design pattern.
+
+Working; -
+----------
+    Pool keeps a bounded number of driver connections. Client borrows a connection using acquire()
+    and gives it back using release(). If all the connections are in use and pool is full then
+    acquire() waits until a connection is released or timeout expires.
+
+    Pool does not know about the database, it uses the creator and reset callables supplied by
+    the database specific connection class.
+
+    Connections die silently when they are idle for long, e.g. behind a load balancer's idle
+    timeout. If validate callable is given,
+
+        -   Connection idle for more than idle_threshold seconds is validated, e.g. pinged, before
+            it is handed out. Connection failing validation is closed and another one is used.
+        -   If keepalive_interval is given, a background thread validates connections idle for more
+            than keepalive_interval seconds, so that they do not reach idle timeout, and reopens
+            connections up to min_size.
+
+    If max_lifetime is given, connection older than its lifetime is closed instead of being handed
+    out. Lifetime of each connection is shortened by a random part of lifetime_jitter, so that
+    connections opened together, or by many processes started together, are not all reopened at
+    the same moment.
+
+Uses; -
+-------
+    This will be used by database specific DC Factory to hand out pooled connections.
+
+Reference; -
+------------
+
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Added discard_idle() for lost database server.
+# 18-10-26            Dilip Kumar Sharma            Added validation on borrow, keepalive and maximum lifetime of connections.
+# 18-10-26            Dilip Kumar Sharma            Connection not borrowed from pool is ignored on release and discard.
+#
+#
+# #############################################################################
+
+
+import collections
+import random
+import threading
+import time
+
+
+class PoolTimeoutError(Exception):
+    """ Class PoolTimeoutError is raised when no connection could be borrowed within timeout.
+
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+    pass
+
+
+class PoolClosedError(Exception):
+    """ Class PoolClosedError is raised when connection is requested from a closed pool.
+
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+    pass
+
+
+class PoolEntry(object):
+    """ Class PoolEntry represents a driver connection of pool with its timestamps.
+
+    Args:
+        connection: Driver connection.
+        expires_at: Monotonic time after which connection is not handed out, None if it never expires.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    __slots__ = ("connection", "created_at", "last_used", "expires_at")
+
+    def __init__(self, connection, expires_at = None):
+        self.connection     =   connection
+        self.created_at     =   time.monotonic()
+        self.last_used      =   self.created_at         # Monotonic time of last release or successful validation.
+        self.expires_at     =   expires_at
+
+    def is_expired(self, now):
+        return self.expires_at is not None and now >= self.expires_at
+
+
+class ConnectionPool(object):
+    """ Class ConnectionPool represents thread safe pool of driver connections.
+
+    Args:
+        creator: Callable which opens and returns a new driver connection.
+        reset: Callable which resets a returned driver connection, e.g. rollback. It may raise to discard the connection.
+        close: Callable which closes a driver connection.
+        min_size: Number of connections opened on first borrow and kept open.
+        max_size: Maximum number of connections opened at any time.
+        timeout: Seconds to wait for a free connection when pool is exhausted.
+        validate: Callable which checks a driver connection cheaply, e.g. ping. It raises if connection is dead.
+        idle_threshold: Seconds of idleness after which connection is validated on borrow.
+        keepalive_interval: Seconds of idleness after which connection is validated in background, None to not keep alive.
+        max_lifetime: Seconds after opening after which connection is closed, None to keep it open.
+        lifetime_jitter: Fraction of max_lifetime by which lifetime of each connection is randomly shortened.
+    Returns:
+        Not Applicable.
+    Raises:
+        ValueError: If pool sizes or times are invalid.
+    """
+
+    DEF_MIN_SIZE        =   1
+    DEF_MAX_SIZE        =   10
+    DEF_TIMEOUT         =   30.0
+    DEF_IDLE_THRESHOLD  =   5.0
+    DEF_LIFETIME_JITTER =   0.1
+
+    def __init__(self, creator, reset = None, close = None, min_size = DEF_MIN_SIZE, max_size = DEF_MAX_SIZE, timeout = DEF_TIMEOUT,
+                 validate = None, idle_threshold = DEF_IDLE_THRESHOLD, keepalive_interval = None, max_lifetime = None, lifetime_jitter = DEF_LIFETIME_JITTER):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Invalid connection pool size, min '{}' max '{}'.".format(min_size, max_size))
+
+        if idle_threshold < 0 or (keepalive_interval is not None and keepalive_interval <= 0) or \
+           (max_lifetime is not None and max_lifetime <= 0) or not 0 <= lifetime_jitter < 1:
+            raise ValueError("Invalid connection pool idle threshold '{}', keepalive '{}', lifetime '{}' or jitter '{}'.".format(
+                idle_threshold, keepalive_interval, max_lifetime, lifetime_jitter))
+
+        self._creator       =   creator
+        self._reset         =   reset
+        self._close         =   close
+        self._min_size      =   min_size
+        self._max_size      =   max_size
+        self._timeout       =   timeout
+        self._validate      =   validate
+        self._idle_limit    =   idle_threshold
+        self._keepalive     =   keepalive_interval if validate is not None else None    # Keepalive needs validation.
+        self._max_lifetime  =   max_lifetime
+        self._jitter        =   lifetime_jitter
+        self._idle          =   collections.deque()     # Idle PoolEntry objects, most recently released at right.
+        self._borrowed      =   {}                      # Borrowed driver connection to its PoolEntry.
+        self._size          =   0                       # Number of connections opened by pool, idle and borrowed.
+        self._is_filled     =   False
+        self._is_closed     =   False
+        self._condition     =   threading.Condition(threading.Lock())
+        self._stop          =   threading.Event()       # Stops keepalive thread.
+
+    @property
+    def min_size(self):
+        return self._min_size
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def idle_count(self):
+        return len(self._idle)
+
+    @property
+    def max_lifetime(self):
+        return self._max_lifetime
+
+    def acquire(self, timeout = None):
+        """ To borrow a driver connection from pool.
+
+        Idle connection is returned if available, otherwise a new connection is opened if pool is
+        not full, otherwise it waits for a connection to be released. Idle connection which is
+        expired or fails validation is closed and not returned.
+
+        Args:
+            timeout: Seconds to wait, pool timeout is used if it is None.
+        Returns:
+            connection: Driver connection.
+        Raises:
+            PoolTimeoutError: If no connection is available within timeout.
+            PoolClosedError: If pool is closed.
+        """
+        timeout     =   self._timeout if timeout is None else timeout
+        deadline    =   time.monotonic() + timeout
+
+        self._fill()
+
+        while True:
+            entry = None
+
+            with self._condition:
+                while True:
+                    if self._is_closed:
+                        raise PoolClosedError("Connection pool is closed.")
+
+                    if self._idle:
+                        entry = self._idle.pop()
+                        break
+
+                    if self._size < self._max_size:
+                        self._size += 1         # Reserve the slot, connection is opened outside the lock.
+                        break
+
+                    remaining = deadline - time.monotonic()
+
+                    if remaining <= 0:
+                        raise PoolTimeoutError("No free connection in pool within {} seconds.".format(timeout))
+
+                    self._condition.wait(remaining)
+
+            if entry is None:
+                entry = self._open()
+            elif not self._check(entry, self._idle_limit):
+                self._close_connection(entry.connection)
+                self._forget()
+                continue
+
+            with self._condition:
+                self._borrowed[entry.connection] = entry
+
+            return entry.connection
+
+    def release(self, connection):
+        """ To return a borrowed driver connection to pool.
+
+        Connection is reset before it is made available again. If reset fails or connection has
+        expired then connection is discarded. Connection which is not borrowed from pool, e.g. it is
+        already released or discarded, is ignored.
+
+        Args:
+            connection: Driver connection borrowed using acquire().
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        with self._condition:
+            entry = self._borrowed.pop(connection, None)
+
+        if entry is None:
+            return
+
+        if not entry.is_expired(time.monotonic()):
+            try:
+                if self._reset is not None:
+                    self._reset(connection)
+            except Exception:
+                pass                    # Connection is closed below.
+            else:
+                entry.last_used = time.monotonic()
+
+                with self._condition:
+                    if not self._is_closed:
+                        self._idle.append(entry)
+                        self._condition.notify()
+                        return
+
+        self._close_connection(connection)
+        self._forget()
+
+    def discard(self, connection):
+        """ To close a borrowed driver connection and free its slot in pool.
+
+        Connection which is not borrowed from pool is ignored, as for release().
+
+        Args:
+            connection: Driver connection borrowed using acquire().
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        with self._condition:
+            if self._borrowed.pop(connection, None) is None:
+                return
+
+        self._close_connection(connection)
+        self._forget()
+
+    def discard_idle(self):
+        """ To close all idle connections, e.g. when database server is lost.
+
+        Pool remains open, new connections are opened as they are borrowed.
+
+        Args:
+            Not Applicable.
+        Returns:
+            int: Number of closed connections.
+        Raises:
+            Not Applicable.
+        """
+        with self._condition:
+            idle_entries = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle_entries)
+            self._condition.notify_all()
+
+        for entry in idle_entries:
+            self._close_connection(entry.connection)
+
+        return len(idle_entries)
+
+    def close(self):
+        """ To close all idle connections, borrowed connections are closed on release.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        self._stop.set()
+
+        with self._condition:
+            self._is_closed = True
+            idle_entries = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle_entries)
+            self._condition.notify_all()
+
+        for entry in idle_entries:
+            self._close_connection(entry.connection)
+
+    def keepalive(self):
+        """ To validate connections idle for more than keepalive interval and reopen connections up to minimum size.
+
+        Called periodically by keepalive thread. Connections being validated are not handed out meanwhile.
+
+        Args:
+            Not Applicable.
+        Returns:
+            int: Number of connections closed as dead or expired.
+        Raises:
+            Not Applicable.
+        """
+        now = time.monotonic()
+
+        with self._condition:
+            entries = [entry for entry in self._idle if entry.is_expired(now) or now - entry.last_used >= self._keepalive]
+
+            for entry in entries:
+                self._idle.remove(entry)
+
+        closed = 0
+
+        for entry in entries:
+            if self._check(entry, 0.0):
+                with self._condition:
+                    if not self._is_closed:
+                        self._idle.appendleft(entry)        # Keeps most recently used connections at right.
+                        self._condition.notify()
+                        continue
+
+            self._close_connection(entry.connection)
+            self._forget()
+            closed += 1
+
+        self._top_up()
+
+        return closed
+
+    def _run_keepalive(self):
+        while not self._stop.wait(self._keepalive / 2.0):
+            self.keepalive()
+
+    def _open(self):
+        """ Returns PoolEntry of newly opened connection, slot must be reserved by caller. """
+        try:
+            connection = self._creator()
+        except Exception:
+            self._forget()
+            raise
+
+        expires_at = None
+
+        if self._max_lifetime is not None:
+            expires_at = time.monotonic() + self._max_lifetime * (1.0 - random.uniform(0.0, self._jitter))
+
+        return PoolEntry(connection, expires_at)
+
+    def _check(self, entry, idle_threshold):
+        """ Returns True if connection of entry is not expired and, if idle for more than idle_threshold, passes validation. """
+        now = time.monotonic()
+
+        if entry.is_expired(now):
+            return False
+
+        if self._validate is None or now - entry.last_used < idle_threshold:
+            return True
+
+        try:
+            self._validate(entry.connection)
+        except Exception:
+            return False
+
+        entry.last_used = time.monotonic()
+
+        return True
+
+    def _fill(self):
+        """ To open minimum number of connections and start keepalive thread on first borrow.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        if self._is_filled:
+            return
+
+        with self._condition:
+            if self._is_filled:
+                return
+            self._is_filled = True
+
+        if self._keepalive is not None:
+            threading.Thread(target = self._run_keepalive, name = "ConnectionPoolKeepalive", daemon = True).start()
+
+        self._top_up()
+
+    def _top_up(self):
+        """ To open connections until pool has minimum number of connections. """
+        with self._condition:
+            if self._is_closed:
+                return
+            count = max(self._min_size - self._size, 0)
+            self._size += count
+
+        for _ in range(count):
+            try:
+                entry = self._open()
+            except Exception:
+                continue                # Failure is reported by acquire() when it opens its own connection.
+
+            with self._condition:
+                self._idle.appendleft(entry)
+                self._condition.notify()
+
+    def _forget(self):
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def _close_connection(self, connection):
+        try:
+            if self._close is not None:
+                self._close(connection)
+        except Exception:
+            pass                        # Connection is already unusable.
@@ -0,0 +1,241 @@
+#!/usr/bin/python3.4
+
+"""Provides database error classification.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_error.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for turning driver exceptions into QueryResult code and
+    message, and for deciding whether the failed operation may be tried again.
+
+Working; -
+----------
+    Errors are classified by a table of database error codes.
+
+        FATAL       -   Error of the query or its data, e.g. syntax error or duplicate key.
+                        Running it again gives same error.
+        RETRYABLE   -   Transient error, e.g. lock wait timeout or deadlock. Query may be run again
+                        on same connection.
+        RECONNECT   -   Connection is lost, e.g. server has gone away during failover. Query may be
+                        run again on a new connection.
+
+    Error codes which are not in the table are FATAL, except driver InterfaceError which is raised
+    when connection is already closed.
+
+Uses; -
+-------
+    This will be used by database connections to report errors and to decide on retry.
+
+Reference; -
+------------
+    https://dev.mysql.com/doc/mysql-errors/8.0/en/server-error-reference.html
+    https://dev.mysql.com/doc/mysql-errors/8.0/en/client-error-reference.html
+    https://docs.oracle.com/en/database/oracle/oracle-database/19/errmg/
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Driver error without code is reported as unknown error.
+# 18-10-26            Dilip Kumar Sharma            Added Oracle error classification.
+# 18-10-26            Dilip Kumar Sharma            Errors are classified without driver if it is not installed.
+#
+#
+# #############################################################################
+
+
+from enum import IntEnum
+from db_lazy_import import is_available
+
+
+class ErrorCategory(IntEnum):
+    """ Class ErrorCategory represents what can be done about a failed database operation.
+
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+    FATAL       =   1
+    RETRYABLE   =   2
+    RECONNECT   =   3
+
+
+MYSQL_ERROR_CATEGORIES = {
+    1040: ErrorCategory.RETRYABLE,          # ER_CON_COUNT_ERROR, too many connections.
+    1203: ErrorCategory.RETRYABLE,          # ER_TOO_MANY_USER_CONNECTIONS.
+    1205: ErrorCategory.RETRYABLE,          # ER_LOCK_WAIT_TIMEOUT.
+    1213: ErrorCategory.RETRYABLE,          # ER_LOCK_DEADLOCK.
+    1053: ErrorCategory.RECONNECT,          # ER_SERVER_SHUTDOWN.
+    1152: ErrorCategory.RECONNECT,          # ER_ABORTING_CONNECTION.
+    1290: ErrorCategory.RECONNECT,          # ER_OPTION_PREVENTS_STATEMENT, server is read only after failover.
+    1792: ErrorCategory.RECONNECT,          # ER_CANT_EXECUTE_IN_READ_ONLY_TRANSACTION.
+    1927: ErrorCategory.RECONNECT,          # ER_CONNECTION_KILLED.
+    2002: ErrorCategory.RECONNECT,          # CR_CONNECTION_ERROR.
+    2003: ErrorCategory.RECONNECT,          # CR_CONN_HOST_ERROR.
+    2006: ErrorCategory.RECONNECT,          # CR_SERVER_GONE_ERROR.
+    2013: ErrorCategory.RECONNECT,          # CR_SERVER_LOST.
+    2055: ErrorCategory.RECONNECT,          # CR_SERVER_LOST_EXTENDED.
+    4031: ErrorCategory.RECONNECT,          # ER_CLIENT_INTERACTION_TIMEOUT.
+}
+
+ORACLE_ERROR_CATEGORIES = {
+    51:    ErrorCategory.RETRYABLE,         # ORA-00051, timeout waiting for a resource.
+    60:    ErrorCategory.RETRYABLE,         # ORA-00060, deadlock detected.
+    8177:  ErrorCategory.RETRYABLE,         # ORA-08177, can't serialize access for this transaction.
+    30006: ErrorCategory.RETRYABLE,         # ORA-30006, resource busy, acquire with WAIT timeout expired.
+    28:    ErrorCategory.RECONNECT,         # ORA-00028, session has been killed.
+    1012:  ErrorCategory.RECONNECT,         # ORA-01012, not logged on.
+    1033:  ErrorCategory.RECONNECT,         # ORA-01033, initialization or shutdown in progress.
+    1034:  ErrorCategory.RECONNECT,         # ORA-01034, ORACLE not available.
+    1089:  ErrorCategory.RECONNECT,         # ORA-01089, immediate shutdown in progress.
+    3113:  ErrorCategory.RECONNECT,         # ORA-03113, end-of-file on communication channel.
+    3114:  ErrorCategory.RECONNECT,         # ORA-03114, not connected to ORACLE.
+    3135:  ErrorCategory.RECONNECT,         # ORA-03135, connection lost contact.
+    12170: ErrorCategory.RECONNECT,         # ORA-12170, connect timeout occurred.
+    12514: ErrorCategory.RECONNECT,         # ORA-12514, listener does not know of requested service.
+    12537: ErrorCategory.RECONNECT,         # ORA-12537, connection closed.
+    12541: ErrorCategory.RECONNECT,         # ORA-12541, no listener.
+}
+
+
+class ErrorClassifier(object):
+    """ Class ErrorClassifier classifies exceptions of a database driver.
+
+    Args:
+        driver: Driver module having Error and InterfaceError exceptions, e.g. pymysql.
+        categories: Dict of database error code to ErrorCategory.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    UNKNOWN_ERROR_CODE  =   9999
+
+    def __init__(self, driver, categories):
+        self._driver        =   driver              # Driver may be lazily imported, it is used only when an error is classified.
+        self._categories    =   categories
+
+    def get_error(self, error):
+        """ Returns code and message of exception.
+
+        Args:
+            error: Exception raised by database operation.
+        Returns:
+            tuple: Error code and error message.
+        Raises:
+            Not Applicable.
+        """
+        if self.is_driver_error(error) and len(error.args) == 2:
+            code, message = error.args
+
+            if code:
+                return code, message
+
+            return self.UNKNOWN_ERROR_CODE, message or type(error).__name__      # e.g. InterfaceError(0, '') of closed connection, 0 is success.
+
+        return self.UNKNOWN_ERROR_CODE, str(error)
+
+    def get_code(self, error):
+        """ Returns database error code of driver exception, None if it has no code. """
+        return error.args[0] if error.args else None
+
+    def is_driver_error(self, error, error_name = "Error"):
+        """ Returns True if exception is of driver exception class error_name.
+
+        Driver which is not installed raises no exception of its own, so any error, e.g. ImportError
+        of connecting through missing driver, is not a driver error then.
+
+        Args:
+            error: Exception raised by database operation.
+            error_name: Name of exception class of driver, e.g. 'InterfaceError'.
+        Returns:
+            bool: False if driver is not installed or exception is not of that class.
+        Raises:
+            Not Applicable.
+        """
+        if not is_available(self._driver):
+            return False
+
+        try:
+            error_class = getattr(self._driver, error_name)
+        except ImportError:
+            return False                # Driver is installed but can not be loaded.
+
+        return isinstance(error, error_class)
+
+    def classify(self, error):
+        """ Returns category of exception.
+
+        Args:
+            error: Exception raised by database operation.
+        Returns:
+            ErrorCategory: Category of error.
+        Raises:
+            Not Applicable.
+        """
+        if not self.is_driver_error(error):
+            return ErrorCategory.FATAL
+
+        category = self._categories.get(self.get_code(error))
+
+        if category is not None:
+            return category
+
+        if self.is_driver_error(error, "InterfaceError"):
+            return ErrorCategory.RECONNECT
+
+        return ErrorCategory.FATAL
+
+    def set_result(self, query_result, error):
+        """ To set code and message of exception in query result.
+
+        Args:
+            query_result: QueryResult object.
+            error: Exception raised by database operation.
+        Returns:
+            ErrorCategory: Category of error.
+        Raises:
+            Not Applicable.
+        """
+        query_result.code, query_result.message = self.get_error(error)
+
+        return self.classify(error)
+
+
+class OracleErrorClassifier(ErrorClassifier):
+    """ Class OracleErrorClassifier classifies exceptions of Oracle driver, whose argument is an error object having code and message.
+
+    Args:
+        driver: Driver module having Error and InterfaceError exceptions, e.g. cx_Oracle.
+        categories: Dict of database error code to ErrorCategory.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    def get_code(self, error):
+        return getattr(error.args[0], "code", None) if error.args else None
+
+    def get_error(self, error):
+        if self.is_driver_error(error) and error.args:
+            code = self.get_code(error)
+            message = getattr(error.args[0], "message", None) or str(error.args[0])
+
+            return code or self.UNKNOWN_ERROR_CODE, message       # e.g. DPI-1010 not connected has code 0.
+
+        return self.UNKNOWN_ERROR_CODE, str(error)
@@ -0,0 +1,398 @@
+#!/usr/bin/python3.4
+
+"""Provides export of SELECT query result to a file.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_export.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for writing batches of records read from an unbuffered cursor
+    to a file or file-like sink, as CSV, JSON Lines or Arrow IPC stream.
+
+Working; -
+----------
+    Each batch of records is encoded in one go and handed to the sink as one write, so that encoding
+    runs in the C code of csv, json and pyarrow modules and the sink sees few large writes. Only one
+    batch and its encoded bytes are held in memory at a time.
+
+    Sink is a file path, opened with a large write buffer, or a binary file-like object. It may be
+    gzip compressed.
+
+        CSV     -   Header row of column names, then one row per record. NULL is an empty field and
+                    binary values are base64 encoded.
+        JSONL   -   One JSON object per record. Decimal, date and time values are strings and binary
+                    values are base64 encoded.
+        ARROW   -   Arrow IPC stream, one record batch per batch of records. Schema is made from
+                    cursor description, text and binary columns are told apart by their first value.
+                    pyarrow is imported only when Arrow export is asked for.
+
+Uses; -
+-------
+    This will be used by MySqlDBConnection.export() for exporting query results.
+
+Reference; -
+------------
+    https://jsonlines.org/
+    https://arrow.apache.org/docs/format/Columnar.html#ipc-streaming-format
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import abc
+import base64
+import csv
+import datetime
+import decimal
+import gzip
+import io
+import json
+import os
+from db_lazy_import import lazy_import
+from db_query_info import ExportFormat
+
+pymysql = lazy_import("pymysql")
+
+
+class ExportSink(object):
+    """ Class ExportSink is the context manager of binary stream an export is written to.
+
+    File opened from a path is closed on exit, file-like sink is flushed and left open.
+
+    Args:
+        sink: File path, or binary file-like object having write().
+        compress: True to gzip compress the export.
+        compress_level: gzip compression level, 1 is fastest and 9 is smallest.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    BUFFER_SIZE         =   1024 * 1024
+    DEF_COMPRESS_LEVEL  =   6
+
+    def __init__(self, sink, compress = False, compress_level = DEF_COMPRESS_LEVEL):
+        self._sink              =   sink
+        self._compress          =   compress
+        self._compress_level    =   compress_level
+        self._file              =   None            # File opened from path.
+        self._stream            =   None
+        self._byte_count        =   0               # Bytes written before compression.
+
+    @property
+    def byte_count(self):
+        return self._byte_count
+
+    @property
+    def closed(self):
+        return self._stream is None
+
+    def __enter__(self):
+        if isinstance(self._sink, (str, bytes, os.PathLike)):
+            self._file = open(self._sink, "wb", buffering = self.BUFFER_SIZE)
+            target = self._file
+        else:
+            target = self._sink
+
+        if self._compress:
+            self._stream = gzip.GzipFile(fileobj = target, mode = "wb", compresslevel = self._compress_level)
+        else:
+            self._stream = target
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if self._compress:
+                self._stream.close()            # Writes gzip trailer, target is left open.
+
+            if self._file is not None:
+                self._file.close()
+            elif hasattr(self._sink, "flush"):
+                self._sink.flush()
+        finally:
+            self._stream = None
+
+        return False
+
+    def write(self, data):
+        self._stream.write(data)
+        self._byte_count += len(data)
+
+        return len(data)
+
+    def tell(self):
+        return self._byte_count
+
+    def flush(self):
+        pass                                    # Sink is flushed on exit.
+
+
+class ExportWriter(object):
+    """ Abstract class ExportWriter is base class of the writers of an export format.
+
+    Args:
+        sink: ExportSink object.
+        description: Cursor description of the query.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+    __metaclass__ = abc.ABCMeta
+
+    def __init__(self, sink, description):
+        self._sink          =   sink
+        self._description   =   description
+        self._names         =   [column[0] for column in description]
+
+    @staticmethod
+    def get_writer_class(export_format):
+        """ Returns writer class of export format.
+
+        Modules needed by the format are imported, so that a missing module fails before query is sent.
+
+        Args:
+            export_format: ExportFormat of the export.
+        Returns:
+            class: ExportWriter subclass.
+        Raises:
+            ValueError: If export format is not known.
+            ImportError: If pyarrow is asked for and it is not installed.
+        """
+        if export_format == ExportFormat.CSV:
+            return CsvExportWriter
+
+        if export_format == ExportFormat.JSONL:
+            return JsonLinesExportWriter
+
+        if export_format == ExportFormat.ARROW:
+            ArrowExportWriter.import_pyarrow()
+            return ArrowExportWriter
+
+        raise ValueError("Invalid export format '{}'.".format(export_format))
+
+    @abc.abstractmethod
+    def write_batch(self, records):
+        raise NotImplementedError("Abstract method 'write_batch' needs implementation.")
+
+    def close(self):
+        """ To write end of export, e.g. end of Arrow stream. Sink is closed by its context manager. """
+        pass
+
+
+class CsvExportWriter(ExportWriter):
+    """ Class CsvExportWriter writes records as CSV with header row.
+
+    Args:
+        sink: ExportSink object.
+        description: Cursor description of the query.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    def __init__(self, sink, description):
+        super(CsvExportWriter, self).__init__(sink, description)
+        self._buffer        =   io.StringIO()
+        self._writer        =   csv.writer(self._buffer, lineterminator = "\n")
+        self._pending       =   set(range(len(self._names)))    # Columns whose type is not known as they were NULL so far.
+        self._binary        =   set()                           # Columns of bytes values.
+
+        self._writer.writerow(self._names)
+        self.flush()
+
+    def write_batch(self, records):
+        if self._pending:
+            self.find_binary_columns(records)
+
+        if self._binary:
+            records = [self.encode_binary(record) for record in records]
+
+        self._writer.writerows(records)
+        self.flush()
+
+    def find_binary_columns(self, records):
+        """ To find columns of bytes values from first non NULL value of columns not seen yet. """
+        for index in list(self._pending):
+            for record in records:
+                value = record[index]
+
+                if value is not None:
+                    if isinstance(value, (bytes, bytearray)):
+                        self._binary.add(index)
+                    self._pending.discard(index)
+                    break
+
+    def encode_binary(self, record):
+        return [base64.b64encode(value).decode("ascii") if index in self._binary and value is not None else value
+                for index, value in enumerate(record)]
+
+    def flush(self):
+        self._sink.write(self._buffer.getvalue().encode("utf-8"))
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+
+class JsonLinesExportWriter(ExportWriter):
+    """ Class JsonLinesExportWriter writes records as JSON Lines, one object keyed by column name per record.
+
+    Args:
+        sink: ExportSink object.
+        description: Cursor description of the query.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    def __init__(self, sink, description):
+        super(JsonLinesExportWriter, self).__init__(sink, description)
+        self._encoder = json.JSONEncoder(ensure_ascii = False, separators = (",", ":"), default = self.to_json)
+
+    def write_batch(self, records):
+        names   =   self._names
+        encode  =   self._encoder.encode
+        lines   =   [encode(dict(zip(names, record))) for record in records]
+        lines.append("")
+
+        self._sink.write("\n".join(lines).encode("utf-8"))
+
+    @staticmethod
+    def to_json(value):
+        """ Returns JSON value of a field value which json module can not encode. """
+        if isinstance(value, (bytes, bytearray)):
+            return base64.b64encode(value).decode("ascii")
+
+        if isinstance(value, (datetime.date, datetime.time)):
+            return value.isoformat()
+
+        if isinstance(value, (decimal.Decimal, datetime.timedelta)):
+            return str(value)
+
+        if isinstance(value, (set, frozenset)):
+            return sorted(value)
+
+        raise TypeError("Value of type '{}' can not be exported as JSON.".format(type(value).__name__))
+
+
+class ArrowExportWriter(ExportWriter):
+    """ Class ArrowExportWriter writes records as Arrow IPC stream of record batches.
+
+    Stream is started with the first batch, as text and binary columns are told apart by their values.
+
+    Args:
+        sink: ExportSink object.
+        description: Cursor description of the query.
+    Returns:
+        Not Applicable.
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+
+    MAX_DECIMAL128_PRECISION    =   38
+
+    def __init__(self, sink, description):
+        super(ArrowExportWriter, self).__init__(sink, description)
+        self._pyarrow       =   self.import_pyarrow()
+        self._schema        =   None
+        self._writer        =   None
+
+    @staticmethod
+    def import_pyarrow():
+        """ Returns pyarrow module, it is imported only when Arrow export is asked for.
+
+        Args:
+            Not Applicable.
+        Returns:
+            module: pyarrow module.
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        import pyarrow
+
+        return pyarrow
+
+    def get_type(self, column, value):
+        """ Returns Arrow type of a column.
+
+        Args:
+            column: Cursor description of the column.
+            value: First non NULL value of the column, None if not known.
+        Returns:
+            DataType: pyarrow data type.
+        Raises:
+            Not Applicable.
+        """
+        pyarrow     =   self._pyarrow
+        field_type  =   pymysql.constants.FIELD_TYPE
+        type_code   =   column[1]
+
+        if type_code in (field_type.TINY, field_type.SHORT, field_type.INT24, field_type.LONG, field_type.LONGLONG, field_type.YEAR):
+            return pyarrow.int64()
+
+        if type_code in (field_type.FLOAT, field_type.DOUBLE):
+            return pyarrow.float64()
+
+        if type_code in (field_type.DECIMAL, field_type.NEWDECIMAL):
+            precision, scale = column[4] or 65, column[5] or 0          # Precision of description counts sign and point, it is an upper bound.
+
+            if precision <= self.MAX_DECIMAL128_PRECISION:
+                return pyarrow.decimal128(precision, scale)
+
+            return pyarrow.decimal256(min(precision, 76), scale)
+
+        if type_code in (field_type.DATE, field_type.NEWDATE):
+            return pyarrow.date32()
+
+        if type_code in (field_type.DATETIME, field_type.TIMESTAMP):
+            return pyarrow.timestamp("us")
+
+        if type_code == field_type.TIME:
+            return pyarrow.duration("us")
+
+        if isinstance(value, (bytes, bytearray)):
+            return pyarrow.binary()
+
+        return pyarrow.string()
+
+    def start(self, records):
+        fields = []
+
+        for index, column in enumerate(self._description):
+            value = next((record[index] for record in records if record[index] is not None), None)
+            fields.append(self._pyarrow.field(column[0], self.get_type(column, value)))
+
+        self._schema = self._pyarrow.schema(fields)
+        self._writer = self._pyarrow.ipc.new_stream(self._sink, self._schema)
+
+    def write_batch(self, records):
+        if self._writer is None:
+            self.start(records)
+
+        pyarrow = self._pyarrow
+        arrays = [pyarrow.array(values, type = field.type) for values, field in zip(zip(*records), self._schema)]
+
+        self._writer.write_batch(pyarrow.RecordBatch.from_arrays(arrays, schema = self._schema))
+
+    def close(self):
+        if self._writer is None:
+            self.start(())                      # Empty result has schema only.
+
+        self._writer.close()
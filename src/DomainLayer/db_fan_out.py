@@ -0,0 +1,158 @@
+#!/usr/bin/python3.4
+
+"""Provides concurrent execution of independent queries.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_fan_out.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for executing a list of independent queries at the same time
+    over several connections, so that time taken is that of the slowest query instead of the sum
+    of all the queries.
+
+Working; -
+----------
+    Queries are executed by a bounded pool of worker threads. Each worker thread keeps its own
+    connection through ThreadConnectionManager, so at most max_workers connections are used and
+    they are reused by later calls of execute_all().
+
+    Results are returned in order of queries. Failure of a query does not affect the other queries,
+    its QueryResult has error code and message. If deadline is given, queries not finished by then
+    get QueryResult with DEADLINE_ERROR_CODE. A query which is already running at the deadline can
+    not be stopped, it finishes in its worker thread and its result is dropped.
+
+    Queries with RecordCount.STREAM and RecordCount.BATCHES are not supported, since records of a
+    stream are read from cursor of the worker thread after the query returns.
+
+Uses; -
+-------
+    This will be used by clients issuing many independent SELECT queries, e.g. for a dashboard.
+
+        with FanOutExecutor(max_workers = 8) as executor:
+            query_results = executor.execute_all(queries, timeout = 2.0)
+
+Reference; -
+------------
+    https://docs.python.org/3/library/concurrent.futures.html
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            BATCHES queries are not supported.
+#
+#
+# #############################################################################
+
+
+import concurrent.futures
+import time
+from db_connection import QueryResult
+from db_error import ErrorClassifier
+from db_query_info import CursorType, RecordCount
+from db_thread_connection import ThreadConnectionError, ThreadConnectionManager
+
+
+class FanOutExecutor(object):
+    """ Class FanOutExecutor executes independent queries concurrently on a bounded pool of connections.
+
+    Args:
+        factory: DCFactory object creating connections, factory of environment if None.
+        max_workers: Maximum number of queries executed at the same time, also maximum number of connections.
+        cursor_type: Type of cursor set on each connection.
+    Returns:
+        Not Applicable.
+    Raises:
+        ValueError: If max_workers is less than one.
+    """
+
+    DEF_MAX_WORKERS         =   8
+    DEADLINE_ERROR_CODE     =   9998
+
+    def __init__(self, factory = None, max_workers = DEF_MAX_WORKERS, cursor_type = CursorType.NORMAL):
+        if max_workers < 1:
+            raise ValueError("Invalid fan out worker count '{}'.".format(max_workers))
+
+        self._manager       =   ThreadConnectionManager(factory, cursor_type)
+        self._max_workers   =   max_workers
+        self._executor      =   concurrent.futures.ThreadPoolExecutor(max_workers = max_workers, thread_name_prefix = "FanOut")
+
+    @property
+    def max_workers(self):
+        return self._max_workers
+
+    def execute_all(self, queries, timeout = None):
+        """ To execute queries concurrently.
+
+        Args:
+            queries: List of MySqlQuery objects, independent of each other.
+            timeout: Seconds after which unfinished queries are reported as failed, None to wait for all.
+        Returns:
+            list: QueryResult object of each query, in order of queries.
+        Raises:
+            Not Applicable.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        futures = [self._executor.submit(self._execute, query) for query in queries]
+
+        concurrent.futures.wait(futures, None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+        query_results = []
+
+        for future in futures:
+            if future.done():
+                query_results.append(future.result())
+            else:
+                future.cancel()                         # Query which has not started yet is not executed.
+                query_results.append(self.get_failed_result(self.DEADLINE_ERROR_CODE,
+                                                            "Query not finished within deadline of {} seconds.".format(timeout)))
+
+        return query_results
+
+    @staticmethod
+    def get_failed_result(code, message):
+        query_result            =   QueryResult()
+        query_result.code       =   code
+        query_result.message    =   message
+
+        return query_result
+
+    def _execute(self, query):
+        if query.record_count in (RecordCount.STREAM, RecordCount.BATCHES):
+            return self.get_failed_result(ErrorClassifier.UNKNOWN_ERROR_CODE, "Stream query can not be executed by fan out executor.")
+
+        try:
+            return self._manager.get_connection().execute(query)
+        except ThreadConnectionError as error:
+            return error.query_result
+        except Exception as error:
+            return self.get_failed_result(ErrorClassifier.UNKNOWN_ERROR_CODE, str(error))
+
+    def close(self):
+        """ To stop worker threads and disconnect their connections.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        self._executor.shutdown(wait = True)
+        self._manager.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -0,0 +1,328 @@
+#!/usr/bin/python3.4
+
+"""Provides group commit of database writes.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_group_commit.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for committing UPDATE queries of many callers together, so
+    that database flushes its log once per batch instead of once per query.
+
+Working; -
+----------
+    Callers submit UPDATE queries from any thread and get a Future. A worker thread executes the
+    queries on one connection and commits after commit_size queries, or when commit_interval
+    seconds have passed since first query of the batch, whichever comes first.
+
+    Future of a query is resolved with its QueryResult after its batch is committed, i.e. once the
+    write is durable. If the query fails, its Future is resolved with the failed QueryResult at once
+    and rest of the batch continues. If the batch is lost, i.e. query fails with a transient error
+    like deadlock or lost connection, or commit fails, the batch is rolled back and every Future of
+    the batch is resolved with that failed QueryResult.
+
+    Queries go through execute() of the connection, so they are checked against owner thread of the
+    connection and logged to slow query log like any other query. If the batch is lost with the
+    connection, the connection is reconnected before next batch, as a lost driver connection would
+    otherwise fail every later batch.
+
+    If worker thread fails unexpectedly, every Future not resolved yet, of the batch or queued, is
+    resolved with a failed QueryResult of the error and committer is closed, so no caller waits forever.
+
+Uses; -
+-------
+    This will be used by clients doing many small writes which do not need to be committed one by one.
+
+        committer = GroupCommitter(connection, commit_size = 100, commit_interval = 0.01)
+        future = committer.submit(query)
+        query_result = future.result()              # Blocks until write is committed.
+        committer.close()
+
+Reference; -
+------------
+
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Queries go through execute(), lost connection is reconnected.
+# 18-10-26            Dilip Kumar Sharma            Outstanding Futures are failed if worker thread fails.
+#
+#
+# #############################################################################
+
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from db_connection import QueryResult
+from db_error import ErrorCategory, ErrorClassifier, MYSQL_ERROR_CATEGORIES
+
+
+class GroupCommitter(object):
+    """ Class GroupCommitter executes submitted UPDATE queries on one connection and commits them in batches.
+
+    Args:
+        connection: Connected DBConnection object with cursor set, e.g. MySqlDBConnection, used by worker thread only, so it must not be owned by another thread.
+        commit_size: Maximum number of queries in a batch.
+        commit_interval: Maximum seconds a query waits for its batch to be committed.
+    Returns:
+        Not Applicable.
+    Raises:
+        ValueError: If commit_size is less than one or commit_interval is negative.
+    """
+
+    DEF_COMMIT_SIZE         =   100
+    DEF_COMMIT_INTERVAL     =   0.01
+
+    def __init__(self, connection, commit_size = DEF_COMMIT_SIZE, commit_interval = DEF_COMMIT_INTERVAL):
+        if commit_size < 1 or commit_interval < 0:
+            raise ValueError("Invalid group commit size '{}' or interval '{}'.".format(commit_size, commit_interval))
+
+        self._connection        =   connection
+        self._commit_size       =   commit_size
+        self._commit_interval   =   commit_interval
+        self._queue             =   queue.Queue()
+        self._is_closed         =   False
+        self._lock              =   threading.Lock()
+        self._batches           =   0
+        self._queries           =   0
+        self._outstanding       =   []              # Futures taken from queue by worker thread, of current batch.
+        self._worker            =   threading.Thread(target = self._run, name = "GroupCommitter", daemon = True)
+        self._worker.start()
+
+    @property
+    def connection(self):
+        return self._connection
+
+    @property
+    def commit_size(self):
+        return self._commit_size
+
+    @property
+    def commit_interval(self):
+        return self._commit_interval
+
+    def submit(self, query):
+        """ To queue UPDATE query for execution and group commit.
+
+        Args:
+            query: MySqlQuery object of UPDATE query.
+        Returns:
+            Future: Resolved with QueryResult of query after its batch is committed or query fails.
+        Raises:
+            RuntimeError: If group committer is closed.
+        """
+        future = Future()
+
+        with self._lock:
+            if self._is_closed:
+                raise RuntimeError("Group committer is closed.")
+
+            self._queue.put((query, future))
+
+        return future
+
+    def close(self, timeout = None):
+        """ To commit queued queries and stop worker thread.
+
+        Args:
+            timeout: Seconds to wait for worker thread, None to wait until it stops.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        with self._lock:
+            if self._is_closed:
+                return
+
+            self._is_closed = True
+            self._queue.put(None)
+
+        self._worker.join(timeout)
+
+    def stats(self):
+        return {"batches": self._batches, "queries": self._queries}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def _run(self):
+        try:
+            self._run_batches()
+        except Exception as error:
+            self._fail_outstanding(error)
+
+    def _run_batches(self):
+        is_closing = False
+
+        while not is_closing:
+            item = self._queue.get()
+
+            if item is None:
+                break
+
+            batch = []
+            deadline = time.monotonic() + self._commit_interval
+            self._outstanding = []
+
+            while item is not None:
+                if not self._execute(item, batch):
+                    batch = []                  # Batch is rolled back and reported.
+
+                if len(batch) >= self._commit_size:
+                    break
+
+                remaining = deadline - time.monotonic()
+
+                try:
+                    item = self._queue.get(timeout = remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                if item is None:
+                    is_closing = True
+
+            if batch:
+                self._commit(batch)
+
+    def _execute(self, item, batch):
+        """ To execute one query of batch.
+
+        Returns:
+            bool: False if the batch is lost and rolled back, True otherwise.
+        """
+        query, future = item
+
+        if not future.set_running_or_notify_cancel():
+            return True
+
+        self._outstanding.append(future)
+
+        try:
+            query_result = self._connection.execute(query, False)
+        except Exception as error:              # e.g. CrossThreadUsageError.
+            query_result, category = self.get_failed_result(error)
+        else:
+            category = self.get_category(query_result)
+
+        if category is None:
+            batch.append((future, query_result))
+            return True
+
+        if category == ErrorCategory.FATAL:
+            future.set_result(query_result)     # Failed query does not affect rest of the batch.
+            return True
+
+        self._rollback(batch, query_result)
+        future.set_result(query_result)
+        self._restore(category)
+
+        return False
+
+    def get_category(self, query_result):
+        """ Returns ErrorCategory of failed QueryResult, None if it is successful.
+
+        Args:
+            query_result: QueryResult returned by the connection.
+        Returns:
+            ErrorCategory: Category of error code, RECONNECT for error without code if connection is lost.
+        Raises:
+            Not Applicable.
+        """
+        if query_result.code == 0:
+            return None
+
+        category = MYSQL_ERROR_CATEGORIES.get(query_result.code)
+
+        if category is not None:
+            return category
+
+        if query_result.code == ErrorClassifier.UNKNOWN_ERROR_CODE and self._connection.is_connection_lost():
+            return ErrorCategory.RECONNECT          # e.g. InterfaceError(0, '') of closed connection.
+
+        return ErrorCategory.FATAL
+
+    def get_failed_result(self, error):
+        """ Returns failed QueryResult of exception and its ErrorCategory. """
+        query_result = QueryResult()
+        classifier = getattr(self._connection, "ERROR_CLASSIFIER", None)
+
+        if classifier is not None:
+            return query_result, classifier.set_result(query_result, error)
+
+        query_result.code, query_result.message = ErrorClassifier.UNKNOWN_ERROR_CODE, str(error)
+
+        return query_result, ErrorCategory.FATAL
+
+    def _end_transaction(self, is_commit):
+        try:
+            return self._connection.end_transaction(is_commit)
+        except Exception as error:              # e.g. CrossThreadUsageError.
+            return self.get_failed_result(error)[0]
+
+    def _restore(self, category):
+        """ To reconnect before next batch if batch is lost with the connection. """
+        if category == ErrorCategory.RECONNECT:
+            self._connection.reconnect()        # If it fails, next query fails and reconnects again.
+
+    def _commit(self, batch):
+        query_result = self._end_transaction(True)
+
+        if query_result.code != 0:
+            self._rollback(batch, query_result)
+            self._restore(self.get_category(query_result))
+            return
+
+        self._batches += 1
+        self._queries += len(batch)
+
+        for future, result in batch:
+            result.info = {"batch_size": len(batch)}
+            future.set_result(result)
+
+    def _rollback(self, batch, query_result):
+        self._end_transaction(False)
+
+        for future, _ in batch:
+            future.set_result(query_result)
+
+    def _fail_outstanding(self, error):
+        """ To resolve every Future not resolved yet with failed QueryResult of unexpected error, and close committer. """
+        query_result, _ = self.get_failed_result(error)
+        futures = self._outstanding
+        self._outstanding = []
+
+        with self._lock:
+            self._is_closed = True          # Nothing is queued after this.
+
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if item is not None and item[1].set_running_or_notify_cancel():
+                futures.append(item[1])
+
+        self._end_transaction(False)
+
+        for future in futures:
+            if not future.done():
+                future.set_result(query_result)
@@ -0,0 +1,315 @@
+#!/usr/bin/python3.4
+
+"""Provides instrumentation of database operations.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_instrumentation.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for telling the registered listeners how long each phase of
+    a database operation took, i.e. connect, cursor creation, execute, fetch and commit.
+
+Design Pattern; -
+-----------------
+    This is implemented as Observer design pattern.
+
+Working; -
+----------
+    Database connection checks Instrumentation.listeners before reading the clock. If no listener
+    is registered then no event is created, so cost of instrumentation is one attribute lookup
+    per phase.
+
+    Listeners are kept in a tuple which is replaced on registration, so events are sent without
+    taking a lock. Exception raised by a listener is ignored, it does not fail the database operation.
+
+    Durations are measured with monotonic clock, in seconds.
+
+    HistogramCollector is a listener which keeps, for each phase, counts of durations in buckets
+    of powers of two microseconds, along with row and byte counts.
+
+Uses; -
+-------
+    This will be used by clients to find where time of slow database calls is spent.
+
+        collector = HistogramCollector()
+        Instrumentation.add_listener(collector)
+        ...
+        print(collector.snapshot())
+
+Reference; -
+------------
+
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import abc
+import math
+import threading
+from enum import IntEnum
+
+
+class EventPhase(IntEnum):
+    """ Class EventPhase represents phase of database operation.
+
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+    CONNECT     =   1
+    CURSOR      =   2
+    EXECUTE     =   3
+    FETCH       =   4
+    COMMIT      =   5
+
+
+class DBEvent(object):
+    """ Class DBEvent represents one timed phase of database operation.
+
+    Args:
+        phase: EventPhase of operation.
+        started: Monotonic time at which phase started.
+        duration: Duration of phase in seconds.
+        query_string: Query string of execute and fetch phases, None for others.
+        row_count: Number of rows executed or fetched, None if not known.
+        byte_count: Estimated size of fetched records in bytes, None if not known.
+        error_code: Error code if phase failed, None if it is successful.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    __slots__ = ("phase", "started", "duration", "query_string", "row_count", "byte_count", "error_code")
+
+    def __init__(self, phase, started, duration, query_string = None, row_count = None, byte_count = None, error_code = None):
+        self.phase          =   phase
+        self.started        =   started
+        self.duration       =   duration
+        self.query_string   =   query_string
+        self.row_count      =   row_count
+        self.byte_count     =   byte_count
+        self.error_code     =   error_code
+
+
+class DBEventListener(object):
+    """ Abstract class DBEventListener is base class of instrumentation listeners.
+
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    __metaclass__ = abc.ABCMeta
+
+    @abc.abstractmethod
+    def on_event(self, event):
+        raise NotImplementedError("Abstract method 'on_event' needs implementation.")
+
+
+class Instrumentation(object):
+    """ Class Instrumentation keeps the listeners registered in process and sends events to them.
+
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    listeners       =   ()                      # Registered listeners, empty tuple when instrumentation is off.
+    _lock           =   threading.Lock()
+
+    @classmethod
+    def add_listener(cls, listener):
+        """ To register listener for events of all database connections.
+
+        Args:
+            listener: DBEventListener object.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        with cls._lock:
+            if listener not in Instrumentation.listeners:
+                Instrumentation.listeners = Instrumentation.listeners + (listener,)
+
+    @classmethod
+    def remove_listener(cls, listener):
+        with cls._lock:
+            Instrumentation.listeners = tuple(item for item in Instrumentation.listeners if item is not listener)
+
+    @classmethod
+    def clear_listeners(cls):
+        with cls._lock:
+            Instrumentation.listeners = ()
+
+    @classmethod
+    def emit(cls, event):
+        """ To send event to all the registered listeners.
+
+        Args:
+            event: DBEvent object.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        for listener in cls.listeners:
+            try:
+                listener.on_event(event)
+            except Exception:
+                pass                        # Instrumentation must not fail database operation.
+
+
+class PhaseHistogram(object):
+    """ Class PhaseHistogram represents duration histogram and counters of one phase.
+
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    BUCKET_COUNT    =   32                      # Upper bounds 1 us to 2 ^ 31 us (about 36 minutes).
+
+    __slots__ = ("count", "total", "minimum", "maximum", "rows", "bytes", "errors", "buckets")
+
+    def __init__(self):
+        self.count      =   0
+        self.total      =   0.0
+        self.minimum    =   None
+        self.maximum    =   None
+        self.rows       =   0
+        self.bytes      =   0
+        self.errors     =   0
+        self.buckets    =   [0] * self.BUCKET_COUNT
+
+    @classmethod
+    def get_bucket(cls, duration):
+        """ Returns index of bucket whose upper bound is 2 ^ index microseconds. """
+        if duration <= 1e-6:
+            return 0
+
+        return min(math.frexp(duration * 1e6 - 1e-9)[1], cls.BUCKET_COUNT - 1)
+
+    @staticmethod
+    def get_upper_bound(index):
+        return (2 ** index) / 1e6
+
+    def add(self, event):
+        duration = event.duration
+
+        self.count += 1
+        self.total += duration
+        self.minimum = duration if self.minimum is None else min(self.minimum, duration)
+        self.maximum = duration if self.maximum is None else max(self.maximum, duration)
+        self.rows += event.row_count or 0
+        self.bytes += event.byte_count or 0
+        self.errors += event.error_code is not None
+        self.buckets[self.get_bucket(duration)] += 1
+
+    def percentile(self, percent):
+        """ Returns upper bound of bucket having given percentile of durations, in seconds.
+
+        Args:
+            percent: Percentile between 0 and 100.
+        Returns:
+            float: Duration in seconds, None if there is no event.
+        Raises:
+            Not Applicable.
+        """
+        if not self.count:
+            return None
+
+        rank = max(1, int(math.ceil(self.count * percent / 100.0)))
+        total = 0
+
+        for index, count in enumerate(self.buckets):
+            total += count
+            if total >= rank:
+                return min(self.get_upper_bound(index), self.maximum)
+
+        return self.maximum
+
+    def to_dict(self):
+        return {"count": self.count,
+                "total": self.total,
+                "mean": self.total / self.count if self.count else None,
+                "min": self.minimum,
+                "max": self.maximum,
+                "p50": self.percentile(50),
+                "p90": self.percentile(90),
+                "p99": self.percentile(99),
+                "rows": self.rows,
+                "bytes": self.bytes,
+                "errors": self.errors,
+                "buckets": [(self.get_upper_bound(index), count) for index, count in enumerate(self.buckets) if count]}
+
+
+class HistogramCollector(DBEventListener):
+    """ Class HistogramCollector is the listener which keeps in memory duration histogram of each phase.
+
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    def __init__(self):
+        self._histograms    =   {}
+        self._lock          =   threading.Lock()
+
+    def on_event(self, event):
+        with self._lock:
+            histogram = self._histograms.get(event.phase)
+
+            if histogram is None:
+                histogram = self._histograms[event.phase] = PhaseHistogram()
+
+            histogram.add(event)
+
+    def snapshot(self):
+        """ Returns statistics of each phase.
+
+        Args:
+            Not Applicable.
+        Returns:
+            dict: Phase name, e.g. 'EXECUTE', to dict of count, total, mean, min, max, p50, p90 and p99
+                  durations in seconds, rows, bytes, errors and non empty buckets as (upper bound, count).
+        Raises:
+            Not Applicable.
+        """
+        with self._lock:
+            return {phase.name: histogram.to_dict() for phase, histogram in sorted(self._histograms.items())}
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
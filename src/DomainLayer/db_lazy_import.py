@@ -0,0 +1,115 @@
+#!/usr/bin/python3.4
+
+"""Provides lazy import of database drivers.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_lazy_import.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for importing database driver modules only when they are used,
+    so that a process pays driver import time only for the database it connects to.
+
+Design Pattern; -
+-----------------
+    This is implemented as Virtual proxy design pattern.
+
+Working; -
+----------
+    lazy_import() returns module object which is executed on first attribute access, e.g. on
+    pymysql.connect() in MySqlDBConnection.connect().
+
+    If driver is not installed then a placeholder is returned, which raises ImportError on
+    first attribute access, so that clients of other databases are not affected. is_available()
+    tells whether driver is installed without raising.
+
+Uses; -
+-------
+    This will be used by database connection modules to import their drivers.
+
+Reference; -
+------------
+    https://docs.python.org/3/library/importlib.html#importlib.util.LazyLoader
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Added is_available() of lazily imported module.
+#
+#
+# #############################################################################
+
+
+import importlib.util
+import sys
+
+
+class MissingModule(object):
+    """ Class MissingModule is the placeholder of a driver module which is not installed.
+
+    Args:
+        name: Name of the module.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attribute):
+        raise ImportError("No module named '{}'".format(self._name))
+
+
+def lazy_import(name):
+    """ Returns module which is executed on first attribute access.
+
+    Module which is already imported is returned as it is.
+
+    Args:
+        name: Absolute name of the module, e.g. 'pymysql'.
+    Returns:
+        module: Lazy module, or MissingModule if module is not installed.
+    Raises:
+        Not Applicable.
+    """
+    module = sys.modules.get(name)
+
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+
+    if spec is None:
+        return MissingModule(name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    return module
+
+
+def is_available(module):
+    """ Returns True if module returned by lazy_import() is installed.
+
+    Args:
+        module: Module returned by lazy_import().
+    Returns:
+        bool: False if module is MissingModule placeholder.
+    Raises:
+        Not Applicable.
+    """
+    return not isinstance(module, MissingModule)
@@ -0,0 +1,576 @@
+#!/usr/bin/python3.4
+
+"""Provides parallel read of a table partitioned by key range.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_partitioned_read.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for reading all records of a large table over several
+    connections at the same time, each connection reading a range of an integer or date key.
+
+Working; -
+----------
+    read() opens parallelism connections and starts a consistent snapshot transaction on each of
+    them, before any record is read.
+
+        BEST_EFFORT     -   Snapshots are started one after another, so they may differ by writes
+                            committed in between, typically a few milliseconds.
+        TABLE_LOCK      -   Table is locked for reading by one more connection while snapshots are
+                            started, so all snapshots see the same table. Writers to the table wait
+                            for the lock, which is held only until the snapshots are started.
+
+    Minimum and maximum of key are read in the snapshot, and key range is split into chunks of
+    equal width. Rows having NULL key are not read.
+
+    Each connection reads its chunks through an unbuffered cursor in a worker thread, and puts
+    batches of records in a bounded queue, so memory used does not depend on size of the table.
+
+        records()       -   One iterator of records of all the chunks, in no particular order.
+                            Chunks are handed to connections as they become free.
+        partitions()    -   One iterator per connection, of records of its single chunk in order
+                            of key. Iterators may be consumed in separate threads.
+
+    Snapshot transactions are rolled back and connections are disconnected once all the records
+    are read. If iteration is stopped early, or reading fails, connections still reading are
+    discarded, as an unbuffered query can not be stopped without reading all of its records.
+    Other connections of the pool are closed too only if the connection is lost.
+
+    Iterator whose chunks are not read to their end, because another iterator failed or the read
+    is closed, raises PartitionedReadError instead of ending, so that a partial partition is never
+    taken for a complete one.
+
+Uses; -
+-------
+    This will be used by clients extracting full tables, e.g. for export or analytics.
+
+        reader = PartitionedReader(parallelism = 8)
+        for record in reader.read("orders", "id").records():
+            ...
+
+Reference; -
+------------
+    https://dev.mysql.com/doc/refman/8.0/en/commit.html
+    https://dev.mysql.com/doc/refman/8.0/en/lock-tables.html
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Stopped read discards only its connections, cut short partitions raise error.
+# 18-10-26            Dilip Kumar Sharma            Isolation level is set for snapshot transaction only, not for pooled session.
+#
+#
+# #############################################################################
+
+
+import datetime
+import queue
+import threading
+from enum import IntEnum
+from db_connection import QueryResult
+from db_error import ErrorCategory, ErrorClassifier, MYSQL_ERROR_CATEGORIES
+from db_query_info import QueryType, CursorType, RecordCount
+from dc_factory import DCFactory
+
+
+class SnapshotMode(IntEnum):
+    """ Class SnapshotMode represents how snapshots of the connections of a partitioned read are aligned.
+
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+    BEST_EFFORT     =   1
+    TABLE_LOCK      =   2
+
+
+class PartitionedReadError(Exception):
+    """ Class PartitionedReadError is raised when a partitioned read can not be started or a chunk can not be read.
+
+    Args:
+        message: Error message.
+        query_result: QueryResult object of failed operation.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    def __init__(self, message, query_result):
+        super(PartitionedReadError, self).__init__(message)
+        self.query_result = query_result
+
+
+class PartitionedReader(object):
+    """ Class PartitionedReader reads a table over several connections, each reading a range of key.
+
+    Args:
+        factory: DCFactory object creating connections, factory of environment if None.
+        parallelism: Number of connections reading at the same time.
+        cursor_type: Type of cursor, tuples or dictionaries of records.
+        batch_size: Number of records handed from a connection to the reader at a time.
+        snapshot_mode: SnapshotMode of snapshots of the connections.
+    Returns:
+        Not Applicable.
+    Raises:
+        ValueError: If parallelism or batch_size is less than one.
+    """
+
+    DEF_PARALLELISM     =   4
+    DEF_BATCH_SIZE      =   10000
+
+    def __init__(self, factory = None, parallelism = DEF_PARALLELISM, cursor_type = CursorType.NORMAL,
+                 batch_size = DEF_BATCH_SIZE, snapshot_mode = SnapshotMode.BEST_EFFORT):
+        if parallelism < 1 or batch_size < 1:
+            raise ValueError("Invalid partitioned read parallelism '{}' or batch size '{}'.".format(parallelism, batch_size))
+
+        self._factory       =   factory if factory is not None else DCFactory.get_dc_factory()
+        self._parallelism   =   parallelism
+        self._cursor_type   =   cursor_type
+        self._batch_size    =   batch_size
+        self._snapshot_mode =   snapshot_mode
+
+    @property
+    def parallelism(self):
+        return self._parallelism
+
+    def read(self, table, key, columns = None, chunk_count = None):
+        """ To start partitioned read of table.
+
+        Args:
+            table: Name of table, optionally qualified by database name, e.g. 'sales.orders'.
+            key: Name of integer, DATE or DATETIME column of table, preferably its primary key.
+            columns: List of column names to read, None for all columns.
+            chunk_count: Number of key ranges for records(), at least parallelism. Defaults to
+                         parallelism, more chunks balance the load if keys are unevenly spread.
+        Returns:
+            PartitionedRead: Object giving records of the table.
+        Raises:
+            PartitionedReadError: If connections can not be connected or snapshots can not be started.
+            ValueError: If key is not of integer, DATE or DATETIME type.
+        """
+        connections = []
+
+        try:
+            for _ in range(self._parallelism):
+                connections.append(self.get_connection())
+
+            self.start_snapshots(connections, table)
+
+            low, high = self.get_key_range(connections[0], table, key)
+        except Exception:
+            PartitionedRead.release(connections)
+            raise
+
+        chunks = self.split_range(low, high, max(chunk_count or self._parallelism, self._parallelism))
+        query_string = "SELECT {} FROM {} WHERE {} >= %s AND {} ".format(
+            "*" if columns is None else ", ".join(self.quote_name(column) for column in columns),
+            self.quote_name(table), self.quote_name(key), self.quote_name(key))
+
+        return PartitionedRead(self._factory, connections, chunks, (query_string + "< %s", query_string + "<= %s"), self._batch_size)
+
+    def get_connection(self):
+        connection = self._factory.get_connection()
+        query_result = connection.connect()
+
+        if query_result.code == 0:
+            query_result = connection.set_cursor(self._cursor_type)
+
+        if query_result.code != 0:
+            connection.disconnect()
+            raise PartitionedReadError("Connection of partitioned read failed, {} {}.".format(query_result.code, query_result.message), query_result)
+
+        return connection
+
+    def start_snapshots(self, connections, table):
+        """ To start consistent snapshot transaction on each connection.
+
+        Args:
+            connections: Connected connections of partitioned read.
+            table: Name of table being read.
+        Returns:
+            Not Applicable.
+        Raises:
+            PartitionedReadError: If table can not be locked or a snapshot can not be started.
+        """
+        lock_connection = None
+
+        if self._snapshot_mode == SnapshotMode.TABLE_LOCK:
+            lock_connection = self.get_connection()
+
+            try:
+                self.execute_statement(lock_connection, "LOCK TABLES {} READ".format(self.quote_name(table)))
+            except PartitionedReadError:
+                lock_connection.disconnect()
+                raise
+
+        try:
+            for connection in connections:
+                self.execute_statement(connection, "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+                self.execute_statement(connection, "START TRANSACTION WITH CONSISTENT SNAPSHOT, READ ONLY")
+        finally:
+            if lock_connection is not None:
+                try:
+                    self.execute_statement(lock_connection, "UNLOCK TABLES")
+                finally:
+                    lock_connection.disconnect()
+
+    def get_key_range(self, connection, table, key):
+        """ Returns minimum and maximum of key in snapshot of connection.
+
+        Args:
+            connection: Connection with snapshot started.
+            table: Name of table being read.
+            key: Name of key column.
+        Returns:
+            tuple: Minimum and maximum key, both None if table has no row with key.
+        Raises:
+            PartitionedReadError: If query fails.
+            ValueError: If key is not of integer, DATE or DATETIME type.
+        """
+        query = self.make_query("SELECT MIN({0}), MAX({0}) FROM {1}".format(self.quote_name(key), self.quote_name(table)),
+                                QueryType.SELECT, RecordCount.SINGLE)
+        query_result = connection.execute(query)
+
+        if query_result.code != 0:
+            raise PartitionedReadError("Key range of '{}' could not be read, {} {}.".format(table, query_result.code, query_result.message), query_result)
+
+        record = query_result.result
+        low, high = record.values() if isinstance(record, dict) else record
+
+        if low is not None and not isinstance(low, (int, datetime.date)):
+            raise ValueError("Key '{}' of type '{}' can not be partitioned.".format(key, type(low).__name__))
+
+        return low, high
+
+    @staticmethod
+    def split_range(low, high, count):
+        """ Returns key range split into chunks of equal width.
+
+        Args:
+            low: Minimum key, int, date or datetime.
+            high: Maximum key, of same type as low.
+            count: Number of chunks wanted.
+        Returns:
+            list: Tuples of lower bound, upper bound and True for the last chunk. Lower bound is
+                  inclusive, upper bound is exclusive except for the last chunk. Fewer chunks are
+                  returned if range is too narrow, none if low is None.
+        Raises:
+            Not Applicable.
+        """
+        if low is None:
+            return []
+
+        if isinstance(low, int):
+            bounds = [low + (high - low) * index // count for index in range(count)]
+        else:
+            bounds = [low + (high - low) * index / count for index in range(count)]    # Part of day is dropped for date.
+
+        bounds = [bound for index, bound in enumerate(bounds) if index == 0 or bound != bounds[index - 1]]
+
+        return [(bound, upper, index == len(bounds) - 1) for index, (bound, upper) in enumerate(zip(bounds, bounds[1:] + [high]))]
+
+    def execute_statement(self, connection, query_string):
+        query_result = connection.execute(self.make_query(query_string, QueryType.UPDATE, RecordCount.SINGLE))
+
+        if query_result.code != 0:
+            raise PartitionedReadError("Statement '{}' of partitioned read failed, {} {}.".format(query_string, query_result.code, query_result.message), query_result)
+
+    def make_query(self, query_string, query_type, record_count, parameters = None):
+        query               =   self._factory.get_query()
+        query.query_string  =   query_string
+        query.query_type    =   query_type
+        query.record_count  =   record_count
+        query.parameters    =   parameters
+
+        return query
+
+    @staticmethod
+    def quote_name(name):
+        return ".".join("`{}`".format(part.replace("`", "``")) for part in name.split("."))
+
+
+class PartitionedRead(object):
+    """ Class PartitionedRead represents a started partitioned read, giving records either merged or per partition.
+
+    Only one of records() and partitions() may be called, once.
+
+    Args:
+        factory: DCFactory object of the connections.
+        connections: Connections with snapshots started, one per worker thread.
+        chunks: List of lower bound, upper bound and last chunk flag of each key range.
+        query_strings: SELECT query strings of a chunk, with exclusive and with inclusive upper bound.
+        batch_size: Number of records per batch put in queue.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    QUEUE_SIZE      =   4                       # Batches buffered per worker thread.
+
+    def __init__(self, factory, connections, chunks, query_strings, batch_size):
+        self._factory       =   factory
+        self._connections   =   connections
+        self._chunks        =   chunks
+        self._query_strings =   query_strings
+        self._batch_size    =   batch_size
+        self._is_started    =   False
+        self._stop          =   threading.Event()
+        self._threads       =   []
+        self._failure       =   None                # QueryResult of first failed chunk.
+
+    @property
+    def chunks(self):
+        return list(self._chunks)
+
+    def records(self):
+        """ Returns iterator of records of all the chunks, read by all the connections.
+
+        Args:
+            Not Applicable.
+        Returns:
+            generator: Records of the table in no particular order.
+        Raises:
+            PartitionedReadError: If a chunk can not be read, raised by the iterator.
+            RuntimeError: If records are already being read.
+        """
+        output = queue.Queue(self.QUEUE_SIZE * len(self._connections))
+        pending = queue.Queue()
+
+        for chunk in self._chunks:
+            pending.put(chunk)
+
+        self.start([(connection, pending, output) for connection in self._connections])
+
+        return self.iterate(output, len(self._connections))
+
+    def partitions(self):
+        """ Returns one iterator per connection, of records of one chunk each.
+
+        Args:
+            Not Applicable.
+        Returns:
+            list: Generators of records, in order of key within each generator. Fewer generators than
+                  connections are returned if key range is too narrow.
+        Raises:
+            PartitionedReadError: If a chunk can not be read, raised by its iterator.
+            RuntimeError: If records are already being read.
+        """
+        connections = self._connections[:len(self._chunks)]
+        self.release(self._connections[len(self._chunks):])     # Extra chunks of records() are merged away.
+
+        chunks = self.group_chunks(len(connections))
+        tasks = []
+
+        for connection, connection_chunks in zip(connections, chunks):
+            pending = queue.Queue()
+            for chunk in connection_chunks:
+                pending.put(chunk)
+            tasks.append((connection, pending, queue.Queue(self.QUEUE_SIZE)))
+
+        self._connections = connections
+        self.start(tasks)
+
+        return [self.iterate(output, 1) for _, _, output in tasks]
+
+    def group_chunks(self, count):
+        """ Returns chunks grouped into count adjacent groups, keeping order of key. """
+        size, extra = divmod(len(self._chunks), count) if count else (0, 0)
+        groups, start = [], 0
+
+        for index in range(count):
+            end = start + size + (index < extra)
+            groups.append(self._chunks[start:end])
+            start = end
+
+        return groups
+
+    def start(self, tasks):
+        if self._is_started:
+            raise RuntimeError("Partitioned read is already started.")
+
+        self._is_started = True
+
+        for task in tasks:
+            thread = threading.Thread(target = self._read, args = task, name = "PartitionedRead", daemon = True)
+            self._threads.append(thread)
+            thread.start()
+
+    def iterate(self, output, worker_count):
+        """ Generator of records put in output queue by worker_count worker threads. """
+        try:
+            while worker_count:
+                item = output.get()
+
+                if item is None:
+                    worker_count -= 1
+                elif isinstance(item, QueryResult):
+                    raise PartitionedReadError("Chunk of partitioned read failed, {} {}.".format(item.code, item.message), item)
+                else:
+                    for record in item:
+                        yield record
+        finally:
+            if worker_count:
+                self.close()
+
+    def close(self):
+        """ To stop worker threads, connections still reading are discarded.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        self._stop.set()
+
+        if not self._is_started:
+            self._is_started = True
+            self.release(self._connections)
+
+    def _read(self, connection, pending, output):
+        is_complete = False
+        category = None                         # ErrorCategory of failed chunk, None if no chunk failed.
+
+        try:
+            while not self._stop.is_set():
+                try:
+                    low, high, is_last = pending.get_nowait()
+                except queue.Empty:
+                    is_complete = True
+                    break
+
+                is_read, category = self._read_chunk(connection, low, high, is_last, output)
+
+                if not is_read:
+                    break
+        finally:
+            if is_complete:
+                self.release([connection])
+                last_item = None
+            else:
+                connection.discard_connection(category == ErrorCategory.RECONNECT)     # Unbuffered query is not read to its end.
+                last_item = None if category is not None else self.get_cancelled_result()
+
+            self._put_last(output, last_item)
+
+    def _read_chunk(self, connection, low, high, is_last, output):
+        """ To read records of one chunk into output queue.
+
+        Returns:
+            tuple: True if all the records of chunk are read, and ErrorCategory of failure or None.
+        """
+        query = self._factory.get_query()
+        query.query_string  =   self._query_strings[is_last]
+        query.query_type    =   QueryType.SELECT
+        query.record_count  =   RecordCount.STREAM
+        query.parameters    =   (low, high)
+        query.batch_size    =   self._batch_size
+
+        query_result = connection.execute(query)
+
+        if query_result.code != 0:
+            return False, self._fail(output, query_result, MYSQL_ERROR_CATEGORIES.get(query_result.code, ErrorCategory.FATAL))
+
+        try:
+            for records in query_result.result:
+                if not self._put(output, records):
+                    return False, None
+        except Exception as error:
+            query_result = QueryResult()
+            classifier = getattr(connection, "ERROR_CLASSIFIER", None)
+
+            if classifier is not None:
+                category = classifier.set_result(query_result, error)
+            else:
+                query_result.code, query_result.message = ErrorClassifier.UNKNOWN_ERROR_CODE, str(error)
+                category = ErrorCategory.FATAL
+
+            return False, self._fail(output, query_result, category)
+
+        return True, None
+
+    def _fail(self, output, query_result, category):
+        """ To put QueryResult of failed chunk in output queue, returns category of failure. """
+        if self._failure is None:
+            self._failure = query_result
+
+        self._put(output, query_result)
+
+        return category
+
+    def get_cancelled_result(self):
+        """ Returns QueryResult given to reader of chunks not read to their end because read is stopped.
+
+        Args:
+            Not Applicable.
+        Returns:
+            QueryResult: Failure which stopped the read, or cancellation if read is closed.
+        Raises:
+            Not Applicable.
+        """
+        if self._failure is not None:
+            return self._failure
+
+        query_result = QueryResult()
+        query_result.code, query_result.message = ErrorClassifier.UNKNOWN_ERROR_CODE, "partitioned read is cancelled"
+
+        return query_result
+
+    def _put(self, output, item):
+        """ To put item in output queue, waiting while queue is full.
+
+        Returns:
+            bool: False if read is stopped before item could be put.
+        """
+        while True:
+            try:
+                output.put(item, timeout = 0.1)
+                return True
+            except queue.Full:
+                if self._stop.is_set():
+                    return False
+
+    def _put_last(self, output, item):
+        """ To put last item of worker in output queue.
+
+        If read is stopped and queue is full, queued batches are dropped to make room, so that a reader
+        still waiting gets an error instead of waiting for ever or taking the batches left for complete.
+        """
+        if self._put(output, item):
+            return
+
+        if item is None:
+            item = self.get_cancelled_result()
+
+        while True:
+            try:
+                output.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    output.get_nowait()
+                except queue.Empty:
+                    pass
+
+    @staticmethod
+    def release(connections):
+        """ To end snapshot transactions and disconnect connections. """
+        for connection in connections:
+            connection.end_transaction(False)
+            connection.disconnect()
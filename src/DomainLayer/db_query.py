@@ -37,12 +37,20 @@ Reference; -
 # Date (DD-MM-YY)  |  Author                    |   Change
 # -----------------------------------------------------------------------------
 # 15-02-19            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Added bind parameters to MySqlQuery.
+# 18-10-26            Dilip Kumar Sharma            Added batch size to MySqlQuery.
+# 18-10-26            Dilip Kumar Sharma            Added result cache time to live to MySqlQuery.
+# 18-10-26            Dilip Kumar Sharma            Added result layout to MySqlQuery.
+# 18-10-26            Dilip Kumar Sharma            Queries are slotted classes.
+# 18-10-26            Dilip Kumar Sharma            Added bind parameters and fetch sizes to OracleQuery.
+# 18-10-26            Dilip Kumar Sharma            Added target bytes per batch to queries.
 #
 #                                                                              
 # #############################################################################
 
 
 import abc
+from db_query_info import ResultLayout
 
 
 class Query:
@@ -59,7 +67,7 @@ class Query:
     Raises:
         Not Applicable.
     """
-    pass
+    __slots__ = ()
 
 
 class MySqlQuery(Query):
@@ -76,43 +84,18 @@ class MySqlQuery(Query):
     Raises:
         Not Applicable.
     """
-    def __init__(self):
-        self._query_string      =   None
-        self._query_type        =   None
-        self._record_count      =   None
-        self._info              =   None                # This will be of dict type. All other information will be stored in this.
-
-    @property
-    def query_string(self):       
-        return self._query_string
- 
-    @query_string.setter
-    def query_string(self, query_string):
-        self._query_string = query_string
-
-    @property
-    def query_type(self):       
-        return self._query_type
-    
-    @query_type.setter
-    def query_type(self, query_type):
-        self._query_type = query_type
-
-    @property
-    def record_count(self):       
-        return self._record_count
-    
-    @record_count.setter
-    def record_count(self, record_count):
-        self._record_count = record_count
+    __slots__ = ("query_string", "query_type", "record_count", "parameters", "batch_size", "batch_bytes", "cache_ttl", "result_layout", "info")
 
-    @property
-    def info(self):       
-        return self._info
-    
-    @info.setter
-    def info(self, info):
-        self._info = info
+    def __init__(self):
+        self.query_string       =   None
+        self.query_type         =   None
+        self.record_count       =   None
+        self.parameters         =   None                # Tuple/list for '%s' or dict for '%(name)s' placeholders in query string.
+        self.batch_size         =   None                # Number of records per batch of Many, BATCHES and STREAM, None to stream records one by one.
+        self.batch_bytes        =   None                # Target size in bytes of a BATCHES batch to adapt batch size to, None for fixed batch size.
+        self.cache_ttl          =   None                # Seconds for which SELECT result may be served from result cache, None to not cache.
+        self.result_layout      =   ResultLayout.ROW    # Layout of SELECT result, records or columns.
+        self.info               =   None                # This will be of dict type. All other information will be stored in this.
 
 
 class OracleQuery(Query):
@@ -129,40 +112,15 @@ class OracleQuery(Query):
     Raises:
         Not Applicable.
     """
-    def __init__(self):
-        self._query_string      =   None
-        self._query_type        =   None
-        self._record_count      =   None
-        self._info              =   None                # This will be of dict type. All other information will be stored in this.
-
-    @property
-    def query_string(self):       
-        return self._query_string
- 
-    @query_string.setter
-    def query_string(self, query_string):
-        self._query_string = query_string
-
-    @property
-    def query_type(self):       
-        return self._query_type
-    
-    @query_type.setter
-    def query_type(self, query_type):
-        self._query_type = query_type
-
-    @property
-    def record_count(self):       
-        return self._record_count
-    
-    @record_count.setter
-    def record_count(self, record_count):
-        self._record_count = record_count
+    __slots__ = ("query_string", "query_type", "record_count", "parameters", "batch_size", "batch_bytes", "arraysize", "prefetch_rows", "info")
 
-    @property
-    def info(self):       
-        return self._info
-    
-    @info.setter
-    def info(self, info):
-        self._info = info
+    def __init__(self):
+        self.query_string       =   None
+        self.query_type         =   None
+        self.record_count       =   None
+        self.parameters         =   None                # Tuple/list for ':1' or dict for ':name' bind variables in query string.
+        self.batch_size         =   None                # Number of records per batch for Many, BATCHES and STREAM, None for arraysize.
+        self.batch_bytes        =   None                # Target size in bytes of a BATCHES batch to adapt batch size to, None for fixed batch size.
+        self.arraysize          =   None                # Rows fetched per round trip, None for configured value.
+        self.prefetch_rows      =   None                # Rows returned with execute round trip, None for configured value.
+        self.info               =   None                # This will be of dict type. All other information will be stored in this.
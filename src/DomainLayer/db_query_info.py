@@ -37,6 +37,11 @@ Reference; -
 # Date (DD-MM-YY)  |  Author                    |   Change
 # -----------------------------------------------------------------------------
 # 16-02-19            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Added STREAM record count.
+# 18-10-26            Dilip Kumar Sharma            Added ResultLayout.
+# 18-10-26            Dilip Kumar Sharma            Added BATCHES record count.
+# 18-10-26            Dilip Kumar Sharma            Added ExportFormat.
+# 18-10-26            Dilip Kumar Sharma            Added RAW and LAZY cursor types.
 #
 #                                                                              
 # #############################################################################
@@ -66,6 +71,8 @@ class CursorType(IntEnum):
     """ Class CursorType represents type of database cursor to be used while fetching records.
 		To fetch normal record from DB table, use 'NORMAL'.
 		To fetch dictionary type records from DB table, use 'DICTIONARY'.
+		To fetch records of undecoded memoryview fields from DB table, use 'RAW'.
+		To fetch records whose fields are decoded on first access from DB table, use 'LAZY'.
     
     Args:
         Not Applicable.
@@ -76,12 +83,16 @@ class CursorType(IntEnum):
 	"""
     NORMAL      = 1
     DICTIONARY  = 2
+    RAW         = 3
+    LAZY        = 4
 
 
 class RecordCount(IntEnum):
     """ Class RecordCount represents Record Count Type.
 		To fetch single record from DB table, use 'SINGLE'.
 		To fetch all records from DB table, use 'ALL'.
+		To fetch records one by one (or in batches) from unbuffered cursor, use 'STREAM'.
+		To fetch all records in batches of fixed or adaptive size from unbuffered cursor, use 'BATCHES'.
     
     Args:
         Not Applicable.
@@ -93,3 +104,41 @@ class RecordCount(IntEnum):
     SINGLE  =   1
     Many    =   2
     ALL     =   3
+    STREAM  =   4
+    BATCHES =   5
+
+
+class ResultLayout(IntEnum):
+    """ Class ResultLayout represents layout of SELECT query result.
+		To fetch records as tuples or dictionaries, use 'ROW'.
+		To fetch mapping of column name to array.array or list, use 'COLUMNAR'.
+		To fetch mapping of column name to NumPy array, use 'NUMPY'.
+
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+	"""
+    ROW         =   1
+    COLUMNAR    =   2
+    NUMPY       =   3
+
+
+class ExportFormat(IntEnum):
+    """ Class ExportFormat represents file format of exported SELECT query result.
+		To export comma separated values with header row, use 'CSV'.
+		To export one JSON object per record, use 'JSONL'.
+		To export Arrow IPC stream of record batches, use 'ARROW'.
+
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+	"""
+    CSV         =   1
+    JSONL       =   2
+    ARROW       =   3
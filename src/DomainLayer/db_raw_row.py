@@ -0,0 +1,364 @@
+#!/usr/bin/python3.4
+
+"""Provides raw and lazily decoded records of MySql queries.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_raw_row.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for reading records of pymysql without converting every
+    field to a Python object, for clients reading few of many columns or passing values through.
+
+Working; -
+----------
+    pymysql reads each record from a row data packet, in which every field is a length coded
+    string, and converts all the fields. Cursors of this module replace that step for their own
+    results only, after field descriptions of the result are read.
+
+        RAW     -   Record is a tuple of memoryview of each field over the packet, or None for NULL.
+                    Nothing is copied or decoded.
+        LAZY    -   Record is a LazyRow keeping the packet. A field is located and converted on its
+                    first access and kept. Converters of columns are the ones pymysql chose from
+                    field descriptions, shared by all the records of the result.
+
+    Buffered cursors run the query unbuffered and read all the records when it is executed, so
+    they behave as pymysql Cursor. Next result set of a multi statement query is read the same way.
+    Unbuffered cursors read records as they are fetched.
+
+    Cursor classes derive from pymysql cursors, so they are created on first use and pymysql is
+    not imported before it. They rely on internals of pymysql MySQLResult, so they are built only
+    for pymysql versions from MIN_PYMYSQL_VERSION up to, not including, MAX_PYMYSQL_VERSION.
+
+Uses; -
+-------
+    This will be used by MySqlDBConnection for CursorType.RAW and CursorType.LAZY.
+
+Reference; -
+------------
+    https://dev.mysql.com/doc/dev/mysql-server/latest/page_protocol_com_query_response_text_resultset_row.html
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Buffered cursors read next result set, pymysql version is checked.
+#
+#
+# #############################################################################
+
+
+import struct
+from db_lazy_import import lazy_import
+from db_query_info import CursorType
+
+pymysql = lazy_import("pymysql")
+
+NULL_COLUMN     =   251                 # Length byte of NULL field.
+UINT16          =   struct.Struct("<H")
+UINT64          =   struct.Struct("<Q")
+
+MIN_PYMYSQL_VERSION =   (1, 0)              # Versions whose result reading is known to the cursors.
+MAX_PYMYSQL_VERSION =   (2, 3)
+
+
+def read_length(data, position):
+    """ Returns position of field data and its length, for length coded field at position.
+
+    Args:
+        data: Bytes of row data packet.
+        position: Position of length of the field.
+    Returns:
+        tuple: Position of field data, and its length or None for NULL field.
+    Raises:
+        IndexError: If position is past end of data.
+    """
+    length = data[position]
+
+    if length < NULL_COLUMN:
+        return position + 1, length
+
+    if length == NULL_COLUMN:
+        return position + 1, None
+
+    if length == 252:
+        return position + 3, UINT16.unpack_from(data, position + 1)[0]
+
+    if length == 253:
+        return position + 4, data[position + 1] | (data[position + 2] << 8) | (data[position + 3] << 16)
+
+    return position + 9, UINT64.unpack_from(data, position + 1)[0]
+
+
+def read_raw_row(data, field_count):
+    """ Returns tuple of memoryview of each field of row data packet, None for NULL field. """
+    view = memoryview(data)
+    position = 0
+    row = []
+
+    for _ in range(field_count):
+        length = data[position]
+
+        if length < NULL_COLUMN:            # Field shorter than 251 bytes, read inline as it is the common case.
+            position += 1
+        else:
+            position, length = read_length(data, position)
+
+        if length is None:
+            row.append(None)
+        else:
+            row.append(view[position:position + length])
+            position += length
+
+    return tuple(row)
+
+
+class RowLayout(object):
+    """ Class RowLayout represents the columns of a result, shared by its LazyRow records.
+
+    Args:
+        names: Column names.
+        converters: List of encoding and converter of each column, either may be None.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+    __slots__ = ("names", "indexes", "converters")
+
+    def __init__(self, names, converters):
+        self.names          =   tuple(names)
+        self.indexes        =   {name: index for index, name in enumerate(self.names)}
+        self.converters     =   tuple(converters)
+
+
+class LazyRow(object):
+    """ Class LazyRow represents a record whose fields are converted on first access.
+
+    Fields are accessed by column index or name, e.g. row[0] or row["id"]. Iterating the row gives
+    all the field values, as tuple record does.
+
+    Args:
+        data: Bytes of row data packet.
+        layout: RowLayout of the result.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+    __slots__ = ("_data", "_layout", "_spans", "_position", "_values")
+
+    def __init__(self, data, layout):
+        self._data          =   data
+        self._layout        =   layout
+        self._spans         =   []              # Position and length of fields located so far.
+        self._position      =   0               # Position of first field not located yet.
+        self._values        =   None            # Dict of column index to converted value.
+
+    def __getitem__(self, key):
+        index = self._layout.indexes[key] if isinstance(key, str) else key
+
+        if index < 0:
+            index += len(self._layout.names)
+
+        if self._values is None:
+            self._values = {}
+        elif index in self._values:
+            return self._values[index]
+
+        value = self.convert(index)
+        self._values[index] = value
+
+        return value
+
+    def __len__(self):
+        return len(self._layout.names)
+
+    def __iter__(self):
+        for index in range(len(self._layout.names)):
+            yield self[index]
+
+    def __repr__(self):
+        return "LazyRow({!r})".format(self.to_dict())
+
+    def keys(self):
+        return self._layout.names
+
+    def get(self, name, default = None):
+        return self[name] if name in self._layout.indexes else default
+
+    def to_tuple(self):
+        return tuple(self)
+
+    def to_dict(self):
+        return dict(zip(self._layout.names, self))
+
+    def convert(self, index):
+        """ Returns converted value of field.
+
+        Args:
+            index: Column index.
+        Returns:
+            object: Field value as pymysql gives it, None for NULL.
+        Raises:
+            IndexError: If index is not of a column.
+        """
+        if not 0 <= index < len(self._layout.names):
+            raise IndexError("Column index '{}' out of range.".format(index))
+
+        spans = self._spans
+
+        while len(spans) <= index:
+            position, length = read_length(self._data, self._position)
+            spans.append((position, length))
+            self._position = position + (length or 0)
+
+        position, length = spans[index]
+
+        if length is None:
+            return None
+
+        value = self._data[position:position + length]
+        encoding, converter = self._layout.converters[index]
+
+        if encoding is not None:
+            value = value.decode(encoding)
+
+        if converter is not None:
+            value = converter(value)
+
+        return value
+
+
+class RawRowCursors(object):
+    """ Class RawRowCursors gives pymysql cursor classes of raw and lazy records.
+
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    _classes = None                             # (CursorType, is unbuffered) to cursor class, built on first use.
+
+    @classmethod
+    def get_cursor_class(cls, cursor_type, is_unbuffered = False):
+        """ Returns pymysql cursor class of cursor type.
+
+        Args:
+            cursor_type: CursorType.RAW or CursorType.LAZY.
+            is_unbuffered: True for unbuffered cursor.
+        Returns:
+            class: pymysql cursor class.
+        Raises:
+            KeyError: If cursor type is not RAW or LAZY.
+        """
+        if cls._classes is None:
+            RawRowCursors._classes = cls.build_classes()
+
+        return cls._classes[(cursor_type, is_unbuffered)]
+
+    @staticmethod
+    def set_row_reader(result, cursor_type):
+        """ To make pymysql result read records of cursor type.
+
+        Args:
+            result: pymysql MySQLResult whose field descriptions are read.
+            cursor_type: CursorType.RAW or CursorType.LAZY.
+        Returns:
+            bool: True if result has records.
+        Raises:
+            Not Applicable.
+        """
+        if result is None or not result.field_count:
+            return False
+
+        if cursor_type == CursorType.LAZY:
+            layout = RowLayout([column[0] for column in result.description], result.converters)
+            result._read_row_from_packet = lambda packet: LazyRow(packet.get_all_data(), layout)
+        else:
+            field_count = result.field_count
+            result._read_row_from_packet = lambda packet: read_raw_row(packet.get_all_data(), field_count)
+
+        return True
+
+    @staticmethod
+    def check_version():
+        """ To check that pymysql version is one whose internals cursors rely on.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            ImportError: If pymysql version is older than MIN_PYMYSQL_VERSION or not older than MAX_PYMYSQL_VERSION.
+        """
+        version = tuple(pymysql.VERSION[:2])
+
+        if not MIN_PYMYSQL_VERSION <= version < MAX_PYMYSQL_VERSION:
+            raise ImportError("RAW and LAZY cursors need pymysql from {} to before {}, found {}.".format(
+                ".".join(map(str, MIN_PYMYSQL_VERSION)), ".".join(map(str, MAX_PYMYSQL_VERSION)), ".".join(map(str, version))))
+
+    @classmethod
+    def build_classes(cls):
+        cls.check_version()
+
+        cursors = pymysql.cursors
+        set_row_reader = cls.set_row_reader
+
+        class BufferedRowCursor(cursors.Cursor):
+            """ Buffered cursor which reads all records of an unbuffered query when it is executed. """
+            row_type = CursorType.RAW
+
+            def _query(self, q):
+                conn = self._get_db()
+                self._clear_result()
+                conn.query(q, unbuffered = True)
+                self._do_get_result()
+                return self.rowcount
+
+            def nextset(self):
+                return self._nextset(unbuffered = True)         # Read by _do_get_result as first result set.
+
+            def _do_get_result(self):
+                result = self._get_db()._result
+
+                if result.unbuffered_active and set_row_reader(result, self.row_type):
+                    rows = []
+                    row = result._read_rowdata_packet_unbuffered()
+
+                    while row is not None:
+                        rows.append(row)
+                        row = result._read_rowdata_packet_unbuffered()
+
+                    result.rows = tuple(rows)
+                    result.affected_rows = len(rows)
+
+                super(BufferedRowCursor, self)._do_get_result()
+
+        class UnbufferedRowCursor(cursors.SSCursor):
+            """ Unbuffered cursor which reads records as they are fetched. """
+            row_type = CursorType.RAW
+
+            def _do_get_result(self):
+                super(UnbufferedRowCursor, self)._do_get_result()
+                set_row_reader(self._result, self.row_type)
+
+        class BufferedLazyCursor(BufferedRowCursor):
+            row_type = CursorType.LAZY
+
+        class UnbufferedLazyCursor(UnbufferedRowCursor):
+            row_type = CursorType.LAZY
+
+        return {(CursorType.RAW, False): BufferedRowCursor, (CursorType.RAW, True): UnbufferedRowCursor,
+                (CursorType.LAZY, False): BufferedLazyCursor, (CursorType.LAZY, True): UnbufferedLazyCursor}
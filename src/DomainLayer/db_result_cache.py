@@ -0,0 +1,442 @@
+#!/usr/bin/python3.4
+
+"""Provides query result cache functionlity.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_result_cache.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for keeping results of SELECT queries in memory, so that
+    repeated reads of same data do not go to database.
+
+Design Pattern; -
+-----------------
+    Result cache is a LRU (Least Recently Used) cache bounded by estimated size of results in bytes.
+
+Working; -
+----------
+    Result is cached against normalized query string and its parameters, for the time to live
+    given in query. Cache remembers the tables read by each query.
+
+    When an UPDATE query writes to a table, all the cached results read from that table are removed.
+
+    Each table has a generation which is incremented when the table is invalidated. Connection takes
+    generation of the tables of a query before executing it, and put() refuses the result if any of
+    them has changed since, as the result may have been read before the write was committed.
+
+    Table names are found by a light weight scan of query string, it is not a SQL parser. If tables
+    of a SELECT query can not be found, or any table reference of its FROM clause can not be read,
+    then its result is not cached.
+
+Uses; -
+-------
+    This will be used by database connection to serve repeated SELECT queries.
+
+Reference; -
+------------
+
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            LOAD DATA INTO TABLE invalidates its table.
+# 18-10-26            Dilip Kumar Sharma            Added table generations, result read before invalidation is not cached.
+# 18-10-26            Dilip Kumar Sharma            Every table reference of FROM clause is read, query with unreadable reference is not cached.
+#
+#
+# #############################################################################
+
+
+import collections
+import re
+import sys
+import threading
+import time
+
+
+class ResultCacheEntry(object):
+    """ Class ResultCacheEntry represents one cached query result.
+
+    Args:
+        result: Query result records.
+        tables: Set of table names read by query.
+        size: Estimated size of result in bytes.
+        expires_at: Monotonic time after which entry is stale.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    def __init__(self, result, tables, size, expires_at):
+        self.result         =   result
+        self.tables         =   tables
+        self.size           =   size
+        self.expires_at     =   expires_at
+
+
+class QueryResultCache(object):
+    """ Class QueryResultCache represents thread safe LRU cache of SELECT query results.
+
+    Args:
+        max_bytes: Maximum estimated size of all cached results in bytes.
+    Returns:
+        Not Applicable.
+    Raises:
+        ValueError: If max_bytes is less than one.
+    """
+
+    DEF_MAX_BYTES       =   64 * 1024 * 1024
+
+    KEYWORDS            =   (r"(?:WHERE|GROUP|ORDER|LIMIT|HAVING|WINDOW|UNION|EXCEPT|INTERSECT|FOR|LOCK|INTO|FROM|SET|VALUES?|"
+                             r"ON|USING|JOIN|STRAIGHT_JOIN|INNER|CROSS|LEFT|RIGHT|NATURAL|USE|IGNORE|FORCE|PARTITION)\b")
+    TABLE_NAME          =   r"(?:`[^`]+`|\w+)(?:\s*\.\s*(?:`[^`]+`|\w+))?"
+    ALIAS               =   r"(?:\s+(?:AS\s+)?(?!" + KEYWORDS + r")(?:`[^`]+`|\w+))?"
+    TABLE_LIST          =   r"(" + TABLE_NAME + ALIAS + r"(?:\s*,\s*" + TABLE_NAME + ALIAS + r")*)"
+    TABLE_NAME_PATTERN  =   re.compile(TABLE_NAME)
+    READ_PATTERN        =   re.compile(r"\b(?:FROM|(?<!FOR )JOIN|(?<!SELECT )STRAIGHT_JOIN)\b\s*", re.IGNORECASE)   # Not index hint or SELECT modifier.
+    ALIAS_PATTERN       =   re.compile(r"(?:\s+PARTITION\s*\([^)]*\))?" + ALIAS +
+                                       r"(?:\s+(?:USE|IGNORE|FORCE)\s+(?:INDEX|KEY)(?:\s+FOR\s+(?:JOIN|ORDER\s+BY|GROUP\s+BY))?\s*\([^)]*\))*",
+                                       re.IGNORECASE)
+    SEPARATOR_PATTERN   =   re.compile(r"\s*,\s*")
+    TABLE_END_PATTERN   =   re.compile(r"\s*(?:\Z|;|\)|" + KEYWORDS + r")", re.IGNORECASE)
+    SUBQUERY_PATTERN    =   re.compile(r"\(\s*SELECT\b", re.IGNORECASE)
+    WRITE_PATTERN       =   re.compile(r"\b(?:UPDATE|INTO(?:\s+TABLE)?|FROM|JOIN|STRAIGHT_JOIN|TRUNCATE(?:\s+TABLE)?|(?:ALTER|DROP|RENAME)\s+TABLE)\s+(?:IGNORE\s+|LOW_PRIORITY\s+|IF\s+EXISTS\s+)*" + TABLE_LIST, re.IGNORECASE)
+    WHITESPACE_PATTERN  =   re.compile(r"\s+")
+
+    def __init__(self, max_bytes = DEF_MAX_BYTES):
+        if max_bytes < 1:
+            raise ValueError("Invalid result cache size '{}'.".format(max_bytes))
+
+        self._max_bytes     =   max_bytes
+        self._entries       =   collections.OrderedDict()
+        self._table_keys    =   collections.defaultdict(set)        # Table name to keys of entries which read it.
+        self._generations   =   {}                                  # Table name to number of times it is invalidated.
+        self._clear_count   =   0                                   # Number of times cache is cleared.
+        self._bytes         =   0
+        self._hits          =   0
+        self._misses        =   0
+        self._evictions     =   0
+        self._expirations   =   0
+        self._invalidations =   0
+        self._lock          =   threading.Lock()
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+
+    @classmethod
+    def normalize(cls, query_string):
+        """ Returns query string with whitespace collapsed and trailing semicolon removed.
+
+        Args:
+            query_string: Query string.
+        Returns:
+            str: Normalized query string.
+        Raises:
+            Not Applicable.
+        """
+        return cls.WHITESPACE_PATTERN.sub(" ", query_string).strip().rstrip(";").rstrip()
+
+    @classmethod
+    def make_key(cls, query_string, parameters = None):
+        """ Returns cache key of query string and its parameters.
+
+        Args:
+            query_string: Query string.
+            parameters: Sequence or dict of bind parameters, or None.
+        Returns:
+            tuple: Hashable cache key.
+        Raises:
+            Not Applicable.
+        """
+        if isinstance(parameters, dict):
+            parameters = tuple(sorted(parameters.items()))
+        elif parameters is not None:
+            parameters = tuple(parameters)
+
+        try:
+            hash(parameters)
+        except TypeError:
+            parameters = repr(parameters)
+
+        return cls.normalize(query_string), parameters
+
+    @classmethod
+    def get_tables(cls, query_string, pattern):
+        tables = set()
+
+        for table_list in pattern.findall(query_string):
+            for table in table_list.split(","):
+                tables.add(cls.table_name(cls.TABLE_NAME_PATTERN.match(table.strip()).group(0)))
+
+        return tables
+
+    @staticmethod
+    def table_name(name):
+        return name.split(".")[-1].strip().strip("`").lower()      # Database name is dropped, invalidation errs on safe side.
+
+    @classmethod
+    def read_tables(cls, query_string):
+        """ Returns tables read by SELECT query string.
+
+        Every table reference following FROM, JOIN or STRAIGHT_JOIN is read, including comma separated
+        lists, aliases, index hints and subqueries. If any table reference can not be read, e.g. a
+        parenthesized join, no table is returned, so that result of the query is not cached.
+
+        Args:
+            query_string: SELECT query string.
+        Returns:
+            set: Lower case table names, empty if tables can not be fully determined.
+        Raises:
+            Not Applicable.
+        """
+        tables = set()
+
+        for keyword in cls.READ_PATTERN.finditer(query_string):
+            position = keyword.end()
+
+            while True:
+                if cls.SUBQUERY_PATTERN.match(query_string, position):
+                    position = cls.skip_parentheses(query_string, position)     # Tables of subquery follow its own FROM.
+                else:
+                    match = cls.TABLE_NAME_PATTERN.match(query_string, position)
+
+                    if match is None:
+                        return set()
+
+                    tables.add(cls.table_name(match.group(0)))
+                    position = match.end()
+
+                if position < 0:
+                    return set()
+
+                position = cls.ALIAS_PATTERN.match(query_string, position).end()
+                separator = cls.SEPARATOR_PATTERN.match(query_string, position)
+
+                if separator is None:
+                    break
+
+                position = separator.end()
+
+            if not cls.TABLE_END_PATTERN.match(query_string, position):
+                return set()
+
+        return tables
+
+    @staticmethod
+    def skip_parentheses(query_string, position):
+        """ Returns position after parenthesis closing the one at position, -1 if it is not closed. """
+        depth = 0
+
+        for index in range(position, len(query_string)):
+            if query_string[index] == "(":
+                depth += 1
+            elif query_string[index] == ")":
+                depth -= 1
+
+                if not depth:
+                    return index + 1
+
+        return -1
+
+    @classmethod
+    def write_tables(cls, query_string):
+        return cls.get_tables(query_string, cls.WRITE_PATTERN)
+
+    @classmethod
+    def estimate_size(cls, value):
+        """ Returns estimated memory size of query result in bytes.
+
+        Args:
+            value: Query result, i.e. records, a record or a field value.
+        Returns:
+            int: Estimated size in bytes.
+        Raises:
+            Not Applicable.
+        """
+        size = sys.getsizeof(value)
+
+        if isinstance(value, dict):
+            size += sum(cls.estimate_size(field) for field in value.values())
+        elif isinstance(value, (tuple, list)):
+            size += sum(cls.estimate_size(item) for item in value)
+
+        return size
+
+    def get(self, key):
+        """ Returns cached result of key.
+
+        Args:
+            key: Cache key returned by make_key().
+        Returns:
+            ResultCacheEntry: Cached entry, None if it is not cached or is stale.
+        Raises:
+            Not Applicable.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+            return entry
+
+    def get_generation(self, key):
+        """ Returns generation of tables read by query of key, to be given to put() of its result.
+
+        Args:
+            key: Cache key returned by make_key().
+        Returns:
+            tuple: Generation of cache and of each table read by the query.
+        Raises:
+            Not Applicable.
+        """
+        tables = sorted(self.read_tables(key[0]))
+
+        with self._lock:
+            return self._clear_count, tuple(self._generations.get(table, 0) for table in tables)
+
+    def put(self, key, result, ttl, generation = None):
+        """ To cache result of SELECT query.
+
+        Result is not cached if tables of the query can not be found, it is larger than the cache, or
+        any of its tables is invalidated after generation was taken.
+
+        Args:
+            key: Cache key returned by make_key().
+            result: Query result records.
+            ttl: Time to live of result in seconds.
+            generation: Value of get_generation() taken before query was executed, None to not check.
+        Returns:
+            bool: True if result is cached.
+        Raises:
+            Not Applicable.
+        """
+        tables = self.read_tables(key[0])
+
+        if not tables:
+            return False
+
+        size = self.estimate_size(result)
+
+        if size > self._max_bytes:
+            return False
+
+        with self._lock:
+            if generation is not None and generation != (self._clear_count, tuple(self._generations.get(table, 0) for table in sorted(tables))):
+                return False                # Result may be older than a committed write.
+
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = ResultCacheEntry(result, tables, size, time.monotonic() + ttl)
+            self._bytes += size
+
+            for table in tables:
+                self._table_keys[table].add(key)
+
+            while self._bytes > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+        return True
+
+    def invalidate(self, tables):
+        """ To remove cached results read from any of the tables.
+
+        Args:
+            tables: Iterable of table names.
+        Returns:
+            int: Number of removed results.
+        Raises:
+            Not Applicable.
+        """
+        count = 0
+
+        with self._lock:
+            for table in tables:
+                table = self.table_name(table)
+                self._generations[table] = self._generations.get(table, 0) + 1
+
+                for key in list(self._table_keys.get(table, ())):
+                    self._remove(key)
+                    count += 1
+
+            self._invalidations += count
+
+        return count
+
+    def invalidate_query(self, query_string):
+        """ To remove cached results read from tables written by query string.
+
+        Args:
+            query_string: UPDATE query string.
+        Returns:
+            int: Number of removed results.
+        Raises:
+            Not Applicable.
+        """
+        return self.invalidate(self.write_tables(query_string))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._table_keys.clear()
+            self._bytes = 0
+            self._clear_count += 1
+
+    def stats(self):
+        """ Returns cache counters.
+
+        Args:
+            Not Applicable.
+        Returns:
+            dict: Hits, misses, hit ratio, evictions, expirations, invalidations, entries and bytes of cache.
+        Raises:
+            Not Applicable.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+
+            return {"hits": self._hits,
+                    "misses": self._misses,
+                    "hit_ratio": float(self._hits) / lookups if lookups else 0.0,
+                    "evictions": self._evictions,
+                    "expirations": self._expirations,
+                    "invalidations": self._invalidations,
+                    "entries": len(self._entries),
+                    "bytes": self._bytes,
+                    "max_bytes": self._max_bytes}
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+        for table in entry.tables:
+            keys = self._table_keys.get(table)
+
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._table_keys[table]
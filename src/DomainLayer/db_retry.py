@@ -0,0 +1,116 @@
+#!/usr/bin/python3.4
+
+"""Provides retry policy of database operations.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_retry.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for deciding how many times and after how long a failed
+    database operation is tried again.
+
+Working; -
+----------
+    Delay before n-th retry is a random value between zero and base_delay * 2 ^ (n - 1), capped
+    at max_delay (exponential backoff with full jitter). Random delay spreads out the retries of
+    the clients which failed together, e.g. when database fails over.
+
+Uses; -
+-------
+    This will be used by database connections to retry operations failed with transient errors.
+
+Reference; -
+------------
+    https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import random
+import time
+
+
+class RetryPolicy(object):
+    """ Class RetryPolicy represents number of retries and backoff between them.
+
+    Args:
+        max_retries: Maximum number of retries after first attempt, 0 to not retry.
+        base_delay: Delay limit of first retry in seconds.
+        max_delay: Delay limit of any retry in seconds.
+    Returns:
+        Not Applicable.
+    Raises:
+        ValueError: If any of the values is negative.
+    """
+
+    DEF_MAX_RETRIES     =   3
+    DEF_BASE_DELAY      =   0.05
+    DEF_MAX_DELAY       =   2.0
+
+    def __init__(self, max_retries = DEF_MAX_RETRIES, base_delay = DEF_BASE_DELAY, max_delay = DEF_MAX_DELAY):
+        if max_retries < 0 or base_delay < 0 or max_delay < 0:
+            raise ValueError("Invalid retry policy '{}, {}, {}'.".format(max_retries, base_delay, max_delay))
+
+        self._max_retries   =   max_retries
+        self._base_delay    =   base_delay
+        self._max_delay     =   max_delay
+
+    @property
+    def max_retries(self):
+        return self._max_retries
+
+    @property
+    def base_delay(self):
+        return self._base_delay
+
+    @property
+    def max_delay(self):
+        return self._max_delay
+
+    def delays(self):
+        """ Generator of delays before each retry.
+
+        Args:
+            Not Applicable.
+        Returns:
+            generator: Delay in seconds, one for each retry.
+        Raises:
+            Not Applicable.
+        """
+        for attempt in range(self._max_retries):
+            yield random.uniform(0, min(self._max_delay, self._base_delay * (2 ** attempt)))
+
+    @staticmethod
+    def wait(delays):
+        """ To sleep for next delay.
+
+        Args:
+            delays: Generator returned by delays().
+        Returns:
+            bool: True if operation may be retried, False if retries are exhausted.
+        Raises:
+            Not Applicable.
+        """
+        delay = next(delays, None)
+
+        if delay is None:
+            return False
+
+        time.sleep(delay)
+
+        return True
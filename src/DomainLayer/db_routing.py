@@ -0,0 +1,586 @@
+#!/usr/bin/python3.4
+
+"""Provides read/write splitting over MySql primary and read replicas.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_routing.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for sending SELECT queries to read replicas and all other
+    work to primary database, so that reads are spread over replicas.
+
+Design Pattern; -
+-----------------
+    RoutingMySqlDBConnection is implemented as Proxy design pattern over pooled MySql connections.
+
+Working; -
+----------
+    Query is sent to primary database if,
+
+        -   It is not a SELECT query, i.e. UPDATE query, execute_many(), load_data(), commit or rollback.
+            SELECT query of export() is routed as SELECT query of execute().
+        -   It is executed inside transaction(), or after an UPDATE query which is not committed yet.
+        -   It is executed within sticky_time seconds after a write of the same connection, so that
+            client reads its own writes even though replicas are behind.
+        -   No replica is available.
+
+    Otherwise it is sent to a replica, chosen at random by weight on first SELECT and kept while it
+    is available, so that consecutive reads of a connection do not go back in time.
+
+    ReplicaMonitor reads replication lag of a replica with SHOW REPLICA STATUS, on a driver connection
+    borrowed from pool of the replica without waiting. Lag is read once when replica is first asked
+    about, and every LAG_CHECK_INTERVAL seconds afterwards by a background thread, so SELECT queries
+    only look up the last lag. If no connection of the pool is free, last lag is kept, as replica is
+    busy serving queries. Replica lagging by more than replica_max_lag seconds, with replication
+    stopped, or not reachable is not available until its next check, and so is a replica whose lag
+    is not read for STALE_CHECKS intervals.
+
+    If SELECT on replica fails because its connection is lost, replica is marked unavailable and
+    query is executed on primary database.
+
+Uses; -
+-------
+    This will be used by MySqlDCFactory when read replicas are configured.
+
+        "Replicas": [{"Host": "10.0.0.2", "Port": "3306", "Weight": "2"},
+                     {"Host": "10.0.0.3", "Port": "3306", "Weight": "1"}],
+        "ReplicaMaxLag": "5",
+        "StickyTime": "2"
+
+Reference; -
+------------
+    https://dev.mysql.com/doc/refman/8.0/en/show-replica-status.html
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Added load_data on primary database.
+# 18-10-26            Dilip Kumar Sharma            Added export on replica or primary database.
+# 18-10-26            Dilip Kumar Sharma            Replica lag is read by background thread without waiting for pool.
+# 18-10-26            Dilip Kumar Sharma            Added reconnect and lost state of primary database connection.
+# 18-10-26            Dilip Kumar Sharma            Failed export marks transaction to be rolled back.
+#
+#
+# #############################################################################
+
+
+import random
+import threading
+import time
+from db_connection import DBConnection, MySqlDBConnection
+from db_connection_pool import PoolTimeoutError
+from db_error import ErrorCategory, MYSQL_ERROR_CATEGORIES
+from db_lazy_import import lazy_import
+from db_query_info import QueryType, ExportFormat
+
+pymysql = lazy_import("pymysql")
+
+
+class ReplicaMonitor(object):
+    """ Class ReplicaMonitor keeps replication lag of read replicas and tells whether a replica may be read from.
+
+    Args:
+        max_lag: Replica lagging by more seconds is not available.
+        check_interval: Seconds for which measured lag is used before it is measured again.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    LAG_CHECK_INTERVAL  =   1.0
+    STALE_CHECKS        =   5                   # Lag not read for these many intervals, e.g. as check hangs, is not trusted.
+    LAG_COLUMNS         =   ("Seconds_Behind_Source", "Seconds_Behind_Master")
+    LAG_QUERIES         =   ("SHOW REPLICA STATUS", "SHOW SLAVE STATUS")        # Second one is for MySql before 8.0.22.
+
+    def __init__(self, max_lag, check_interval = LAG_CHECK_INTERVAL):
+        self._max_lag           =   max_lag
+        self._check_interval    =   check_interval
+        self._states            =   {}              # Replica key to [checked time, lag in seconds or None if not available].
+        self._pools             =   {}              # Replica key to ConnectionPool, of replicas checked by background thread.
+        self._lock              =   threading.Lock()
+        self._stop              =   threading.Event()
+        self._checker           =   None
+
+    @property
+    def max_lag(self):
+        return self._max_lag
+
+    @staticmethod
+    def get_key(replica):
+        return replica.host, replica.port
+
+    def get_lag(self, replica):
+        """ Returns last measured lag of replica in seconds, None if it is not available or not measured. """
+        state = self._states.get(self.get_key(replica))
+
+        return None if state is None else state[1]
+
+    def is_available(self, replica, pool):
+        """ Returns True if replica may be read from, as per its last measured lag.
+
+        Lag of a replica asked about for the first time is measured at once, without waiting for a
+        connection of its pool. Afterwards it is measured by background thread.
+
+        Args:
+            replica: ReplicaConfig object.
+            pool: ConnectionPool of replica.
+        Returns:
+            bool: True if replica is reachable and its lag is within max_lag.
+        Raises:
+            Not Applicable.
+        """
+        key = self.get_key(replica)
+        state = self._states.get(key)
+
+        if state is None:
+            with self._lock:
+                is_first = key not in self._pools
+
+                if is_first:
+                    self._pools[key] = pool
+                    state = self._states.setdefault(key, [time.monotonic(), None])
+
+            if not is_first:
+                return False                        # Another thread is measuring first lag.
+
+            self.check(key, pool)
+            self.start()
+            state = self._states[key]
+
+        if time.monotonic() - state[0] > self._check_interval * self.STALE_CHECKS:
+            return False
+
+        return state[1] is not None and state[1] <= self._max_lag
+
+    def check(self, key, pool):
+        """ To measure lag of replica, last lag is kept if no connection of its pool is free. """
+        try:
+            lag = self.measure_lag(pool)
+        except PoolTimeoutError:
+            with self._lock:
+                self._states[key][0] = time.monotonic()
+            return
+
+        with self._lock:
+            self._states[key] = [time.monotonic(), lag]
+
+    def start(self):
+        """ To start background thread measuring lag of replicas every check interval. """
+        with self._lock:
+            if self._checker is not None:
+                return
+
+            self._checker = threading.Thread(target = self._run, name = "ReplicaMonitor", daemon = True)
+            self._checker.start()
+
+    def close(self):
+        """ To stop background thread. """
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self._check_interval):
+            with self._lock:
+                pools = list(self._pools.items())
+
+            for key, pool in pools:
+                self.check(key, pool)
+
+    def mark_failed(self, replica):
+        """ To mark replica unavailable until its next check, e.g. when its connection is lost. """
+        with self._lock:
+            self._states[self.get_key(replica)] = [time.monotonic(), None]
+
+    def measure_lag(self, pool):
+        """ Returns replication lag of replica in seconds.
+
+        Args:
+            pool: ConnectionPool of replica.
+        Returns:
+            float: Lag in seconds, 0 if server is not a replica, None if replication is stopped or server is not reachable.
+        Raises:
+            PoolTimeoutError: If no connection of pool is free, as lag is not waited for.
+        """
+        try:
+            connection = pool.acquire(timeout = 0)
+        except PoolTimeoutError:
+            raise
+        except Exception:
+            return None
+
+        try:
+            status = self.read_status(connection)
+        except Exception:
+            pool.discard(connection)
+            return None
+
+        pool.release(connection)
+
+        if not status:
+            return None if status is None else 0.0
+
+        for column in self.LAG_COLUMNS:
+            if status.get(column) is not None:
+                return float(status[column])
+
+        return None
+
+    def read_status(self, connection):
+        """ Returns replication status of server as dict, empty dict if it is not a replica, None if status can not be read. """
+        for query_string in self.LAG_QUERIES:
+            cursor = connection.cursor(pymysql.cursors.DictCursor)
+
+            try:
+                cursor.execute(query_string)
+                return cursor.fetchone() or {}
+            except pymysql.ProgrammingError:
+                continue                            # Older server does not know SHOW REPLICA STATUS.
+            finally:
+                cursor.close()
+
+        return None
+
+
+class RoutingMySqlDBConnection(DBConnection):
+    """ Class RoutingMySqlDBConnection sends SELECT queries to read replicas and other work to primary database.
+
+    Args:
+        database_config: MySqlConnectionConfig object of primary database.
+        primary: PooledMySqlDBConnection object of primary database.
+        replicas: List of ReplicaConfig and PooledMySqlDBConnection object of each replica.
+        monitor: ReplicaMonitor object shared by connections of the database.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    ERROR_CLASSIFIER    =   MySqlDBConnection.ERROR_CLASSIFIER
+
+    def __init__(self, database_config, primary, replicas, monitor):
+        super(RoutingMySqlDBConnection, self).__init__(database_config)
+        self._primary           =   primary
+        self._replicas          =   replicas
+        self._monitor           =   monitor
+        self._replica           =   None            # ReplicaConfig and connection of replica in use, None until first SELECT.
+        self._cursor_type       =   None
+        self._last_write        =   None            # Monotonic time of last write, None if connection has not written.
+        self._is_uncommitted    =   False
+
+    @property
+    def primary(self):
+        return self._primary
+
+    @property
+    def replica(self):
+        """ ReplicaConfig of replica in use, None if SELECT queries are sent to primary. """
+        return None if self._replica is None else self._replica[0]
+
+    @property
+    def cursor_type(self):
+        return self._cursor_type
+
+    def connect(self):
+        """ To connect to primary database, replica is connected on first SELECT query.
+
+        Args:
+            Not Applicable.
+        Returns:
+            QueryResult: Object representing connection result of primary database.
+        Raises:
+            Not Applicable.
+        """
+        return self._primary.connect()
+
+    def set_cursor(self, cursor_type):
+        """ To set cursor on primary database and on replica in use.
+
+        Args:
+            cursor_type: Type of cursor, e.g. Dictionary Cursor
+        Returns:
+            QueryResult: Object representing cursor creation result of primary database.
+        Raises:
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+
+        self._cursor_type = cursor_type
+
+        if self._replica is not None and self._replica[1].set_cursor(cursor_type).code != 0:
+            self.release_replica()
+
+        return self._primary.set_cursor(cursor_type)
+
+    def execute(self, query, is_commit = False):
+        """ To execute query on replica or primary database.
+
+        Args:
+            query: MySqlQuery object representing query attributes.
+            is_commit: True to commit the records.
+        Returns:
+            QueryResult: Object representing query result.
+        Raises:
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+
+        if self.active_transaction is not None:
+            is_commit = False                   # Transaction is committed on exit.
+
+        replica = self.get_read_replica() if query.query_type == QueryType.SELECT else None
+
+        if replica is not None:
+            query_result = replica[1].execute(query)
+
+            if MYSQL_ERROR_CATEGORIES.get(query_result.code) != ErrorCategory.RECONNECT:
+                return query_result
+
+            self._monitor.mark_failed(replica[0])
+            self.release_replica()
+
+        query_result = self._primary.execute(query, is_commit)
+
+        if query.query_type != QueryType.SELECT and query_result.code == 0:
+            self.set_written(is_commit)
+
+        if query_result.code != 0 and self.active_transaction is not None:
+            self.active_transaction.set_rollback_only()
+
+        return query_result
+
+    def export(self, query, sink, export_format = ExportFormat.CSV, compress = False):
+        """ To export result of SELECT query from replica or primary database, see MySqlDBConnection.export().
+
+        Export is moved to primary database only if replica is lost before anything is written to sink.
+        Failed export inside transaction() marks the transaction to be rolled back on exit.
+
+        Args:
+            query: MySqlQuery object of SELECT query.
+            sink: File path, or binary file-like object which is left open.
+            export_format: ExportFormat of the file.
+            compress: True to gzip compress the file.
+        Returns:
+            QueryResult: Object representing query result, result is number of records exported.
+        Raises:
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+
+        replica = self.get_read_replica()
+
+        if replica is not None:
+            query_result = replica[1].export(query, sink, export_format, compress)
+
+            if (MYSQL_ERROR_CATEGORIES.get(query_result.code) != ErrorCategory.RECONNECT or
+                    query_result.info["rows"] or query_result.info["bytes"]):
+                return query_result
+
+            self._monitor.mark_failed(replica[0])
+            self.release_replica()
+
+        query_result = self._primary.export(query, sink, export_format, compress)
+
+        if query_result.code != 0 and self.active_transaction is not None:
+            self.active_transaction.set_rollback_only()
+
+        return query_result
+
+    def execute_many(self, query, parameters_list, is_commit = False, commit_size = None):
+        """ To execute query once for each parameters on primary database.
+
+        Args:
+            query: MySqlQuery object representing query attributes.
+            parameters_list: List of parameters, one per execution.
+            is_commit: True to commit the records.
+            commit_size: Number of rows after which to commit, None to commit once at end.
+        Returns:
+            QueryResult: Object representing query result, result is total number of affected rows.
+        Raises:
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+
+        if self.active_transaction is not None:
+            is_commit = False
+
+        query_result = self._primary.execute_many(query, parameters_list, is_commit, commit_size)
+
+        if query_result.code == 0:
+            self.set_written(is_commit)
+        elif self.active_transaction is not None:
+            self.active_transaction.set_rollback_only()
+        else:
+            self.set_written(True)              # Uncommitted rows are rolled back, rows committed before failure are written.
+
+        return query_result
+
+    def load_data(self, table, source, columns = None, is_commit = False, chunk_size = MySqlDBConnection.DEF_LOAD_CHUNK_SIZE, null_value = None):
+        """ To bulk load rows into table of primary database, see MySqlDBConnection.load_data(). """
+        self.check_owner()
+
+        if self.active_transaction is not None:
+            is_commit = False
+
+        query_result = self._primary.load_data(table, source, columns, is_commit, chunk_size, null_value)
+        self.set_written(is_commit)             # Chunks loaded before a failure are written too.
+
+        if query_result.code != 0 and self.active_transaction is not None:
+            self.active_transaction.set_rollback_only()
+
+        return query_result
+
+    def commit(self):
+        self.check_owner()
+        self._primary.commit()
+        self.set_written(True)
+
+    def rollback(self):
+        self.check_owner()
+        self._primary.rollback()
+        self._is_uncommitted = False
+
+    def end_transaction(self, is_commit):
+        """ To commit or roll back transaction on primary database.
+
+        Args:
+            is_commit: True to commit, False to roll back.
+        Returns:
+            QueryResult: Object representing commit or rollback result.
+        Raises:
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+
+        query_result = self._primary.end_transaction(is_commit)
+
+        if is_commit and query_result.code == 0:
+            self.set_written(True)
+        else:
+            self._is_uncommitted = False
+
+        return query_result
+
+    def set_written(self, is_committed):
+        """ To note a write on primary database, SELECT queries are sent to primary for sticky_time afterwards. """
+        self._is_uncommitted = not is_committed
+        self._last_write = time.monotonic()
+
+    def is_sticky(self):
+        """ Returns True if SELECT query must be sent to primary database to see writes of this connection. """
+        if self.active_transaction is not None or self._is_uncommitted:
+            return True
+
+        return self._last_write is not None and time.monotonic() - self._last_write < self.database_config.sticky_time
+
+    def get_read_replica(self):
+        """ Returns replica to send SELECT query to.
+
+        Args:
+            Not Applicable.
+        Returns:
+            tuple: ReplicaConfig and connected PooledMySqlDBConnection, None to send query to primary database.
+        Raises:
+            Not Applicable.
+        """
+        if self.is_sticky():
+            return None
+
+        if self._replica is not None:
+            if self._monitor.is_available(self._replica[0], self._replica[1].pool):
+                return self._replica
+
+            self.release_replica()
+
+        candidates = [replica for replica in self._replicas if replica[0].weight > 0 and self._monitor.is_available(replica[0], replica[1].pool)]
+
+        while candidates:
+            replica = self.choose(candidates)
+            candidates.remove(replica)
+
+            if self.connect_replica(replica[1]):
+                self._replica = replica
+                return replica
+
+            self._monitor.mark_failed(replica[0])
+
+        return None
+
+    @staticmethod
+    def choose(candidates):
+        """ Returns one of the replicas chosen at random by weight. """
+        point = random.uniform(0, sum(replica[0].weight for replica in candidates))
+
+        for replica in candidates:
+            point -= replica[0].weight
+            if point <= 0:
+                return replica
+
+        return candidates[-1]
+
+    def connect_replica(self, connection):
+        if connection.connect().code != 0:
+            return False
+
+        if self._cursor_type is not None and connection.set_cursor(self._cursor_type).code != 0:
+            connection.disconnect()
+            return False
+
+        return True
+
+    def release_replica(self):
+        if self._replica is not None:
+            self._replica[1].disconnect()
+            self._replica = None
+
+    def reconnect(self):
+        """ To replace lost driver connection of primary database, replica in use is returned to its pool.
+
+        Args:
+            Not Applicable.
+        Returns:
+            tuple: QueryResult object, and ErrorCategory of error or None if reconnection is successful.
+        Raises:
+            CrossThreadUsageError: If connection is used by a thread other than its owner.
+        """
+        self.check_owner()
+        self.release_replica()
+
+        self._is_uncommitted = False            # Uncommitted work is lost with connection.
+
+        return self._primary.reconnect()
+
+    def is_connection_lost(self):
+        """ Returns True if driver connection of primary database is lost. """
+        return self._primary.is_connection_lost()
+
+    def discard_connection(self, is_lost = True):
+        """ To close lost driver connections of primary database and of replica in use. """
+        self._primary.discard_connection(is_lost)
+
+        if self._replica is not None:
+            self._replica[1].discard_connection(is_lost)
+            self._replica = None
+
+    def disconnect(self):
+        """ To return driver connections of primary database and of replica in use to their pools.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        self.release_replica()
+        self._primary.disconnect()
+        self._is_uncommitted = False
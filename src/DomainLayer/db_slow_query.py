@@ -0,0 +1,335 @@
+#!/usr/bin/python3.4
+
+"""Provides log of slow queries with their query plans.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_slow_query.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for keeping a client side record of the queries which took
+    long, so that a latency spike can be traced to the query strings which caused it.
+
+Working; -
+----------
+    Database connection hands over each executed query with its duration. Query taking threshold
+    seconds or more is logged. Faster query is logged with probability of sample rate, so that
+    the log also shows what normal queries look like.
+
+    Each entry is one JSON line of,
+
+        time        -   Wall clock time at which query ended, ISO format in UTC.
+        host, port  -   Database server on which query ran, e.g. a replica.
+        sql         -   Query string as given, bind parameters are not logged.
+        parameters  -   Fingerprint of bind parameters, same parameters give same fingerprint.
+        rows        -   Number of records fetched, or of rows affected by UPDATE query.
+        total       -   Seconds taken by execute(), including retries.
+        execute     -   Seconds taken by execute phase of last attempt.
+        fetch       -   Seconds taken by fetch phase of last attempt, absent for streamed results.
+        attempts    -   Number of times query was sent to database.
+        code        -   Result code, 0 for success.
+        sampled     -   True if query is below threshold and logged as a sample.
+        explain     -   Query plan of EXPLAIN FORMAT=JSON, for SELECT query taking explain
+                        threshold seconds or more.
+
+    Caller only builds the entry and puts it in a bounded queue. A background thread runs EXPLAIN
+    on its own connection to the database, one per database, and writes the entries to a file
+    rotated by size. So client pays for neither the EXPLAIN round trip nor the file write. If the
+    queue is full the entry is dropped and counted.
+
+    Same query string is explained at most once per explain interval, so a hot slow query does
+    not load the database with EXPLAIN.
+
+Uses; -
+-------
+    This will be used by MySqlDBConnection.execute() when slow query log is configured.
+
+Reference; -
+------------
+    https://dev.mysql.com/doc/refman/8.0/en/explain.html
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import datetime
+import hashlib
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import threading
+import time
+from db_query_info import QueryType
+from db_result_cache import QueryResultCache
+
+
+class SlowQueryLog(object):
+    """ Class SlowQueryLog represents a rotating file of slow and sampled queries.
+
+    Args:
+        path: Path of log file.
+        connect: Callable taking database configuration and returning driver connection for EXPLAIN.
+        close: Callable closing driver connection returned by connect.
+        threshold: Query taking these many seconds or more is logged.
+        sample_rate: Fraction, between 0 and 1, of faster queries which are logged.
+        explain_threshold: SELECT query taking these many seconds or more is explained, None to not explain.
+        max_bytes: Log file is rotated when it reaches this size.
+        backup_count: Number of rotated log files kept.
+    Returns:
+        Not Applicable.
+    Raises:
+        ValueError: If threshold is negative or sample rate is not between 0 and 1.
+    """
+
+    DEF_THRESHOLD           =   1.0
+    DEF_SAMPLE_RATE         =   0.0
+    DEF_EXPLAIN_THRESHOLD   =   5.0
+    DEF_MAX_BYTES           =   10 * 1024 * 1024
+    DEF_BACKUP_COUNT        =   5
+    QUEUE_SIZE              =   1000            # Entries waiting to be written, more are dropped.
+    EXPLAIN_INTERVAL        =   60.0            # Seconds before same query string is explained again.
+    MAX_EXPLAINED           =   1000            # Query strings remembered as explained.
+
+    def __init__(self, path, connect = None, close = None, threshold = DEF_THRESHOLD, sample_rate = DEF_SAMPLE_RATE,
+                 explain_threshold = DEF_EXPLAIN_THRESHOLD, max_bytes = DEF_MAX_BYTES, backup_count = DEF_BACKUP_COUNT):
+        if threshold < 0 or not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("Invalid slow query threshold '{}' or sample rate '{}'.".format(threshold, sample_rate))
+
+        self._path              =   path
+        self._connect           =   connect
+        self._close             =   close
+        self._threshold         =   threshold
+        self._sample_rate       =   sample_rate
+        self._explain_threshold =   explain_threshold if connect is not None else None
+        self._max_bytes         =   max_bytes
+        self._backup_count      =   backup_count
+        self._queue             =   queue.Queue(self.QUEUE_SIZE)
+        self._explained         =   {}              # Normalized query string to monotonic time it was explained at.
+        self._connections       =   {}              # Database key to driver connection, used by writer thread only.
+        self._dropped_count     =   0
+        self._writer            =   None
+        self._lock              =   threading.Lock()
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def threshold(self):
+        return self._threshold
+
+    @property
+    def sample_rate(self):
+        return self._sample_rate
+
+    @property
+    def explain_threshold(self):
+        return self._explain_threshold
+
+    @property
+    def dropped_count(self):
+        return self._dropped_count
+
+    @staticmethod
+    def get_fingerprint(parameters):
+        """ Returns short hash of bind parameters, None if query has no parameters.
+
+        Args:
+            parameters: Sequence or dict of bind parameters, or None.
+        Returns:
+            str: Hex digest identifying the parameters without showing their values.
+        Raises:
+            Not Applicable.
+        """
+        if parameters is None:
+            return None
+
+        _, parameters = QueryResultCache.make_key("", parameters)
+
+        return hashlib.sha1(repr(parameters).encode("utf-8")).hexdigest()[:16]
+
+    def is_logged(self, duration):
+        """ Returns True if query of duration is to be logged, i.e. it is slow or it is sampled. """
+        return duration >= self._threshold or (self._sample_rate > 0.0 and random.random() < self._sample_rate)
+
+    def record(self, connection, query, query_result, duration, statistics):
+        """ To log executed query if it is slow or sampled.
+
+        Args:
+            connection: MySqlDBConnection which executed query.
+            query: MySqlQuery object representing query attributes.
+            query_result: QueryResult of query.
+            duration: Seconds taken by execute().
+            statistics: Dict of execute and fetch seconds, rows and attempts of the query.
+        Returns:
+            bool: True if query is queued to be logged.
+        Raises:
+            Not Applicable.
+        """
+        if not self.is_logged(duration):
+            return False
+
+        config = connection.database_config
+        entry = {"time": time.time(),
+                 "host": config.host,
+                 "port": config.port,
+                 "sql": query.query_string,
+                 "parameters": self.get_fingerprint(query.parameters),
+                 "rows": statistics.get("rows"),
+                 "total": duration,
+                 "execute": statistics.get("execute"),
+                 "fetch": statistics.get("fetch"),
+                 "attempts": statistics.get("attempts"),
+                 "code": query_result.code,
+                 "sampled": duration < self._threshold}
+
+        explain = None
+
+        if self._explain_threshold is not None and duration >= self._explain_threshold and \
+                query.query_type == QueryType.SELECT and self.is_explain_due(query.query_string):
+            try:
+                explain = "EXPLAIN FORMAT=JSON " + connection.get_query_string(query)
+            except Exception:
+                explain = None                  # Connection is lost, query is logged without plan.
+
+        try:
+            self._queue.put_nowait((entry, config, explain))
+        except queue.Full:
+            self._dropped_count += 1
+            return False
+
+        self.start()
+
+        return True
+
+    def is_explain_due(self, query_string):
+        """ Returns True if query string is not explained within explain interval, and marks it explained. """
+        key = QueryResultCache.normalize(query_string)
+        now = time.monotonic()
+
+        with self._lock:
+            explained_at = self._explained.get(key)
+
+            if explained_at is not None and now - explained_at < self.EXPLAIN_INTERVAL:
+                return False
+
+            if len(self._explained) >= self.MAX_EXPLAINED:
+                self._explained = {query: at for query, at in self._explained.items() if now - at < self.EXPLAIN_INTERVAL}
+
+            self._explained[key] = now
+
+        return True
+
+    def start(self):
+        """ To start writer thread on first logged query. """
+        if self._writer is not None:
+            return
+
+        with self._lock:
+            if self._writer is not None:
+                return
+
+            self._writer = threading.Thread(target = self._run, name = "SlowQueryLog", daemon = True)
+            self._writer.start()
+
+    def close(self, timeout = None):
+        """ To write queued entries and stop writer thread.
+
+        Args:
+            timeout: Seconds to wait for writer thread, None to wait until it stops.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        with self._lock:
+            writer, self._writer = self._writer, None
+
+        if writer is not None:
+            self._queue.put(None)
+            writer.join(timeout)
+
+    def _run(self):
+        handler = logging.handlers.RotatingFileHandler(self._path, maxBytes = self._max_bytes, backupCount = self._backup_count,
+                                                       encoding = "utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger = logging.Logger("SlowQueryLog")         # Not registered with logging, so its entries go to this file only.
+        logger.propagate = False
+        logger.addHandler(handler)
+
+        try:
+            while True:
+                item = self._queue.get()
+
+                if item is None:
+                    break
+
+                entry, config, explain = item
+
+                if explain is not None:
+                    entry["explain"] = self.explain(config, explain)
+
+                entry["time"] = datetime.datetime.fromtimestamp(entry["time"], datetime.timezone.utc).isoformat()
+                logger.info(json.dumps(entry, default = str))
+        finally:
+            handler.close()
+
+            for connection in self._connections.values():
+                self._close_connection(connection)
+            self._connections.clear()
+
+    def explain(self, config, explain):
+        """ Returns query plan of EXPLAIN statement, run on connection of writer thread to the database.
+
+        Args:
+            config: Configuration of database on which query ran.
+            explain: EXPLAIN FORMAT=JSON statement.
+        Returns:
+            object: Query plan, or dict having error message if EXPLAIN failed.
+        Raises:
+            Not Applicable.
+        """
+        key = (config.host, config.port, config.name, config.user)
+        connection = self._connections.get(key)
+
+        try:
+            if connection is None:
+                connection = self._connections[key] = self._connect(config)
+
+            cursor = connection.cursor()
+
+            try:
+                cursor.execute(explain)
+                row = cursor.fetchone()
+            finally:
+                cursor.close()
+
+            return json.loads(row[0]) if row else None
+        except Exception as error:
+            connection = self._connections.pop(key, None)
+
+            if connection is not None:
+                self._close_connection(connection)         # Opened again for next EXPLAIN.
+
+            return {"error": str(error)}
+
+    def _close_connection(self, connection):
+        try:
+            self._close(connection)
+        except Exception:
+            pass                                # Connection is lost.
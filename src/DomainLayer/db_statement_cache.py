@@ -0,0 +1,262 @@
+#!/usr/bin/python3.4
+
+"""Provides prepared statement cache functionlity.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_statement_cache.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for parsing parameterized queries once and
+    keeping the parsed statements in a bounded cache.
+
+Design Pattern; -
+-----------------
+    Statement cache is a LRU (Least Recently Used) cache keyed by query string.
+
+Working; -
+----------
+    Query string is split on its bind placeholders, '%s' for positional and '%(name)s'
+    for named parameters, and '%%' for a literal percent sign.
+
+    Binding joins the split query string with escaped parameter values, so repeated
+    queries are not scanned again.
+
+Uses; -
+-------
+    This will be used by database connection to execute parameterized queries.
+
+Reference; -
+------------
+
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Added statement cache registry of driver connections.
+#
+#
+# #############################################################################
+
+
+import collections
+import re
+import threading
+import weakref
+
+
+class PreparedStatement(object):
+    """ Class PreparedStatement represents a query string parsed on its bind placeholders.
+
+    Args:
+        query_string: Query string with '%s' or '%(name)s' placeholders.
+    Returns:
+        Not Applicable.
+    Raises:
+        ValueError: If query string mixes positional and named placeholders.
+    """
+
+    PLACEHOLDER_PATTERN     =   re.compile(r"%(?:\((\w+)\))?s|%%")
+
+    def __init__(self, query_string):
+        self._query_string  =   query_string
+        self._fragments     =   []              # Query text between placeholders, one more than placeholders.
+        self._keys          =   []              # Parameter name for named placeholder, None for positional.
+        self.parse()
+
+    @property
+    def query_string(self):
+        return self._query_string
+
+    @property
+    def parameter_count(self):
+        return len(self._keys)
+
+    @property
+    def is_named(self):
+        return bool(self._keys) and self._keys[0] is not None
+
+    def parse(self):
+        """ To split query string on its placeholders.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            ValueError: If query string mixes positional and named placeholders.
+        """
+        fragment    =   []
+        position    =   0
+
+        for match in self.PLACEHOLDER_PATTERN.finditer(self._query_string):
+            fragment.append(self._query_string[position:match.start()])
+            position = match.end()
+
+            if match.group(0) == "%%":
+                fragment.append("%")
+                continue
+
+            self._fragments.append("".join(fragment))
+            self._keys.append(match.group(1))
+            fragment = []
+
+        fragment.append(self._query_string[position:])
+        self._fragments.append("".join(fragment))
+
+        if len(set(key is None for key in self._keys)) > 1:
+            raise ValueError("Query '{}' mixes positional and named parameters.".format(self._query_string))
+
+    def bind(self, parameters, escape):
+        """ To build executable query string from parameters.
+
+        Args:
+            parameters: Sequence for positional or dict for named placeholders.
+            escape: Callable which returns SQL literal of a parameter value.
+        Returns:
+            str: Query string with escaped parameter values.
+        Raises:
+            ValueError: If parameters do not match the placeholders.
+        """
+        if self.is_named:
+            if not isinstance(parameters, dict):
+                raise ValueError("Named parameters are required for query '{}'.".format(self._query_string))
+            try:
+                values = [parameters[key] for key in self._keys]
+            except KeyError as error:
+                raise ValueError("Parameter {} is missing for query '{}'.".format(error, self._query_string))
+        else:
+            if isinstance(parameters, dict):
+                raise ValueError("Positional parameters are required for query '{}'.".format(self._query_string))
+            values = parameters
+            if len(values) != len(self._keys):
+                raise ValueError("Query '{}' needs {} parameters, {} given.".format(self._query_string, len(self._keys), len(values)))
+
+        parts = [self._fragments[0]]
+
+        for value, fragment in zip(values, self._fragments[1:]):
+            parts.append(escape(value))
+            parts.append(fragment)
+
+        return "".join(parts)
+
+
+class StatementCache(object):
+    """ Class StatementCache represents bounded LRU cache of prepared statements keyed by query string.
+
+    Args:
+        max_size: Maximum number of statements kept in cache.
+    Returns:
+        Not Applicable.
+    Raises:
+        ValueError: If max_size is less than one.
+    """
+
+    DEF_MAX_SIZE    =   128
+
+    _connection_caches      =   weakref.WeakKeyDictionary()     # Statement cache of each driver connection.
+    _connection_caches_lock =   threading.Lock()
+
+    def __init__(self, max_size = DEF_MAX_SIZE):
+        if max_size < 1:
+            raise ValueError("Invalid statement cache size '{}'.".format(max_size))
+
+        self._max_size      =   max_size
+        self._statements    =   collections.OrderedDict()
+        self._hits          =   0
+        self._misses        =   0
+        self._lock          =   threading.Lock()
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @property
+    def size(self):
+        return len(self._statements)
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def get(self, query_string):
+        """ Returns prepared statement for query string, parsing it on cache miss.
+
+        Args:
+            query_string: Query string with bind placeholders.
+        Returns:
+            PreparedStatement: Parsed query string.
+        Raises:
+            ValueError: If query string mixes positional and named placeholders.
+        """
+        with self._lock:
+            statement = self._statements.get(query_string)
+
+            if statement is not None:
+                self._hits += 1
+                self._statements.move_to_end(query_string)
+                return statement
+
+            self._misses += 1
+
+        statement = PreparedStatement(query_string)
+
+        with self._lock:
+            self._statements[query_string] = statement
+
+            if len(self._statements) > self._max_size:
+                self._statements.popitem(last = False)
+
+        return statement
+
+    def clear(self):
+        with self._lock:
+            self._statements.clear()
+
+    def stats(self):
+        """ Returns cache counters.
+
+        Args:
+            Not Applicable.
+        Returns:
+            dict: Hits, misses and size of cache.
+        Raises:
+            Not Applicable.
+        """
+        return {"hits": self._hits, "misses": self._misses, "size": self.size, "max_size": self._max_size}
+
+    @classmethod
+    def for_connection(cls, connection, max_size = DEF_MAX_SIZE):
+        """ Returns statement cache of driver connection, creating it on first request.
+
+        Cache lives as long as driver connection, so it is kept when pooled connection is reused.
+
+        Args:
+            connection: Driver connection.
+            max_size: Maximum number of statements kept in new cache.
+        Returns:
+            StatementCache: Cache of prepared statements of driver connection.
+        Raises:
+            Not Applicable.
+        """
+        with cls._connection_caches_lock:
+            cache = cls._connection_caches.get(connection)
+
+            if cache is None:
+                cache = cls(max_size)
+                cls._connection_caches[connection] = cache
+
+        return cache
@@ -0,0 +1,200 @@
+#!/usr/bin/python3.4
+
+"""Provides one database connection per thread.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file db_thread_connection.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for giving each thread of a multi-threaded worker its own
+    connection and cursor, created on first use and reused by the thread afterwards.
+
+Working; -
+----------
+    Connection of the current thread is kept in a threading.local, so a thread gets its connection
+    without taking a lock. Connections are also kept in a registry of thread to connection, so that
+    connections of threads which have finished are disconnected by reclaim(). reclaim() is called
+    whenever a new connection is created, and may also be called by clients.
+
+    Owner thread of each connection is set, so connection raises CrossThreadUsageError if another
+    thread uses it, e.g. when connection is handed to a thread pool by mistake.
+
+Uses; -
+-------
+    This will be used by multi-threaded clients which need a connection in each thread.
+
+        manager = ThreadConnectionManager()
+        connection = manager.get_connection()       # In any thread.
+        query_result = connection.execute(query)
+        ...
+        manager.close()
+
+Reference; -
+------------
+    https://docs.python.org/3/library/threading.html#thread-local-data
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import threading
+from db_query_info import CursorType
+from dc_factory import DCFactory
+
+
+class ThreadConnectionError(Exception):
+    """ Class ThreadConnectionError is raised when connection of a thread can not be connected.
+
+    Args:
+        message: Error message.
+        query_result: QueryResult object of failed connect or cursor creation.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    def __init__(self, message, query_result):
+        super(ThreadConnectionError, self).__init__(message)
+        self.query_result = query_result
+
+
+class ThreadConnectionManager(object):
+    """ Class ThreadConnectionManager creates and keeps one connected database connection per thread.
+
+    Args:
+        factory: DCFactory object creating connections, factory of environment if None.
+        cursor_type: Type of cursor set on each connection.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    def __init__(self, factory = None, cursor_type = CursorType.NORMAL):
+        self._factory       =   factory if factory is not None else DCFactory.get_dc_factory()
+        self._cursor_type   =   cursor_type
+        self._local         =   threading.local()
+        self._connections   =   {}                  # Thread object to its connection.
+        self._lock          =   threading.Lock()
+
+    @property
+    def size(self):
+        with self._lock:
+            return len(self._connections)
+
+    def get_connection(self):
+        """ Returns connection of current thread, connecting it on first call in the thread.
+
+        Args:
+            Not Applicable.
+        Returns:
+            DBConnection: Connected connection with cursor set, owned by current thread.
+        Raises:
+            ThreadConnectionError: If connection can not be connected or cursor can not be created.
+        """
+        connection = getattr(self._local, "connection", None)
+
+        if connection is not None:
+            return connection
+
+        self.reclaim()
+
+        connection = self._factory.get_connection()
+        query_result = connection.connect()
+
+        if query_result.code == 0:
+            query_result = connection.set_cursor(self._cursor_type)
+
+            if query_result.code != 0:
+                connection.disconnect()
+
+        if query_result.code != 0:
+            raise ThreadConnectionError("Connection of thread '{}' failed, {} {}.".format(
+                threading.current_thread().name, query_result.code, query_result.message), query_result)
+
+        connection.owner_thread = threading.get_ident()
+        self._local.connection = connection
+
+        with self._lock:
+            self._connections[threading.current_thread()] = connection
+
+        return connection
+
+    def release(self):
+        """ To disconnect connection of current thread, next get_connection() connects a new one.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        connection = getattr(self._local, "connection", None)
+
+        if connection is None:
+            return
+
+        self._local.connection = None
+
+        with self._lock:
+            self._connections.pop(threading.current_thread(), None)
+
+        connection.disconnect()
+
+    def reclaim(self):
+        """ To disconnect connections of threads which have finished.
+
+        Args:
+            Not Applicable.
+        Returns:
+            int: Number of connections disconnected.
+        Raises:
+            Not Applicable.
+        """
+        with self._lock:
+            dead_threads = [thread for thread in self._connections if not thread.is_alive()]
+            connections = [self._connections.pop(thread) for thread in dead_threads]
+
+        for connection in connections:
+            connection.owner_thread = None          # Owner has finished, current thread may disconnect it.
+            connection.disconnect()
+
+        return len(connections)
+
+    def close(self):
+        """ To disconnect connections of all the threads.
+
+        Connections of live threads are disconnected too, threads must not use them afterwards.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+
+        self._local = threading.local()
+
+        for connection in connections:
+            connection.owner_thread = None
+            connection.disconnect()
@@ -40,6 +40,15 @@ Reference; -
 # Date (DD-MM-YY)  |  Author                    |   Change
 # -----------------------------------------------------------------------------
 # 16-02-19            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            MySqlDCFactory hands out pooled connections.
+# 18-10-26            Dilip Kumar Sharma            Added AsyncMySqlDCFactory for asyncio clients.
+# 18-10-26            Dilip Kumar Sharma            MySqlDCFactory sets shared result cache on connections.
+# 18-10-26            Dilip Kumar Sharma            Factories are created once per process and initialized once.
+# 18-10-26            Dilip Kumar Sharma            Connection modules are imported on first get_connection().
+# 18-10-26            Dilip Kumar Sharma            MySqlDCFactory sets retry policy on connections.
+# 18-10-26            Dilip Kumar Sharma            MySqlDCFactory routes SELECT to read replicas if configured.
+# 18-10-26            Dilip Kumar Sharma            MySql pool validates, keeps alive and recycles connections.
+# 18-10-26            Dilip Kumar Sharma            MySqlDCFactory sets shared slow query log on connections.
 #
 #                                                                              
 # #############################################################################
@@ -47,9 +56,14 @@ Reference; -
 
 import os
 import abc
+import functools
+import threading
 from enum import IntEnum
 from dc_config_dao_factory import DCConfigDaoFactory
-from db_connection import MySqlDBConnection, OracleDBConnection
+from dc_connection_dao import ConnectionDao, MySqlConnectionConfig
+from db_connection_pool import ConnectionPool
+from db_result_cache import QueryResultCache
+from db_retry import RetryPolicy
 from db_query import MySqlQuery, OracleQuery
 
 
@@ -83,6 +97,9 @@ class DCFactory(object):
     DC_FACT_ENV_VAR         =   "DC_FACT_TYPE"
     DEF_DC_FACT_TYPE        =   DCFactoryType.MYSQL_FACTORY    
 
+    _factories              =   {}              # Factory shared in process, keyed by factory class and configuration source.
+    _factories_lock         =   threading.Lock()
+
     def __init__(self):
         self.config_dao_factory = None
         self.database_config = None
@@ -132,9 +149,73 @@ class DCFactory(object):
         factory_type = cls.get_factory_type()
 
         if factory_type == DCFactoryType.MYSQL_FACTORY:
-            return MySqlDCFactory()
+            return cls.get_shared_factory(MySqlDCFactory)
+        elif factory_type == DCFactoryType.ORACLE_FACTORY:
+            return cls.get_shared_factory(OracleDCFactory)
+        else:
+            raise ValueError("Invalid DC Factory Type")
+
+    @classmethod
+    def get_shared_factory(cls, factory_class):
+        """ Returns factory shared in process for current configuration source.
+
+        Factory, and so configuration, is created on first request only.
+
+        Args:
+            factory_class: Specific DCFactory class.
+        Returns:
+            DCFactory: Shared factory object.
+        Raises:
+            ValueError: If configuration is invalid.
+        """
+        key = (factory_class, DCConfigDaoFactory.get_factory_type(), os.getenv(ConnectionDao.CONN_CFG_ENV_VAR, None))
+        factory = DCFactory._factories.get(key)
+
+        if factory is None:
+            with DCFactory._factories_lock:
+                factory = DCFactory._factories.get(key)
+
+                if factory is None:
+                    factory = factory_class()
+                    DCFactory._factories[key] = factory
+
+        return factory
+
+    @classmethod
+    def clear_factories(cls):
+        """ To drop shared factories and configurations, so that configuration is read again on next request.
+
+        Connection pools and result caches are kept.
+
+        Args:
+            Not Applicable.
+        Returns:
+            Not Applicable.
+        Raises:
+            Not Applicable.
+        """
+        with DCFactory._factories_lock:
+            DCFactory._factories.clear()
+
+        ConnectionDao.clear_shared()
+
+    @classmethod
+    def get_async_dc_factory(cls):
+        """ Creates database specific factory for asyncio clients.
+
+        Args:
+            Not Applicable.
+        Returns:
+            DCFactory: Specific asyncio factory.
+        Raises:
+            ValueError: If factory type is not among the constants in DCFactoryType or has no asyncio support.
+        """
+        factory_type = cls.get_factory_type()
+
+        if factory_type == DCFactoryType.MYSQL_FACTORY:
+            return cls.get_shared_factory(AsyncMySqlDCFactory)
         elif factory_type == DCFactoryType.ORACLE_FACTORY:
-            return OracleDCFactory()
+            raise ValueError("Async DC Factory is not supported for Oracle")
         else:
             raise ValueError("Invalid DC Factory Type")
 
@@ -152,10 +233,14 @@ class MySqlDCFactory(DCFactory):
         Not Applicable.
     """
 
+    _pools          =   {}                      # Connection pools shared by all MySqlDCFactory objects, keyed by database.
+    _result_caches  =   {}                      # Result caches shared by all MySqlDCFactory objects, keyed by database.
+    _monitors       =   {}                      # Replica monitors shared by all MySqlDCFactory objects, keyed by database.
+    _slow_query_logs =  {}                      # Slow query logs shared by all MySqlDCFactory objects, keyed by file path.
+    _pools_lock     =   threading.Lock()
+
     def __init__(self):
-        super(MySqlDCFactory, self).__init__()
-        self.database_config = None
-        self.initialize()               
+        super(MySqlDCFactory, self).__init__()        # Base class calls initialize().
 
     def initialize(self):
         """ To initialize MySql database configuration.
@@ -178,14 +263,197 @@ class MySqlDCFactory(DCFactory):
     def get_connection(self):
         """ Returns MySqlDBConnection class object.
 
+        Returned connection borrows its driver connection from pool on connect() and returns it on disconnect().
+        It shares result cache of the database if result cache is enabled in configuration, and slow
+        query log if slow query log file is configured.
+
+        If read replicas are configured, returned connection routes SELECT queries to a replica and
+        other queries to primary database.
+
         Args:
             Not Applicable.
         Returns:
-            MySqlDBConnection: To connect to MySql database.
+            PooledMySqlDBConnection: To connect to MySql database, RoutingMySqlDBConnection if replicas are configured.
         Raises:
             Not Applicable.
-        """         
-        return MySqlDBConnection(self.database_config)
+        """
+        if self.database_config.replicas:
+            from db_routing import RoutingMySqlDBConnection
+
+            replicas = [(replica, self.get_pooled_connection(self.get_replica_config(replica))) for replica in self.database_config.replicas]
+
+            return RoutingMySqlDBConnection(self.database_config, self.get_pooled_connection(self.database_config), replicas, self.get_replica_monitor())
+
+        return self.get_pooled_connection(self.database_config)
+
+    def get_pooled_connection(self, database_config):
+        from db_connection import PooledMySqlDBConnection
+
+        connection = PooledMySqlDBConnection(database_config, self.get_pool(database_config))
+        connection.result_cache = self.get_result_cache()
+        connection.retry_policy = self.get_retry_policy()
+        connection.slow_query_log = self.get_slow_query_log()
+
+        return connection
+
+    def get_replica_config(self, replica):
+        """ Returns connection configuration of read replica.
+
+        Args:
+            replica: ReplicaConfig object.
+        Returns:
+            MySqlConnectionConfig: Configuration of primary database with host and port of replica.
+        Raises:
+            Not Applicable.
+        """
+        config = self.database_config
+
+        return MySqlConnectionConfig(config.database, replica.host, replica.port, config.name, config.user, config.password,
+                                     config.pool_min_size, config.pool_max_size, config.pool_timeout, config.result_cache_size,
+                                     config.retry_count, config.retry_delay, config.retry_max_delay,
+                                     pool_idle_threshold = config.pool_idle_threshold, pool_keepalive = config.pool_keepalive,
+                                     pool_max_lifetime = config.pool_max_lifetime, pool_lifetime_jitter = config.pool_lifetime_jitter)
+
+    def get_replica_monitor(self):
+        """ Returns replica lag monitor for configured MySql database.
+
+        Monitor is created on first request and shared by all the factories for same database.
+
+        Args:
+            Not Applicable.
+        Returns:
+            ReplicaMonitor: Monitor of replication lag of replicas.
+        Raises:
+            Not Applicable.
+        """
+        from db_routing import ReplicaMonitor
+
+        key = self.get_database_key()
+
+        with MySqlDCFactory._pools_lock:
+            monitor = MySqlDCFactory._monitors.get(key)
+
+            if monitor is None:
+                monitor = ReplicaMonitor(self.database_config.replica_max_lag)
+                MySqlDCFactory._monitors[key] = monitor
+
+        return monitor
+
+    def get_database_key(self, database_config = None):
+        config = database_config or self.database_config
+
+        return config.host, config.port, config.name, config.user, config.password
+
+    def get_result_cache(self):
+        """ Returns result cache for configured MySql database.
+
+        Cache is created on first request and shared by all the factories for same database.
+
+        Args:
+            Not Applicable.
+        Returns:
+            QueryResultCache: Cache of SELECT query results, None if result cache size is not configured.
+        Raises:
+            Not Applicable.
+        """
+        if not self.database_config.result_cache_size:
+            return None
+
+        key = self.get_database_key()
+
+        with MySqlDCFactory._pools_lock:
+            result_cache = MySqlDCFactory._result_caches.get(key)
+
+            if result_cache is None:
+                result_cache = QueryResultCache(self.database_config.result_cache_size)
+                MySqlDCFactory._result_caches[key] = result_cache
+
+        return result_cache
+
+    def get_slow_query_log(self):
+        """ Returns slow query log for configured MySql database.
+
+        Log is created on first request and shared by all the factories writing to same file. Its
+        EXPLAIN connections are opened with the configuration of the database which ran the query.
+
+        Args:
+            Not Applicable.
+        Returns:
+            SlowQueryLog: Log of slow and sampled queries, None if slow query log file is not configured.
+        Raises:
+            ValueError: If slow query configuration is invalid.
+        """
+        config = self.database_config
+
+        if not config.slow_query_log:
+            return None
+
+        from db_connection import MySqlDBConnection
+        from db_slow_query import SlowQueryLog
+
+        with MySqlDCFactory._pools_lock:
+            slow_query_log = MySqlDCFactory._slow_query_logs.get(config.slow_query_log)
+
+            if slow_query_log is None:
+                slow_query_log = SlowQueryLog(config.slow_query_log, MySqlDBConnection.create_connection, MySqlDBConnection.close_connection,
+                                              config.slow_query_threshold, config.slow_query_sample_rate, config.explain_threshold or None)
+                MySqlDCFactory._slow_query_logs[config.slow_query_log] = slow_query_log
+
+        return slow_query_log
+
+    def get_retry_policy(self):
+        """ Returns retry policy for configured MySql database.
+
+        Args:
+            Not Applicable.
+        Returns:
+            RetryPolicy: Retry policy of connection and SELECT query, None if retry count is not configured.
+        Raises:
+            ValueError: If retry configuration is invalid.
+        """
+        config = self.database_config
+
+        if not config.retry_count:
+            return None
+
+        return RetryPolicy(config.retry_count, config.retry_delay, config.retry_max_delay)
+
+    def get_pool(self, database_config = None):
+        """ Returns connection pool for configured MySql database.
+
+        Pool is created on first request and shared by all the factories for same database. Its
+        connections are pinged when idle and reopened after their lifetime, as configured.
+
+        Args:
+            database_config: MySqlConnectionConfig of database or replica, configured database if None.
+        Returns:
+            ConnectionPool: Pool of MySql driver connections.
+        Raises:
+            ValueError: If pool size in configuration is invalid.
+        """
+        from db_connection import MySqlDBConnection
+
+        config  =   database_config or self.database_config
+        key     =   self.get_database_key(config)
+
+        with MySqlDCFactory._pools_lock:
+            pool = MySqlDCFactory._pools.get(key)
+
+            if pool is None:
+                pool = ConnectionPool(functools.partial(MySqlDBConnection.create_connection, config),
+                                      MySqlDBConnection.reset_connection,
+                                      MySqlDBConnection.close_connection,
+                                      config.pool_min_size,
+                                      config.pool_max_size,
+                                      config.pool_timeout,
+                                      MySqlDBConnection.ping_connection,
+                                      config.pool_idle_threshold,
+                                      config.pool_keepalive or None,
+                                      config.pool_max_lifetime or None,
+                                      config.pool_lifetime_jitter)
+                MySqlDCFactory._pools[key] = pool
+
+        return pool
 
     def get_query(self):
         """ Returns Query object for MySql database.
@@ -200,6 +468,69 @@ class MySqlDCFactory(DCFactory):
         return MySqlQuery()
 
 
+class AsyncMySqlDCFactory(MySqlDCFactory):
+    """ Class AsyncMySqlDCFactory is the specific DCFactory class for MySql database used from asyncio event loop.
+
+    This is responsible for creating asyncio MySql specific objects. Its connections use aiomysql driver,
+    which is imported on first get_connection().
+
+    Args:
+        Not Applicable.
+    Returns:
+        Not Applicable.
+    Raises:
+        Not Applicable.
+    """
+
+    _async_pools    =   {}                      # Async connection pools shared by all AsyncMySqlDCFactory objects, keyed by database.
+
+    def get_connection(self):
+        """ Returns AsyncMySqlDBConnection class object.
+
+        Args:
+            Not Applicable.
+        Returns:
+            AsyncMySqlDBConnection: To connect to MySql database from asyncio event loop.
+        Raises:
+            ImportError: If aiomysql is not installed.
+        """
+        from db_async_connection import AsyncMySqlDBConnection
+
+        return AsyncMySqlDBConnection(self.database_config, self.get_pool())
+
+    def get_pool(self):
+        """ Returns asyncio connection pool for configured MySql database.
+
+        Pool is created on first request and shared by all the async factories for same database.
+        It must be used from one event loop only.
+
+        Args:
+            Not Applicable.
+        Returns:
+            AsyncConnectionPool: Pool of aiomysql connections.
+        Raises:
+            ValueError: If pool size in configuration is invalid.
+        """
+        from db_async_connection import AsyncConnectionPool, AsyncMySqlDBConnection
+
+        config  =   self.database_config
+        key     =   self.get_database_key()
+
+        with MySqlDCFactory._pools_lock:
+            pool = AsyncMySqlDCFactory._async_pools.get(key)
+
+            if pool is None:
+                pool = AsyncConnectionPool(functools.partial(AsyncMySqlDBConnection.create_connection, config),
+                                           AsyncMySqlDBConnection.reset_connection,
+                                           AsyncMySqlDBConnection.close_connection,
+                                           config.pool_min_size,
+                                           config.pool_max_size,
+                                           config.pool_timeout)
+                AsyncMySqlDCFactory._async_pools[key] = pool
+
+        return pool
+
+
 class OracleDCFactory(DCFactory):
     """ Class OracleDCFactory is the specific DCFactory class for Oracle database.
 
@@ -214,9 +545,7 @@ class OracleDCFactory(DCFactory):
     """
 
     def __init__(self):
-        super(OracleDCFactory, self).__init__()
-        self.database_config = None
-        self.initialize()               
+        super(OracleDCFactory, self).__init__()        # Base class calls initialize().
 
     def initialize(self):
         """ To initialize Oracle database configuration.
@@ -246,6 +575,8 @@ class OracleDCFactory(DCFactory):
         Raises:
             Not Applicable.
         """         
+        from db_connection import OracleDBConnection
+
         return OracleDBConnection(self.database_config)
 
     def get_query(self):
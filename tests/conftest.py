@@ -0,0 +1,37 @@
+#!/usr/bin/python3.4
+
+"""Test configuration of Database Connector.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file conftest.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for making Database Connector modules, and the fake pymysql
+    driver of benchmarks, importable by the tests.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Benchmarks directory is importable for fake pymysql driver.
+#
+#
+# #############################################################################
+
+
+import os
+import sys
+
+TESTS_DIR       =   os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR        =   os.path.dirname(TESTS_DIR)
+sys.path[:0]    =   [TESTS_DIR, os.path.join(ROOT_DIR, "src", "DomainLayer"), os.path.join(ROOT_DIR, "src", "DataAccessLayer", "config_dao"),
+                     os.path.join(ROOT_DIR, "benchmarks")]
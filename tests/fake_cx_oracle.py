@@ -0,0 +1,179 @@
+#!/usr/bin/python3.4
+
+"""Fake in-process cx_Oracle driver counting round trips.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file fake_cx_oracle.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for standing in for cx_Oracle in tests, so that round trips
+    made by OracleDBConnection can be counted without an Oracle server.
+
+Working; -
+----------
+    Every SELECT returns the rows set on the connection. Round trips are modelled on the driver,
+
+        execute         -   One round trip, which brings back prefetchrows rows.
+        fetch           -   One round trip per arraysize rows, made only when prefetched or
+                            fetched rows are used up and server has more rows.
+        executemany     -   One round trip for all the rows given.
+
+    Connection counts calls of execute, executemany and fetch round trips, and parses of query
+    strings not found in its statement cache of stmtcachesize statements.
+
+Uses; -
+-------
+    This will be used by tests/test_oracle_connection.py.
+
+Reference; -
+------------
+
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import collections
+
+
+class Error(Exception):
+    pass
+
+
+class InterfaceError(Error):
+    pass
+
+
+class DatabaseError(Error):
+    pass
+
+
+def makedsn(host, port, service_name = None):
+    return "{}:{}/{}".format(host, port, service_name)
+
+
+def connect(user = None, password = None, dsn = None):
+    return Connection()
+
+
+class Connection(object):
+
+    def __init__(self, rows = ()):
+        self.rows           =   list(rows)
+        self.stmtcachesize  =   20
+        self.calls          =   collections.Counter()       # execute, executemany, fetch, parse, commit, rollback.
+        self.statements     =   collections.OrderedDict()   # Statement cache, least recently used first.
+
+    def cursor(self):
+        return Cursor(self)
+
+    def prepare(self, statement):
+        """ To parse statement unless it is in statement cache. """
+        if statement in self.statements:
+            self.statements.move_to_end(statement)
+            return
+
+        self.calls["parse"] += 1
+        self.statements[statement] = True
+
+        while len(self.statements) > self.stmtcachesize:
+            self.statements.popitem(last = False)
+
+    def commit(self):
+        self.calls["commit"] += 1
+
+    def rollback(self):
+        self.calls["rollback"] += 1
+
+    def close(self):
+        pass
+
+
+class Cursor(object):
+
+    def __init__(self, connection):
+        self.connection     =   connection
+        self.arraysize      =   100
+        self.prefetchrows   =   2
+        self.description    =   None
+        self.rowcount       =   0
+        self.rowfactory     =   None
+        self._pending       =   collections.deque()     # Rows on server not fetched yet.
+        self._buffer        =   collections.deque()     # Rows brought back and not returned yet.
+
+    def execute(self, statement, parameters = None):
+        self.connection.calls["execute"] += 1
+        self.connection.prepare(statement)
+
+        if statement.lstrip()[:6].upper() == "SELECT":
+            self.description = [("ID", int, None, None, None, None, True)]
+            self.rowcount = 0
+            self._pending = collections.deque(self.connection.rows)
+            self._buffer = collections.deque()
+            self._bring(self.prefetchrows)
+        else:
+            self.description = None
+            self.rowcount = 1
+
+    def executemany(self, statement, rows):
+        self.connection.calls["executemany"] += 1
+        self.connection.prepare(statement)
+        self.rowcount = len(rows)
+
+    def _bring(self, count):
+        for _ in range(min(count, len(self._pending))):
+            self._buffer.append(self._pending.popleft())
+
+    def _next(self):
+        if not self._buffer and self._pending:
+            self.connection.calls["fetch"] += 1
+            self._bring(self.arraysize)
+
+        if not self._buffer:
+            return None
+
+        row = self._buffer.popleft()
+        self.rowcount += 1
+
+        return self.rowfactory(*row) if self.rowfactory is not None else row
+
+    def fetchone(self):
+        return self._next()
+
+    def fetchmany(self, size = None):
+        rows = []
+
+        for _ in range(size or self.arraysize):
+            row = self._next()
+            if row is None:
+                break
+            rows.append(row)
+
+        return rows
+
+    def fetchall(self):
+        rows = []
+        row = self._next()
+
+        while row is not None:
+            rows.append(row)
+            row = self._next()
+
+        return rows
+
+    def close(self):
+        pass
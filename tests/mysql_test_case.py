@@ -0,0 +1,121 @@
+#!/usr/bin/python3.4
+
+"""Base of tests running MySql connections over the fake pymysql driver.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file mysql_test_case.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for running Database Connector against benchmarks/fake_pymysql.py
+    in tests, so that they need neither pymysql nor a MySql server.
+
+Working; -
+----------
+    MySqlTestCase replaces pymysql in the modules using it, and error classifier of MySqlDBConnection,
+    with the fake driver for each test, the same way tests/test_oracle_connection.py replaces
+    cx_Oracle. Scripted results, failures and query log of the fake driver are reset around each test.
+
+Uses; -
+-------
+    This will be used by tests of MySql connection and of the modules built on it.
+
+Reference; -
+------------
+
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import functools
+import unittest
+from unittest import mock
+
+import fake_pymysql
+import db_connection
+import db_export
+import db_routing
+from db_connection import MySqlDBConnection, PooledMySqlDBConnection
+from db_connection_pool import ConnectionPool
+from db_error import ErrorClassifier, MYSQL_ERROR_CATEGORIES
+from db_query import MySqlQuery
+from db_query_info import QueryType, CursorType, RecordCount
+from dc_connection_dao import MySqlConnectionConfig
+
+
+class MySqlTestCase(unittest.TestCase):
+
+    ROWS = ((1, "a", 0.5), (2, None, 1.0), (3, "c", 1.5))
+
+    def setUp(self):
+        fake_pymysql.reset()
+        fake_pymysql.set_rows(self.ROWS)
+        self.addCleanup(fake_pymysql.reset)
+
+        patches = [mock.patch.object(module, "pymysql", fake_pymysql) for module in (db_connection, db_export, db_routing)]
+        patches.append(mock.patch.object(MySqlDBConnection, "ERROR_CLASSIFIER", ErrorClassifier(fake_pymysql, MYSQL_ERROR_CATEGORIES)))
+
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    @staticmethod
+    def make_config(host = "primary", **kwargs):
+        kwargs.setdefault("retry_count", 0)
+        return MySqlConnectionConfig("MySql", host, "3306", "local", "local", "", **kwargs)
+
+    def connect(self, connection, cursor_type = CursorType.NORMAL):
+        """ Returns connection after connecting it and setting its cursor, it is disconnected after test. """
+        self.assertEqual(connection.connect().code, 0)
+        self.assertEqual(connection.set_cursor(cursor_type).code, 0)
+        self.addCleanup(connection.disconnect)
+        return connection
+
+    def make_connection(self, cursor_type = CursorType.NORMAL, **kwargs):
+        return self.connect(MySqlDBConnection(self.make_config(**kwargs)), cursor_type)
+
+    def make_pool(self, database_config, **kwargs):
+        """ Returns pool of fake driver connections to database, as MySqlDCFactory creates it, closed after test. """
+        pool = ConnectionPool(functools.partial(MySqlDBConnection.create_connection, database_config),
+                              MySqlDBConnection.reset_connection,
+                              MySqlDBConnection.close_connection,
+                              validate = MySqlDBConnection.ping_connection,
+                              **kwargs)
+        self.addCleanup(pool.close)
+        return pool
+
+    def make_pooled_connection(self, database_config, pool = None):
+        """ Returns PooledMySqlDBConnection to database, it is not connected. """
+        return PooledMySqlDBConnection(database_config, pool or self.make_pool(database_config))
+
+    @staticmethod
+    def make_query(query_string, query_type = QueryType.SELECT, record_count = RecordCount.ALL, parameters = None):
+        query = MySqlQuery()
+        query.query_string = query_string
+        query.query_type = query_type
+        query.record_count = record_count
+        query.parameters = parameters
+        return query
+
+    @classmethod
+    def make_update(cls, query_string = "UPDATE t SET a = 1", parameters = None):
+        return cls.make_query(query_string, QueryType.UPDATE, None, parameters)
+
+    def start_query_log(self):
+        """ Returns list to which fake driver appends host and query string of each executed query. """
+        fake_pymysql.QUERY_LOG = []
+        return fake_pymysql.QUERY_LOG
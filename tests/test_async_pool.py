@@ -0,0 +1,114 @@
+#!/usr/bin/python3.5
+
+"""Tests of AsyncConnectionPool.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_async_pool.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking that asyncio pool hands out and takes back
+    connections within its size, whatever is released or discarded.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import asyncio
+import unittest
+
+import fake_pymysql
+from db_async_connection import AsyncConnectionPool
+from db_connection_pool import PoolTimeoutError
+
+
+class AsyncConnectionPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.resets = []
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def make_pool(self, max_size = 1):
+        async def create():
+            return fake_pymysql.Connection()
+
+        async def reset(connection):
+            connection.rollback()
+            self.resets.append(connection)
+
+        return AsyncConnectionPool(create, reset, fake_pymysql.Connection.close, min_size = 0, max_size = max_size, timeout = 0.05)
+
+    def test_double_release_is_ignored(self):
+        pool = self.make_pool()
+
+        async def borrow_twice():
+            connection = await pool.acquire()
+            await pool.release(connection)
+            await pool.release(connection)
+
+            first = await pool.acquire()
+
+            with self.assertRaises(PoolTimeoutError):
+                await pool.acquire()
+
+            return connection, first
+
+        connection, first = self.run_async(borrow_twice())
+
+        self.assertIs(first, connection)
+        self.assertEqual(self.resets, [connection])
+        self.assertEqual((pool.size, pool.idle_count), (1, 0))
+
+    def test_discard_frees_slot_once(self):
+        pool = self.make_pool()
+
+        async def discard_twice():
+            connection = await pool.acquire()
+            pool.discard(connection)
+            pool.discard(connection)
+            await pool.acquire()
+
+            with self.assertRaises(PoolTimeoutError):
+                await pool.acquire()
+
+            return connection
+
+        connection = self.run_async(discard_twice())
+
+        self.assertFalse(connection.open)
+        self.assertEqual(pool.size, 1)
+
+    def test_failed_reset_discards_connection(self):
+        pool = self.make_pool()
+
+        async def release_lost():
+            connection = await pool.acquire()
+            connection.open = False                 # Rollback of reset fails.
+            await pool.release(connection)
+            return connection, await pool.acquire()
+
+        connection, replacement = self.run_async(release_lost())
+
+        self.assertIsNot(replacement, connection)
+        self.assertEqual(pool.size, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
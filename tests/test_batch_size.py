@@ -0,0 +1,153 @@
+#!/usr/bin/python3.4
+
+"""Tests of BatchSizer and batched fetches of MySqlDBConnection.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_batch_size.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking that RecordCount.Many fetches one batch, that
+    RecordCount.BATCHES yields every record in batches whose size adapts within bounds, and that
+    failed batched queries are reported and roll back their transaction.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import unittest
+from unittest import mock
+
+import fake_pymysql
+from mysql_test_case import MySqlTestCase
+from db_batch_size import BatchSizer
+from db_error import ErrorClassifier
+from db_query_info import RecordCount
+
+ROW_COUNT   =   10
+
+
+class BatchSizerTest(unittest.TestCase):
+
+    RECORDS = [(index, "name-{}".format(index)) for index in range(8)]
+
+    def test_fixed_size_is_kept(self):
+        sizer = BatchSizer(4)
+
+        self.assertEqual(sizer.update(self.RECORDS, 10.0), 4)
+        self.assertFalse(sizer.is_adaptive)
+        self.assertEqual(BatchSizer().size, BatchSizer.DEF_BATCH_SIZE)
+
+    def test_adaptive_size_changes_by_at_most_max_step(self):
+        growing = BatchSizer(8, target_bytes = 10 ** 9)
+        shrinking = BatchSizer(8, target_bytes = 1)
+
+        self.assertEqual(growing.update(self.RECORDS, 0.0), 8 * BatchSizer.MAX_STEP)
+        self.assertEqual(shrinking.update(self.RECORDS, 0.0), 8 // BatchSizer.MAX_STEP)
+        self.assertGreater(growing.record_bytes, 0)
+
+    def test_adaptive_size_is_within_bounds(self):
+        sizer = BatchSizer(8, target_bytes = 10 ** 9, min_size = 2, max_size = 20)
+
+        self.assertEqual([sizer.update(self.RECORDS, 0.0) for _ in range(3)], [16, 20, 20])
+
+        sizer = BatchSizer(8, target_bytes = 1, min_size = 2, max_size = 20)
+
+        self.assertEqual([sizer.update(self.RECORDS, 0.0) for _ in range(3)], [4, 2, 2])
+
+    def test_slow_batch_shrinks_size(self):
+        sizer = BatchSizer(8, target_bytes = 10 ** 9, target_latency = 0.1)
+
+        self.assertEqual(sizer.update(self.RECORDS, 0.2), 4)
+
+    def test_invalid_size_is_refused(self):
+        for arguments in ({"batch_size": -1}, {"target_bytes": 0}, {"target_latency": 0}, {"min_size": 0}, {"min_size": 5, "max_size": 4}):
+            with self.subTest(**arguments):
+                with self.assertRaises(ValueError):
+                    BatchSizer(**arguments)
+
+
+class BatchFetchTest(MySqlTestCase):
+
+    ROWS = fake_pymysql.make_rows(ROW_COUNT)
+
+    def setUp(self):
+        super(BatchFetchTest, self).setUp()
+        self.connection = self.make_connection()
+
+    def make_batch_query(self, record_count = RecordCount.BATCHES, batch_size = None, batch_bytes = None):
+        query = self.make_query("SELECT id, name, score FROM t", record_count = record_count)
+        query.batch_size = batch_size
+        query.batch_bytes = batch_bytes
+        return query
+
+    def test_many_fetches_one_batch(self):
+        query_result = self.connection.execute(self.make_batch_query(RecordCount.Many, batch_size = 4))
+
+        self.assertEqual(query_result.code, 0)
+        self.assertEqual(list(query_result.result), list(self.ROWS[:4]))
+        self.assertEqual(len(self.connection.execute(self.make_batch_query(RecordCount.Many)).result), ROW_COUNT)
+
+    def test_records_are_fetched_in_batches(self):
+        batches = list(self.connection.execute(self.make_batch_query(batch_size = 4)).result)
+
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 2])
+        self.assertEqual([record for batch in batches for record in batch], list(self.ROWS))
+
+    def test_adaptive_batches_return_every_record(self):
+        batches = list(self.connection.execute(self.make_batch_query(batch_size = 2, batch_bytes = 10 ** 9)).result)
+
+        self.assertEqual([len(batch) for batch in batches], [2, 4, 4])
+        self.assertEqual([record for batch in batches for record in batch], list(self.ROWS))
+
+    def test_invalid_batch_bytes_is_reported(self):
+        query_result = self.connection.execute(self.make_batch_query(batch_bytes = -1))
+
+        self.assertEqual(query_result.code, ErrorClassifier.UNKNOWN_ERROR_CODE)
+        self.assertIsNone(query_result.result)
+
+    def test_failed_batch_raises_error(self):
+        fetchmany = fake_pymysql.SSCursor.fetchmany
+
+        def failing_fetchmany(cursor, size = None):
+            if cursor._position:
+                cursor.connection.open = False
+                raise fake_pymysql.OperationalError(2013, "Lost connection to MySQL server during query")
+            return fetchmany(cursor, size)
+
+        with mock.patch.object(fake_pymysql.SSCursor, "fetchmany", failing_fetchmany):
+            batches = self.connection.execute(self.make_batch_query(batch_size = 4)).result
+
+            self.assertEqual(len(next(batches)), 4)
+
+            with self.assertRaises(fake_pymysql.OperationalError):
+                next(batches)
+
+        self.assertTrue(self.connection.is_connection_lost())
+
+    def test_failed_batches_query_in_transaction_rolls_back(self):
+        fake_pymysql.fail("SELECT", fake_pymysql.OperationalError(1205, "Lock wait timeout exceeded"))
+
+        with self.connection.transaction() as transaction:
+            self.assertEqual(self.connection.execute(self.make_update()).code, 0)
+            self.assertEqual(self.connection.execute(self.make_batch_query(batch_size = 4)).code, 1205)
+
+        self.assertTrue(transaction.is_rollback_only)
+        self.assertEqual((self.connection.connection.commit_count, self.connection.connection.rollback_count), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
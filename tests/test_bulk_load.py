@@ -0,0 +1,142 @@
+#!/usr/bin/python3.4
+
+"""Tests of load_data of MySqlDBConnection.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_bulk_load.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking that rows and CSV files are bulk loaded in
+    chunks with their warnings, and that a failed load rolls back the uncommitted chunks, or marks
+    its transaction to be rolled back.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import io
+import unittest
+
+import fake_pymysql
+from mysql_test_case import MySqlTestCase
+from db_bulk_load import BulkLoadFormat
+from db_error import ErrorClassifier
+
+COLUMNS     =   ("id", "name")
+ROWS        =   [(1, "a"), (2, None), (3, "o'k")]
+
+
+class BulkLoadFormatTest(unittest.TestCase):
+
+    def test_rows_are_encoded_as_escaped_fields(self):
+        encode = BulkLoadFormat.make_encoder(fake_pymysql.Connection().escape, "utf8", COLUMNS)
+
+        self.assertEqual([encode(row) for row in ROWS], [b"1,'a'\n", b"2,NULL\n", b"3,'o\\'k'\n"])
+        self.assertEqual(encode({"name": "b", "id": 4}), b"4,'b'\n")
+
+    def test_names_are_quoted(self):
+        self.assertEqual(BulkLoadFormat.get_load_clause("db.t`x", ["id"], "utf8mb4").split(" CHARACTER")[0], "INTO TABLE `db`.`t``x`")
+
+    def test_csv_fields_are_read_with_null_value(self):
+        rows = list(BulkLoadFormat.get_rows(io.BytesIO(b"1,a\n2,\\N\n"), null_value = "\\N"))
+
+        self.assertEqual(rows, [["1", "a"], ["2", None]])
+
+
+class LoadDataTest(MySqlTestCase):
+
+    def setUp(self):
+        super(LoadDataTest, self).setUp()
+        self.connection = self.make_connection(local_infile = True)
+        self.driver = self.connection.connection
+        self.log = self.start_query_log()
+
+    def get_loads(self):
+        return [query_string for _, query_string in self.log if query_string.startswith("LOAD DATA")]
+
+    def test_rows_are_loaded_and_committed_in_chunks(self):
+        query_result = self.connection.load_data("t", ROWS, COLUMNS, is_commit = True, chunk_size = 2)
+
+        self.assertEqual(query_result.code, 0)
+        self.assertEqual(query_result.result, 3)
+        self.assertEqual(query_result.info, {"rows": 3, "skipped": 0, "chunks": 2, "commits": 2, "warnings": 0, "warning_messages": []})
+        self.assertEqual(self.driver.commit_count, 2)
+        self.assertTrue(self.get_loads()[0].endswith("(`id`, `name`)"))
+
+    def test_csv_file_is_loaded(self):
+        query_result = self.connection.load_data("t", io.StringIO("1,a\n2,b\n"), chunk_size = 10)
+
+        self.assertEqual(query_result.result, 2)
+        self.assertEqual(len(self.get_loads()), 1)
+
+    def test_warnings_are_reported(self):
+        fake_pymysql.set_result("SHOW COUNT(*) WARNINGS", ("count",), ((1,),))
+        fake_pymysql.set_result("SHOW WARNINGS", ("Level", "Code", "Message"), (("Warning", 1265, "Data truncated"),))
+
+        query_result = self.connection.load_data("t", ROWS, chunk_size = 2)
+
+        self.assertEqual(query_result.info["warnings"], 2)
+        self.assertEqual(query_result.info["warning_messages"], ["Warning 1265: Data truncated"] * 2)
+
+    def test_failed_chunk_keeps_only_committed_chunks(self):
+        rows = ROWS[:2] + [{"id": 3}]                       # Dict row is not encoded without columns.
+
+        query_result = self.connection.load_data("t", rows, is_commit = True, chunk_size = 2)
+
+        self.assertEqual(query_result.code, ErrorClassifier.UNKNOWN_ERROR_CODE)
+        self.assertEqual(query_result.info["rows"], 2)
+        self.assertEqual((self.driver.commit_count, self.driver.rollback_count), (1, 1))
+
+    def test_failure_without_commit_rolls_back_every_chunk(self):
+        self.assertEqual(self.connection.execute(self.make_update()).code, 0)
+        fake_pymysql.fail("LOAD DATA", fake_pymysql.IntegrityError(1062, "Duplicate entry"))
+
+        query_result = self.connection.load_data("t", ROWS, chunk_size = 2)
+
+        self.assertEqual(query_result.code, 1062)
+        self.assertEqual((self.driver.commit_count, self.driver.rollback_count), (0, 1))
+
+    def test_lost_connection_is_reported(self):
+        fake_pymysql.fail("LOAD DATA", fake_pymysql.OperationalError(2013, "Lost connection to MySQL server during query"))
+
+        query_result = self.connection.load_data("t", ROWS, is_commit = True)
+
+        self.assertEqual(query_result.code, 2013)
+        self.assertTrue(self.connection.is_connection_lost())
+        self.assertEqual(self.driver.commit_count, 0)
+
+    def test_failure_in_transaction_rolls_back_on_exit(self):
+        fake_pymysql.fail("LOAD DATA", fake_pymysql.OperationalError(1205, "Lock wait timeout exceeded"))
+
+        with self.connection.transaction() as transaction:
+            query_result = self.connection.load_data("t", ROWS, is_commit = True)
+            self.assertEqual(self.driver.rollback_count, 0)
+
+        self.assertEqual(query_result.code, 1205)
+        self.assertTrue(transaction.is_rollback_only)
+        self.assertEqual((self.driver.commit_count, self.driver.rollback_count), (0, 1))
+
+    def test_invalid_chunk_size_is_reported(self):
+        query_result = self.connection.load_data("t", ROWS, chunk_size = 0)
+
+        self.assertEqual(query_result.code, ErrorClassifier.UNKNOWN_ERROR_CODE)
+        self.assertEqual(self.get_loads(), [])
+        self.assertEqual(self.driver.rollback_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
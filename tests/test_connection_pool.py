@@ -0,0 +1,221 @@
+#!/usr/bin/python3.4
+
+"""Tests of ConnectionPool over the fake pymysql driver.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_connection_pool.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking that pool hands out, takes back, validates,
+    expires and closes driver connections as MySqlDCFactory configures it, and that its size stays
+    right whatever is released or discarded.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Added tests of keepalive failures and invalid settings.
+#
+#
+# #############################################################################
+
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+import fake_pymysql
+from mysql_test_case import MySqlTestCase
+from db_connection_pool import PoolClosedError, PoolTimeoutError
+
+WAIT_TIMEOUT    =   5.0
+
+
+class ConnectionPoolTest(MySqlTestCase):
+
+    def make_pool(self, **kwargs):
+        kwargs.setdefault("min_size", 1)
+        kwargs.setdefault("max_size", 2)
+        kwargs.setdefault("timeout", WAIT_TIMEOUT)
+        return super(ConnectionPoolTest, self).make_pool(self.make_config(), **kwargs)
+
+    def test_released_connection_is_reset_and_reused(self):
+        pool = self.make_pool()
+        connection = pool.acquire()
+
+        self.assertEqual((pool.size, pool.idle_count), (1, 0))
+
+        pool.release(connection)
+
+        self.assertEqual(connection.rollback_count, 1)
+        self.assertEqual((pool.size, pool.idle_count), (1, 1))
+        self.assertIs(pool.acquire(), connection)
+
+    def test_acquire_times_out_when_pool_is_full(self):
+        pool = self.make_pool(max_size = 1)
+        pool.acquire()
+
+        with self.assertRaises(PoolTimeoutError):
+            pool.acquire(timeout = 0.05)
+
+    def test_acquire_waits_for_released_connection(self):
+        pool = self.make_pool(max_size = 1)
+        connection = pool.acquire()
+        timer = threading.Timer(0.05, pool.release, (connection,))
+        timer.start()
+        self.addCleanup(timer.join)
+
+        self.assertIs(pool.acquire(), connection)
+
+    def test_double_release_is_ignored(self):
+        pool = self.make_pool()
+        connection = pool.acquire()
+
+        pool.release(connection)
+        pool.release(connection)
+
+        self.assertEqual((pool.size, pool.idle_count), (1, 1))
+        self.assertEqual(connection.rollback_count, 1)
+        self.assertIsNot(pool.acquire(), pool.acquire())
+
+    def test_connection_not_borrowed_from_pool_is_ignored(self):
+        pool = self.make_pool()
+        connection = fake_pymysql.connect("other")
+
+        pool.release(connection)
+        pool.discard(connection)
+
+        self.assertTrue(connection.open)
+        self.assertEqual((pool.size, pool.idle_count), (0, 0))
+
+    def test_discard_frees_slot_once(self):
+        pool = self.make_pool(max_size = 1)
+        connection = pool.acquire()
+
+        pool.discard(connection)
+        pool.discard(connection)
+
+        self.assertFalse(connection.open)
+        self.assertEqual(pool.size, 0)
+        self.assertTrue(pool.acquire(timeout = 0).open)
+        self.assertEqual(pool.size, 1)
+
+    def test_connection_failing_reset_is_discarded(self):
+        pool = self.make_pool()
+        connection = pool.acquire()
+        connection.open = False                         # Lost while borrowed.
+
+        pool.release(connection)
+
+        self.assertEqual((pool.size, pool.idle_count), (0, 0))
+        self.assertIsNot(pool.acquire(), connection)
+
+    def test_failed_connect_frees_its_slot(self):
+        pool = self.make_pool(min_size = 0, max_size = 1)
+        fake_pymysql.fail(fake_pymysql.CONNECT_QUERY, fake_pymysql.OperationalError(2003, "Can't connect"))
+
+        with self.assertRaises(fake_pymysql.OperationalError):
+            pool.acquire()
+
+        self.assertEqual(pool.size, 0)
+        self.assertTrue(pool.acquire(timeout = 0).open)
+
+    def test_expired_connection_is_reopened(self):
+        pool = self.make_pool(max_lifetime = 0.05, lifetime_jitter = 0.0)
+        connection = pool.acquire()
+        time.sleep(0.1)
+
+        pool.release(connection)                        # Expired connection is closed instead of reset.
+
+        self.assertFalse(connection.open)
+        self.assertEqual(connection.rollback_count, 0)
+        self.assertIsNot(pool.acquire(), connection)
+        self.assertEqual(pool.size, 1)
+
+    def test_dead_idle_connection_is_not_handed_out(self):
+        pool = self.make_pool(idle_threshold = 0.0)
+        connection = pool.acquire()
+        pool.release(connection)
+        connection.open = False                         # Closed by server while idle.
+
+        self.assertIsNot(pool.acquire(), connection)
+        self.assertEqual(pool.size, 1)
+
+    def test_keepalive_reopens_expired_idle_connection(self):
+        pool = self.make_pool(keepalive_interval = 0.02, max_lifetime = 0.05, lifetime_jitter = 0.0)
+        connection = pool.acquire()
+        pool.release(connection)
+        deadline = time.monotonic() + WAIT_TIMEOUT
+
+        while connection.open or pool.idle_count != 1:  # Closed and replaced by keepalive thread.
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+
+        self.assertEqual(pool.size, 1)
+        self.assertTrue(pool.acquire(timeout = 0).open)
+
+    def test_keepalive_replaces_dead_idle_connection(self):
+        pool = self.make_pool(keepalive_interval = 0.02)
+        connection = pool.acquire()
+        connections = [connection]
+        connect = fake_pymysql.connect
+
+        def recording_connect(*args, **kwargs):
+            connections.append(connect(*args, **kwargs))
+            return connections[-1]
+
+        with mock.patch.object(fake_pymysql, "connect", recording_connect):
+            pool.release(connection)
+            connection.open = False                     # Closed by server while idle, ping fails.
+            deadline = time.monotonic() + WAIT_TIMEOUT
+
+            while len(connections) == 1 or pool.idle_count != 1:
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.01)
+
+        self.assertEqual(pool.size, 1)
+        self.assertIs(pool.acquire(timeout = 0), connections[1])
+
+    def test_failed_top_up_frees_its_slot(self):
+        pool = self.make_pool(min_size = 1, max_size = 1)
+        fake_pymysql.fail(fake_pymysql.CONNECT_QUERY, fake_pymysql.OperationalError(2003, "Can't connect"))
+
+        connection = pool.acquire(timeout = 0)          # Minimum connection failed, acquire opens its own.
+
+        self.assertTrue(connection.open)
+        self.assertEqual(pool.size, 1)
+
+    def test_invalid_settings_are_refused(self):
+        for kwargs in ({"min_size": 3, "max_size": 2}, {"max_size": 0}, {"idle_threshold": -1}, {"keepalive_interval": 0},
+                       {"max_lifetime": 0}, {"lifetime_jitter": 1.0}):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    self.make_pool(**kwargs)
+
+    def test_closed_pool_refuses_acquire_and_closes_released_connection(self):
+        pool = self.make_pool()
+        connection = pool.acquire()
+
+        pool.close()
+
+        with self.assertRaises(PoolClosedError):
+            pool.acquire()
+
+        pool.release(connection)
+
+        self.assertFalse(connection.open)
+        self.assertEqual(pool.size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
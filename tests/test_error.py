@@ -0,0 +1,69 @@
+#!/usr/bin/python3.4
+
+"""Tests of ErrorClassifier.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_error.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking that driver exceptions are reported with their
+    code and category, and that errors are still reported when driver is not installed.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import unittest
+
+import fake_pymysql
+from db_connection import QueryResult
+from db_error import ErrorCategory, ErrorClassifier, MYSQL_ERROR_CATEGORIES
+from db_lazy_import import MissingModule, lazy_import
+
+UNKNOWN_ERROR_CODE  =   ErrorClassifier.UNKNOWN_ERROR_CODE
+
+
+class ErrorClassifierTest(unittest.TestCase):
+
+    def set_result(self, classifier, error):
+        query_result = QueryResult()
+        category = classifier.set_result(query_result, error)
+        return category, query_result.code, query_result.message
+
+    def test_driver_error_is_reported_with_its_code(self):
+        classifier = ErrorClassifier(fake_pymysql, MYSQL_ERROR_CATEGORIES)
+
+        self.assertEqual(self.set_result(classifier, fake_pymysql.OperationalError(1205, "Lock wait timeout exceeded")),
+                         (ErrorCategory.RETRYABLE, 1205, "Lock wait timeout exceeded"))
+        self.assertEqual(self.set_result(classifier, fake_pymysql.InterfaceError(0, ""))[0], ErrorCategory.RECONNECT)
+        self.assertEqual(self.set_result(classifier, ValueError("bad"))[:2], (ErrorCategory.FATAL, UNKNOWN_ERROR_CODE))
+
+    def test_error_is_reported_when_driver_is_not_installed(self):
+        driver = lazy_import("no_such_driver")
+        classifier = ErrorClassifier(driver, MYSQL_ERROR_CATEGORIES)
+
+        self.assertIsInstance(driver, MissingModule)
+
+        with self.assertRaises(ImportError) as context:
+            driver.connect()
+
+        self.assertEqual(self.set_result(classifier, context.exception),
+                         (ErrorCategory.FATAL, UNKNOWN_ERROR_CODE, str(context.exception)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/python3.4
+
+"""Tests of export of MySqlDBConnection.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_export.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking that SELECT results are exported in batches as
+    CSV and JSON Lines, optionally compressed, and that a failed export is reported with what was
+    written, leaves a file sink untouched if the query fails, and rolls back its transaction.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import datetime
+import decimal
+import gzip
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import fake_pymysql
+from mysql_test_case import MySqlTestCase
+from db_error import ErrorClassifier
+from db_query_info import ExportFormat
+
+UNKNOWN_ERROR_CODE  =   ErrorClassifier.UNKNOWN_ERROR_CODE
+
+
+class ExportTest(MySqlTestCase):
+
+    def setUp(self):
+        super(ExportTest, self).setUp()
+        self.connection = self.make_connection()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "export")
+
+    def make_export_query(self, query_string = "SELECT id, name, score FROM t", batch_size = 2):
+        query = self.make_query(query_string)
+        query.batch_size = batch_size
+        return query
+
+    def test_records_are_exported_as_csv(self):
+        sink = io.BytesIO()
+
+        query_result = self.connection.export(self.make_export_query(), sink)
+
+        self.assertEqual(query_result.code, 0)
+        self.assertEqual(query_result.result, 3)
+        self.assertEqual(sink.getvalue(), b"id,name,score\n1,a,0.5\n2,,1.0\n3,c,1.5\n")
+        self.assertEqual(query_result.info, {"rows": 3, "bytes": len(sink.getvalue())})
+
+    def test_binary_values_are_base64_encoded(self):
+        fake_pymysql.set_result("SELECT data", ("id", "data"), ((1, None), (2, b"\x00\xff")))
+        sink = io.BytesIO()
+
+        self.connection.export(self.make_export_query("SELECT data FROM t", batch_size = 1), sink)
+
+        self.assertEqual(sink.getvalue(), b"id,data\n1,\n2,AP8=\n")
+
+    def test_records_are_exported_as_json_lines(self):
+        fake_pymysql.set_result("SELECT typed", ("amount", "day"), ((decimal.Decimal("1.50"), datetime.date(2026, 10, 18)),))
+        sink = io.BytesIO()
+
+        query_result = self.connection.export(self.make_export_query("SELECT typed FROM t"), sink, ExportFormat.JSONL)
+
+        self.assertEqual(query_result.code, 0)
+        self.assertEqual([json.loads(line) for line in sink.getvalue().splitlines()], [{"amount": "1.50", "day": "2026-10-18"}])
+
+    def test_compressed_file_is_written(self):
+        query_result = self.connection.export(self.make_export_query(), self.path, compress = True)
+
+        with gzip.open(self.path) as export_file:
+            data = export_file.read()
+
+        self.assertEqual(query_result.code, 0)
+        self.assertEqual(data.splitlines()[1], b"1,a,0.5")
+        self.assertEqual(query_result.info["bytes"], len(data))
+
+    def test_failed_query_leaves_file_untouched(self):
+        fake_pymysql.fail("SELECT", fake_pymysql.ProgrammingError(1146, "Table doesn't exist"))
+
+        query_result = self.connection.export(self.make_export_query(), self.path)
+
+        self.assertEqual(query_result.code, 1146)
+        self.assertEqual(query_result.info, {"rows": 0, "bytes": 0})
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_lost_connection_reports_records_written(self):
+        fetchmany = fake_pymysql.SSCursor.fetchmany
+
+        def failing_fetchmany(cursor, size = None):
+            if cursor._position:
+                cursor.connection.open = False
+                raise fake_pymysql.OperationalError(2013, "Lost connection to MySQL server during query")
+            return fetchmany(cursor, size)
+
+        sink = io.BytesIO()
+
+        with mock.patch.object(fake_pymysql.SSCursor, "fetchmany", failing_fetchmany):
+            query_result = self.connection.export(self.make_export_query(), sink)
+
+        self.assertEqual(query_result.code, 2013)
+        self.assertEqual(query_result.info, {"rows": 2, "bytes": len(sink.getvalue())})
+        self.assertTrue(self.connection.is_connection_lost())
+
+    def test_unexportable_query_is_refused(self):
+        for query, export_format in ((self.make_update(), ExportFormat.CSV), (self.make_export_query(), 99)):
+            with self.subTest(export_format = export_format):
+                self.assertEqual(self.connection.export(query, io.BytesIO(), export_format).code, UNKNOWN_ERROR_CODE)
+
+    def test_missing_pyarrow_is_reported_before_query_is_sent(self):
+        log = self.start_query_log()
+
+        with mock.patch.dict(sys.modules, {"pyarrow": None}):               # Import of pyarrow raises ImportError.
+            query_result = self.connection.export(self.make_export_query(), io.BytesIO(), ExportFormat.ARROW)
+
+        self.assertEqual(query_result.code, UNKNOWN_ERROR_CODE)
+        self.assertEqual(log, [])
+
+    def test_failed_export_in_transaction_rolls_back(self):
+        fake_pymysql.fail("SELECT", fake_pymysql.OperationalError(1205, "Lock wait timeout exceeded"))
+
+        with self.connection.transaction() as transaction:
+            self.assertEqual(self.connection.execute(self.make_update()).code, 0)
+            self.assertEqual(self.connection.export(self.make_export_query(), io.BytesIO()).code, 1205)
+
+        self.assertTrue(transaction.is_rollback_only)
+        self.assertEqual((self.connection.connection.commit_count, self.connection.connection.rollback_count), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+#!/usr/bin/python3.4
+
+"""Tests of FanOutExecutor.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_fan_out.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking that fanned out queries return their results in
+    order of queries over at most max_workers connections, and that a failed, refused or late query
+    is reported in its own QueryResult without affecting the others.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import threading
+import unittest
+from unittest import mock
+
+import fake_pymysql
+from mysql_test_case import MySqlTestCase
+from db_connection import MySqlDBConnection
+from db_error import ErrorClassifier
+from db_fan_out import FanOutExecutor
+from db_query_info import RecordCount
+
+MAX_WORKERS     =   2
+WAIT_TIMEOUT    =   5.0
+
+
+class FanOutExecutorTest(MySqlTestCase):
+
+    def setUp(self):
+        super(FanOutExecutorTest, self).setUp()
+        self.config = self.make_config()
+        self.pool = None
+        self.connections = []
+        self.log = self.start_query_log()
+
+    def get_connection(self):
+        """ Connection of DCFactory, pooled if pool is set. """
+        if self.pool is not None:
+            connection = self.make_pooled_connection(self.config, self.pool)
+        else:
+            connection = MySqlDBConnection(self.config)
+
+        self.connections.append(connection)
+
+        return connection
+
+    def make_executor(self):
+        executor = FanOutExecutor(self, MAX_WORKERS)
+        self.addCleanup(executor.close)
+        return executor
+
+    def block(self, prefix):
+        """ Returns event until which queries starting with prefix are blocked. """
+        event = threading.Event()
+        execute = fake_pymysql.Cursor.execute
+
+        def blocking_execute(cursor, query, args = None):
+            if query.startswith(prefix):
+                event.wait(WAIT_TIMEOUT)
+            return execute(cursor, query, args)
+
+        patch = mock.patch.object(fake_pymysql.Cursor, "execute", blocking_execute)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.addCleanup(event.set)
+
+        return event
+
+    def record_drivers(self):
+        """ Returns list to which driver connections are appended as they are opened. """
+        drivers = []
+        connect = fake_pymysql.connect
+
+        def recording_connect(*args, **kwargs):
+            drivers.append(connect(*args, **kwargs))
+            return drivers[-1]
+
+        patch = mock.patch.object(fake_pymysql, "connect", recording_connect)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+        return drivers
+
+    def test_results_are_in_order_of_queries(self):
+        for index in range(4):
+            fake_pymysql.set_result("SELECT {}".format(index), ("n",), ((index,),))
+
+        query_results = self.make_executor().execute_all([self.make_query("SELECT {}".format(index)) for index in range(4)])
+
+        self.assertEqual([query_result.result for query_result in query_results], [((index,),) for index in range(4)])
+        self.assertLessEqual(len(self.connections), MAX_WORKERS)
+
+    def test_failed_query_does_not_affect_others(self):
+        fake_pymysql.fail("SELECT b", fake_pymysql.ProgrammingError(1146, "Table doesn't exist"))
+
+        query_results = self.make_executor().execute_all([self.make_query("SELECT a"), self.make_query("SELECT b"), self.make_query("SELECT c")])
+
+        self.assertEqual([query_result.code for query_result in query_results], [0, 1146, 0])
+
+    def test_failed_connect_is_reported_in_result(self):
+        fake_pymysql.fail(fake_pymysql.CONNECT_QUERY, fake_pymysql.OperationalError(2003, "Can't connect to MySQL server"))
+        executor = FanOutExecutor(self, 1)
+        self.addCleanup(executor.close)
+
+        query_results = executor.execute_all([self.make_query("SELECT a"), self.make_query("SELECT b")])
+
+        self.assertEqual([query_result.code for query_result in query_results], [2003, 0])
+
+    def test_stream_query_is_refused(self):
+        query_results = self.make_executor().execute_all([self.make_query("SELECT a", record_count = RecordCount.STREAM),
+                                                          self.make_query("SELECT b", record_count = RecordCount.BATCHES)])
+
+        self.assertEqual([query_result.code for query_result in query_results], [ErrorClassifier.UNKNOWN_ERROR_CODE] * 2)
+        self.assertEqual(self.log, [])
+
+    def test_query_not_finished_by_deadline_is_reported(self):
+        executor = self.make_executor()
+        self.block("SELECT slow")                   # Freed before executor is closed.
+
+        query_results = executor.execute_all([self.make_query("SELECT slow"), self.make_query("SELECT fast")], timeout = 0.1)
+
+        self.assertEqual([query_result.code for query_result in query_results], [FanOutExecutor.DEADLINE_ERROR_CODE, 0])
+
+    def test_uncommitted_update_is_rolled_back_on_close(self):
+        self.pool = self.make_pool(self.config, min_size = 0, max_size = MAX_WORKERS)
+        drivers = self.record_drivers()
+        fake_pymysql.fail("UPDATE b", fake_pymysql.OperationalError(1205, "Lock wait timeout exceeded"))
+        executor = FanOutExecutor(self, MAX_WORKERS)
+
+        query_results = executor.execute_all([self.make_update("UPDATE a SET n = 1"), self.make_update("UPDATE b SET n = 1")])
+        executor.close()
+
+        self.assertEqual([query_result.code for query_result in query_results], [0, 1205])
+        self.assertEqual(self.pool.idle_count, self.pool.size)
+        self.assertEqual([(driver.commit_count, driver.rollback_count) for driver in drivers], [(0, 1)] * len(drivers))
+
+
+if __name__ == "__main__":
+    unittest.main()
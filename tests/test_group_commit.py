@@ -0,0 +1,189 @@
+#!/usr/bin/python3.4
+
+"""Tests of transaction() and GroupCommitter.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_group_commit.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking, against the fake pymysql driver, that
+    transactions and group commits are committed or rolled back as a unit, and that every Future
+    of a group commit is resolved whatever happens to its batch.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import threading
+import unittest
+from unittest import mock
+
+import fake_pymysql
+from mysql_test_case import MySqlTestCase
+from db_group_commit import GroupCommitter
+
+RESULT_TIMEOUT  =   5.0
+
+
+class TransactionTest(MySqlTestCase):
+
+    def setUp(self):
+        super(TransactionTest, self).setUp()
+        self.connection = self.make_connection()
+        self.driver = self.connection.connection
+
+    def test_transaction_is_committed_once_on_exit(self):
+        with self.connection.transaction() as transaction:
+            self.assertEqual(self.connection.execute(self.make_update(), is_commit = True).code, 0)
+            self.assertEqual(self.driver.commit_count, 0)
+
+        self.assertTrue(transaction.is_committed)
+        self.assertEqual(self.driver.commit_count, 1)
+
+    def test_failed_query_rolls_back_transaction(self):
+        fake_pymysql.fail("UPDATE", fake_pymysql.ProgrammingError(1064, "syntax"))
+
+        with self.connection.transaction() as transaction:
+            self.assertEqual(self.connection.execute(self.make_update()).code, 1064)
+
+        self.assertFalse(transaction.is_committed)
+        self.assertTrue(transaction.is_rollback_only)
+        self.assertEqual((self.driver.commit_count, self.driver.rollback_count), (0, 1))
+        self.assertEqual(transaction.query_result.message, "Transaction rolled back.")
+
+    def test_exception_rolls_back_transaction(self):
+        with self.assertRaises(KeyError):
+            with self.connection.transaction() as transaction:
+                self.connection.execute(self.make_update())
+                raise KeyError("boom")
+
+        self.assertFalse(transaction.is_committed)
+        self.assertEqual(self.driver.rollback_count, 1)
+        self.assertIsNone(self.connection.active_transaction)
+
+    def test_nested_transaction_is_refused(self):
+        with self.connection.transaction():
+            with self.assertRaises(RuntimeError):
+                with self.connection.transaction():
+                    pass
+
+
+class GroupCommitterTest(MySqlTestCase):
+
+    def setUp(self):
+        super(GroupCommitterTest, self).setUp()
+        self.connection = self.make_connection()
+
+    def make_committer(self, commit_size = 10, commit_interval = 0.2):
+        committer = GroupCommitter(self.connection, commit_size = commit_size, commit_interval = commit_interval)
+        self.addCleanup(committer.close, RESULT_TIMEOUT)
+        return committer
+
+    def test_queries_are_committed_in_batches(self):
+        committer = self.make_committer(commit_size = 10, commit_interval = 1.0)
+        futures = []
+
+        def submit():
+            for _ in range(25):
+                futures.append(committer.submit(self.make_update()))
+
+        threads = [threading.Thread(target = submit) for _ in range(4)]
+        [thread.start() for thread in threads]
+        [thread.join() for thread in threads]
+
+        results = [future.result(RESULT_TIMEOUT) for future in futures]
+
+        self.assertTrue(all(result.code == 0 for result in results))
+        self.assertEqual(committer.stats(), {"batches": 10, "queries": 100})
+        self.assertEqual(self.connection.connection.commit_count, 10)
+
+    def test_failed_query_does_not_fail_its_batch(self):
+        committer = self.make_committer(commit_size = 3, commit_interval = 1.0)
+        fake_pymysql.fail("UPDATE t SET a = 2", fake_pymysql.IntegrityError(1062, "Duplicate entry"))
+
+        futures = [committer.submit(self.make_update("UPDATE t SET a = {}".format(value))) for value in (1, 2, 3, 4)]
+        codes = [future.result(RESULT_TIMEOUT).code for future in futures]
+
+        self.assertEqual(codes, [0, 1062, 0, 0])
+        self.assertEqual(committer.stats()["queries"], 3)
+
+    def test_lost_connection_fails_batch_and_reconnects(self):
+        committer = self.make_committer(commit_size = 3)
+        lost_driver = self.connection.connection
+        fake_pymysql.fail("UPDATE t SET a = 2", fake_pymysql.OperationalError(2013, "Lost connection"))
+
+        futures = [committer.submit(self.make_update("UPDATE t SET a = {}".format(value))) for value in (1, 2, 3)]
+        codes = [future.result(RESULT_TIMEOUT).code for future in futures]
+
+        self.assertEqual(codes, [2013, 2013, 0])
+        self.assertIsNot(self.connection.connection, lost_driver)
+        self.assertEqual(lost_driver.commit_count, 0)
+        self.assertEqual(self.connection.connection.commit_count, 1)
+
+    def test_closed_connection_without_error_code_reconnects(self):
+        committer = self.make_committer(commit_size = 1)
+        self.connection.connection.open = False
+
+        self.assertEqual(committer.submit(self.make_update()).result(RESULT_TIMEOUT).code, 9999)
+        self.assertEqual(committer.submit(self.make_update()).result(RESULT_TIMEOUT).code, 0)
+
+    def test_failed_commit_fails_every_query_of_batch(self):
+        committer = self.make_committer(commit_size = 2, commit_interval = 1.0)
+
+        with mock.patch.object(self.connection.connection, "commit", side_effect = fake_pymysql.OperationalError(1213, "Deadlock")):
+            futures = [committer.submit(self.make_update()) for _ in range(2)]
+            codes = [future.result(RESULT_TIMEOUT).code for future in futures]
+
+        self.assertEqual(codes, [1213, 1213])
+        self.assertEqual(committer.stats()["batches"], 0)
+
+    def test_unexpected_worker_error_resolves_every_future(self):
+        committer = self.make_committer(commit_size = 10, commit_interval = 1.0)
+        fake_pymysql.fail("UPDATE t SET a = 2", fake_pymysql.OperationalError(2013, "Lost connection"))
+        gate = threading.Event()
+        execute = self.connection.execute
+
+        def held_execute(query, is_commit = False):
+            gate.wait(RESULT_TIMEOUT)               # Rest of the queries are queued meanwhile.
+            return execute(query, is_commit)
+
+        with mock.patch.object(self.connection, "execute", side_effect = held_execute), \
+                mock.patch.object(self.connection, "reconnect", side_effect = AttributeError("reconnect")):
+            futures = [committer.submit(self.make_update("UPDATE t SET a = {}".format(value))) for value in range(1, 6)]
+            gate.set()
+            results = [future.result(RESULT_TIMEOUT) for future in futures]
+
+        self.assertEqual([result.code for result in results], [2013, 2013, 9999, 9999, 9999])
+        self.assertEqual(results[2].message, "reconnect")
+
+        with self.assertRaises(RuntimeError):
+            committer.submit(self.make_update())
+
+    def test_close_commits_queued_queries(self):
+        committer = self.make_committer(commit_size = 100, commit_interval = 10.0)
+        futures = [committer.submit(self.make_update()) for _ in range(5)]
+
+        committer.close(RESULT_TIMEOUT)
+
+        self.assertTrue(all(future.result(0).code == 0 for future in futures))
+
+        with self.assertRaises(RuntimeError):
+            committer.submit(self.make_update())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+#!/usr/bin/python3.4
+
+"""Tests of query execution of MySqlDBConnection.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_mysql_connection.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking, against the fake pymysql driver, that failures
+    of MySqlDBConnection queries are reported in QueryResult, retried when transient and leave no
+    uncommitted work behind.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Added tests of execute_many.
+#
+#
+# #############################################################################
+
+
+import sys
+import unittest
+from unittest import mock
+
+import fake_pymysql
+from mysql_test_case import MySqlTestCase
+from db_query_info import ResultLayout
+from db_retry import RetryPolicy
+
+
+class ColumnarFetchTest(MySqlTestCase):
+
+    def setUp(self):
+        super(ColumnarFetchTest, self).setUp()
+        self.connection = self.make_connection()
+
+    def make_columnar_query(self, result_layout = ResultLayout.COLUMNAR):
+        query = self.make_query("SELECT id, name, score FROM t")
+        query.result_layout = result_layout
+        return query
+
+    def fail_fetch(self, count = 1):
+        """ To lose connection while records of next count columnar queries are fetched. """
+        fetchmany = fake_pymysql.SSCursor.fetchmany
+        failures = [count]
+
+        def failing_fetchmany(cursor, size = None):
+            if failures[0]:
+                failures[0] -= 1
+                cursor.connection.open = False
+                raise fake_pymysql.OperationalError(2013, "Lost connection to MySQL server during query")
+            return fetchmany(cursor, size)
+
+        patch = mock.patch.object(fake_pymysql.SSCursor, "fetchmany", failing_fetchmany)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_columns_are_fetched(self):
+        query_result = self.connection.execute(self.make_columnar_query())
+
+        self.assertEqual(query_result.code, 0)
+        self.assertEqual(list(query_result.result["id"]), [1, 2, 3])
+        self.assertEqual(query_result.info["row_count"], 3)
+
+    def test_lost_connection_while_fetching_is_reported(self):
+        self.fail_fetch()
+
+        query_result = self.connection.execute(self.make_columnar_query())
+
+        self.assertEqual(query_result.code, 2013)
+        self.assertIsNone(query_result.result)
+        self.assertTrue(self.connection.is_connection_lost())
+
+    def test_lost_connection_while_fetching_is_retried(self):
+        self.connection.retry_policy = RetryPolicy(1, 0, 0)
+        self.fail_fetch()
+
+        query_result = self.connection.execute(self.make_columnar_query())
+
+        self.assertEqual(query_result.code, 0)
+        self.assertEqual(query_result.info["row_count"], 3)
+        self.assertFalse(self.connection.is_connection_lost())
+
+    def test_missing_numpy_is_reported(self):
+        with mock.patch.dict(sys.modules, {"numpy": None}):               # Import of numpy raises ImportError.
+            query_result = self.connection.execute(self.make_columnar_query(ResultLayout.NUMPY))
+
+        self.assertEqual(query_result.code, 9999)
+        self.assertIsNone(query_result.result)
+        self.assertEqual(self.connection.execute(self.make_query("SELECT id FROM t")).code, 0)
+
+    def test_failed_fetch_in_transaction_rolls_back(self):
+        self.fail_fetch()
+
+        with self.connection.transaction() as transaction:
+            self.assertEqual(self.connection.execute(self.make_update()).code, 0)
+            self.assertEqual(self.connection.execute(self.make_columnar_query()).code, 2013)
+
+        self.assertFalse(transaction.is_committed)
+        self.assertTrue(transaction.is_rollback_only)
+
+
+class ExecuteManyTest(MySqlTestCase):
+
+    INSERT  =   "INSERT INTO t (id, name) VALUES (%s, %s)"
+    UPDATE  =   "UPDATE t SET name = %s WHERE id = %s"
+
+    def setUp(self):
+        super(ExecuteManyTest, self).setUp()
+        self.connection = self.make_connection()
+        self.driver = self.connection.connection
+        self.log = self.start_query_log()
+
+    def test_insert_rows_are_sent_as_multi_row_statements(self):
+        rows = [(index, "name{}".format(index)) for index in range(10)]
+
+        query_result = self.connection.execute_many(self.make_update(self.INSERT), rows, is_commit = True, commit_size = 4)
+
+        self.assertEqual(query_result.code, 0)
+        self.assertEqual(query_result.result, 10)
+        self.assertEqual(query_result.info, {"rows": 10, "committed_rows": 10, "statements": 3, "commits": 3})
+        self.assertEqual(self.driver.commit_count, 3)
+        inserts = [query_string for _, query_string in self.log if query_string.startswith("INSERT")]
+        self.assertEqual(inserts[0], "INSERT INTO t (id, name) VALUES (0, 'name0'),(1, 'name1'),(2, 'name2'),(3, 'name3')")
+        self.assertEqual(len(inserts), 3)
+
+    def test_failure_keeps_only_committed_rows(self):
+        fake_pymysql.fail("UPDATE t SET name = 'c'", fake_pymysql.IntegrityError(1062, "Duplicate entry"))
+        rows = [("a", 1), ("b", 2), ("c", 3), ("d", 4)]
+
+        query_result = self.connection.execute_many(self.make_update(self.UPDATE), rows, is_commit = True, commit_size = 2)
+
+        self.assertEqual(query_result.code, 1062)
+        self.assertEqual(query_result.info["committed_rows"], 2)
+        self.assertEqual((self.driver.commit_count, self.driver.rollback_count), (1, 1))
+        self.assertEqual([query_string[-1] for _, query_string in self.log], ["1", "2", "3"])    # Last row is not executed.
+
+    def test_failure_without_commit_rolls_back_every_row(self):
+        fake_pymysql.fail("UPDATE t SET name = 'b'", fake_pymysql.OperationalError(1205, "Lock wait timeout exceeded"))
+
+        query_result = self.connection.execute_many(self.make_update(self.UPDATE), [("a", 1), ("b", 2)])
+
+        self.assertEqual(query_result.code, 1205)
+        self.assertEqual(query_result.info["committed_rows"], 0)
+        self.assertEqual((self.driver.commit_count, self.driver.rollback_count), (0, 1))
+        self.assertEqual(self.connection.execute(self.make_update()).code, 0)
+
+    def test_invalid_parameters_are_reported(self):
+        query_result = self.connection.execute_many(self.make_update(self.UPDATE), [("a", 1), ("b",)], is_commit = True)
+
+        self.assertNotEqual(query_result.code, 0)
+        self.assertEqual(self.driver.commit_count, 0)
+        self.assertEqual(self.driver.rollback_count, 1)
+
+    def test_failure_in_transaction_rolls_back_on_exit(self):
+        fake_pymysql.fail("UPDATE t SET name = 'b'", fake_pymysql.IntegrityError(1062, "Duplicate entry"))
+
+        with self.connection.transaction() as transaction:
+            query_result = self.connection.execute_many(self.make_update(self.UPDATE), [("a", 1), ("b", 2)], is_commit = True, commit_size = 1)
+            self.assertEqual(self.driver.rollback_count, 0)
+
+        self.assertEqual(query_result.info["committed_rows"], 0)
+        self.assertTrue(transaction.is_rollback_only)
+        self.assertEqual((self.driver.commit_count, self.driver.rollback_count), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+#!/usr/bin/python3.4
+
+"""Tests of round trips made by OracleDBConnection.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_oracle_connection.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking, against the fake cx_Oracle driver, that
+    fetch sizes, statement cache and array DML of OracleDBConnection save round trips.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Added test of failed execute_many.
+#
+#
+# #############################################################################
+
+
+import types
+import unittest
+from unittest import mock
+
+import fake_cx_oracle
+import db_connection
+from db_connection import OracleDBConnection
+from db_error import OracleErrorClassifier, ORACLE_ERROR_CATEGORIES
+from db_query import OracleQuery
+from db_query_info import QueryType, CursorType, RecordCount
+from dc_connection_dao import OracleConnectionConfig
+
+
+class OracleConnectionTest(unittest.TestCase):
+
+    ROW_COUNT = 250
+
+    def setUp(self):
+        patches = [mock.patch.object(db_connection, "cx_Oracle", fake_cx_oracle),
+                   mock.patch.object(OracleDBConnection, "ERROR_CLASSIFIER", OracleErrorClassifier(fake_cx_oracle, ORACLE_ERROR_CATEGORIES))]
+
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.config = OracleConnectionConfig("Oracle", "127.0.0.1", "1521", "orcl", "local", "local", "", arraysize = 100,
+                                             prefetch_rows = 2, statement_cache_size = 5)
+        self.db = OracleDBConnection(self.config)
+        self.assertEqual(self.db.connect().code, 0)
+        self.assertEqual(self.db.set_cursor(CursorType.NORMAL).code, 0)
+        self.driver = self.db.connection
+        self.driver.rows = [(index,) for index in range(self.ROW_COUNT)]
+
+    def tearDown(self):
+        self.db.disconnect()
+
+    @staticmethod
+    def make_query(record_count, query_string = "SELECT id FROM t", parameters = None, query_type = QueryType.SELECT):
+        query = OracleQuery()
+        query.query_string = query_string
+        query.query_type = query_type
+        query.record_count = record_count
+        query.parameters = parameters
+        return query
+
+    def test_statement_cache_size_is_set(self):
+        self.assertEqual(self.driver.stmtcachesize, 5)
+
+    def test_single_record_comes_back_with_execute(self):
+        query_result = self.db.execute(self.make_query(RecordCount.SINGLE))
+
+        self.assertEqual(query_result.result, (0,))
+        self.assertEqual(self.driver.calls["execute"], 1)
+        self.assertEqual(self.driver.calls["fetch"], 0)
+        self.assertEqual((self.db.cursor.arraysize, self.db.cursor.prefetchrows), (1, 2))
+
+    def test_many_records_come_back_with_execute(self):
+        query = self.make_query(RecordCount.Many)
+        query.batch_size = 50
+
+        query_result = self.db.execute(query)
+
+        self.assertEqual(len(query_result.result), 50)
+        self.assertEqual(self.driver.calls["execute"], 1)
+        self.assertEqual(self.driver.calls["fetch"], 0)
+
+    def test_all_records_are_fetched_arraysize_per_round_trip(self):
+        query_result = self.db.execute(self.make_query(RecordCount.ALL))
+
+        self.assertEqual(len(query_result.result), self.ROW_COUNT)
+        self.assertEqual(self.driver.calls["execute"], 1)
+        self.assertEqual(self.driver.calls["fetch"], 3)             # 2 rows prefetched, then 100, 100 and 48.
+
+    def test_query_fetch_sizes_override_configuration(self):
+        query = self.make_query(RecordCount.ALL)
+        query.arraysize = 1000
+        query.prefetch_rows = 0
+
+        self.db.execute(query)
+
+        self.assertEqual(self.driver.calls["fetch"], 1)
+        self.assertEqual((self.db.cursor.arraysize, self.db.cursor.prefetchrows), (1000, 0))
+
+    def test_batches_are_fetched_batch_size_per_round_trip(self):
+        query = self.make_query(RecordCount.BATCHES)
+        query.batch_size = 100
+
+        batches = list(self.db.execute(query).result)
+
+        self.assertEqual([len(batch) for batch in batches], [100, 100, 50])
+        self.assertEqual(self.driver.calls["execute"], 1)
+        self.assertEqual(self.driver.calls["fetch"], 2)             # 101 rows prefetched, then 100 and 49.
+
+    def test_bind_variables_reuse_parsed_statement(self):
+        for value in range(10):
+            query = self.make_query(RecordCount.SINGLE, "SELECT id FROM t WHERE id = :1", (value,))
+            self.assertEqual(self.db.execute(query).code, 0)
+
+        self.assertEqual(self.driver.calls["execute"], 10)
+        self.assertEqual(self.driver.calls["parse"], 1)
+
+    def test_execute_many_sends_array_dml(self):
+        query = self.make_query(None, "INSERT INTO t (id) VALUES (:1)", query_type = QueryType.UPDATE)
+        rows = [(index,) for index in range(25000)]
+
+        query_result = self.db.execute_many(query, rows, is_commit = True)
+
+        self.assertEqual(query_result.code, 0)
+        self.assertEqual(query_result.result, 25000)
+        self.assertEqual(self.driver.calls["executemany"], 3)       # 10000, 10000 and 5000 rows.
+        self.assertEqual(self.driver.calls["execute"], 0)
+        self.assertEqual(self.driver.calls["parse"], 1)
+        self.assertEqual(self.driver.calls["commit"], 1)
+        self.assertEqual(query_result.info, {"rows": 25000, "committed_rows": 25000, "statements": 3, "commits": 1})
+
+    def test_execute_many_commits_every_commit_size_rows(self):
+        query = self.make_query(None, "INSERT INTO t (id) VALUES (:1)", query_type = QueryType.UPDATE)
+
+        query_result = self.db.execute_many(query, ((index,) for index in range(25000)), is_commit = True, commit_size = 4000)
+
+        self.assertEqual(self.driver.calls["executemany"], 7)       # 6 of 4000 rows and 1 of 1000 rows.
+        self.assertEqual(self.driver.calls["commit"], 7)
+        self.assertEqual(query_result.info, {"rows": 25000, "committed_rows": 25000, "statements": 7, "commits": 7})
+
+    def test_failed_execute_many_rolls_back_uncommitted_rows(self):
+        query = self.make_query(None, "INSERT INTO t (id) VALUES (:1)", query_type = QueryType.UPDATE)
+        error = fake_cx_oracle.DatabaseError(types.SimpleNamespace(code = 1, message = "ORA-00001: unique constraint violated"))
+
+        with mock.patch.object(fake_cx_oracle.Cursor, "executemany", side_effect = [None, None, error]):
+            query_result = self.db.execute_many(query, ((index,) for index in range(12000)), is_commit = True, commit_size = 4000)
+
+        self.assertEqual(query_result.code, 1)
+        self.assertEqual(self.driver.calls["rollback"], 1)
+        self.assertEqual(query_result.info["committed_rows"], 8000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/python3.4
+
+"""Tests of PartitionedReader over the fake pymysql driver.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_partitioned_read.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking that a partitioned read starts a snapshot on
+    each connection, reads every chunk, and that a failed chunk or start ends the read with
+    PartitionedReadError and leaves no connection of the pool in a snapshot.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import unittest
+
+import fake_pymysql
+from mysql_test_case import MySqlTestCase
+from db_partitioned_read import PartitionedReader, PartitionedReadError, SnapshotMode
+from db_query import MySqlQuery
+
+PARALLELISM     =   3
+CHUNK_ROWS      =   ((1, "a"), (2, "b"))
+
+
+class PartitionedReadTest(MySqlTestCase):
+
+    def setUp(self):
+        super(PartitionedReadTest, self).setUp()
+        config = self.make_config()
+        self.pool = self.make_pool(config, min_size = 0, max_size = PARALLELISM + 1)
+        self.config = config
+        self.log = self.start_query_log()
+
+        fake_pymysql.set_result("SELECT MIN", ("MIN(`id`)", "MAX(`id`)"), ((1, 90),))
+        fake_pymysql.set_result("SELECT *", ("id", "name"), CHUNK_ROWS)
+
+    def get_connection(self):
+        return self.make_pooled_connection(self.config, self.pool)
+
+    @staticmethod
+    def get_query():
+        return MySqlQuery()
+
+    def make_reader(self, snapshot_mode = SnapshotMode.BEST_EFFORT):
+        return PartitionedReader(self, PARALLELISM, batch_size = 1, snapshot_mode = snapshot_mode)
+
+    def get_statements(self, prefix):
+        return [query_string for _, query_string in self.log if query_string.startswith(prefix)]
+
+    def test_records_of_every_chunk_are_read_in_snapshots(self):
+        read = self.make_reader().read("t", "id", chunk_count = 6)
+
+        records = list(read.records())
+
+        self.assertEqual(len(records), len(CHUNK_ROWS) * 6)
+        self.assertEqual(self.get_statements("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ"),
+                         ["SET TRANSACTION ISOLATION LEVEL REPEATABLE READ"] * PARALLELISM)
+        self.assertEqual(len(self.get_statements("START TRANSACTION WITH CONSISTENT SNAPSHOT")), PARALLELISM)
+        self.assertIn("SELECT * FROM `t` WHERE `id` >= 75 AND `id` <= 90", self.get_statements("SELECT *"))
+        self.assertEqual((self.pool.size, self.pool.idle_count), (PARALLELISM, PARALLELISM))
+
+    def test_partitions_are_read_in_order_of_key(self):
+        partitions = self.make_reader().read("t", "id").partitions()
+
+        self.assertEqual([list(partition) for partition in partitions], [list(CHUNK_ROWS)] * PARALLELISM)
+        self.assertEqual(len(self.get_statements("SELECT *")), PARALLELISM)
+
+    def test_table_is_locked_while_snapshots_start(self):
+        self.make_reader(SnapshotMode.TABLE_LOCK).read("t", "id").close()
+
+        statements = [query_string for _, query_string in self.log if not query_string.startswith("SELECT")]
+
+        self.assertEqual(statements[0], "LOCK TABLES `t` READ")
+        self.assertEqual(statements.index("UNLOCK TABLES"), 1 + 2 * PARALLELISM)
+
+    def test_failed_snapshot_releases_connections(self):
+        fake_pymysql.fail("START TRANSACTION", fake_pymysql.OperationalError(1205, "Lock wait timeout exceeded"))
+
+        with self.assertRaises(PartitionedReadError) as context:
+            self.make_reader().read("t", "id")
+
+        self.assertEqual(context.exception.query_result.code, 1205)
+        self.assertEqual(self.pool.idle_count, self.pool.size)
+
+    def test_lost_connection_fails_read_and_discards_connection(self):
+        fake_pymysql.fail("SELECT *", fake_pymysql.OperationalError(2013, "Lost connection"))
+        read = self.make_reader().read("t", "id")
+
+        with self.assertRaises(PartitionedReadError) as context:
+            list(read.records())
+
+        self.assertEqual(context.exception.query_result.code, 2013)
+
+        for thread in read._threads:
+            thread.join()
+
+        self.assertLess(self.pool.size, PARALLELISM)
+        self.assertEqual(self.pool.idle_count, self.pool.size)
+
+    def test_failed_partition_raises_error(self):
+        fake_pymysql.fail("SELECT *", fake_pymysql.ProgrammingError(1146, "Table doesn't exist"))
+        partitions = self.make_reader().read("t", "id").partitions()
+        errors = []
+
+        for partition in partitions:
+            try:
+                list(partition)
+            except PartitionedReadError as error:
+                errors.append(error.query_result.code)
+
+        self.assertIn(1146, errors)
+
+    def test_partitions_cut_short_by_close_raise_error(self):
+        fake_pymysql.set_result("SELECT *", ("id", "name"), tuple((index, "x") for index in range(100)))
+        read = self.make_reader().read("t", "id")
+        partitions = read.partitions()
+        next(partitions[0])
+
+        read.close()
+
+        for partition in partitions:
+            with self.assertRaises(PartitionedReadError):
+                list(partition)
+
+        for thread in read._threads:
+            thread.join()
+
+        self.assertEqual(self.pool.size, 0)                 # Unbuffered queries not read to their end are discarded.
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,213 @@
+#!/usr/bin/python3.4
+
+"""Tests of RAW and LAZY cursors over a fake MySql packet stream.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_raw_row.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking, against packets a MySql server would send,
+    that cursors of db_raw_row read fields of every length coding, NULL fields and multiple result
+    sets as pymysql does.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import collections
+import struct
+import unittest
+from unittest import mock
+
+try:
+    import pymysql
+except ImportError:
+    pymysql = None
+
+import db_raw_row
+from db_raw_row import LazyRow, RawRowCursors, RowLayout, read_length, read_raw_row
+from db_query_info import CursorType
+
+SERVER_MORE_RESULTS_EXISTS  =   8
+LONG_TYPE                   =   3
+VAR_STRING_TYPE             =   253
+UTF8_CHARSET                =   33
+
+
+def length_coded(value, prefix = None):
+    """ Returns field as length coded string, None for NULL, prefix forces length byte 252, 253 or 254. """
+    if value is None:
+        return b"\xfb"
+
+    length = len(value)
+
+    if prefix is None:
+        prefix = 0 if length < 251 else 252 if length < 1 << 16 else 253 if length < 1 << 24 else 254
+
+    if prefix == 0:
+        return bytes([length]) + value
+    if prefix == 252:
+        return b"\xfc" + struct.pack("<H", length) + value
+    if prefix == 253:
+        return b"\xfd" + struct.pack("<I", length)[:3] + value
+
+    return b"\xfe" + struct.pack("<Q", length) + value
+
+
+def column_packet(name, type_code):
+    fields = [b"def", b"db", b"t", b"t", name.encode(), name.encode()]
+    charset = 63 if type_code == LONG_TYPE else UTF8_CHARSET
+    return b"".join(length_coded(field) for field in fields) + struct.pack("<BHIBHBxx", 12, charset, 255, type_code, 0, 0)
+
+
+def eof_packet(has_next = False):
+    return b"\xfe" + struct.pack("<HH", 0, SERVER_MORE_RESULTS_EXISTS if has_next else 0)
+
+
+def result_packets(columns, rows, has_next = False, prefixes = None):
+    """ Returns packets of a result set, columns being (name, type_code) and rows being tuples of bytes or None. """
+    packets = [bytes([len(columns)])]
+    packets.extend(column_packet(name, type_code) for name, type_code in columns)
+    packets.append(eof_packet())
+
+    for row in rows:
+        packets.append(b"".join(length_coded(value, (prefixes or {}).get(index)) for index, value in enumerate(row)))
+
+    packets.append(eof_packet(has_next))
+
+    return packets
+
+
+if pymysql is not None:
+    class FakeConnection(pymysql.connections.Connection):
+        """ pymysql Connection answering each query with the next queued list of packets. """
+
+        def __init__(self):
+            super(FakeConnection, self).__init__(defer_connect = True, charset = "utf8mb4")
+            self.answers = collections.deque()
+            self.packets = collections.deque()
+
+        def _execute_command(self, command, sql):
+            self.packets.extend(self.answers.popleft())
+
+        def _read_packet(self, packet_type = pymysql.protocol.MysqlPacket):
+            return packet_type(self.packets.popleft(), self.encoding)
+
+
+@unittest.skipUnless(pymysql is not None, "pymysql is not installed.")
+class RawRowCursorTest(unittest.TestCase):
+
+    COLUMNS = [("id", LONG_TYPE), ("name", VAR_STRING_TYPE)]
+    ROWS    = [(b"1", b"a"), (b"2", None), (b"3", "é".encode() * 300)]
+
+    def setUp(self):
+        self.connection = FakeConnection()
+
+    def make_cursor(self, cursor_type, is_unbuffered = False):
+        return self.connection.cursor(RawRowCursors.get_cursor_class(cursor_type, is_unbuffered))
+
+    def test_raw_fields_are_memoryviews_and_null_is_none(self):
+        self.connection.answers.append(result_packets(self.COLUMNS, self.ROWS))
+        cursor = self.make_cursor(CursorType.RAW)
+
+        self.assertEqual(cursor.execute("SELECT id, name FROM t"), 3)
+        rows = cursor.fetchall()
+
+        self.assertIsInstance(rows[0][0], memoryview)
+        self.assertEqual([tuple(None if field is None else bytes(field) for field in row) for row in rows], self.ROWS)
+
+    def test_length_prefixes_are_read(self):
+        rows = [(b"x" * 10, b"y" * 300, b"z" * 70000, b"w" * 5)]
+        columns = [("a", VAR_STRING_TYPE), ("b", VAR_STRING_TYPE), ("c", VAR_STRING_TYPE), ("d", VAR_STRING_TYPE)]
+        self.connection.answers.append(result_packets(columns, rows, prefixes = {3: 254}))
+        self.connection.answers.append(result_packets(columns, rows, prefixes = {3: 254}))
+
+        raw_cursor = self.make_cursor(CursorType.RAW)
+        raw_cursor.execute("SELECT a, b, c, d FROM t")
+        lazy_cursor = self.make_cursor(CursorType.LAZY)
+        lazy_cursor.execute("SELECT a, b, c, d FROM t")
+
+        self.assertEqual(tuple(bytes(field) for field in raw_cursor.fetchone()), rows[0])
+        self.assertEqual(lazy_cursor.fetchone().to_tuple(), tuple(field.decode() for field in rows[0]))
+
+    def test_length_253_is_read(self):
+        data = length_coded(b"q" * 5, 253) + length_coded(b"r", 0)
+
+        self.assertEqual(read_length(data, 0), (4, 5))
+        self.assertEqual([bytes(field) for field in read_raw_row(data, 2)], [b"q" * 5, b"r"])
+
+    def test_lazy_fields_are_read_by_name_and_index(self):
+        self.connection.answers.append(result_packets(self.COLUMNS, self.ROWS))
+        cursor = self.make_cursor(CursorType.LAZY)
+        cursor.execute("SELECT id, name FROM t")
+
+        first, second, third = cursor.fetchall()
+
+        self.assertIsInstance(first, LazyRow)
+        self.assertEqual((first["name"], first[0], first[-1]), ("a", 1, "a"))
+        self.assertIsNone(second["name"])
+        self.assertEqual(second.to_dict(), {"id": 2, "name": None})
+        self.assertEqual(third[1], "é" * 300)
+        self.assertEqual(third.get("missing", 0), 0)
+
+        with self.assertRaises(IndexError):
+            first[2]
+
+    def test_unbuffered_cursor_reads_as_fetched(self):
+        self.connection.answers.append(result_packets(self.COLUMNS, self.ROWS))
+        cursor = self.make_cursor(CursorType.LAZY, is_unbuffered = True)
+        cursor.execute("SELECT id, name FROM t")
+
+        self.assertEqual(cursor.fetchone()["id"], 1)
+        self.assertEqual(len(self.connection.packets), 3)               # Two records and EOF are not read yet.
+        self.assertEqual([row.to_tuple() for row in cursor.fetchall()], [(2, None), (3, "é" * 300)])
+
+    def test_next_result_set_is_read(self):
+        for cursor_type, is_unbuffered in ((CursorType.RAW, False), (CursorType.LAZY, False), (CursorType.LAZY, True)):
+            with self.subTest(cursor_type = cursor_type, is_unbuffered = is_unbuffered):
+                self.connection.answers.append(result_packets(self.COLUMNS, self.ROWS[:1], has_next = True) +
+                                               result_packets([("total", LONG_TYPE)], [(b"42",), (b"43",)]))
+                cursor = self.make_cursor(cursor_type, is_unbuffered)
+                cursor.execute("SELECT id, name FROM t; SELECT total FROM s")
+
+                self.assertEqual(len(cursor.fetchall()), 1)
+                self.assertTrue(cursor.nextset())
+                self.assertEqual([bytes(row[0]) if cursor_type == CursorType.RAW else row[0] for row in cursor.fetchall()],
+                                 [b"42", b"43"] if cursor_type == CursorType.RAW else [42, 43])
+                self.assertEqual(cursor.description[0][0], "total")
+                self.assertFalse(cursor.nextset())
+                cursor.close()
+
+    def test_unsupported_pymysql_version_is_refused(self):
+        with mock.patch.object(pymysql, "VERSION", (db_raw_row.MAX_PYMYSQL_VERSION[0], db_raw_row.MAX_PYMYSQL_VERSION[1], 0, None)):
+            with self.assertRaises(ImportError):
+                RawRowCursors.build_classes()
+
+
+class LazyRowTest(unittest.TestCase):
+
+    def test_fields_are_converted_once(self):
+        converter = mock.Mock(side_effect = int)
+        layout = RowLayout(["id", "name"], [("ascii", converter), ("utf8", None)])
+        row = LazyRow(length_coded(b"7") + length_coded(None), layout)
+
+        self.assertEqual((row["id"], row["id"], row[1]), (7, 7, None))
+        self.assertEqual(converter.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/python3.4
+
+"""Tests of QueryResultCache and its use by MySqlDBConnection.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_result_cache.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking that tables read and written by queries are
+    found, that a write removes every cached result read from its tables, and that a result whose
+    tables can not be fully found is never cached.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import unittest
+
+import fake_pymysql
+from mysql_test_case import MySqlTestCase
+from db_result_cache import QueryResultCache
+
+CACHE_TTL   =   60
+
+
+class TableScanTest(unittest.TestCase):
+
+    def test_every_table_reference_is_read(self):
+        cases = {"SELECT * FROM a, b WHERE a.id = b.id":                        {"a", "b"},
+                 "SELECT * FROM a x, `db`.`b` AS y":                            {"a", "b"},
+                 "SELECT * FROM a JOIN b ON a.id = b.id LEFT JOIN c USING (id)": {"a", "b", "c"},
+                 "SELECT * FROM a STRAIGHT_JOIN b ON a.id = b.id":              {"a", "b"},
+                 "SELECT STRAIGHT_JOIN * FROM a, b":                            {"a", "b"},
+                 "SELECT * FROM a USE INDEX (k), b FORCE INDEX FOR JOIN (k)":   {"a", "b"},
+                 "SELECT * FROM (SELECT id FROM c) x, d":                       {"c", "d"},
+                 "select * from a where id in (select id from e)":              {"a", "e"}}
+
+        for query_string, tables in cases.items():
+            with self.subTest(query_string = query_string):
+                self.assertEqual(QueryResultCache.read_tables(query_string), tables)
+
+    def test_unreadable_table_reference_gives_no_table(self):
+        for query_string in ("SELECT * FROM (a JOIN b)", "SELECT * FROM a, (b)", "SELECT 1", "SELECT * FROM a WHERE n = 'x from y'"):
+            with self.subTest(query_string = query_string):
+                self.assertEqual(QueryResultCache.read_tables(query_string), set())
+
+    def test_every_written_table_is_found(self):
+        cases = {"UPDATE a JOIN b ON a.id = b.id SET a.n = 1":  {"a", "b"},
+                 "UPDATE a x, b SET x.n = 1":                   {"a", "b"},
+                 "DELETE a FROM a STRAIGHT_JOIN b":             {"a", "b"},
+                 "INSERT INTO a (id) SELECT id FROM b":         {"a", "b"}}
+
+        for query_string, tables in cases.items():
+            with self.subTest(query_string = query_string):
+                self.assertEqual(QueryResultCache.write_tables(query_string), tables)
+
+    def test_result_of_unreadable_query_is_not_cached(self):
+        cache = QueryResultCache()
+
+        self.assertFalse(cache.put(cache.make_key("SELECT * FROM (a JOIN b)"), [(1,)], CACHE_TTL))
+        self.assertTrue(cache.put(cache.make_key("SELECT * FROM a, b"), [(1,)], CACHE_TTL))
+
+
+class ResultCacheInvalidationTest(MySqlTestCase):
+
+    def setUp(self):
+        super(ResultCacheInvalidationTest, self).setUp()
+        self.cache = QueryResultCache()
+        self.connection = self.make_connection()
+        self.connection.result_cache = self.cache
+        self.log = self.start_query_log()
+
+    def select(self, query_string):
+        """ Returns True if SELECT query is served from cache. """
+        query = self.make_query(query_string)
+        query.cache_ttl = CACHE_TTL
+        count = len(self.log)
+
+        self.assertEqual(self.connection.execute(query).code, 0)
+
+        return len(self.log) == count
+
+    def test_write_to_any_joined_table_removes_result(self):
+        for query_string in ("SELECT * FROM a, b", "SELECT * FROM a STRAIGHT_JOIN b", "SELECT * FROM a JOIN b USING (id)"):
+            with self.subTest(query_string = query_string):
+                self.assertFalse(self.select(query_string))
+                self.assertTrue(self.select(query_string))
+
+                self.assertEqual(self.connection.execute(self.make_update("UPDATE b SET n = 1"), is_commit = True).code, 0)
+
+                self.assertFalse(self.select(query_string))
+
+    def test_result_of_unreadable_query_is_not_served(self):
+        self.assertFalse(self.select("SELECT * FROM (a JOIN b)"))
+        self.assertFalse(self.select("SELECT * FROM (a JOIN b)"))
+
+    def test_failed_select_is_not_cached(self):
+        fake_pymysql.fail("SELECT", fake_pymysql.OperationalError(1205, "Lock wait timeout exceeded"))
+        query = self.make_query("SELECT * FROM a")
+        query.cache_ttl = CACHE_TTL
+
+        self.assertEqual(self.connection.execute(query).code, 1205)
+        self.assertFalse(self.select("SELECT * FROM a"))
+        self.assertTrue(self.select("SELECT * FROM a"))
+
+    def test_rolled_back_write_is_not_read_from_cache(self):
+        self.select("SELECT * FROM a")
+
+        with self.connection.transaction():
+            self.connection.execute(self.make_update("UPDATE a SET n = 1"))
+            self.assertFalse(self.select("SELECT * FROM a"))            # Cache is not used in transaction.
+            query_result = self.connection.execute(self.make_update("ERROR"))
+
+        self.assertEqual(query_result.code, 1064)
+        self.assertFalse(self.select("SELECT * FROM a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
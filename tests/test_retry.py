@@ -0,0 +1,165 @@
+#!/usr/bin/python3.4
+
+"""Tests of RetryPolicy and retries of MySqlDBConnection.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_retry.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking that connect and SELECT query failed with a
+    transient error are tried again as per retry policy, after reconnecting if connection is
+    lost, and that fatal errors and queries with uncommitted work are not.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import unittest
+
+import fake_pymysql
+from mysql_test_case import MySqlTestCase
+from db_connection import MySqlDBConnection
+from db_retry import RetryPolicy
+
+MAX_RETRIES     =   2
+
+
+class RetryPolicyTest(unittest.TestCase):
+
+    def test_delays_grow_within_max_delay(self):
+        delays = list(RetryPolicy(5, 0.1, 0.3).delays())
+
+        self.assertEqual(len(delays), 5)
+        self.assertTrue(all(0 <= delay <= 0.3 for delay in delays))
+        self.assertTrue(all(delay <= 0.1 for delay in delays[:1]))
+
+    def test_invalid_policy_is_refused(self):
+        for arguments in ((-1, 0, 0), (1, -0.1, 0), (1, 0, -1)):
+            with self.subTest(arguments = arguments):
+                with self.assertRaises(ValueError):
+                    RetryPolicy(*arguments)
+
+    def test_wait_stops_after_last_delay(self):
+        delays = RetryPolicy(1, 0, 0).delays()
+
+        self.assertTrue(RetryPolicy.wait(delays))
+        self.assertFalse(RetryPolicy.wait(delays))
+
+
+class RetryTest(MySqlTestCase):
+
+    def setUp(self):
+        super(RetryTest, self).setUp()
+        self.log = self.start_query_log()
+
+    def make_connection(self, **kwargs):
+        connection = super(RetryTest, self).make_connection(**kwargs)
+        connection.retry_policy = RetryPolicy(MAX_RETRIES, 0, 0)
+        return connection
+
+    def get_attempts(self, prefix = "SELECT"):
+        return len([query_string for _, query_string in self.log if query_string.startswith(prefix)])
+
+    def test_transient_connect_failure_is_retried(self):
+        connection = MySqlDBConnection(self.make_config())
+        connection.retry_policy = RetryPolicy(MAX_RETRIES, 0, 0)
+        fake_pymysql.fail(fake_pymysql.CONNECT_QUERY, fake_pymysql.OperationalError(2003, "Can't connect to MySQL server"))
+
+        self.assertEqual(connection.connect().code, 0)
+        self.addCleanup(connection.disconnect)
+
+    def test_fatal_connect_failure_is_not_retried(self):
+        connection = MySqlDBConnection(self.make_config())
+        connection.retry_policy = RetryPolicy(MAX_RETRIES, 0, 0)
+        fake_pymysql.fail(fake_pymysql.CONNECT_QUERY, fake_pymysql.OperationalError(1045, "Access denied"))
+        fake_pymysql.fail(fake_pymysql.CONNECT_QUERY, fake_pymysql.OperationalError(2003, "Can't connect to MySQL server"))
+
+        self.assertEqual(connection.connect().code, 1045)
+        self.assertTrue(connection.is_connection_lost())
+
+    def test_deadlocked_select_is_retried(self):
+        connection = self.make_connection()
+        fake_pymysql.fail("SELECT", fake_pymysql.OperationalError(1213, "Deadlock found"))
+
+        query_result = connection.execute(self.make_query("SELECT * FROM t"))
+
+        self.assertEqual(query_result.code, 0)
+        self.assertEqual(len(query_result.result), len(self.ROWS))
+        self.assertEqual(self.get_attempts(), 2)
+
+    def test_last_error_is_reported_when_retries_are_exhausted(self):
+        connection = self.make_connection()
+        fake_pymysql.fail("SELECT", fake_pymysql.OperationalError(1205, "Lock wait timeout exceeded"), MAX_RETRIES + 1)
+
+        query_result = connection.execute(self.make_query("SELECT * FROM t"))
+
+        self.assertEqual(query_result.code, 1205)
+        self.assertEqual(self.get_attempts(), MAX_RETRIES + 1)
+        self.assertEqual(connection.execute(self.make_query("SELECT * FROM t")).code, 0)
+
+    def test_fatal_error_is_not_retried(self):
+        connection = self.make_connection()
+        fake_pymysql.fail("SELECT", fake_pymysql.ProgrammingError(1146, "Table doesn't exist"))
+
+        self.assertEqual(connection.execute(self.make_query("SELECT * FROM t")).code, 1146)
+        self.assertEqual(self.get_attempts(), 1)
+
+    def test_lost_connection_is_reopened_and_select_retried(self):
+        connection = self.make_connection()
+        lost_connection = connection.connection
+        fake_pymysql.fail("SELECT", fake_pymysql.OperationalError(2013, "Lost connection to MySQL server during query"))
+
+        query_result = connection.execute(self.make_query("SELECT * FROM t"))
+
+        self.assertEqual(query_result.code, 0)
+        self.assertIsNot(connection.connection, lost_connection)
+        self.assertFalse(lost_connection.open)
+
+    def test_failed_reconnect_reports_query_error(self):
+        connection = self.make_connection()
+        fake_pymysql.fail("SELECT", fake_pymysql.OperationalError(2006, "MySQL server has gone away"))
+        fake_pymysql.fail(fake_pymysql.CONNECT_QUERY, fake_pymysql.OperationalError(1045, "Access denied"))
+
+        query_result = connection.execute(self.make_query("SELECT * FROM t"))
+
+        self.assertEqual(query_result.code, 2006)             # Reconnect failed fatally, so it is not retried.
+        self.assertTrue(connection.is_connection_lost())
+        self.assertEqual(self.get_attempts(), 1)
+
+    def test_update_is_not_retried(self):
+        connection = self.make_connection()
+        fake_pymysql.fail("UPDATE", fake_pymysql.OperationalError(1213, "Deadlock found"))
+
+        self.assertEqual(connection.execute(self.make_update(), is_commit = True).code, 1213)
+        self.assertEqual(self.get_attempts("UPDATE"), 1)
+        self.assertEqual(connection.connection.commit_count, 0)
+
+    def test_select_after_uncommitted_update_is_not_retried(self):
+        connection = self.make_connection()
+        fake_pymysql.fail("SELECT", fake_pymysql.OperationalError(1213, "Deadlock found"))
+
+        with connection.transaction() as transaction:
+            self.assertEqual(connection.execute(self.make_update()).code, 0)
+            self.assertEqual(connection.execute(self.make_query("SELECT * FROM t")).code, 1213)
+
+        self.assertEqual(self.get_attempts(), 1)
+        self.assertTrue(transaction.is_rollback_only)
+        self.assertEqual((connection.connection.commit_count, connection.connection.rollback_count), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+#!/usr/bin/python3.4
+
+"""Tests of read/write splitting of RoutingMySqlDBConnection.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_routing.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking, against the fake pymysql driver, that SELECT
+    queries are sent to an available replica, that writes, transactions and reads following them
+    are sent to primary database, and that lost connections of replica or primary are recovered.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+# 18-10-26            Dilip Kumar Sharma            Added test of failed export in transaction.
+#
+#
+# #############################################################################
+
+
+import io
+import time
+import unittest
+
+import fake_pymysql
+from mysql_test_case import MySqlTestCase
+from db_routing import ReplicaMonitor, RoutingMySqlDBConnection
+from dc_connection_dao import ReplicaConfig
+
+LAG_COLUMNS     =   ("Seconds_Behind_Source",)
+STICKY_TIME     =   0.05
+
+
+class RoutingTest(MySqlTestCase):
+
+    def setUp(self):
+        super(RoutingTest, self).setUp()
+        self.set_lag(0)
+
+        self.replica_config = ReplicaConfig("replica", "3306")
+        config = self.make_config(replicas = (self.replica_config,), replica_max_lag = 5.0, sticky_time = STICKY_TIME)
+
+        self.monitor = ReplicaMonitor(config.replica_max_lag, check_interval = 60.0)
+        self.addCleanup(self.monitor.close)
+
+        primary = self.make_pooled_connection(config)
+        self.replica = self.make_pooled_connection(self.make_config("replica"))
+        self.connection = self.connect(RoutingMySqlDBConnection(config, primary, [(self.replica_config, self.replica)], self.monitor))
+        self.log = self.start_query_log()
+
+    @staticmethod
+    def set_lag(lag):
+        fake_pymysql.set_result("SHOW REPLICA STATUS", LAG_COLUMNS, ((lag,),))
+
+    def execute(self, query, is_commit = False):
+        """ Returns host on which query is executed. """
+        self.assertEqual(self.connection.execute(query, is_commit).code, 0)
+        return self.log[-1][0]
+
+    def test_select_is_sent_to_replica_and_update_to_primary(self):
+        self.assertEqual(self.execute(self.make_query("SELECT id FROM t")), "replica")
+        self.assertIs(self.connection.replica, self.replica_config)
+        self.assertEqual(self.execute(self.make_update(), is_commit = True), "primary")
+
+    def test_select_after_write_is_sent_to_primary_for_sticky_time(self):
+        self.execute(self.make_update(), is_commit = True)
+
+        self.assertEqual(self.execute(self.make_query("SELECT id FROM t")), "primary")
+        time.sleep(STICKY_TIME * 2)
+        self.assertEqual(self.execute(self.make_query("SELECT id FROM t")), "replica")
+
+    def test_select_after_uncommitted_write_is_sent_to_primary_until_commit(self):
+        self.execute(self.make_update())
+        time.sleep(STICKY_TIME * 2)
+
+        self.assertEqual(self.execute(self.make_query("SELECT id FROM t")), "primary")
+
+        self.connection.commit()
+        time.sleep(STICKY_TIME * 2)
+
+        self.assertEqual(self.execute(self.make_query("SELECT id FROM t")), "replica")
+
+    def test_transaction_is_sent_to_primary_and_rolled_back_on_failure(self):
+        fake_pymysql.fail("UPDATE", fake_pymysql.IntegrityError(1062, "Duplicate entry"))
+
+        with self.connection.transaction() as transaction:
+            self.assertEqual(self.execute(self.make_query("SELECT id FROM t")), "primary")
+            self.assertEqual(self.connection.execute(self.make_update()).code, 1062)
+
+        self.assertFalse(transaction.is_committed)
+        self.assertEqual(self.connection.primary.connection.rollback_count, 1)
+
+    def test_failed_export_in_transaction_rolls_back(self):
+        fake_pymysql.fail("SELECT", fake_pymysql.OperationalError(1205, "Lock wait timeout exceeded"))
+
+        with self.connection.transaction() as transaction:
+            self.execute(self.make_update())
+            self.assertEqual(self.connection.export(self.make_query("SELECT id FROM t"), io.BytesIO()).code, 1205)
+
+        self.assertTrue(transaction.is_rollback_only)
+        self.assertEqual([host for host, _ in self.log], ["primary"] * 2)
+
+    def test_lagging_replica_is_not_read_from(self):
+        self.set_lag(60)
+        self.monitor.check(self.monitor.get_key(self.replica_config), self.replica.pool)
+
+        self.assertEqual(self.execute(self.make_query("SELECT id FROM t")), "primary")
+        self.assertIsNone(self.connection.replica)
+
+    def test_select_is_moved_to_primary_when_replica_is_lost(self):
+        self.execute(self.make_query("SELECT id FROM t"))
+        fake_pymysql.fail("SELECT", fake_pymysql.OperationalError(2013, "Lost connection"))
+
+        self.assertEqual(self.execute(self.make_query("SELECT id FROM t")), "primary")
+        self.assertIsNone(self.connection.replica)
+        self.assertIsNone(self.monitor.get_lag(self.replica_config))
+
+    def test_lost_primary_is_reconnected_and_replica_released(self):
+        self.execute(self.make_query("SELECT id FROM t"))
+        fake_pymysql.fail("UPDATE", fake_pymysql.OperationalError(2013, "Lost connection"))
+
+        self.assertEqual(self.connection.execute(self.make_update()).code, 2013)
+        self.assertTrue(self.connection.is_connection_lost())
+
+        query_result, category = self.connection.reconnect()
+
+        self.assertEqual((query_result.code, category), (0, None))
+        self.assertFalse(self.connection.is_connection_lost())
+        self.assertIsNone(self.connection.replica)
+        self.assertEqual(self.replica.pool.idle_count, 1)
+        self.assertEqual(self.execute(self.make_update(), is_commit = True), "primary")
+
+    def test_failed_reconnect_is_reported(self):
+        fake_pymysql.fail("UPDATE", fake_pymysql.OperationalError(2013, "Lost connection"))
+        self.connection.execute(self.make_update())
+        fake_pymysql.fail(fake_pymysql.CONNECT_QUERY, fake_pymysql.OperationalError(2003, "Can't connect"))
+
+        query_result, category = self.connection.reconnect()
+
+        self.assertEqual(query_result.code, 2003)
+        self.assertIsNotNone(category)
+        self.assertTrue(self.connection.is_connection_lost())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+#!/usr/bin/python3.4
+
+"""Tests of SlowQueryLog and its use by MySqlDBConnection.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_slow_query.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking that slow and sampled queries are logged with
+    their result code, attempts and query plan, that failed queries and failed EXPLAIN are logged
+    too, and that entries are dropped rather than blocking the client when the queue is full.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import fake_pymysql
+from mysql_test_case import MySqlTestCase
+from db_connection import MySqlDBConnection
+from db_result_cache import QueryResultCache
+from db_retry import RetryPolicy
+from db_slow_query import SlowQueryLog
+
+PLAN    =   {"query_block": {"select_id": 1}}
+
+
+class SlowQueryLogTest(MySqlTestCase):
+
+    def setUp(self):
+        super(SlowQueryLogTest, self).setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "slow.log")
+        self.connection = self.make_connection()
+        self.log = self.start_query_log()
+
+        fake_pymysql.set_result("EXPLAIN", ("EXPLAIN",), ((json.dumps(PLAN),),))
+
+    def make_log(self, threshold = 0.0, sample_rate = 0.0, explain_threshold = None):
+        slow_query_log = SlowQueryLog(self.path, MySqlDBConnection.create_connection, MySqlDBConnection.close_connection,
+                                      threshold, sample_rate, explain_threshold)
+        self.addCleanup(slow_query_log.close)
+        self.connection.slow_query_log = slow_query_log
+        return slow_query_log
+
+    def read_entries(self):
+        """ Returns logged entries, after writing the queued ones. """
+        self.connection.slow_query_log.close()
+
+        if not os.path.exists(self.path):
+            return []
+
+        with open(self.path, encoding = "utf-8") as log_file:
+            return [json.loads(line) for line in log_file]
+
+    def test_slow_query_is_logged(self):
+        self.make_log()
+
+        self.connection.execute(self.make_query("SELECT * FROM t WHERE id = %s", parameters = (7,)))
+
+        entry, = self.read_entries()
+
+        self.assertEqual((entry["host"], entry["sql"], entry["rows"], entry["attempts"], entry["code"], entry["sampled"]),
+                         ("primary", "SELECT * FROM t WHERE id = %s", len(self.ROWS), 1, 0, False))
+        self.assertEqual(entry["parameters"], SlowQueryLog.get_fingerprint([7]))
+        self.assertNotIn("explain", entry)
+
+    def test_fast_query_is_logged_only_if_sampled(self):
+        self.make_log(threshold = 60.0)
+        self.connection.execute(self.make_query("SELECT a FROM t"))
+
+        self.assertEqual(self.read_entries(), [])
+
+        self.make_log(threshold = 60.0, sample_rate = 1.0)
+        self.connection.execute(self.make_query("SELECT b FROM t"))
+
+        entry, = self.read_entries()
+
+        self.assertEqual((entry["sql"], entry["sampled"]), ("SELECT b FROM t", True))
+
+    def test_failed_query_is_logged_with_attempts(self):
+        self.make_log()
+        self.connection.retry_policy = RetryPolicy(1, 0, 0)
+        fake_pymysql.fail("SELECT", fake_pymysql.OperationalError(1205, "Lock wait timeout exceeded"), 2)
+
+        self.assertEqual(self.connection.execute(self.make_query("SELECT * FROM t")).code, 1205)
+
+        entry, = self.read_entries()
+
+        self.assertEqual((entry["code"], entry["attempts"], entry["rows"]), (1205, 2, None))
+
+    def test_slow_select_is_explained_once_per_interval(self):
+        self.make_log(explain_threshold = 0.0)
+
+        for _ in range(2):
+            self.connection.execute(self.make_query("SELECT * FROM t WHERE id = %s", parameters = (1,)))
+        self.connection.execute(self.make_update(), is_commit = True)
+
+        entries = self.read_entries()
+
+        self.assertEqual(entries[0]["explain"], PLAN)
+        self.assertEqual(["explain" in entry for entry in entries], [True, False, False])
+        self.assertIn(("primary", "EXPLAIN FORMAT=JSON SELECT * FROM t WHERE id = 1"), self.log)
+
+    def test_failed_explain_is_logged_and_connection_reopened(self):
+        self.make_log(explain_threshold = 0.0)
+        fake_pymysql.fail("EXPLAIN", fake_pymysql.OperationalError(2013, "Lost connection to MySQL server during query"))
+
+        self.connection.execute(self.make_query("SELECT a FROM t"))
+        self.connection.execute(self.make_query("SELECT b FROM t"))
+
+        entries = self.read_entries()
+
+        self.assertIn("Lost connection", entries[0]["explain"]["error"])
+        self.assertEqual(entries[1]["explain"], PLAN)
+
+    def test_cached_result_is_not_logged(self):
+        self.make_log()
+        self.connection.result_cache = QueryResultCache()
+        query = self.make_query("SELECT * FROM t")
+        query.cache_ttl = 60
+
+        for _ in range(2):
+            self.assertEqual(self.connection.execute(query).code, 0)
+
+        self.assertEqual(len(self.read_entries()), 1)
+
+    def test_entry_is_dropped_when_queue_is_full(self):
+        with mock.patch.object(SlowQueryLog, "QUEUE_SIZE", 1):
+            slow_query_log = self.make_log()
+
+        with mock.patch.object(slow_query_log, "start"):            # Writer thread is not emptying queue.
+            self.connection.execute(self.make_query("SELECT a FROM t"))
+            self.connection.execute(self.make_query("SELECT b FROM t"))
+
+        slow_query_log.start()
+
+        self.assertEqual(slow_query_log.dropped_count, 1)
+        self.assertEqual([entry["sql"] for entry in self.read_entries()], ["SELECT a FROM t"])
+
+    def test_invalid_settings_are_refused(self):
+        for arguments in ((-1.0, 0.0), (1.0, 1.5), (1.0, -0.1)):
+            with self.subTest(arguments = arguments):
+                with self.assertRaises(ValueError):
+                    SlowQueryLog(self.path, None, None, *arguments)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/python3.4
+
+"""Tests of bind parameters and StatementCache.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_statement_cache.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking that bind parameters are escaped into query
+    string, that parsed statements are reused per driver connection, and that parameters not
+    matching their query are reported without sending the query.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import unittest
+
+from mysql_test_case import MySqlTestCase
+from db_statement_cache import PreparedStatement, StatementCache
+
+UNKNOWN_ERROR_CODE  =   9999
+
+
+class StatementCacheTest(unittest.TestCase):
+
+    def test_least_recently_used_statement_is_evicted(self):
+        cache = StatementCache(max_size = 2)
+        first = cache.get("SELECT %s")
+        cache.get("SELECT %s, %s")
+
+        self.assertIs(cache.get("SELECT %s"), first)
+
+        cache.get("SELECT %(a)s")
+
+        self.assertIs(cache.get("SELECT %s"), first)
+        self.assertEqual(cache.stats(), {"hits": 2, "misses": 3, "size": 2, "max_size": 2})
+
+    def test_mixed_placeholders_are_refused(self):
+        with self.assertRaises(ValueError):
+            PreparedStatement("SELECT %s, %(a)s")
+
+        with self.assertRaises(ValueError):
+            StatementCache(max_size = 0)
+
+    def test_literal_percent_is_kept(self):
+        statement = PreparedStatement("SELECT * FROM t WHERE name LIKE 'a%%' AND id = %s")
+
+        self.assertEqual(statement.bind((1,), str), "SELECT * FROM t WHERE name LIKE 'a%' AND id = 1")
+
+
+class BindParameterTest(MySqlTestCase):
+
+    def setUp(self):
+        super(BindParameterTest, self).setUp()
+        self.log = self.start_query_log()
+
+    def test_parameters_are_escaped_and_statement_is_reused(self):
+        connection = self.make_connection()
+        query = self.make_query("SELECT * FROM t WHERE name = %s AND id = %s", parameters = ("o'k", 1))
+
+        self.assertEqual(connection.execute(query).code, 0)
+
+        query.parameters = (None, 2)
+
+        self.assertEqual(connection.execute(query).code, 0)
+        self.assertEqual([query_string for _, query_string in self.log],
+                         ["SELECT * FROM t WHERE name = 'o\\'k' AND id = 1", "SELECT * FROM t WHERE name = NULL AND id = 2"])
+        self.assertEqual((connection.statement_cache.hits, connection.statement_cache.misses), (1, 1))
+
+    def test_named_parameters_are_bound(self):
+        connection = self.make_connection()
+        query = self.make_update("UPDATE t SET name = %(name)s WHERE id = %(id)s", {"id": 3, "name": "c"})
+
+        self.assertEqual(connection.execute(query, is_commit = True).code, 0)
+        self.assertEqual(self.log[-1][1], "UPDATE t SET name = 'c' WHERE id = 3")
+
+    def test_statement_cache_is_kept_by_pooled_driver_connection(self):
+        config = self.make_config()
+        pool = self.make_pool(config, min_size = 0, max_size = 1)
+        query = self.make_query("SELECT * FROM t WHERE id = %s", parameters = (1,))
+
+        for _ in range(2):
+            connection = self.connect(self.make_pooled_connection(config, pool))
+            self.assertEqual(connection.execute(query).code, 0)
+            statement_cache = connection.statement_cache
+            connection.disconnect()
+
+        self.assertEqual((statement_cache.hits, statement_cache.misses), (1, 1))
+
+    def test_parameters_not_matching_query_are_reported(self):
+        connection = self.make_connection()
+
+        for parameters in ((1, 2), {"id": 1}, ()):
+            with self.subTest(parameters = parameters):
+                query_result = connection.execute(self.make_query("SELECT * FROM t WHERE id = %s", parameters = parameters))
+
+                self.assertEqual(query_result.code, UNKNOWN_ERROR_CODE)
+                self.assertIn("parameters", query_result.message)
+
+        self.assertEqual(self.log, [])
+
+    def test_invalid_parameters_roll_back_transaction(self):
+        connection = self.make_connection()
+
+        with connection.transaction() as transaction:
+            self.assertEqual(connection.execute(self.make_update("UPDATE t SET a = %s", (1,))).code, 0)
+            self.assertEqual(connection.execute(self.make_update("UPDATE t SET b = %(b)s", {"c": 1})).code, UNKNOWN_ERROR_CODE)
+
+        self.assertTrue(transaction.is_rollback_only)
+        self.assertFalse(transaction.is_committed)
+        self.assertEqual((connection.connection.commit_count, connection.connection.rollback_count), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+#!/usr/bin/python3.4
+
+"""Tests of RecordCount.STREAM of MySqlDBConnection.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_stream.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking that streamed records are read from an
+    unbuffered cursor, and that the cursor is closed whether the stream is read to its end, closed
+    early, or fails.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import unittest
+from unittest import mock
+
+import fake_pymysql
+from mysql_test_case import MySqlTestCase
+from db_query_info import CursorType, RecordCount
+
+
+class StreamTest(MySqlTestCase):
+
+    def setUp(self):
+        super(StreamTest, self).setUp()
+        self.closed = []
+        close = fake_pymysql.SSCursor.close
+
+        def recording_close(cursor):
+            self.closed.append(cursor)
+            close(cursor)
+
+        patch = mock.patch.object(fake_pymysql.SSCursor, "close", recording_close)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def make_stream_query(self, batch_size = None):
+        query = self.make_query("SELECT id, name, score FROM t", record_count = RecordCount.STREAM)
+        query.batch_size = batch_size
+        return query
+
+    def lose_connection_after(self, count):
+        """ To lose connection after count records of unbuffered cursor are fetched. """
+        fetchone = fake_pymysql.SSCursor.fetchone
+
+        def failing_fetchone(cursor):
+            if cursor._position >= count:
+                cursor.connection.open = False
+                raise fake_pymysql.OperationalError(2013, "Lost connection to MySQL server during query")
+            return fetchone(cursor)
+
+        patch = mock.patch.object(fake_pymysql.SSCursor, "fetchone", failing_fetchone)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_records_are_streamed_from_unbuffered_cursor(self):
+        connection = self.make_connection()
+
+        query_result = connection.execute(self.make_stream_query())
+
+        self.assertEqual(query_result.code, 0)
+        self.assertEqual(list(query_result.result), list(self.ROWS))
+        self.assertEqual(len(self.closed), 1)
+        self.assertIsNot(self.closed[0], connection.cursor)
+
+    def test_records_are_streamed_in_batches(self):
+        connection = self.make_connection(CursorType.DICTIONARY)
+
+        batches = list(connection.execute(self.make_stream_query(batch_size = 2)).result)
+
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        self.assertEqual(batches[1], [{"id": 3, "name": "c", "score": 1.5}])
+
+    def test_stream_closed_early_closes_cursor(self):
+        connection = self.make_connection()
+        records = connection.execute(self.make_stream_query()).result
+
+        self.assertEqual(next(records), self.ROWS[0])
+
+        records.close()
+
+        self.assertEqual(len(self.closed), 1)
+        self.assertEqual(connection.execute(self.make_query("SELECT id FROM t")).code, 0)
+
+    def test_failed_query_closes_cursor(self):
+        connection = self.make_connection()
+        fake_pymysql.fail("SELECT", fake_pymysql.ProgrammingError(1146, "Table doesn't exist"))
+
+        query_result = connection.execute(self.make_stream_query())
+
+        self.assertEqual(query_result.code, 1146)
+        self.assertIsNone(query_result.result)
+        self.assertEqual(len(self.closed), 1)
+
+    def test_lost_connection_while_streaming_raises_and_closes_cursor(self):
+        connection = self.make_connection()
+        self.lose_connection_after(1)
+        records = connection.execute(self.make_stream_query()).result
+
+        self.assertEqual(next(records), self.ROWS[0])
+
+        with self.assertRaises(fake_pymysql.OperationalError):
+            next(records)
+
+        self.assertEqual(len(self.closed), 1)
+        self.assertTrue(connection.is_connection_lost())
+
+    def test_failed_stream_in_transaction_rolls_back(self):
+        connection = self.make_connection()
+        fake_pymysql.fail("SELECT", fake_pymysql.OperationalError(1205, "Lock wait timeout exceeded"))
+
+        with connection.transaction() as transaction:
+            self.assertEqual(connection.execute(self.make_update()).code, 0)
+            self.assertEqual(connection.execute(self.make_stream_query()).code, 1205)
+
+        self.assertTrue(transaction.is_rollback_only)
+        self.assertEqual((connection.connection.commit_count, connection.connection.rollback_count), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/python3.4
+
+"""Tests of ThreadConnectionManager and cross-thread use detection.
+
+DILIP KUMAR SHARMA CONFIDENTIAL & PROPRIETARY
+
+@file test_thread_connection.py
+@author Dilip Kumar Sharma
+@copyright Dilip Kumar Sharma
+@date 18th Oct 2026
+
+About; -
+--------
+    This python module is responsible for checking that each thread gets its own connection,
+    that a connection used by another thread raises CrossThreadUsageError, and that connections
+    which fail to connect, or whose threads have finished, are not kept.
+
+"""
+
+# #############################################################################
+# #######                      CHANGE RECORD                          #########
+# -----------------------------------------------------------------------------
+# Date (DD-MM-YY)  |  Author                    |   Change
+# -----------------------------------------------------------------------------
+# 18-10-26            Dilip Kumar Sharma            New file added.
+#
+#
+# #############################################################################
+
+
+import threading
+import unittest
+from unittest import mock
+
+import fake_pymysql
+from mysql_test_case import MySqlTestCase
+from db_connection import CrossThreadUsageError, MySqlDBConnection
+from db_thread_connection import ThreadConnectionError, ThreadConnectionManager
+
+
+class ThreadConnectionManagerTest(MySqlTestCase):
+
+    def setUp(self):
+        super(ThreadConnectionManagerTest, self).setUp()
+        self.config = self.make_config()
+        self.pool = None
+        self.manager = ThreadConnectionManager(self)
+        self.addCleanup(self.manager.close)
+
+    def get_connection(self):
+        """ Connection of DCFactory, pooled if pool is set. """
+        if self.pool is not None:
+            return self.make_pooled_connection(self.config, self.pool)
+
+        return MySqlDBConnection(self.config)
+
+    def run_in_thread(self, function):
+        """ Returns result of function run in a new thread, or exception raised by it. """
+        results = []
+
+        def run():
+            try:
+                results.append(function())
+            except Exception as error:
+                results.append(error)
+
+        thread = threading.Thread(target = run)
+        thread.start()
+        thread.join()
+
+        return results[0]
+
+    def test_each_thread_has_its_own_connection(self):
+        connection = self.manager.get_connection()
+
+        other_connection = self.run_in_thread(self.manager.get_connection)
+
+        self.assertIs(self.manager.get_connection(), connection)
+        self.assertIsNot(other_connection, connection)
+        self.assertEqual(connection.owner_thread, threading.get_ident())
+
+    def test_connection_used_by_another_thread_raises_error(self):
+        connection = self.manager.get_connection()
+
+        error = self.run_in_thread(lambda: connection.execute(self.make_query("SELECT * FROM t")))
+
+        self.assertIsInstance(error, CrossThreadUsageError)
+        self.assertEqual(connection.execute(self.make_query("SELECT * FROM t")).code, 0)
+
+    def test_failed_connect_is_not_kept(self):
+        fake_pymysql.fail(fake_pymysql.CONNECT_QUERY, fake_pymysql.OperationalError(2003, "Can't connect to MySQL server"))
+
+        with self.assertRaises(ThreadConnectionError) as context:
+            self.manager.get_connection()
+
+        self.assertEqual(context.exception.query_result.code, 2003)
+        self.assertEqual(self.manager.size, 0)
+        self.assertEqual(self.manager.get_connection().execute(self.make_query("SELECT * FROM t")).code, 0)
+
+    def test_failed_cursor_disconnects_connection(self):
+        connections = []
+        connect = fake_pymysql.connect
+
+        def recording_connect(*args, **kwargs):
+            connections.append(connect(*args, **kwargs))
+            return connections[-1]
+
+        with mock.patch.object(fake_pymysql, "connect", recording_connect), \
+             mock.patch.object(fake_pymysql.Connection, "cursor", side_effect = fake_pymysql.InterfaceError(0, "")):
+            with self.assertRaises(ThreadConnectionError):
+                self.manager.get_connection()
+
+        self.assertFalse(connections[0].open)
+        self.assertEqual(self.manager.size, 0)
+
+    def test_connection_of_finished_thread_is_reclaimed(self):
+        other_connection = self.run_in_thread(self.manager.get_connection)
+
+        self.assertEqual(self.manager.size, 1)
+        self.assertEqual(self.manager.reclaim(), 1)
+        self.assertEqual(self.manager.size, 0)
+        self.assertFalse(other_connection.connection.open)
+
+    def test_reclaimed_connection_rolls_back_uncommitted_work(self):
+        self.pool = self.make_pool(self.config, min_size = 0, max_size = 1)
+
+        def update():
+            connection = self.manager.get_connection()
+            self.assertEqual(connection.execute(self.make_update()).code, 0)
+            return connection.connection
+
+        driver_connection = self.run_in_thread(update)
+        self.manager.reclaim()
+
+        self.assertEqual((driver_connection.commit_count, driver_connection.rollback_count), (0, 1))
+        self.assertEqual(self.pool.idle_count, 1)
+
+    def test_released_connection_is_replaced(self):
+        connection = self.manager.get_connection()
+
+        self.manager.release()
+
+        self.assertFalse(connection.connection.open)
+        self.assertIsNot(self.manager.get_connection(), connection)
+        self.assertEqual(self.manager.size, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()